@@ -2,12 +2,21 @@
 """
 API Flask per Transfermarkt Scraper
 Espone endpoint REST per estrarre dati giocatori da Transfermarkt
+(singolo URL, job batch in background oppure batch in streaming)
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
-from transfermarkt_scraper import TransfermarktScraper, map_to_database_format
+from transfermarkt_mapping import map_to_database_format
+from transfermarkt_cache import DiskHTMLCache
+from transfermarkt_rate_limiter import get_rate_limiter
+from scraper_registry import configure_registry
+from transfermarkt_job_queue import STREAM_FORMATS, JobQueue, encode_stream, parse_batch_urls, stream_format
+from transfermarkt_singleflight import SingleFlight, player_flight_key
+from transfermarkt_result_cache import ResultCache
+from typing import Tuple
 import logging
+import os
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -17,8 +26,64 @@ logger = logging.getLogger(__name__)
 app = Flask(__name__)
 CORS(app)  # Abilita CORS per permettere richieste dal frontend React
 
-# Inizializza scraper
-scraper = TransfermarktScraper()
+# Registro degli scraper (con cache su disco delle pagine profilo):
+# istanze, sessione e connessioni keep-alive riusate tra le richieste
+registry = configure_registry(cache=DiskHTMLCache(
+    cache_dir=os.environ.get('TM_CACHE_DIR', '.tm_cache'),
+    ttl=float(os.environ.get('TM_CACHE_TTL', 6 * 3600))
+), partial_parse=True)
+
+
+# Richieste contemporanee per lo stesso giocatore: un solo scraping condiviso
+inflight = SingleFlight()
+
+
+def get_player_info(url: str) -> dict:
+    """Scraping del profilo, fuso con quelli in corso dello stesso giocatore"""
+    def scrape():
+        with registry.scraper('transfermarkt') as scraper:
+            return scraper.get_player_info(url)
+    return inflight.do(player_flight_key(url), scrape)
+
+
+def scrape_payload(url: str) -> dict:
+    """Dati del giocatore e formato database (oppure {"error": ...})"""
+    player_data = get_player_info(url)
+    if 'error' in player_data:
+        return player_data
+    
+    return {
+        'data': player_data,
+        'db_format': map_to_database_format(player_data)
+    }
+
+
+# Risultati degli scraping riusciti per giocatore (memoria + Redis opzionale,
+# stale-while-revalidate: vedi TM_RESULT_CACHE_*)
+results = ResultCache(namespace='api_scraper')
+
+
+def scrape_cached(url: str) -> Tuple[dict, str]:
+    """
+    scrape_payload passando dalla cache dei risultati
+    
+    Returns:
+        (payload, stato della cache: 'hit', 'stale' o 'miss')
+    """
+    return results.get_or_compute(player_flight_key(url), lambda: scrape_payload(url))
+
+
+def scrape_for_job(url: str) -> dict:
+    """Elabora un URL di un job batch (stesso formato di /api/scrape)"""
+    if 'transfermarkt' not in url.lower():
+        return {'error': 'URL non valido. Deve essere un link Transfermarkt'}
+    
+    payload, _ = scrape_cached(url)
+    return payload
+
+
+# Job batch elaborati in background (TM_JOB_WORKERS URL in parallelo)
+jobs = JobQueue(process=scrape_for_job)
 
 
 @app.route('/health', methods=['GET'])
@@ -30,6 +95,18 @@ def health_check():
     })
 
 
+@app.route('/api/stats', methods=['GET'])
+def stats():
+    """Statistiche dei pool di connessioni, del rate limiter, dei job, delle richieste fuse e della cache dei risultati"""
+    return jsonify({
+        'pools': registry.pool_stats(),
+        'rate_limits': get_rate_limiter().stats(),
+        'jobs': jobs.stats(),
+        'coalescing': inflight.stats(),
+        'results': results.stats()
+    })
+
+
 @app.route('/api/scrape', methods=['POST'])
 def scrape_player():
     """
@@ -68,26 +145,25 @@ def scrape_player():
         
         logger.info(f"Richiesta scraping per URL: {url}")
         
-        # Esegui scraping
-        player_data = scraper.get_player_info(url)
+        # Risultato in cache, oppure scraping (o attesa di quello già in corso dello stesso giocatore)
+        payload, cache_status = scrape_cached(url)
         
         # Verifica errori
-        if 'error' in player_data:
+        if 'error' in payload:
             return jsonify({
                 'success': False,
-                'error': player_data['error']
+                'error': payload['error']
             }), 500
         
-        # Mappa al formato database
-        db_format = map_to_database_format(player_data)
-        
-        logger.info(f"Scraping completato per: {player_data.get('name', 'Unknown')}")
+        logger.info(f"Scraping completato per: {payload['data'].get('name', 'Unknown')} (cache: {cache_status})")
         
-        return jsonify({
+        response = jsonify({
             'success': True,
-            'data': player_data,
-            'db_format': db_format
+            'data': payload['data'],
+            'db_format': payload['db_format']
         })
+        response.headers['X-Cache'] = cache_status.upper()
+        return response
         
     except Exception as e:
         logger.error(f"Errore durante scraping: {str(e)}")
@@ -122,23 +198,22 @@ def scrape_player_get():
         
         logger.info(f"Richiesta scraping GET per URL: {url}")
         
-        # Esegui scraping
-        player_data = scraper.get_player_info(url)
+        # Risultato in cache, oppure scraping (o attesa di quello già in corso dello stesso giocatore)
+        payload, cache_status = scrape_cached(url)
         
-        if 'error' in player_data:
+        if 'error' in payload:
             return jsonify({
                 'success': False,
-                'error': player_data['error']
+                'error': payload['error']
             }), 500
         
-        # Mappa al formato database
-        db_format = map_to_database_format(player_data)
-        
-        return jsonify({
+        response = jsonify({
             'success': True,
-            'data': player_data,
-            'db_format': db_format
+            'data': payload['data'],
+            'db_format': payload['db_format']
         })
+        response.headers['X-Cache'] = cache_status.upper()
+        return response
         
     except Exception as e:
         logger.error(f"Errore durante scraping: {str(e)}")
@@ -148,6 +223,100 @@ def scrape_player_get():
         }), 500
 
 
+@app.route('/api/scrape-batch', methods=['POST'])
+def scrape_batch():
+    """
+    Crea un job di scraping in background
+    
+    Body JSON:
+    {
+        "urls": ["https://www.transfermarkt.it/...", ...]
+    }
+    
+    Returns (202):
+    {
+        "success": true,
+        "job_id": "...",
+        "status_url": "/api/jobs/..."
+    }
+    """
+    try:
+        urls = parse_batch_urls(request.get_json(silent=True))
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    
+    job = jobs.submit(urls)
+    logger.info(f"Job {job.id} creato con {len(urls)} URL")
+    
+    return jsonify({
+        'success': True,
+        'job_id': job.id,
+        'total': len(urls),
+        'status_url': f'/api/jobs/{job.id}'
+    }), 202
+
+
+@app.route('/api/scrape-stream', methods=['POST'])
+def scrape_stream():
+    """
+    Scraping di più URL con risultati in streaming, appena pronti
+    
+    Body JSON:
+    {
+        "urls": ["https://www.transfermarkt.it/...", ...]
+    }
+    
+    Query params:
+    ?format=ndjson (default) oppure ?format=sse (anche con Accept: text/event-stream)
+    
+    Frame (uno per riga NDJSON o evento SSE):
+    {"type": "start", "job_id": "...", "total": 2}
+    {"type": "result", "index": 1, "url": "...", "status": "done", "data": {"data": {...}, "db_format": {...}}}
+    {"type": "result", "index": 0, "url": "...", "status": "failed", "error": "..."}
+    {"type": "summary", "job_id": "...", "total": 2, "done": 1, "failed": 1, "elapsed": 3.2}
+    """
+    try:
+        urls = parse_batch_urls(request.get_json(silent=True))
+        fmt = stream_format(request.args.get('format'), request.headers.get('Accept', ''))
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    
+    logger.info(f"Streaming di {len(urls)} URL ({fmt})")
+    return Response(
+        encode_stream(jobs.stream(urls), fmt),
+        mimetype=STREAM_FORMATS[fmt],
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def job_status(job_id):
+    """
+    Avanzamento di un job batch e risultati per URL ({"data", "db_format"} o "error")
+    
+    Query params:
+    ?results=0 per il solo avanzamento
+    """
+    job = jobs.get(job_id)
+    if job is None:
+        return jsonify({
+            'success': False,
+            'error': 'Job non trovato'
+        }), 404
+    
+    include_results = request.args.get('results', '1') != '0'
+    return jsonify({
+        'success': True,
+        'job': job.to_dict(include_results=include_results)
+    })
+
+
 if __name__ == '__main__':
     print("=" * 70)
     print("🚀 TRANSFERMARKT SCRAPER API")
@@ -157,8 +326,12 @@ if __name__ == '__main__':
     print()
     print("Endpoints disponibili:")
     print("  GET  /health              - Health check")
+    print("  GET  /api/stats           - Pool connessioni e rate limit")
     print("  POST /api/scrape          - Scrape player (JSON body)")
     print("  GET  /api/scrape-url      - Scrape player (query param)")
+    print("  POST /api/scrape-batch    - Job batch in background (JSON body con urls)")
+    print("  GET  /api/jobs/<id>       - Avanzamento e risultati del job")
+    print("  POST /api/scrape-stream   - Risultati in streaming (NDJSON o SSE)")
     print()
     print("Esempio richiesta POST:")
     print('  curl -X POST http://localhost:5001/api/scrape \\')
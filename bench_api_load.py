@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Load test: API Flask (un thread bloccato per richiesta) vs API ASGI (download asincroni)
+
+Senza argomenti il test gira in un solo processo, senza rete: Transfermarkt
+è simulato da un trasporto che risponde con le pagine di fixtures/ dopo
+`--latency` secondi. L'API Flask (scraper_api.py) viene servita da
+`--flask-threads` thread, come `gunicorn -w 1 --threads N`. L'API ASGI
+(scraper_asgi.py) gira in un unico event loop, come un worker uvicorn. Entrambe
+ricevono `--requests` richieste, con `--concurrency` richieste in volo.
+
+Con --target si misura invece un server già avviato, su URL reali (attenzione
+al rate limit di Transfermarkt: meglio con la cache delle pagine calda).
+
+Uso:
+    python bench_api_load.py                                # simulazione, latenza 0.5 s
+    python bench_api_load.py --latency 1.0 --requests 400 --concurrency 200
+    python bench_api_load.py --target http://localhost:5001 --requests 50 --concurrency 20
+"""
+
+import io
+import os
+import sys
+import time
+import asyncio
+import argparse
+import statistics
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+from requests import Response
+from requests.adapters import BaseAdapter
+
+from transfermarkt_domains import match_domain
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Pagine servite dal Transfermarkt simulato (edizione -> fixture)
+SIMULATED_PAGES = {
+    'transfermarkt.co.uk': 'transfermarkt_profile_en.html',
+    'transfermarkt.it': 'transfermarkt_profile_it.html',
+}
+
+SAMPLE_URLS = [
+    "https://www.transfermarkt.co.uk/filipe-relvas/profil/spieler/{id}",
+    "https://www.transfermarkt.it/filipe-relvas/profil/spieler/{id}",
+]
+
+
+def sample_urls(count: int):
+    """URL distinti (ID diversi: niente cache né richieste fuse)"""
+    return [SAMPLE_URLS[i % len(SAMPLE_URLS)].format(id=100000 + i) for i in range(count)]
+
+
+def load_pages():
+    pages = {}
+    for domain, name in SIMULATED_PAGES.items():
+        with open(os.path.join(ROOT, 'fixtures', name), 'rb') as f:
+            pages[domain] = f.read()
+    return pages
+
+
+def summarize(name: str, latencies, errors: int, elapsed: float) -> dict:
+    ordered = sorted(latencies)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] if ordered else 0.0
+    return {
+        'name': name,
+        'requests': len(latencies) + errors,
+        'errors': errors,
+        'elapsed': elapsed,
+        'throughput': (len(latencies) + errors) / elapsed if elapsed else 0.0,
+        'p50': statistics.median(ordered) if ordered else 0.0,
+        'p95': p95,
+    }
+
+
+def configure_simulation(pages, latency: float):
+    """Registro degli scraper senza cache né rate limit, traduzioni offline"""
+    # Le API configurano il proprio registro all'import: va sostituito dopo
+    import scraper_api
+    import scraper_asgi
+    from scraper_registry import configure_registry
+    from transfermarkt_rate_limiter import DomainRateLimiter
+
+    unlimited = DomainRateLimiter(rate=1e6, burst=1e6, max_rate=1e6)
+    registry = configure_registry(cache=None, rate_limiter=unlimited, partial_parse=True,
+                                  translation_backend='offline')
+    registry.session('multilang').mount('https://', SimulatedAdapter(pages, latency))
+    return registry
+
+
+def page_for(pages, url: str) -> bytes:
+    return pages.get(match_domain(url), pages['transfermarkt.co.uk'])
+
+
+class SimulatedAdapter(BaseAdapter):
+    """Transfermarkt simulato per requests: risponde dopo `latency` secondi (bloccando il thread)"""
+
+    def __init__(self, pages, latency: float):
+        super().__init__()
+        self.pages = pages
+        self.latency = latency
+
+    def send(self, request, **kwargs):
+        time.sleep(self.latency)
+        response = Response()
+        response.status_code = 200
+        response._content = page_for(self.pages, request.url)
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+class SimulatedTransport(httpx.AsyncBaseTransport):
+    """Transfermarkt simulato per httpx: l'attesa non blocca l'event loop"""
+
+    def __init__(self, pages, latency: float):
+        self.pages = pages
+        self.latency = latency
+
+    async def handle_async_request(self, request):
+        await asyncio.sleep(self.latency)
+        return httpx.Response(200, content=page_for(self.pages, str(request.url)), request=request)
+
+
+def run_flask(urls, threads: int) -> dict:
+    """Ogni richiesta occupa un thread del server per tutta la sua durata"""
+    import scraper_api
+
+    client = scraper_api.app.test_client()
+    latencies, errors = [], 0
+
+    def call(url):
+        started = time.perf_counter()
+        response = client.post('/api/scrape', json={'url': url})
+        return time.perf_counter() - started, response.status_code == 200
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        for seconds, ok in executor.map(call, urls):
+            if ok:
+                latencies.append(seconds)
+            else:
+                errors += 1
+    return summarize(f"Flask ({threads} thread)", latencies, errors, time.perf_counter() - started)
+
+
+async def run_asgi(urls, concurrency: int, transport) -> dict:
+    """Tutte le richieste in un solo event loop: i download in attesa non occupano thread"""
+    import scraper_asgi
+
+    app = scraper_asgi.create_app(max_connections=concurrency, transport=transport)
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies, errors = [], 0
+
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url='http://asgi',
+                                     timeout=None) as client:
+            async def call(url):
+                nonlocal errors
+                async with semaphore:
+                    started = time.perf_counter()
+                    response = await client.post('/api/scrape', json={'url': url})
+                    if response.status_code == 200:
+                        latencies.append(time.perf_counter() - started)
+                    else:
+                        errors += 1
+
+            started = time.perf_counter()
+            await asyncio.gather(*(call(url) for url in urls))
+            elapsed = time.perf_counter() - started
+    return summarize("ASGI (1 event loop)", latencies, errors, elapsed)
+
+
+async def run_target(target: str, urls, concurrency: int) -> dict:
+    """Carico HTTP reale su un server già avviato (Flask o ASGI)"""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies, errors = [], 0
+    limits = httpx.Limits(max_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=target, timeout=120, limits=limits) as client:
+        async def call(url):
+            nonlocal errors
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    response = await client.post('/api/scrape', json={'url': url})
+                    ok = response.status_code == 200
+                except httpx.HTTPError:
+                    ok = False
+                if ok:
+                    latencies.append(time.perf_counter() - started)
+                else:
+                    errors += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(call(url) for url in urls))
+        elapsed = time.perf_counter() - started
+    return summarize(target, latencies, errors, elapsed)
+
+
+def print_result(result: dict):
+    print(f"{result['name']:<28} {result['requests']:>6} req  {result['errors']:>4} err  "
+          f"{result['elapsed']:>7.2f} s  {result['throughput']:>8.1f} req/s  "
+          f"p50 {result['p50'] * 1000:>7.0f} ms  p95 {result['p95'] * 1000:>7.0f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test API Flask vs ASGI")
+    parser.add_argument('--requests', '-n', type=int, default=200, help="Richieste totali")
+    parser.add_argument('--concurrency', '-c', type=int, default=100, help="Richieste in volo")
+    parser.add_argument('--latency', type=float, default=0.5, help="Latenza simulata di Transfermarkt (s)")
+    parser.add_argument('--flask-threads', type=int, default=8, help="Thread del server Flask simulato")
+    parser.add_argument('--target', help="Base URL di un server già avviato (es: http://localhost:5001)")
+    parser.add_argument('urls', nargs='*', help="URL profilo per --target (ripetuti fino a --requests)")
+    args = parser.parse_args()
+
+    if args.target:
+        urls = args.urls or [url.format(id=363227) for url in SAMPLE_URLS]
+        urls = [urls[i % len(urls)] for i in range(args.requests)]
+        print_result(asyncio.run(run_target(args.target, urls, args.concurrency)))
+        return 0
+
+    pages = load_pages()
+    configure_simulation(pages, args.latency)
+    urls = sample_urls(args.requests)
+    print(f"Transfermarkt simulato: latenza {args.latency:.2f} s, {args.requests} richieste, "
+          f"{args.concurrency} in volo\n")
+
+    # I log per richiesta degli scraper non interessano qui
+    with contextlib.redirect_stdout(io.StringIO()):
+        flask_result = run_flask(urls, args.flask_threads)
+        asgi_result = asyncio.run(run_asgi(urls, args.concurrency, SimulatedTransport(pages, args.latency)))
+
+    print_result(flask_result)
+    print_result(asgi_result)
+    if flask_result['throughput']:
+        print(f"\nASGI / Flask: {asgi_result['throughput'] / flask_result['throughput']:.1f}x throughput")
+    return 1 if flask_result['errors'] or asgi_result['errors'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
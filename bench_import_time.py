@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark del tempo di import dei moduli scraper e delle API
+
+Ogni modulo viene importato in un interprete nuovo con `python -X importtime`:
+si misura il tempo cumulativo del modulo (mediana di più esecuzioni) e si
+controlla quali dipendenze pesanti (requests, bs4, lxml, deep_translator, ...)
+finiscono in sys.modules al solo import. I valori di riferimento sono in
+bench_import_time.json.
+
+Uso:
+    python bench_import_time.py [-n ESECUZIONI]
+    python bench_import_time.py --check     # esce con 1 se peggiora rispetto al riferimento
+    python bench_import_time.py --record    # aggiorna bench_import_time.json
+"""
+
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+BASELINE = os.path.join(ROOT, 'bench_import_time.json')
+
+MODULES = [
+    'transfermarkt_mapping',
+    'transfermarkt_scraper',
+    'transfermarkt_multilang_scraper',
+    'integrate_multilang_to_db',
+    'scraper_api',
+    'api_scraper',
+]
+
+# Dipendenze che devono caricarsi solo al primo uso
+HEAVY_MODULES = ('requests', 'urllib3', 'bs4', 'lxml', 'deep_translator', 'asyncio', 'sqlite3', 'httpx')
+
+
+def measure(module: str):
+    """Tempo cumulativo di import (µs) e dipendenze pesanti caricate, oppure None"""
+    code = f"import sys, {module}; print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                          cwd=ROOT, capture_output=True, text=True)
+    if proc.returncode != 0:
+        return None
+
+    cumulative = None
+    for line in proc.stderr.splitlines():
+        parts = line.split('|')
+        if len(parts) == 3 and parts[2].strip() == module:
+            cumulative = int(parts[1])
+    heavy = [m for m in proc.stdout.strip().split(',') if m]
+    return cumulative, heavy
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tempo di import dei moduli scraper")
+    parser.add_argument('-n', '--runs', type=int, default=5, help="Esecuzioni per modulo (mediana)")
+    parser.add_argument('--record', action='store_true', help="Salva i risultati come riferimento")
+    parser.add_argument('--check', action='store_true', help="Confronta con il riferimento")
+    parser.add_argument('--tolerance', type=float, default=0.5, help="Peggioramento ammesso in --check (0.5 = +50%%)")
+    args = parser.parse_args()
+
+    baseline = {}
+    if os.path.exists(BASELINE):
+        with open(BASELINE, encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    results = {}
+    failures = []
+    print(f"{'modulo':34s} {'ms':>8s} {'rif. ms':>8s}  dipendenze pesanti")
+    for module in MODULES:
+        runs = [measure(module) for _ in range(args.runs)]
+        if any(run is None for run in runs):
+            print(f"{module:34s} {'-':>8s} {'-':>8s}  ⚠️  non importabile in questo ambiente")
+            continue
+
+        cumulative = int(statistics.median(run[0] for run in runs))
+        heavy = sorted(set().union(*(run[1] for run in runs)))
+        results[module] = {'cumulative_us': cumulative, 'heavy_modules': heavy}
+
+        reference = baseline.get(module)
+        reference_ms = f"{reference['cumulative_us'] / 1000:8.1f}" if reference else f"{'-':>8s}"
+        print(f"{module:34s} {cumulative / 1000:8.1f} {reference_ms}  {', '.join(heavy) or '-'}")
+
+        if args.check and reference:
+            new_heavy = set(heavy) - set(reference['heavy_modules'])
+            if new_heavy:
+                failures.append(f"{module}: ora importa {', '.join(sorted(new_heavy))}")
+            if cumulative > reference['cumulative_us'] * (1 + args.tolerance):
+                failures.append(f"{module}: {cumulative / 1000:.1f} ms (riferimento {reference['cumulative_us'] / 1000:.1f} ms)")
+
+    if args.record:
+        with open(BASELINE, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+            f.write('\n')
+        print(f"💾 Riferimento salvato in: {BASELINE}")
+
+    for failure in failures:
+        print(f"❌ {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark del classificatore delle label della info-table
+
+Confronta, su tutte le label viste nelle sei edizioni linguistiche
+(fixtures/info_table_labels.json), la catena di any(keyword in label) con il
+classificatore compilato, a freddo (senza memoizzazione) e a caldo, e
+verifica che i risultati coincidano.
+
+Uso:
+    python bench_label_classifier.py [-n RIPETIZIONI]
+"""
+
+import os
+import sys
+import json
+import timeit
+import argparse
+
+from transfermarkt_labels import MULTILANG_LABELS, PROFILE_LABELS
+
+LABELS_FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'info_table_labels.json')
+
+
+def load_labels():
+    with open(LABELS_FIXTURE, encoding='utf-8') as f:
+        by_language = json.load(f)
+    return [label.lower() for labels in by_language.values() for label in labels]
+
+
+def bench(name, classifier, labels, runs):
+    mismatches = [l for l in labels if classifier.classify(l) != classifier.classify_linear(l)]
+    
+    linear = timeit.timeit(lambda: [classifier.classify_linear(l) for l in labels], number=runs)
+    
+    def cold():
+        for label in labels:
+            classifier._cache.clear()
+            classifier.classify(label)
+    compiled_cold = timeit.timeit(cold, number=runs)
+    
+    classifier._cache.clear()
+    compiled_warm = timeit.timeit(lambda: [classifier.classify(l) for l in labels], number=runs)
+    
+    per_label = 1e9 / (runs * len(labels))
+    print(f"{name:16s} {linear * per_label:10.0f} {compiled_cold * per_label:10.0f} {compiled_warm * per_label:10.0f}"
+          f" {linear / compiled_warm:8.1f}x{'' if not mismatches else f'  ⚠️  {len(mismatches)} differenze'}")
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark classificatore label")
+    parser.add_argument('-n', '--runs', type=int, default=2000)
+    args = parser.parse_args()
+    
+    labels = load_labels()
+    print(f"🏷️  {len(labels)} label, {args.runs} ripetizioni (ns per label)\n")
+    print(f"{'Classificatore':16s} {'any()':>10s} {'regex':>10s} {'memo':>10s} {'speedup':>9s}")
+    print("-" * 60)
+    
+    mismatches = []
+    mismatches += bench('PROFILE_LABELS', PROFILE_LABELS, labels, args.runs)
+    mismatches += bench('MULTILANG_LABELS', MULTILANG_LABELS, labels, args.runs)
+    
+    print("-" * 60)
+    if mismatches:
+        print(f"⚠️  Risultati diversi per: {mismatches}")
+        return 1
+    print("✅ Classificazione identica alla catena di any()")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark parsing completo vs parziale delle pagine profilo Transfermarkt
+
+Confronta, su pagine salvate in fixtures/, il tempo CPU e il picco di memoria
+di make_soup + parse_player_page con e senza SoupStrainer, e verifica che i
+dati estratti siano identici.
+
+Uso:
+    python bench_partial_parse.py                       # tutte le fixtures/*.html
+    python bench_partial_parse.py pagina1.html pagina2.html -n 50
+    python bench_partial_parse.py --save https://www.transfermarkt.it/filipe-relvas/profil/spieler/567497
+"""
+
+import os
+import sys
+import glob
+import time
+import argparse
+import tracemalloc
+
+from transfermarkt_domains import detect_language
+from transfermarkt_scraper import TransfermarktScraper
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+FIXTURE_URL = "https://www.transfermarkt.it/fixture/profil/spieler/0"
+
+
+def save_pages(urls):
+    """Scarica pagine profilo reali in fixtures/ per il benchmark"""
+    scraper = TransfermarktScraper()
+    for url in urls:
+        player_id = scraper.extract_player_id(url) or 'unknown'
+        response = scraper.session.get(url, timeout=15)
+        response.raise_for_status()
+        path = os.path.join(FIXTURES_DIR, f"transfermarkt_profile_{player_id}_{detect_language(url)}.html")
+        with open(path, 'wb') as f:
+            f.write(response.content)
+        print(f"💾 {url} -> {path} ({len(response.content) / 1024:.0f} KB)")
+
+
+def measure(scraper, html, runs):
+    """Restituisce (ms medi per pagina, picco memoria in KB, dati estratti)"""
+    data = scraper.parse_player_page(html, FIXTURE_URL, '0')
+    
+    start = time.process_time()
+    for _ in range(runs):
+        scraper.parse_player_page(html, FIXTURE_URL, '0')
+    cpu_ms = (time.process_time() - start) * 1000 / runs
+    
+    tracemalloc.start()
+    scraper.parse_player_page(html, FIXTURE_URL, '0')
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    data.pop('scraped_at', None)
+    return cpu_ms, peak / 1024, data
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark parsing completo vs parziale")
+    parser.add_argument('pages', nargs='*', help="File HTML (default: fixtures/*.html)")
+    parser.add_argument('-n', '--runs', type=int, default=20, help="Ripetizioni per pagina")
+    parser.add_argument('--save', nargs='+', metavar='URL', help="Salva pagine profilo in fixtures/ e termina")
+    args = parser.parse_args()
+    
+    if args.save:
+        save_pages(args.save)
+        return 0
+    
+    pages = args.pages or sorted(glob.glob(os.path.join(FIXTURES_DIR, '*.html')))
+    if not pages:
+        print("❌ Nessuna pagina: usa --save URL per salvarne una")
+        return 1
+    
+    full = TransfermarktScraper(partial_parse=False)
+    partial = TransfermarktScraper(partial_parse=True)
+    mismatches = 0
+    
+    print(f"{'Pagina':40s} {'KB':>6s} {'full ms':>9s} {'part ms':>9s} {'CPU':>6s} {'full KB':>9s} {'part KB':>9s} {'mem':>6s}")
+    print("-" * 100)
+    
+    for path in pages:
+        with open(path, 'rb') as f:
+            html = f.read()
+        
+        # Silenzia i print dello scraper durante le misure
+        stdout, sys.stdout = sys.stdout, open(os.devnull, 'w')
+        try:
+            full_ms, full_kb, full_data = measure(full, html, args.runs)
+            part_ms, part_kb, part_data = measure(partial, html, args.runs)
+        finally:
+            sys.stdout.close()
+            sys.stdout = stdout
+        
+        same = full_data == part_data
+        mismatches += not same
+        print(f"{os.path.basename(path)[:40]:40s} {len(html) / 1024:6.0f} {full_ms:9.2f} {part_ms:9.2f} "
+              f"{full_ms / part_ms:5.1f}x {full_kb:9.0f} {part_kb:9.0f} {full_kb / part_kb:5.1f}x"
+              f"{'' if same else '  ⚠️  dati diversi'}")
+    
+    print("-" * 100)
+    print("✅ Dati estratti identici in entrambe le modalità" if not mismatches
+          else f"⚠️  {mismatches} pagine con dati diversi")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark della normalizzazione delle posizioni
+
+Su tutto il vocabolario multilingua delle posizioni (chiavi di
+ROLE_ABBREVIATIONS, POSITION_TRANSLATIONS dello scraper multilingua e le
+stesse con ogni prefisso di reparto) confronta l'implementazione storica
+(replace in sequenza, mappa ricostruita, catena di any) con il normalizzatore
+compilato, a freddo (senza memoizzazione), a caldo e in batch, e verifica
+che i risultati coincidano.
+
+Uso:
+    python bench_position_normalizer.py [-n RIPETIZIONI]
+"""
+
+import sys
+import timeit
+import argparse
+
+from transfermarkt_positions import POSITION_PREFIXES, ROLE_ABBREVIATIONS, PositionNormalizer
+
+
+def load_positions():
+    from transfermarkt_multilang_scraper import MultiLangTransfermarktScraper
+    
+    translations = MultiLangTransfermarktScraper.POSITION_TRANSLATIONS
+    base = list(dict.fromkeys([*ROLE_ABBREVIATIONS, *translations, *translations.values()]))
+    return base + [prefix + position for prefix in POSITION_PREFIXES for position in base]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark normalizzazione posizioni")
+    parser.add_argument('-n', '--runs', type=int, default=50)
+    args = parser.parse_args()
+    
+    positions = load_positions()
+    normalizer = PositionNormalizer()
+    print(f"🧭 {len(positions)} posizioni, {args.runs} ripetizioni (ns per posizione, ruolo + abbreviazione)\n")
+    
+    mismatches = [p for p in positions
+                  if normalizer.normalize(p) != (normalizer.role_linear(p), normalizer.abbreviation_linear(p))]
+    
+    def linear():
+        for position in positions:
+            normalizer.role_linear(position)
+            normalizer.abbreviation_linear(position)
+    
+    def cold():
+        for position in positions:
+            normalizer.cache_clear()
+            normalizer.normalize(position)
+    
+    timings = {'storica': timeit.timeit(linear, number=args.runs)}
+    timings['compilata'] = timeit.timeit(cold, number=args.runs)
+    normalizer.cache_clear()
+    timings['memo'] = timeit.timeit(lambda: [normalizer.normalize(p) for p in positions], number=args.runs)
+    timings['batch'] = timeit.timeit(lambda: normalizer.normalize_batch(positions), number=args.runs)
+    
+    per_position = 1e9 / (args.runs * len(positions))
+    print(f"{'Implementazione':16s} {'ns':>10s} {'speedup':>9s}")
+    print("-" * 37)
+    for name, seconds in timings.items():
+        print(f"{name:16s} {seconds * per_position:10.0f} {timings['storica'] / seconds:8.1f}x")
+    print("-" * 37)
+    
+    if mismatches:
+        print(f"⚠️  Risultati diversi per: {mismatches}")
+        return 1
+    print("✅ Risultati identici all'implementazione storica")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
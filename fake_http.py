@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Risposte e sessioni HTTP finte per i test (nessuna richiesta verso Transfermarkt)
+
+Uso:
+    from fake_http import FakeAsyncClient, FakeResponse, FakeSession, etag_session
+
+    session = FakeSession(html, failing_ids={'3'}, delay=0.05)     # pagina fissa, 404 per ID
+    session = FakeSession(statuses=[(429, {'Retry-After': '1'}), (200, {})])
+    session = etag_session()                                       # 304 se l'ETag coincide
+"""
+
+import time
+import threading
+
+import requests
+
+PAGE_V1 = b'<html>v1</html>'
+ETAG_V1 = '"v1"'
+LAST_MODIFIED = 'Mon, 01 Jan 2024 00:00:00 GMT'
+
+
+class FakeResponse:
+    def __init__(self, content: bytes = b'', status_code: int = 200, headers=None):
+        self.content = content
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error", response=self)
+
+
+class FakeSession(requests.Session):
+    """
+    Sessione finta con risposte configurabili
+
+    Registra per ogni richiesta gli header inviati (calls), l'istante
+    (call_times) e la concorrenza massima (max_active).
+    """
+
+    def __init__(self, html: bytes = PAGE_V1, failing_ids=(), etag=None, last_modified=None,
+                 statuses=None, delay: float = 0.0):
+        """
+        Args:
+            html: Pagina restituita per ogni URL
+            failing_ids: ID giocatore (ultimo segmento dell'URL) che rispondono 404
+            etag: ETag della pagina; con If-None-Match uguale la risposta è 304
+            last_modified: Header Last-Modified della pagina
+            statuses: Risposte (status, header) restituite in ordine prima della pagina
+            delay: Attesa per richiesta (per misurare la concorrenza)
+        """
+        super().__init__()
+        self.html = html
+        self.failing_ids = set(failing_ids)
+        self.etag = etag
+        self.last_modified = last_modified
+        self.statuses = list(statuses or [])
+        self.delay = delay
+        self.calls = []
+        self.call_times = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def get(self, url, headers=None, **kwargs):
+        with self.lock:
+            self.calls.append(dict(headers or {}))
+            self.call_times.append(time.monotonic())
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            scripted = self.statuses.pop(0) if self.statuses else None
+        try:
+            if self.delay:
+                time.sleep(self.delay)
+            if scripted is not None:
+                status, response_headers = scripted
+                return FakeResponse(status_code=status, headers=response_headers)
+            if url.rstrip('/').split('/')[-1] in self.failing_ids:
+                return FakeResponse(status_code=404)
+            if self.etag and headers and headers.get('If-None-Match') == self.etag:
+                return FakeResponse(status_code=304)
+            return FakeResponse(self.html, headers=self._page_headers())
+        finally:
+            with self.lock:
+                self.active -= 1
+
+    def _page_headers(self):
+        headers = {}
+        if self.etag:
+            headers['ETag'] = self.etag
+        if self.last_modified:
+            headers['Last-Modified'] = self.last_modified
+        return headers
+
+
+class FakeAsyncClient:
+    """Come FakeSession, con get asincrono (al posto di httpx.AsyncClient)"""
+
+    def __init__(self, session: FakeSession):
+        self.session = session
+
+    async def get(self, url, **kwargs):
+        return self.session.get(url, **kwargs)
+
+
+def etag_session() -> FakeSession:
+    """Pagina v1 con ETag e Last-Modified: le GET condizionali ricevono 304"""
+    return FakeSession(PAGE_V1, etag=ETAG_V1, last_modified=LAST_MODIFIED)
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Genera transfermarkt_vocabulary_data.py (paesi e piede nelle sei lingue dei siti)
+
+Sorgenti:
+    - tabella ISO 3166-1 e cataloghi gettext del pacchetto iso-codes
+      (Debian/Ubuntu: apt install iso-codes; macOS: brew install iso-codes)
+    - nomi in uso su Transfermarkt che non sono nomi ISO (nazioni britanniche,
+      Kosovo, "Korea, South", ...) e correzioni al nome inglese canonico,
+      definiti qui sotto
+
+Il modulo generato contiene solo letterali: si importa senza dipendenze e
+senza leggere file. Va rigenerato quando cambiano le tabelle di questo script.
+
+Uso:
+    python generate_vocabulary.py [--iso-codes /usr/share/iso-codes/json] [--locale-dir /usr/share/locale]
+"""
+
+import os
+import sys
+import json
+import gettext
+import argparse
+import unicodedata
+from typing import Dict, List
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+OUTPUT = os.path.join(ROOT, 'transfermarkt_vocabulary_data.py')
+
+# Lingue dei siti Transfermarkt -> cataloghi gettext (il primo dà il nome mostrato)
+LANGUAGES = {
+    'it': ['it'],
+    'en': [],
+    'es': ['es'],
+    'de': ['de'],
+    'fr': ['fr'],
+    'pt': ['pt', 'pt_BR'],
+}
+
+# Nome inglese canonico quando diverso dal nome comune ISO (allineato ai valori storici del database)
+CANONICAL_NAMES = {
+    'BN': 'Brunei',
+    'BO': 'Bolivia',
+    'CD': 'DR Congo',
+    'CI': 'Ivory Coast',
+    'CV': 'Cape Verde',
+    'CW': 'Curacao',
+    'CZ': 'Czech Republic',
+    'FM': 'Micronesia',
+    'GB': 'United Kingdom',
+    'IR': 'Iran',
+    'KP': 'North Korea',
+    'KR': 'South Korea',
+    'LA': 'Laos',
+    'MD': 'Moldova',
+    'MK': 'North Macedonia',
+    'NL': 'Netherlands',
+    'PS': 'Palestine',
+    'RU': 'Russia',
+    'SY': 'Syria',
+    'TR': 'Turkey',
+    'TW': 'Taiwan',
+    'TZ': 'Tanzania',
+    'VA': 'Vatican City',
+    'VE': 'Venezuela',
+    'VN': 'Vietnam',
+}
+
+# Nomi mostrati mancanti nei cataloghi (es. dopo il cambio Turkey -> Türkiye)
+DISPLAY_NAMES = {
+    'TR': {'it': 'Turchia', 'es': 'Turquía', 'fr': 'Turquie', 'de': 'Türkei', 'pt': 'Turquia'},
+    'VA': {'it': 'Città del Vaticano', 'es': 'Ciudad del Vaticano', 'de': 'Vatikanstadt', 'fr': 'Vatican', 'pt': 'Vaticano'},
+}
+
+# Nazionali senza codice ISO 3166-1: codice -> nome per lingua
+EXTRA_COUNTRIES = {
+    'GB-ENG': {'en': 'England', 'it': 'Inghilterra', 'es': 'Inglaterra', 'de': 'England', 'fr': 'Angleterre', 'pt': 'Inglaterra'},
+    'GB-SCT': {'en': 'Scotland', 'it': 'Scozia', 'es': 'Escocia', 'de': 'Schottland', 'fr': 'Écosse', 'pt': 'Escócia'},
+    'GB-WLS': {'en': 'Wales', 'it': 'Galles', 'es': 'Gales', 'de': 'Wales', 'fr': 'Pays de Galles', 'pt': 'País de Gales'},
+    'GB-NIR': {'en': 'Northern Ireland', 'it': 'Irlanda del Nord', 'es': 'Irlanda del Norte', 'de': 'Nordirland', 'fr': 'Irlande du Nord', 'pt': 'Irlanda do Norte'},
+    'XK': {'en': 'Kosovo', 'it': 'Kosovo', 'es': 'Kosovo', 'de': 'Kosovo', 'fr': 'Kosovo', 'pt': 'Kosovo'},
+}
+
+# Altri nomi visti sui siti o nei fogli Excel (minuscolo) -> codice
+EXTRA_ALIASES = {
+    'olanda': 'NL', 'holanda': 'NL', 'paesi bassi': 'NL', 'países bajos': 'NL', 'países baixos': 'NL',
+    'repubblica ceca': 'CZ', 'república checa': 'CZ', 'república tcheca': 'CZ', 'république tchèque': 'CZ', 'czech republic': 'CZ',
+    'turchia': 'TR', 'turquía': 'TR', 'turquie': 'TR', 'türkei': 'TR', 'turkey': 'TR',
+    'russia': 'RU', 'rusia': 'RU', 'russie': 'RU', 'russland': 'RU', 'rússia': 'RU',
+    'corea del sud': 'KR', 'corea del sur': 'KR', 'corée du sud': 'KR', 'südkorea': 'KR', 'coreia do sul': 'KR', 'korea, south': 'KR',
+    'corea del nord': 'KP', 'corea del norte': 'KP', 'corée du nord': 'KP', 'nordkorea': 'KP', 'coreia do norte': 'KP', 'korea, north': 'KP',
+    'costa de marfil': 'CI', 'elfenbeinküste': 'CI', "cote d'ivoire": 'CI', 'ivory coast': 'CI',
+    'bosnia-herzegovina': 'BA', 'bosnia ed erzegovina': 'BA', 'bosnia y herzegovina': 'BA', 'bosnie-herzégovine': 'BA',
+    'bosnien und herzegowina': 'BA', 'bósnia e herzegovina': 'BA',
+    'dr congo': 'CD', 'congo dr': 'CD', 'rd congo': 'CD', 'rd del congo': 'CD', 'rdc': 'CD',
+    'capo verde': 'CV', 'cabo verde': 'CV', 'cap-vert': 'CV', 'kap verde': 'CV', 'cape verde': 'CV',
+    'stati uniti': 'US', 'usa': 'US', 'united states of america': 'US',
+    'polônia': 'PL', 'romênia': 'RO', 'roménia': 'RO', 'eslovênia': 'SI', 'eslovénia': 'SI',
+    'chéquia': 'CZ', 'egito': 'EG', 'gana': 'GH', 'nigéria': 'NG',
+    'macedonia del nord': 'MK', 'macedonia': 'MK', 'nordmazedonien': 'MK', 'macédoine du nord': 'MK',
+    'macedonia del norte': 'MK', 'macedônia do norte': 'MK', 'north macedonia': 'MK',
+    'túnez': 'TN', 'tunísia': 'TN',
+    'chinese taipei': 'TW', 'curacao': 'CW', 'curaçao': 'CW', 'the gambia': 'GM', 'vietnam': 'VN',
+    'sudafrica': 'ZA', 'sudáfrica': 'ZA', 'südafrika': 'ZA', 'afrique du sud': 'ZA', 'áfrica do sul': 'ZA',
+    'gran bretagna': 'GB', 'great britain': 'GB', 'regno unito': 'GB',
+}
+
+# Piede preferito: valore canonico -> forme nelle sei lingue
+FOOT_VOCABULARY = {
+    'Right': ['right', 'destro', 'derecho', 'diestro', 'rechts', 'droit', 'direito', 'destro (naturale)'],
+    'Left': ['left', 'sinistro', 'izquierdo', 'zurdo', 'links', 'gauche', 'esquerdo', 'canhoto', 'mancino'],
+    'Both': ['both', 'entrambi', 'ambidestro', 'ambos', 'ambidiestro', 'beidfüßig', 'beidfüssig',
+             'les deux', 'ambidextre', 'ambidestro', 'ambidextrous'],
+}
+
+
+def normalize(text: str) -> str:
+    """Forma delle chiavi: minuscolo e spazi compattati (come transfermarkt_vocabulary.normalize_key)"""
+    return ' '.join(text.lower().split())
+
+
+def fold(text: str) -> str:
+    """Chiave senza accenti ('türkiye' -> 'turkiye')"""
+    return ''.join(c for c in unicodedata.normalize('NFKD', text) if not unicodedata.combining(c))
+
+
+def uncomma(name: str) -> str:
+    """'Corea, Repubblica di' -> 'Repubblica di Corea' (forma con la virgola tipica di ISO)"""
+    head, sep, tail = name.partition(', ')
+    return f'{tail} {head}' if sep else name
+
+
+def translate(catalog, msgid: str):
+    """Traduzione del catalogo oppure None (gettext restituirebbe il testo originale)"""
+    return getattr(catalog, '_catalog', {}).get(msgid)
+
+
+def load_catalogs(locale_dir: str) -> Dict[str, list]:
+    catalogs = {}
+    for language, names in LANGUAGES.items():
+        catalogs[language] = [gettext.translation('iso_3166-1', locale_dir, languages=[name], fallback=True)
+                              for name in names]
+    return catalogs
+
+
+def build(iso_dir: str, locale_dir: str):
+    with open(os.path.join(iso_dir, 'iso_3166-1.json'), encoding='utf-8') as f:
+        entries = json.load(f)['3166-1']
+    catalogs = load_catalogs(locale_dir)
+
+    countries: Dict[str, Dict[str, str]] = {}
+    aliases: Dict[str, List[str]] = {}   # chiave -> codici candidati, in ordine di priorità
+
+    def add_alias(name: str, code: str):
+        key = normalize(name)
+        if key and code not in aliases.setdefault(key, []):
+            aliases[key].append(code)
+
+    for entry in sorted(entries, key=lambda e: e['alpha_2']):
+        code = entry['alpha_2']
+        english = CANONICAL_NAMES.get(code) or entry.get('common_name') or entry['name']
+        iso_names = [n for n in (english, entry.get('common_name'), entry['name']) if n]
+
+        names = dict(DISPLAY_NAMES.get(code, {}), en=english)
+        for name in iso_names + [entry.get('official_name', '')]:
+            add_alias(name, code)
+            add_alias(uncomma(name), code)
+        # Il nome ufficiale ("Repubblica islamica di ...") si traduce male: solo in inglese
+        for language, translations in catalogs.items():
+            for catalog in translations:
+                for name in iso_names:
+                    translated = translate(catalog, name)
+                    if translated:
+                        names.setdefault(language, uncomma(translated))
+                        add_alias(translated, code)
+                        add_alias(uncomma(translated), code)
+            names.setdefault(language, english)
+        countries[code] = names
+
+    for code, names in EXTRA_COUNTRIES.items():
+        countries[code] = dict(names)
+        for name in names.values():
+            add_alias(name, code)
+    for alias, code in EXTRA_ALIASES.items():
+        # Gli alias manuali hanno priorità su quelli derivati
+        key = normalize(alias)
+        aliases[key] = [code] + [c for c in aliases.get(key, []) if c != code]
+
+    resolved = {key: codes[0] for key, codes in aliases.items()}
+    conflicts = {key: codes for key, codes in aliases.items() if len(codes) > 1 and key not in EXTRA_ALIASES}
+
+    # Chiavi senza accenti: solo se non ambigue e non già presenti
+    folded: Dict[str, set] = {}
+    for key, code in resolved.items():
+        folded.setdefault(fold(key), set()).add(code)
+    for key, codes in folded.items():
+        if key not in resolved and len(codes) == 1:
+            resolved[key] = next(iter(codes))
+
+    feet = {}
+    for value, forms in FOOT_VOCABULARY.items():
+        for form in forms:
+            feet.setdefault(normalize(form), value)
+            feet.setdefault(fold(normalize(form)), value)
+
+    return countries, resolved, feet, conflicts
+
+
+def render(countries, aliases, feet) -> str:
+    lines = [
+        '# Generato da generate_vocabulary.py: non modificare a mano',
+        '"""Tabelle di paesi (ISO 3166-1 + nazionali britanniche e Kosovo) e piede preferito"""',
+        '',
+        '# Codice -> nome per lingua del sito (en = nome canonico del database)',
+        'COUNTRIES = {',
+    ]
+    for code, names in countries.items():
+        ordered = {language: names[language] for language in LANGUAGES}
+        lines.append(f'    {code!r}: {ordered!r},')
+    lines += ['}', '', '# Nome in qualsiasi lingua (minuscolo, anche senza accenti) -> codice', 'COUNTRY_ALIASES = {']
+    for key in sorted(aliases):
+        lines.append(f'    {key!r}: {aliases[key]!r},')
+    lines += ['}', '', '# Piede preferito in qualsiasi lingua (minuscolo) -> valore canonico', 'FOOT_ALIASES = {']
+    for key in sorted(feet):
+        lines.append(f'    {key!r}: {feet[key]!r},')
+    lines += ['}', '']
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Genera transfermarkt_vocabulary_data.py")
+    parser.add_argument('--iso-codes', default='/usr/share/iso-codes/json', help="Directory dei JSON di iso-codes")
+    parser.add_argument('--locale-dir', default='/usr/share/locale', help="Directory dei cataloghi gettext")
+    parser.add_argument('-o', '--output', default=OUTPUT)
+    args = parser.parse_args()
+
+    if not os.path.exists(os.path.join(args.iso_codes, 'iso_3166-1.json')):
+        print(f"❌ iso_3166-1.json non trovato in {args.iso_codes} (installa il pacchetto iso-codes)")
+        return 1
+
+    countries, aliases, feet, conflicts = build(args.iso_codes, args.locale_dir)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        f.write(render(countries, aliases, feet))
+
+    print(f"✅ {len(countries)} paesi, {len(aliases)} alias, {len(feet)} forme del piede -> {args.output}")
+    for key, codes in sorted(conflicts.items()):
+        print(f"   ⚠️  '{key}' ambiguo: {', '.join(codes)} (vince {codes[0]})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
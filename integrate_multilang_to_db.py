@@ -4,7 +4,8 @@ Integrazione Scraper Multilingua con Database
 Estrae dati da Transfermarkt (qualsiasi lingua) e salva in formato database inglese
 """
 
-from transfermarkt_multilang_scraper import MultiLangTransfermarktScraper
+from scraper_registry import get_registry
+from transfermarkt_positions import TokenIndexMatcher
 
 # Mapping ruoli inglesi -> abbreviazioni database
 POSITION_TO_ABBREVIATION = {
@@ -57,22 +58,37 @@ POSITION_TO_GENERAL_ROLE = {
 }
 
 
+# Abbreviazione di ripiego per ruolo generale (ruoli senza corrispondenza nel vocabolario)
+GENERAL_ROLE_TO_ABBREVIATION = {
+    'Portiere': 'POR',
+    'Difensore': 'DC',
+    'Centrocampista': 'CC',
+    'Attaccante': 'ATT',
+}
+
+# Indici fuzzy dei due vocabolari (token -> ruoli), costruiti una volta
+ABBREVIATION_MATCHER = TokenIndexMatcher(POSITION_TO_ABBREVIATION, name='abbreviations')
+GENERAL_ROLE_MATCHER = TokenIndexMatcher(POSITION_TO_GENERAL_ROLE, name='general_roles')
+
+
 def map_position_to_abbreviation(position_english: str) -> str:
     """Converte ruolo inglese in abbreviazione database"""
     if not position_english:
         return None
     
-    # Cerca match esatto
-    if position_english in POSITION_TO_ABBREVIATION:
-        return POSITION_TO_ABBREVIATION[position_english]
+    # Match esatto o miglior match per token (vedi TokenIndexMatcher)
+    match = ABBREVIATION_MATCHER.lookup(position_english)
+    if match:
+        return match.value
     
-    # Cerca match parziale
-    for key, abbr in POSITION_TO_ABBREVIATION.items():
-        if key.lower() in position_english.lower() or position_english.lower() in key.lower():
-            return abbr
+    # Corrispondenza parziale per token contenuti ("Striker" -> "Second Striker");
+    # l'input resta registrato tra i non riconosciuti
+    match = ABBREVIATION_MATCHER.partial_match(position_english)
+    if match:
+        return match.value
     
-    # Fallback: prime 3 lettere
-    return position_english[:3].upper()
+    # Fallback: abbreviazione del ruolo generale, None se sconosciuto
+    return GENERAL_ROLE_TO_ABBREVIATION.get(map_position_to_general_role(position_english))
 
 
 def map_position_to_general_role(position_english: str) -> str:
@@ -80,14 +96,10 @@ def map_position_to_general_role(position_english: str) -> str:
     if not position_english:
         return None
     
-    # Cerca match esatto
-    if position_english in POSITION_TO_GENERAL_ROLE:
-        return POSITION_TO_GENERAL_ROLE[position_english]
-    
-    # Cerca match parziale
-    for key, role in POSITION_TO_GENERAL_ROLE.items():
-        if key.lower() in position_english.lower():
-            return role
+    # Match esatto o miglior match per token
+    match = GENERAL_ROLE_MATCHER.lookup(position_english)
+    if match:
+        return match.value
     
     # Fallback
     if 'back' in position_english.lower() or 'defender' in position_english.lower():
@@ -102,23 +114,57 @@ def map_position_to_general_role(position_english: str) -> str:
     return 'Sconosciuto'
 
 
+def unmatched_positions() -> dict:
+    """Ruoli senza corrispondenza nei vocabolari (input -> occorrenze), da aggiungere alle mappe"""
+    return {
+        'abbreviations': ABBREVIATION_MATCHER.stats()['unmatched'],
+        'general_roles': GENERAL_ROLE_MATCHER.stats()['unmatched'],
+    }
+
+
 def extract_and_map_to_database(url: str) -> dict:
     """
     Estrae dati da Transfermarkt (qualsiasi lingua) e mappa al formato database
     
+    Usa uno scraper di lunga durata preso dal registro del processo
+    (sessione HTTP, pool di connessioni e traduttore riusati tra le chiamate).
+    
     Args:
         url: URL Transfermarkt in qualsiasi lingua
         
     Returns:
         Dizionario pronto per inserimento in database
     """
-    scraper = MultiLangTransfermarktScraper()
-    
     print(f"🔗 URL: {url}")
     
     # Estrai dati (tradotti in inglese)
-    raw_data = scraper.get_player_info(url)
+    with get_registry().scraper('multilang') as scraper:
+        raw_data = scraper.get_player_info(url)
+    
+    return map_raw_to_database(raw_data)
+
+
+async def extract_and_map_to_database_async(url: str, client) -> dict:
+    """
+    Come extract_and_map_to_database, con download non bloccante
+    
+    Ogni coroutine prende in prestito il proprio scraper dal registro per
+    tutta la durata della richiesta.
+    
+    Args:
+        url: URL Transfermarkt in qualsiasi lingua
+        client: httpx.AsyncClient condiviso (vedi scraper_registry.build_async_client)
+    """
+    print(f"🔗 URL: {url}")
+    
+    with get_registry().scraper('multilang') as scraper:
+        raw_data = await scraper.get_player_info_async(url, client)
     
+    return map_raw_to_database(raw_data)
+
+
+def map_raw_to_database(raw_data: dict) -> dict:
+    """Mappa i dati dello scraper multilingua al formato database (None se contengono un errore)"""
     if 'error' in raw_data:
         print(f"❌ Error: {raw_data['error']}")
         return None
@@ -214,6 +260,13 @@ def main():
             else:
                 print(f"   ⚠️  Valori diversi\n")
     
+    unmatched = unmatched_positions()
+    if any(unmatched.values()):
+        print("\n⚠️  RUOLI NON NEL VOCABOLARIO (da aggiungere a POSITION_TO_ABBREVIATION / POSITION_TO_GENERAL_ROLE):")
+        for vocabulary, positions in unmatched.items():
+            for position, count in positions.items():
+                print(f"   {vocabulary}: {position!r} x{count}")
+    
     print("\n" + "✅" * 50)
     print("TEST COMPLETATO!")
     print("✅" * 50)
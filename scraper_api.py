@@ -4,7 +4,10 @@ Transfermarkt Scraper API Server
 API REST per lo scraper multilingua Transfermarkt
 
 Endpoint:
-    POST /api/scrape - Estrae dati da URL Transfermarkt
+    POST /api/scrape        - Estrae dati da URL Transfermarkt
+    POST /api/scrape-batch  - Crea un job in background con molti URL
+    GET  /api/jobs/<id>     - Avanzamento e risultati del job
+    POST /api/scrape-stream - Molti URL, ogni risultato in streaming appena pronto
 
 Uso:
     python3 scraper_api.py
@@ -17,21 +20,85 @@ Uso:
     })
 """
 
-from flask import Flask, request, jsonify
+import os
+from typing import Optional, Tuple
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
-from transfermarkt_multilang_scraper import MultiLangTransfermarktScraper
+from transfermarkt_cache import DiskHTMLCache
+from transfermarkt_domains import SUPPORTED_LANGUAGES, clean_url
+from transfermarkt_rate_limiter import get_rate_limiter
+from transfermarkt_translation_cache import get_translation_cache
+from transfermarkt_hedging import get_hedged_fetcher
+from transfermarkt_translation_backends import get_translator_pool
+from scraper_registry import configure_registry
+from transfermarkt_job_queue import STREAM_FORMATS, JobQueue, encode_stream, parse_batch_urls, stream_format
+from transfermarkt_singleflight import SingleFlight, player_flight_key
+from transfermarkt_result_cache import ResultCache
 from integrate_multilang_to_db import (
     extract_and_map_to_database,
     map_position_to_abbreviation,
-    map_position_to_general_role
+    map_position_to_general_role,
+    unmatched_positions
 )
 import traceback
 
 app = Flask(__name__)
 CORS(app)  # Abilita CORS per React
 
-# Inizializza scraper globale
-scraper = MultiLangTransfermarktScraper()
+# Cache su disco delle pagine profilo (riusata tra le richieste e i riavvii)
+html_cache = DiskHTMLCache(
+    cache_dir=os.environ.get('TM_CACHE_DIR', '.tm_cache'),
+    ttl=float(os.environ.get('TM_CACHE_TTL', 6 * 3600))
+)
+
+def env_flag(name: str) -> bool:
+    return os.environ.get(name, '0').lower() in ('1', 'true', 'yes')
+
+
+# Registro globale degli scraper: istanze e connessioni riusate tra le richieste
+# TM_CANONICAL_EDITION=1: i profili vengono letti dall'edizione inglese, senza traduzioni
+# TM_HEDGE=1: se l'edizione richiesta è lenta si interroga anche un mirror
+registry = configure_registry(
+    cache=html_cache,
+    partial_parse=True,
+    kind_options={'multilang': {
+        'canonical_edition': env_flag('TM_CANONICAL_EDITION'),
+        'hedge': env_flag('TM_HEDGE'),
+    }}
+)
+
+
+# Richieste contemporanee per lo stesso giocatore: un solo scraping condiviso
+inflight = SingleFlight()
+
+
+# Risultati degli scraping riusciti per giocatore (memoria + Redis opzionale,
+# stale-while-revalidate: vedi TM_RESULT_CACHE_*)
+results = ResultCache(namespace='scraper_api')
+
+
+def scrape_url(url: str) -> Tuple[Optional[dict], str]:
+    """
+    extract_and_map_to_database passando dalla cache dei risultati; in caso di
+    miss lo scraping è fuso con quelli in corso dello stesso giocatore
+    
+    Returns:
+        (dati per il database o None, stato della cache: 'hit', 'stale' o 'miss')
+    """
+    key = player_flight_key(url)
+    return results.get_or_compute(key, lambda: inflight.do(key, lambda: extract_and_map_to_database(url)))
+
+
+def scrape_for_job(url: str) -> dict:
+    """Elabora un URL di un job batch (stesso formato di /api/scrape)"""
+    db_data, _ = scrape_url(clean_url(url))
+    if not db_data:
+        return {'error': 'Unable to extract data from provided URL'}
+    return db_data
+
+
+# Job batch elaborati in background (TM_JOB_WORKERS URL in parallelo)
+jobs = JobQueue(process=scrape_for_job)
 
 
 @app.route('/api/scrape', methods=['POST', 'OPTIONS'])
@@ -68,18 +135,14 @@ def scrape_player():
                 'error': 'URL missing in request body'
             }), 400
         
-        url = data['url']
-        
-        # Rimuovi parametri extra come /fromCaptcha/1
-        if '/fromCaptcha' in url or '/fromCatpcha' in url:
-            url = url.split('/fromC')[0]
+        url = clean_url(data['url'])
         
         print(f"\n{'='*80}")
         print(f"📥 Richiesta scraping da: {url}")
         print(f"{'='*80}\n")
         
-        # Estrai e mappa dati
-        db_data = extract_and_map_to_database(url)
+        # Risultato in cache, oppure estrai e mappa dati (o attendi lo scraping già in corso)
+        db_data, cache_status = scrape_url(url)
         
         if not db_data:
             return jsonify({
@@ -87,16 +150,18 @@ def scrape_player():
                 'error': 'Unable to extract data from provided URL'
             }), 400
         
-        print(f"\n✅ Data extracted successfully!")
+        print(f"\n✅ Data extracted successfully! (cache: {cache_status})")
         print(f"   Name: {db_data.get('name')}")
         print(f"   Position: {db_data.get('specific_position')}\n")
         
         # Restituisci dati
-        return jsonify({
+        response = jsonify({
             'success': True,
             'data': db_data,
             'message': f"Data successfully extracted for {db_data.get('name')}"
-        }), 200
+        })
+        response.headers['X-Cache'] = cache_status.upper()
+        return response, 200
         
     except Exception as e:
         print(f"\n❌ ERRORE durante lo scraping:")
@@ -109,6 +174,83 @@ def scrape_player():
         }), 500
 
 
+@app.route('/api/scrape-batch', methods=['POST', 'OPTIONS'])
+def scrape_batch():
+    """
+    Crea un job di scraping in background
+    
+    Request Body:
+        {"urls": ["https://www.transfermarkt.es/...", ...]}
+    
+    Response (202):
+        {"success": true, "job_id": "...", "total": 120, "status_url": "/api/jobs/..."}
+    """
+    if request.method == 'OPTIONS':
+        return '', 204
+    
+    try:
+        urls = parse_batch_urls(request.get_json(silent=True))
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    
+    job = jobs.submit(urls)
+    return jsonify({
+        'success': True,
+        'job_id': job.id,
+        'total': len(urls),
+        'status_url': f'/api/jobs/{job.id}'
+    }), 202
+
+
+@app.route('/api/scrape-stream', methods=['POST', 'OPTIONS'])
+def scrape_stream():
+    """
+    Scraping di più URL con ogni record inviato appena pronto
+    
+    Request Body:
+        {"urls": ["https://www.transfermarkt.es/...", ...]}
+    
+    Query params:
+        ?format=ndjson (default) oppure ?format=sse (anche con Accept: text/event-stream)
+    
+    Response (un frame per riga NDJSON o evento SSE, in ordine di completamento):
+        {"type": "start", "job_id": "...", "total": 2}
+        {"type": "result", "index": 1, "url": "...", "status": "done", "data": {"name": ...}}
+        {"type": "result", "index": 0, "url": "...", "status": "failed", "error": "..."}
+        {"type": "summary", "job_id": "...", "total": 2, "done": 1, "failed": 1, "elapsed": 3.2}
+    """
+    if request.method == 'OPTIONS':
+        return '', 204
+    
+    try:
+        urls = parse_batch_urls(request.get_json(silent=True))
+        fmt = stream_format(request.args.get('format'), request.headers.get('Accept', ''))
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    
+    return Response(
+        encode_stream(jobs.stream(urls), fmt),
+        mimetype=STREAM_FORMATS[fmt],
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def job_status(job_id):
+    """
+    Avanzamento di un job e risultati per URL
+    
+    Query params:
+        ?results=0 per il solo avanzamento (utile per il polling)
+    """
+    job = jobs.get(job_id)
+    if job is None:
+        return jsonify({'success': False, 'error': 'Job not found'}), 404
+    
+    include_results = request.args.get('results', '1') != '0'
+    return jsonify({'success': True, 'job': job.to_dict(include_results=include_results)}), 200
+
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
@@ -119,18 +261,27 @@ def health_check():
     }), 200
 
 
+@app.route('/api/stats', methods=['GET'])
+def stats():
+    """Statistiche dei pool di connessioni, del rate limiter, delle cache (pagine, traduzioni, risultati), dei ruoli non riconosciuti e delle richieste fuse"""
+    return jsonify({
+        'pools': registry.pool_stats(),
+        'rate_limits': get_rate_limiter().stats(),
+        'translations': get_translation_cache().stats(),
+        'translators': get_translator_pool().stats(),
+        'hedging': get_hedged_fetcher().stats(),
+        'unmatched_positions': unmatched_positions(),
+        'jobs': jobs.stats(),
+        'coalescing': inflight.stats(),
+        'results': results.stats()
+    }), 200
+
+
 @app.route('/api/supported-languages', methods=['GET'])
 def supported_languages():
     """Restituisce le lingue supportate"""
     return jsonify({
-        'languages': [
-            {'code': 'it', 'name': 'Italiano', 'domain': 'transfermarkt.it'},
-            {'code': 'es', 'name': 'Spagnolo', 'domain': 'transfermarkt.es'},
-            {'code': 'de', 'name': 'Tedesco', 'domain': 'transfermarkt.de'},
-            {'code': 'en', 'name': 'Inglese', 'domain': 'transfermarkt.co.uk'},
-            {'code': 'fr', 'name': 'Francese', 'domain': 'transfermarkt.fr'},
-            {'code': 'pt', 'name': 'Portoghese', 'domain': 'transfermarkt.pt'},
-        ]
+        'languages': SUPPORTED_LANGUAGES
     }), 200
 
 
@@ -140,7 +291,10 @@ if __name__ == '__main__':
     print("🚀" * 40 + "\n")
     print("📍 Server running on: http://localhost:5001")
     print("📡 Endpoint: POST http://localhost:5001/api/scrape")
+    print("📦 Batch: POST http://localhost:5001/api/scrape-batch, GET http://localhost:5001/api/jobs/<id>")
+    print("📡 Streaming: POST http://localhost:5001/api/scrape-stream (NDJSON o SSE)")
     print("🏥 Health check: GET http://localhost:5001/api/health")
+    print("📊 Stats: GET http://localhost:5001/api/stats")
     print("\n" + "="*80 + "\n")
     
     app.run(
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Transfermarkt Scraper API Server (ASGI)
+Stessi endpoint di scraper_api.py su Starlette, con download asincroni
+
+Endpoint:
+    POST /api/scrape               - Estrae dati da URL Transfermarkt
+    GET  /api/health               - Health check
+    GET  /api/supported-languages  - Lingue supportate
+    GET  /api/stats                - Rate limiter, cache, traduttori, richieste in volo e fuse
+
+Ogni richiesta a Transfermarkt passa da un unico httpx.AsyncClient per
+processo: mentre una pagina è in download il worker serve le altre richieste,
+quindi pochi processi reggono centinaia di scraping contemporanei (i worker
+Flask restano invece bloccati un thread per richiesta). Parsing e traduzione
+restano sincroni e girano nel pool di thread di asyncio. Rate limiter per
+dominio, cache delle pagine, hedging e traduzioni sono gli stessi dell'API Flask.
+
+Requisiti:
+    pip install starlette uvicorn httpx
+
+Uso:
+    python3 scraper_asgi.py
+    uvicorn scraper_asgi:app --host 0.0.0.0 --port 5001 --workers 2
+
+    Confronto con l'API Flask: python bench_api_load.py
+"""
+
+import os
+import traceback
+from contextlib import asynccontextmanager
+
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from transfermarkt_cache import DiskHTMLCache
+from transfermarkt_domains import SUPPORTED_LANGUAGES, clean_url
+from transfermarkt_rate_limiter import get_rate_limiter
+from transfermarkt_translation_cache import get_translation_cache
+from transfermarkt_hedging import get_hedged_fetcher
+from transfermarkt_translation_backends import get_translator_pool
+from transfermarkt_singleflight import SingleFlight, player_flight_key
+from scraper_registry import build_async_client, configure_registry
+from integrate_multilang_to_db import extract_and_map_to_database_async, unmatched_positions
+
+# Connessioni verso Transfermarkt aperte al massimo da un processo (le altre richieste attendono)
+MAX_UPSTREAM_CONNECTIONS = int(os.environ.get('TM_ASYNC_MAX_CONNECTIONS', 100))
+
+
+def env_flag(name: str) -> bool:
+    return os.environ.get(name, '0').lower() in ('1', 'true', 'yes')
+
+
+# Stessa configurazione dell'API Flask (TM_CACHE_DIR, TM_CANONICAL_EDITION, TM_HEDGE, ...)
+html_cache = DiskHTMLCache(
+    cache_dir=os.environ.get('TM_CACHE_DIR', '.tm_cache'),
+    ttl=float(os.environ.get('TM_CACHE_TTL', 6 * 3600))
+)
+
+registry = configure_registry(
+    cache=html_cache,
+    partial_parse=True,
+    kind_options={'multilang': {
+        'canonical_edition': env_flag('TM_CANONICAL_EDITION'),
+        'hedge': env_flag('TM_HEDGE'),
+    }}
+)
+
+# Richieste contemporanee per lo stesso giocatore: un solo scraping condiviso
+inflight = SingleFlight()
+
+
+async def scrape_player(request: Request):
+    """
+    Endpoint per estrarre dati da Transfermarkt (stesso formato di scraper_api.py)
+
+    Request Body:
+        {"url": "https://www.transfermarkt.es/player/profil/spieler/123"}
+    """
+    try:
+        try:
+            data = await request.json()
+        except ValueError:
+            data = None
+
+        if not isinstance(data, dict) or 'url' not in data:
+            return JSONResponse({
+                'success': False,
+                'error': 'URL missing in request body'
+            }, status_code=400)
+
+        url = clean_url(data['url'])
+        print(f"📥 Richiesta scraping da: {url}")
+
+        client = request.app.state.client
+        request.app.state.in_flight += 1
+        try:
+            # Un solo scraping per giocatore in volo, condiviso dalle richieste contemporanee
+            db_data = await inflight.do_async(
+                player_flight_key(url), lambda: extract_and_map_to_database_async(url, client))
+        finally:
+            request.app.state.in_flight -= 1
+
+        if not db_data:
+            return JSONResponse({
+                'success': False,
+                'error': 'Unable to extract data from provided URL'
+            }, status_code=400)
+
+        return JSONResponse({
+            'success': True,
+            'data': db_data,
+            'message': f"Data successfully extracted for {db_data.get('name')}"
+        })
+
+    except Exception as e:
+        print(f"\n❌ ERRORE durante lo scraping:")
+        print(traceback.format_exc())
+
+        return JSONResponse({
+            'success': False,
+            'error': str(e),
+            'details': traceback.format_exc()
+        }, status_code=500)
+
+
+async def health_check(request: Request):
+    """Health check endpoint"""
+    return JSONResponse({
+        'status': 'ok',
+        'message': 'Transfermarkt Scraper API is running',
+        'version': '1.0.0'
+    })
+
+
+async def supported_languages(request: Request):
+    """Restituisce le lingue supportate"""
+    return JSONResponse({'languages': SUPPORTED_LANGUAGES})
+
+
+async def stats(request: Request):
+    """Statistiche del rate limiter, delle cache, dei traduttori, delle richieste in volo e di quelle fuse"""
+    return JSONResponse({
+        'in_flight': request.app.state.in_flight,
+        'max_upstream_connections': request.app.state.max_connections,
+        'rate_limits': get_rate_limiter().stats(),
+        'translations': get_translation_cache().stats(),
+        'translators': get_translator_pool().stats(),
+        'hedging': get_hedged_fetcher().stats(),
+        'unmatched_positions': unmatched_positions(),
+        'coalescing': inflight.stats(),
+    })
+
+
+def create_app(max_connections: int = MAX_UPSTREAM_CONNECTIONS, transport=None) -> Starlette:
+    """
+    Crea l'applicazione ASGI
+
+    Args:
+        max_connections: Connessioni verso Transfermarkt aperte al massimo
+        transport: Trasporto httpx alternativo per i download (test e benchmark)
+    """
+    @asynccontextmanager
+    async def lifespan(app: Starlette):
+        # Un client per processo (e per event loop), chiuso allo spegnimento
+        app.state.client = build_async_client(max_connections=max_connections, transport=transport)
+        app.state.max_connections = max_connections
+        app.state.in_flight = 0
+        try:
+            yield
+        finally:
+            await app.state.client.aclose()
+
+    return Starlette(
+        routes=[
+            Route('/api/scrape', scrape_player, methods=['POST']),
+            Route('/api/health', health_check, methods=['GET']),
+            Route('/api/supported-languages', supported_languages, methods=['GET']),
+            Route('/api/stats', stats, methods=['GET']),
+        ],
+        # Abilita CORS per React (preflight OPTIONS inclusi)
+        middleware=[Middleware(CORSMiddleware, allow_origins=['*'], allow_methods=['*'], allow_headers=['*'])],
+        lifespan=lifespan,
+    )
+
+
+app = create_app()
+
+
+if __name__ == '__main__':
+    import uvicorn
+
+    print("\n" + "🚀" * 40)
+    print("TRANSFERMARKT SCRAPER API SERVER (ASGI)")
+    print("🚀" * 40 + "\n")
+    print("📍 Server running on: http://localhost:5001")
+    print("📡 Endpoint: POST http://localhost:5001/api/scrape")
+    print("🏥 Health check: GET http://localhost:5001/api/health")
+    print("📊 Stats: GET http://localhost:5001/api/stats")
+    print(f"🔌 Connessioni verso Transfermarkt: max {MAX_UPSTREAM_CONNECTIONS}")
+    print("\n" + "="*80 + "\n")
+
+    uvicorn.run('scraper_asgi:app', host='0.0.0.0', port=5001, workers=int(os.environ.get('TM_ASGI_WORKERS', 1)))
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Registro process-wide degli scraper Transfermarkt
+
+Invece di creare uno scraper (e quindi una nuova requests.Session, un nuovo
+handshake TCP/TLS e un nuovo traduttore) per ogni richiesta, il registro tiene
+istanze di lunga durata che condividono una sessione per tipo di scraper, con
+un pool di connessioni keep-alive dimensionato per le richieste concorrenti.
+
+Ogni istanza viene prestata a un solo thread alla volta (context manager),
+quindi anche lo stato interno dello scraper multilingua resta thread-safe.
+Le istanze per tipo sono al massimo max_instances (default: le connessioni
+del pool per host): oltre, la richiesta attende che un'istanza torni libera.
+
+Uso:
+    from scraper_registry import get_registry
+
+    with get_registry().scraper('multilang') as scraper:
+        data = scraper.get_player_info(url)
+
+    print(get_registry().pool_stats())
+"""
+
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+from transfermarkt_domains import DOMAIN_LANGUAGE_MAP
+
+# Un pool per ogni dominio Transfermarkt, connessioni keep-alive per dominio
+DEFAULT_POOL_CONNECTIONS = len(DOMAIN_LANGUAGE_MAP)
+DEFAULT_POOL_MAXSIZE = 32
+
+# Attesa massima di un'istanza libera quando il limite è raggiunto
+DEFAULT_ACQUIRE_TIMEOUT = 30.0
+
+
+def _scraper_classes() -> Dict:
+    from transfermarkt_scraper import TransfermarktScraper
+    from transfermarkt_multilang_scraper import MultiLangTransfermarktScraper
+    return {
+        'transfermarkt': TransfermarktScraper,
+        'multilang': MultiLangTransfermarktScraper,
+    }
+
+
+def build_session(pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+                  pool_maxsize: int = DEFAULT_POOL_MAXSIZE) -> 'requests.Session':
+    """Crea una sessione con pool di connessioni dimensionato e retry sulle connessioni"""
+    # requests/urllib3 si caricano alla prima sessione, non all'import del registro
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        # Solo errori di connessione: i 429/403 li gestisce il rate limiter
+        max_retries=Retry(total=None, connect=2, read=0, status=0, redirect=5, backoff_factor=0.2),
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def build_async_client(max_connections: int = 100,
+                       max_keepalive: int = DEFAULT_POOL_MAXSIZE,
+                       transport=None) -> 'httpx.AsyncClient':
+    """
+    Client HTTP asincrono per l'API ASGI (vedi scraper_asgi.py)
+    
+    Un solo client per event loop: le connessioni keep-alive verso i domini
+    Transfermarkt sono condivise da tutte le richieste in volo.
+    
+    Args:
+        max_connections: Connessioni aperte al massimo (le richieste oltre attendono)
+        max_keepalive: Connessioni inattive tenute aperte
+        transport: Trasporto httpx alternativo (test e benchmark)
+    """
+    import httpx
+    from transfermarkt_multilang_scraper import MultiLangTransfermarktScraper
+    
+    return httpx.AsyncClient(
+        headers=MultiLangTransfermarktScraper.HEADERS,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive),
+        # Attesa di una connessione libera separata dal timeout della richiesta
+        timeout=httpx.Timeout(10.0, pool=30.0),
+        transport=transport,
+    )
+
+
+class ScraperRegistry:
+    """Istanze di scraper di lunga durata, una sessione condivisa per tipo"""
+    
+    def __init__(self, cache=None, rate_limiter=None,
+                 pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+                 max_instances: Optional[int] = None,
+                 acquire_timeout: float = DEFAULT_ACQUIRE_TIMEOUT,
+                 kind_options: Optional[Dict[str, Dict]] = None,
+                 **scraper_options):
+        """
+        Args:
+            cache: Cache delle pagine profilo passata a ogni scraper
+            rate_limiter: Rate limiter (default: quello condiviso dal processo)
+            pool_connections: Numero di host tenuti nel pool di connessioni
+            pool_maxsize: Connessioni keep-alive per host
+            max_instances: Istanze massime per tipo di scraper (default: pool_maxsize)
+            acquire_timeout: Secondi di attesa di un'istanza libera oltre il limite
+            kind_options: Opzioni per un solo tipo di scraper
+                (es: {'multilang': {'canonical_edition': True}})
+            **scraper_options: Altre opzioni per il costruttore degli scraper
+                (es: partial_parse=True)
+        """
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.scraper_options = scraper_options
+        self.kind_options = kind_options or {}
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.max_instances = max(1, max_instances or pool_maxsize)
+        self.acquire_timeout = acquire_timeout
+        
+        self._sessions = {}
+        self._idle = {}
+        self._created = {}
+        self._waits = {}
+        self._lock = threading.Lock()
+    
+    def session(self, kind: str) -> 'requests.Session':
+        """Sessione condivisa da tutte le istanze di un tipo di scraper"""
+        with self._lock:
+            if kind not in self._sessions:
+                self._sessions[kind] = build_session(self.pool_connections, self.pool_maxsize)
+            return self._sessions[kind]
+    
+    def _create(self, kind: str):
+        classes = _scraper_classes()
+        if kind not in classes:
+            raise ValueError(f"Tipo di scraper sconosciuto: {kind}")
+        return classes[kind](
+            cache=self.cache,
+            rate_limiter=self.rate_limiter,
+            session=self.session(kind),
+            **{**self.scraper_options, **self.kind_options.get(kind, {})}
+        )
+    
+    def acquire(self, kind: str = 'multilang'):
+        """
+        Prende in prestito un'istanza (da restituire con release)
+        
+        Raises:
+            TimeoutError se il limite di istanze è raggiunto e nessuna torna
+            libera entro acquire_timeout
+        """
+        with self._lock:
+            idle = self._idle.setdefault(kind, queue.LifoQueue())
+        try:
+            return idle.get_nowait()
+        except queue.Empty:
+            pass
+        
+        # Posto riservato prima della creazione: il limite vale anche con richieste contemporanee
+        with self._lock:
+            can_create = self._created.get(kind, 0) < self.max_instances
+            if can_create:
+                self._created[kind] = self._created.get(kind, 0) + 1
+            else:
+                self._waits[kind] = self._waits.get(kind, 0) + 1
+        
+        if can_create:
+            try:
+                return self._create(kind)
+            except BaseException:
+                with self._lock:
+                    self._created[kind] -= 1
+                raise
+        
+        try:
+            return idle.get(timeout=self.acquire_timeout)
+        except queue.Empty:
+            raise TimeoutError(
+                f"Nessuno scraper '{kind}' libero entro {self.acquire_timeout:.0f}s "
+                f"({self.max_instances} istanze in uso)") from None
+    
+    def release(self, kind: str, scraper):
+        self._idle[kind].put(scraper)
+    
+    @contextmanager
+    def scraper(self, kind: str = 'multilang'):
+        """Context manager: istanza riservata al thread corrente per la durata del blocco"""
+        instance = self.acquire(kind)
+        try:
+            yield instance
+        finally:
+            self.release(kind, instance)
+    
+    def pool_stats(self) -> Dict:
+        """
+        Statistiche dei pool di connessioni per tipo di scraper e host
+        
+        waits = richieste che hanno atteso un'istanza libera (limite max_instances)
+        reuse_ratio = richieste servite su connessioni già aperte / richieste totali
+        """
+        stats = {}
+        with self._lock:
+            sessions = dict(self._sessions)
+            created = dict(self._created)
+            waits = dict(self._waits)
+        
+        for kind, session in sessions.items():
+            hosts = {}
+            total_requests = 0
+            total_connections = 0
+            # Lo stesso adapter è montato su http:// e https://: contalo una volta sola
+            adapters = {id(a): a for a in session.adapters.values() if hasattr(a, 'poolmanager')}
+            for adapter in adapters.values():
+                pools = adapter.poolmanager.pools
+                for key in list(pools.keys()):
+                    pool = pools.get(key)
+                    if pool is None:
+                        continue
+                    idle = sum(1 for conn in list(pool.pool.queue) if conn is not None) if pool.pool else 0
+                    hosts[f"{key.key_scheme}://{key.key_host}"] = {
+                        'connections_opened': pool.num_connections,
+                        'requests': pool.num_requests,
+                        'idle_connections': idle,
+                        'maxsize': pool.pool.maxsize if pool.pool else 0,
+                    }
+                    total_requests += pool.num_requests
+                    total_connections += pool.num_connections
+            
+            stats[kind] = {
+                'instances': created.get(kind, 0),
+                'max_instances': self.max_instances,
+                'waits': waits.get(kind, 0),
+                'idle_instances': self._idle[kind].qsize() if kind in self._idle else 0,
+                'requests': total_requests,
+                'connections_opened': total_connections,
+                'reuse_ratio': round(1 - total_connections / total_requests, 3) if total_requests else None,
+                'hosts': hosts,
+            }
+        return stats
+
+
+_registry: Optional[ScraperRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def configure_registry(**options) -> ScraperRegistry:
+    """Crea (o sostituisce) il registro del processo; da chiamare all'avvio"""
+    global _registry
+    with _registry_lock:
+        _registry = ScraperRegistry(**options)
+    return _registry
+
+
+def get_registry() -> ScraperRegistry:
+    """Restituisce il registro del processo, creandolo con le opzioni di default"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = ScraperRegistry()
+    return _registry
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Test per i job di scraping riprendibili (journal di checkpoint)
+"""
+
+import tempfile
+
+from test_batch_scraper import make_scraper
+from transfermarkt_jobs import BatchJob
+
+URLS = [f"https://www.transfermarkt.it/player/profil/spieler/{i}" for i in range(1, 7)]
+
+
+def test_resume_skips_completed_and_retries_only_failures():
+    with tempfile.TemporaryDirectory() as job_dir:
+        job = BatchJob(job_dir, scraper=make_scraper(failing_ids={'2', '5'}))
+        assert job.add(URLS) == 6
+        assert job.add(URLS[:2]) == 0
+
+        status = job.run(concurrency=3)
+        assert status == {'pending': 0, 'done': 4, 'failed': 2, 'total': 6}
+
+        # Un nuovo processo rilegge il journal: niente da rifare con resume
+        scraper = make_scraper()
+        job = BatchJob(job_dir, scraper=scraper)
+        assert sorted(job.ids('failed')) == ['2', '5']
+        job.run()
+        assert scraper.session.max_active == 0
+
+        # retry riesegue solo i falliti
+        job.run(retry_failed=True)
+        assert job.status()['done'] == 6
+        assert job.results()['1']['name'] == 'Filipe Relvas'
+
+
+def test_truncated_journal_line_is_ignored():
+    with tempfile.TemporaryDirectory() as job_dir:
+        job = BatchJob(job_dir, scraper=make_scraper())
+        job.add(URLS[:3])
+        with open(job.journal_path, 'a', encoding='utf-8') as f:
+            f.write('{"event": "done", "player_id": "1", "da')
+
+        job = BatchJob(job_dir, scraper=make_scraper())
+        assert job.status() == {'pending': 3, 'done': 0, 'failed': 0, 'total': 3}
+
+        job.run()
+        job = BatchJob(job_dir, scraper=make_scraper())
+        assert job.status()['done'] == 3
+
+
+if __name__ == "__main__":
+    test_resume_skips_completed_and_retries_only_failures()
+    test_truncated_journal_line_is_ignored()
+    print("✅ Test job riprendibili passati")
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Test per lo scraping in batch (get_players_info)
+Usa la pagina salvata in fixtures/ al posto delle richieste reali
+"""
+
+import os
+
+from fake_http import FakeSession
+from transfermarkt_rate_limiter import DomainRateLimiter
+from transfermarkt_scraper import TransfermarktScraper
+
+FIXTURE = os.path.join(os.path.dirname(__file__), 'fixtures', 'transfermarkt_profile_it.html')
+
+
+def make_scraper(**kwargs):
+    with open(FIXTURE, 'rb') as f:
+        html = f.read()
+    scraper = TransfermarktScraper(rate_limiter=DomainRateLimiter(rate=1000, burst=1000, max_rate=1000))
+    scraper.session = FakeSession(html, delay=0.05, **kwargs)
+    return scraper
+
+
+def test_parse_fixture():
+    scraper = make_scraper()
+    data = scraper.get_player_info("https://www.transfermarkt.it/filipe-relvas/profil/spieler/567497")
+    assert 'error' not in data
+    assert data['name'] == 'Filipe Relvas'
+    assert data['shirt_number'] == 4
+    assert data['height_cm'] == 192
+    assert data['nationality_primary'] == 'Portogallo'
+    assert data['position'] == 'Difesa - Difensore centrale'
+    assert data['natural_position'] == 'Difensore centrale'
+    assert data['contract_expiry'] == '30/06/2028'
+    assert data['market_value'] == 3.5
+
+
+def test_batch_keeps_order_and_reports_errors():
+    scraper = make_scraper(failing_ids={'2'})
+    urls = [f"https://www.transfermarkt.it/player/profil/spieler/{i}" for i in range(1, 7)]
+    urls.append("https://www.transfermarkt.it/senza-id")
+
+    results = scraper.get_players_info(urls, concurrency=3)
+
+    assert len(results) == len(urls)
+    assert [r.get('id') for r in results] == ['1', None, '3', '4', '5', '6', None]
+    assert results[1]['url'] == urls[1]
+    assert 'error' in results[1]
+    assert results[6]['url'] == urls[6]
+    assert 'error' in results[6]
+    assert 1 < scraper.session.max_active <= 3
+
+
+if __name__ == "__main__":
+    test_parse_fixture()
+    test_batch_keeps_order_and_reports_errors()
+    print("✅ Tutti i test batch passati")
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Test per la traduzione in blocco dello scraper multilingua
+Il traduttore online è sostituito da una funzione che conta le richieste
+"""
+
+from fake_http import FakeSession
+from test_batch_scraper import FIXTURE
+from transfermarkt_multilang_scraper import MultiLangTransfermarktScraper
+from transfermarkt_rate_limiter import DomainRateLimiter
+from transfermarkt_translation_cache import TranslationCache
+
+URL = "https://www.transfermarkt.it/filipe-relvas/profil/spieler/{}"
+
+
+def make_scraper(calls, separator='\n'):
+    scraper = MultiLangTransfermarktScraper(
+        rate_limiter=DomainRateLimiter(rate=1000, burst=1000, max_rate=1000),
+        translation_cache=TranslationCache(path=None),
+    )
+
+    def remote(text, source_lang):
+        calls.append(text)
+        return separator.join(f"EN({line})" for line in text.split('\n'))
+
+    scraper._translate_remote = remote
+    return scraper
+
+
+def test_page_sends_one_translation_request():
+    calls = []
+    scraper = make_scraper(calls)
+    with open(FIXTURE, 'rb') as f:
+        html = f.read()
+
+    data = scraper.parse_player_page(html, URL.format(567497), '567497')
+
+    assert calls == ['Portogallo\nAEK Atene']
+    assert data['nationality_primary'] == 'EN(Portogallo)'
+    assert data['team'] == 'EN(AEK Atene)'
+    # Ruoli e piede arrivano dai dizionari manuali, senza traduttore
+    assert data['position'] == 'Centre-Back'
+    assert data['preferred_foot'] == 'right'
+    assert data['other_positions'] == 'Defensive Midfield'
+
+
+def test_batch_of_pages_shares_one_request_and_cache():
+    calls = []
+    scraper = make_scraper(calls)
+    with open(FIXTURE, 'rb') as f:
+        scraper.session = FakeSession(f.read(), failing_ids={'3'})
+
+    urls = [URL.format(i) for i in range(1, 6)]
+    results = scraper.get_players_info(urls, concurrency=3)
+
+    assert calls == ['Portogallo\nAEK Atene']
+    assert [r.get('player_id') for r in results] == ['1', '2', None, '4', '5']
+    assert results[2]['url'] == urls[2] and 'error' in results[2]
+
+    # Seconda pagina: tutto dalla cache
+    scraper.get_players_info(urls[:1])
+    assert len(calls) == 1
+
+
+def test_mismatched_lines_fall_back_to_single_requests():
+    calls = []
+    scraper = make_scraper(calls, separator=' / ')
+    translations = scraper.translate_batch(['Spagna', 'Scozia', 'Spagna'], 'it')
+
+    assert calls == ['Spagna\nScozia', 'Spagna', 'Scozia']
+    assert translations == {'Spagna': 'EN(Spagna)', 'Scozia': 'EN(Scozia)'}
+
+
+def test_unexpected_fetch_error_does_not_abort_the_batch():
+    calls = []
+    scraper = make_scraper(calls)
+    with open(FIXTURE, 'rb') as f:
+        html = f.read()
+
+    def fetch_profile(url, player_id):
+        if player_id == '2':
+            raise OSError('disco pieno')
+        return html, None
+
+    scraper.fetch_profile = fetch_profile
+    urls = [URL.format(i) for i in range(1, 4)]
+    results = scraper.get_players_info(urls, concurrency=3)
+
+    assert [r.get('player_id') for r in results] == ['1', None, '3']
+    assert results[1] == {'error': 'Unexpected error: disco pieno', 'url': urls[1]}
+
+
+if __name__ == "__main__":
+    test_page_sends_one_translation_request()
+    test_batch_of_pages_shares_one_request_and_cache()
+    test_mismatched_lines_fall_back_to_single_requests()
+    test_unexpected_fetch_error_does_not_abort_the_batch()
+    print("✅ Test traduzione in blocco passati")
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Test per la modalità canonical_edition dello scraper multilingua
+Le richieste all'edizione inglese restituiscono la fixture inglese
+"""
+
+import os
+
+from fake_http import FakeResponse
+from transfermarkt_domains import edition_url
+from transfermarkt_multilang_scraper import MultiLangTransfermarktScraper
+from transfermarkt_rate_limiter import DomainRateLimiter
+from transfermarkt_translation_cache import TranslationCache
+
+FIXTURE_EN = os.path.join(os.path.dirname(__file__), 'fixtures', 'transfermarkt_profile_en.html')
+
+
+class EditionSession:
+    def __init__(self):
+        with open(FIXTURE_EN, 'rb') as f:
+            self.html = f.read()
+        self.headers = {}
+        self.urls = []
+
+    def get(self, url, **kwargs):
+        self.urls.append(url)
+        return FakeResponse(self.html)
+
+
+def test_edition_url_keeps_slug_and_id():
+    assert edition_url("https://www.transfermarkt.es/james-penrice/profil/spieler/363227", '363227') == \
+        "https://www.transfermarkt.co.uk/james-penrice/profil/spieler/363227"
+    assert edition_url("https://www.transfermarkt.de/x/leistungsdaten/spieler/1/saison/2024", '1', 'transfermarkt.it') == \
+        "https://www.transfermarkt.it/x/profil/spieler/1"
+
+
+def test_canonical_edition_skips_translation():
+    session = EditionSession()
+    scraper = MultiLangTransfermarktScraper(
+        rate_limiter=DomainRateLimiter(rate=1000, burst=1000, max_rate=1000),
+        session=session,
+        translation_cache=TranslationCache(path=None),
+        canonical_edition=True,
+    )
+
+    def no_translation(text, source_lang):
+        raise AssertionError(f"traduzione non prevista: {text!r}")
+
+    scraper._translate_remote = no_translation
+    data = scraper.get_player_info("https://www.transfermarkt.es/filipe-relvas/profil/spieler/567497")
+
+    assert session.urls == ["https://www.transfermarkt.co.uk/filipe-relvas/profil/spieler/567497"]
+    assert data['source_language'] == 'es'
+    assert data['url'] == "https://www.transfermarkt.es/filipe-relvas/profil/spieler/567497"
+    assert data['edition_url'] == session.urls[0]
+    assert data['nationality_primary'] == 'Portugal'
+    assert data['team'] == 'AEK Athens'
+    assert data['position'] == 'Centre-Back'
+    assert data['preferred_foot'] == 'right'
+    assert data['other_positions'] == 'Defensive Midfield'
+    assert data['height_cm'] == 192
+    assert data['contract_expiry'] == '2028'
+
+
+if __name__ == "__main__":
+    test_edition_url_keeps_slug_and_id()
+    test_canonical_edition_skips_translation()
+    print("✅ Test edizione canonica passati")
@@ -4,7 +4,7 @@ Test per verificare la mappatura dei ruoli generali
 Devono corrispondere ai 6 ruoli disponibili nel sistema
 """
 
-from transfermarkt_scraper import map_position_to_role
+from transfermarkt_mapping import map_position_to_role
 
 # Test cases con posizioni da Transfermarkt
 test_cases = [
@@ -123,7 +123,7 @@ penrice_tests = [
     ("Esterno di sinistra", "Terzino", "ES")
 ]
 
-from transfermarkt_scraper import get_role_abbreviation
+from transfermarkt_mapping import get_role_abbreviation
 
 for pos, expected_general, expected_abbr in penrice_tests:
     general = map_position_to_role(pos)
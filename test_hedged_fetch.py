@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Test per le richieste hedged tra edizioni di Transfermarkt
+"""
+
+import time
+
+import pytest
+
+from fake_http import FakeResponse
+from test_canonical_edition import FIXTURE_EN
+from transfermarkt_cache import _revalidating, revalidate
+from transfermarkt_hedging import HedgedFetcher, LatencyTracker
+from transfermarkt_multilang_scraper import MultiLangTransfermarktScraper
+from transfermarkt_rate_limiter import DomainRateLimiter
+from transfermarkt_translation_cache import TranslationCache
+
+
+def slow(value, delay, error=None):
+    def call():
+        time.sleep(delay)
+        if error:
+            raise error
+        return value
+    return call
+
+
+def make_fetcher():
+    return HedgedFetcher(LatencyTracker(default_delay=0.05), max_workers=4)
+
+
+def test_fast_primary_is_not_hedged():
+    fetcher = make_fetcher()
+    backup_calls = []
+    assert fetcher.fetch(slow('primary', 0), lambda: backup_calls.append(1)) == ('primary', False)
+    assert backup_calls == []
+    assert fetcher.stats()['hedged'] == 0
+
+
+def test_slow_primary_loses_to_backup():
+    fetcher = make_fetcher()
+    started = time.monotonic()
+    assert fetcher.fetch(slow('primary', 0.5), slow('backup', 0.01)) == ('backup', True)
+    assert time.monotonic() - started < 0.3
+    assert fetcher.stats()['backup_wins'] == 1
+
+
+def test_failed_backup_waits_for_primary():
+    fetcher = make_fetcher()
+    assert fetcher.fetch(slow('primary', 0.15), slow(None, 0, ValueError('mirror'))) == ('primary', False)
+
+    with pytest.raises(KeyError):
+        fetcher.fetch(slow(None, 0.1, KeyError('primary')), slow(None, 0, ValueError('mirror')))
+
+
+def test_time_queued_in_the_pool_does_not_trigger_the_backup():
+    fetcher = HedgedFetcher(LatencyTracker(default_delay=0.05), max_workers=1)
+    backup_calls = []
+    # Pool occupato: la richiesta principale resta in coda oltre il ritardo di hedge
+    fetcher._executor.submit(time.sleep, 0.2)
+
+    assert fetcher.fetch(slow('primary', 0), lambda: backup_calls.append(1)) == ('primary', False)
+    assert backup_calls == []
+    assert fetcher.stats()['hedged'] == 0
+    assert fetcher.tracker.samples[0] < 0.05
+
+
+def test_requests_run_in_the_caller_context():
+    fetcher = make_fetcher()
+    with revalidate():
+        assert fetcher.fetch(_revalidating.get, _revalidating.get) == (True, False)
+    assert fetcher.fetch(_revalidating.get, _revalidating.get) == (False, False)
+
+
+def test_hedge_delay_follows_p95():
+    tracker = LatencyTracker(min_samples=10, min_delay=0.01)
+    assert tracker.hedge_delay() == tracker.default_delay
+    for i in range(1, 101):
+        tracker.record(i / 100)
+    assert tracker.hedge_delay() == pytest.approx(0.96)
+
+
+class MirrorSession:
+    """L'edizione .it è lenta, il mirror .co.uk risponde subito"""
+
+    def __init__(self):
+        with open(FIXTURE_EN, 'rb') as f:
+            self.html = f.read()
+        self.headers = {}
+
+    def get(self, url, **kwargs):
+        if 'transfermarkt.it' in url:
+            time.sleep(0.5)
+        return FakeResponse(self.html)
+
+
+def test_scraper_parses_the_winning_mirror():
+    scraper = MultiLangTransfermarktScraper(
+        rate_limiter=DomainRateLimiter(rate=1000, burst=1000, max_rate=1000),
+        session=MirrorSession(),
+        translation_cache=TranslationCache(path=None),
+        hedge=True,
+        hedged_fetcher=make_fetcher(),
+    )
+    scraper._translate_remote = lambda text, source_lang: pytest.fail(f"traduzione non prevista: {text!r}")
+
+    data = scraper.get_player_info("https://www.transfermarkt.it/filipe-relvas/profil/spieler/567497")
+
+    assert data['edition_url'] == "https://www.transfermarkt.co.uk/filipe-relvas/profil/spieler/567497"
+    assert data['source_language'] == 'it'
+    assert data['team'] == 'AEK Athens'
+    assert data['position'] == 'Centre-Back'
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-q'])
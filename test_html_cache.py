@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Test per la cache HTML su disco con GET condizionale
+"""
+
+import tempfile
+
+import requests
+
+from fake_http import FakeSession, etag_session
+from transfermarkt_cache import DiskHTMLCache, HTMLCache, fetch_html, make_cache_key
+
+
+def test_cache_key_uses_language_domain():
+    assert make_cache_key("https://www.transfermarkt.es/x/profil/spieler/363227", '363227') == 'transfermarkt.es/363227'
+    assert make_cache_key("https://www.transfermarkt.com.br/x/profil/spieler/1", '1') == 'transfermarkt.com.br/1'
+
+
+def test_fresh_entry_skips_network():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = DiskHTMLCache(tmp, ttl=3600)
+        session = etag_session()
+        url = "https://www.transfermarkt.it/x/profil/spieler/1"
+        key = make_cache_key(url, '1')
+
+        assert fetch_html(session, url, 10, cache, key) == b'<html>v1</html>'
+        assert fetch_html(session, url, 10, cache, key) == b'<html>v1</html>'
+        assert len(session.calls) == 1
+
+
+def test_stale_entry_is_revalidated():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = DiskHTMLCache(tmp, ttl=0)
+        session = etag_session()
+        url = "https://www.transfermarkt.it/x/profil/spieler/1"
+        key = make_cache_key(url, '1')
+
+        fetch_html(session, url, 10, cache, key)
+
+        # 304: stessa pagina dal disco
+        assert fetch_html(session, url, 10, cache, key) == b'<html>v1</html>'
+        assert session.calls[-1]['If-None-Match'] == '"v1"'
+        assert session.calls[-1]['If-Modified-Since'] == 'Mon, 01 Jan 2024 00:00:00 GMT'
+
+        # Pagina cambiata: 200 e aggiornamento della cache
+        session.etag = '"v2"'
+        session.html = b'<html>v2</html>'
+        assert fetch_html(session, url, 10, cache, key) == b'<html>v2</html>'
+        assert cache.get(key)['etag'] == '"v2"'
+
+
+def test_304_without_cached_copy_is_an_error():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = DiskHTMLCache(tmp, ttl=3600)
+        url = "https://www.transfermarkt.it/x/profil/spieler/1"
+        try:
+            fetch_html(FakeSession(statuses=[(304, {})]), url, 10, cache, make_cache_key(url, '1'))
+        except requests.HTTPError:
+            pass
+        else:
+            raise AssertionError("un 304 senza copia in cache deve fallire")
+
+
+def test_html_cache_interface_is_abstract():
+    try:
+        HTMLCache()
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("HTMLCache non deve essere istanziabile")
+
+
+if __name__ == "__main__":
+    test_cache_key_uses_language_domain()
+    test_fresh_entry_skips_network()
+    test_stale_entry_is_revalidated()
+    test_304_without_cached_copy_is_an_error()
+    test_html_cache_interface_is_abstract()
+    print("✅ Tutti i test cache passati")
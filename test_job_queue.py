@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Test per i job batch in background delle API (POST /api/scrape-batch, GET /api/jobs/<id>)
+e per lo streaming dei risultati (POST /api/scrape-stream)
+"""
+
+import json
+import time
+import threading
+
+import pytest
+
+from transfermarkt_job_queue import COMPLETED, FAILED, JobQueue, encode_frame, parse_batch_urls, stream_format
+
+
+def wait_finished(job, timeout=5.0):
+    deadline = time.time() + timeout
+    while not job.finished:
+        assert time.time() < deadline, "job non terminato"
+        time.sleep(0.01)
+
+
+def test_job_progress_and_results_in_order():
+    release = threading.Event()
+
+    def process(url):
+        release.wait(5)
+        if url.endswith('/2'):
+            return {"error": "Player not found"}
+        return {'name': f"player {url[-1]}"}
+
+    jobs = JobQueue(process=process, workers=2)
+    job = jobs.submit([f"https://www.transfermarkt.it/p/profil/spieler/{i}" for i in range(1, 5)])
+
+    status = jobs.get(job.id).to_dict()
+    assert status['status'] in ('queued', 'running') and status['progress'] == 0
+    assert jobs.stats()['active_jobs'] == 1
+
+    release.set()
+    wait_finished(job)
+    status = job.to_dict()
+    assert status['status'] == COMPLETED
+    assert (status['done'], status['failed'], status['progress']) == (3, 1, 1.0)
+    assert [r['status'] for r in status['results']] == ['done', 'failed', 'done', 'done']
+    assert status['results'][1]['error'] == "Player not found"
+    assert status['results'][3]['data'] == {'name': 'player 4'}
+    assert 'results' not in job.to_dict(include_results=False)
+    jobs.shutdown()
+
+
+def test_exceptions_become_failures_and_old_jobs_expire():
+    def process(url):
+        raise RuntimeError("boom")
+
+    jobs = JobQueue(process=process, workers=1, ttl=0)
+    job = jobs.submit(['https://www.transfermarkt.it/p/profil/spieler/1'])
+    wait_finished(job)
+    assert 'boom' in job.to_dict()['results'][0]['error']
+
+    time.sleep(0.01)
+    jobs.submit(['https://www.transfermarkt.it/p/profil/spieler/2'])
+    assert jobs.get(job.id) is None
+    jobs.shutdown()
+
+
+def test_parse_batch_urls():
+    assert parse_batch_urls({'urls': [' https://a ', 'https://b']}) == ['https://a', 'https://b']
+    for payload in (None, {}, {'urls': []}, {'urls': 'https://a'}, {'urls': ['']}, {'urls': ['x'] * 10_000}):
+        with pytest.raises(ValueError):
+            parse_batch_urls(payload)
+
+
+def test_flask_endpoints(monkeypatch):
+    pytest.importorskip('flask')
+    import api_scraper
+
+    jobs = JobQueue(process=lambda url: {'data': {'url': url}, 'db_format': {}}, workers=2)
+    monkeypatch.setattr(api_scraper, 'jobs', jobs)
+    client = api_scraper.app.test_client()
+
+    response = client.post('/api/scrape-batch', json={'urls': ['https://www.transfermarkt.it/p/profil/spieler/7']})
+    assert response.status_code == 202
+    job_id = response.get_json()['job_id']
+
+    wait_finished(jobs.get(job_id))
+    body = client.get(f'/api/jobs/{job_id}').get_json()
+    assert body['job']['status'] == COMPLETED
+    assert body['job']['results'][0]['data']['data']['url'].endswith('/7')
+
+    assert client.get('/api/jobs/unknown').status_code == 404
+    assert client.post('/api/scrape-batch', json={'urls': []}).status_code == 400
+    jobs.shutdown()
+
+
+def test_stream_yields_results_as_they_complete():
+    slow_done = threading.Event()
+
+    def process(url):
+        if url.endswith('/1'):
+            slow_done.wait(5)
+        if url.endswith('/3'):
+            return {"error": "Player not found"}
+        return {'name': f"player {url[-1]}"}
+
+    jobs = JobQueue(process=process, workers=3)
+    frames = jobs.stream([f"https://www.transfermarkt.it/p/profil/spieler/{i}" for i in (1, 2, 3)])
+
+    assert next(frames)['type'] == 'start'
+    # Il giocatore lento (indice 0) non blocca gli altri
+    first, second = next(frames), next(frames)
+    assert {first['index'], second['index']} == {1, 2}
+    slow_done.set()
+    last, summary = list(frames)
+    assert (last['index'], last['data']) == (0, {'name': 'player 1'})
+    assert [f['status'] for f in sorted([first, second], key=lambda f: f['index'])] == ['done', 'failed']
+    assert (summary['type'], summary['total'], summary['done'], summary['failed']) == ('summary', 3, 2, 1)
+    assert jobs.get(summary['job_id']).finished
+    jobs.shutdown()
+
+
+def test_closed_stream_cancels_pending_urls():
+    release = threading.Event()
+    jobs = JobQueue(process=lambda url: release.wait(5) and {'name': url}, workers=1)
+    frames = jobs.stream([f"https://www.transfermarkt.it/p/profil/spieler/{i}" for i in range(3)])
+
+    job_id = next(frames)['job_id']
+    frames.close()
+    release.set()
+
+    job = jobs.get(job_id)
+    wait_finished(job)
+    statuses = [item['status'] for item in job.to_dict()['results']]
+    assert statuses.count(FAILED) == 2
+    jobs.shutdown()
+
+
+def test_stream_formats():
+    frame = {'type': 'summary', 'total': 1}
+    assert encode_frame(frame, 'ndjson') == '{"type": "summary", "total": 1}\n'
+    assert encode_frame(frame, 'sse') == 'event: summary\ndata: {"type": "summary", "total": 1}\n\n'
+    assert stream_format(None, 'text/event-stream') == 'sse'
+    assert stream_format(None, '*/*') == 'ndjson'
+    with pytest.raises(ValueError):
+        stream_format('xml')
+
+
+def test_flask_stream_endpoint(monkeypatch):
+    pytest.importorskip('flask')
+    import scraper_api
+
+    jobs = JobQueue(process=lambda url: {'name': url[-1]}, workers=2)
+    monkeypatch.setattr(scraper_api, 'jobs', jobs)
+    client = scraper_api.app.test_client()
+    urls = [f"https://www.transfermarkt.it/p/profil/spieler/{i}" for i in (1, 2)]
+
+    response = client.post('/api/scrape-stream', json={'urls': urls})
+    assert response.mimetype == 'application/x-ndjson'
+    frames = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert [f['type'] for f in frames] == ['start', 'result', 'result', 'summary']
+    assert sorted(f['data']['name'] for f in frames[1:3]) == ['1', '2']
+    assert frames[-1]['done'] == 2
+
+    response = client.post('/api/scrape-stream', json={'urls': urls[:1]}, headers={'Accept': 'text/event-stream'})
+    assert response.mimetype == 'text/event-stream'
+    assert response.get_data(as_text=True).startswith('event: start\ndata: ')
+    assert client.post('/api/scrape-stream?format=xml', json={'urls': urls}).status_code == 400
+    jobs.shutdown()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-q'])
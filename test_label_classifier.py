@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Test per il classificatore delle label della info-table
+"""
+
+import os
+import json
+
+from transfermarkt_labels import MULTILANG_LABELS, PROFILE_LABELS, InfoField
+
+LABELS_FIXTURE = os.path.join(os.path.dirname(__file__), 'fixtures', 'info_table_labels.json')
+
+
+def all_labels():
+    with open(LABELS_FIXTURE, encoding='utf-8') as f:
+        return [label.lower() for labels in json.load(f).values() for label in labels]
+
+
+def test_same_result_as_any_chain():
+    for classifier in (PROFILE_LABELS, MULTILANG_LABELS):
+        for label in all_labels():
+            assert classifier.classify(label) == classifier.classify_linear(label), label
+
+
+def test_known_labels():
+    assert PROFILE_LABELS.classify('data di nascita/età:') is InfoField.BIRTH
+    assert PROFILE_LABELS.classify('lugar de nac.:') is InfoField.BIRTH_PLACE
+    assert PROFILE_LABELS.classify('gewicht:') is InfoField.WEIGHT
+    assert PROFILE_LABELS.classify('vertrag bis:') is InfoField.CONTRACT
+    assert PROFILE_LABELS.classify('squadra attuale:') is None
+    # Priorità: "f. nacim./edad" contiene sia 'f. nacim' che 'edad', entrambe BIRTH
+    assert MULTILANG_LABELS.classify('f. nacim./edad:') is InfoField.BIRTH
+    # "lugar de nacimiento" contiene 'lugar' (nazionalità) ma 'nacim' (nascita) ha priorità
+    assert MULTILANG_LABELS.classify('lugar de nacimiento:') is InfoField.BIRTH
+    assert MULTILANG_LABELS.classify('valor de mercado:') is InfoField.MARKET_VALUE
+
+
+if __name__ == "__main__":
+    test_same_result_as_any_chain()
+    test_known_labels()
+    print("✅ Tutti i test classificatore passati")
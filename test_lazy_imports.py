@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Test per gli import differiti: i moduli scraper non caricano le dipendenze
+pesanti finché non servono (vedi bench_import_time.py)
+"""
+
+import os
+import sys
+import subprocess
+
+import pytest
+
+from bench_import_time import HEAVY_MODULES
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def loaded_after_import(statement):
+    code = f"import sys; {statement}; print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    proc = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return [m for m in proc.stdout.strip().split(',') if m]
+
+
+@pytest.mark.parametrize('module', [
+    'transfermarkt_mapping',
+    'transfermarkt_scraper',
+    'transfermarkt_multilang_scraper',
+    'integrate_multilang_to_db',
+])
+def test_import_does_not_load_heavy_dependencies(module):
+    assert loaded_after_import(f"import {module}") == []
+
+
+def test_dependencies_load_on_first_use():
+    loaded = loaded_after_import(
+        "from transfermarkt_parsing import make_soup; make_soup('<p>x</p>', partial=True)")
+    assert 'bs4' in loaded and 'lxml' in loaded
+
+
+def test_scraper_reexports_mapping_functions():
+    import transfermarkt_mapping
+    import transfermarkt_scraper
+    assert transfermarkt_scraper.map_to_database_format is transfermarkt_mapping.map_to_database_format
+    assert transfermarkt_scraper.get_role_abbreviation("Difensore centrale") == 'CB'
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-q'])
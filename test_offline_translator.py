@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Test per il backend di traduzione offline
+"""
+
+import io
+import contextlib
+
+import pytest
+
+from test_batch_scraper import FIXTURE
+from transfermarkt_domains import DOMAIN_LANGUAGE_MAP
+from transfermarkt_multilang_scraper import MultiLangTransfermarktScraper
+from transfermarkt_translation_backends import OfflineTranslator, make_translator
+from transfermarkt_translation_cache import TranslationCache
+
+
+@pytest.mark.parametrize('source, text, expected', [
+    ('it', 'Portogallo', 'Portugal'),
+    ('es', 'Países Bajos', 'Netherlands'),
+    ('de', 'Elfenbeinküste', 'Ivory Coast'),
+    ('fr', 'Milieu défensif', 'Defensive Midfield'),
+    ('pt', 'Costa do Marfim', 'Ivory Coast'),
+    ('de', 'beidfüßig', 'both'),
+    ('it', 'Bayern Monaco', 'Bayern Munich'),
+    ('pt', 'Estrela Vermelha', 'Red Star'),
+    ('it', 'Celtic', 'Celtic'),
+])
+def test_offline_vocabulary(source, text, expected):
+    assert make_translator('offline', source).translate(text) == expected
+
+
+def test_every_domain_language_is_supported():
+    for language in set(DOMAIN_LANGUAGE_MAP.values()):
+        assert OfflineTranslator(source=language).translate('Spain') == 'Spain'
+    with pytest.raises(ValueError):
+        make_translator('babelfish', 'it')
+
+
+def test_scraper_with_offline_backend():
+    cache = TranslationCache(path=None)
+    scraper = MultiLangTransfermarktScraper(translation_backend='offline', translation_cache=cache)
+    with open(FIXTURE, 'rb') as f, contextlib.redirect_stdout(io.StringIO()):
+        data = scraper.parse_player_page(f.read(), "https://www.transfermarkt.it/filipe-relvas/profil/spieler/567497", '567497')
+
+    assert data['nationality_primary'] == 'Portugal'
+    assert data['team'] == 'AEK Athens'
+    assert data['position'] == 'Centre-Back'
+    # Le traduzioni offline non passano dalla cache
+    assert cache.stats()['misses'] == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-q'])
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Test modalità di parsing parziale: stessi dati del parsing completo
+"""
+
+import os
+
+from transfermarkt_parsing import make_soup
+from transfermarkt_scraper import TransfermarktScraper
+
+FIXTURE = os.path.join(os.path.dirname(__file__), 'fixtures', 'transfermarkt_profile_it.html')
+URL = "https://www.transfermarkt.it/filipe-relvas/profil/spieler/567497"
+
+
+def load_fixture():
+    with open(FIXTURE, 'rb') as f:
+        return f.read()
+
+
+def test_partial_soup_keeps_only_profile_regions():
+    html = load_fixture()
+    full = make_soup(html)
+    partial = make_soup(html, partial=True)
+
+    assert partial.find('div', class_='info-table') is not None
+    assert partial.find('div', class_='detail-position') is not None
+    assert partial.find('ul', class_='news-list') is None
+    assert len(list(partial.descendants)) < len(list(full.descendants))
+
+
+def test_partial_parse_extracts_same_data():
+    html = load_fixture()
+    full_data = TransfermarktScraper().parse_player_page(html, URL, '567497')
+    partial_data = TransfermarktScraper(partial_parse=True).parse_player_page(html, URL, '567497')
+
+    full_data.pop('scraped_at')
+    partial_data.pop('scraped_at')
+    assert partial_data == full_data
+
+
+if __name__ == "__main__":
+    test_partial_soup_keeps_only_profile_regions()
+    test_partial_parse_extracts_same_data()
+    print("✅ Tutti i test parsing parziale passati")
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Test per la pipeline download (thread) + parsing (processi)
+"""
+
+import os
+
+import transfermarkt_pipeline
+from test_batch_scraper import make_scraper
+from transfermarkt_pipeline import run_pipeline
+
+_parse_and_map = transfermarkt_pipeline._parse_and_map
+
+
+def _crash_on_player_2(html, url, player_id):
+    """Eseguito nel processo worker: simula un processo ucciso (es. OOM)"""
+    if player_id == '2':
+        os._exit(1)
+    return _parse_and_map(html, url, player_id)
+
+
+def test_pipeline_parses_in_worker_processes():
+    scraper = make_scraper(failing_ids={'3'})
+    urls = [f"https://www.transfermarkt.it/player/profil/spieler/{i}" for i in range(1, 9)]
+    urls.append("https://www.transfermarkt.it/senza-id")
+
+    results = run_pipeline(urls, fetch_workers=3, parse_workers=2, queue_size=2, scraper=scraper)
+
+    assert len(results) == len(urls)
+    assert [r.get('player_id') for r in results] == ['1', '2', None, '4', '5', '6', '7', '8', None]
+    assert 'error' in results[2] and results[2]['url'] == urls[2]
+    assert 'error' in results[8]
+    assert results[0]['data']['name'] == 'Filipe Relvas'
+    assert results[0]['db_format']['specific_position'] == 'CB'
+    assert results[0]['db_format']['nationality'] == 'Portugal'
+
+
+def test_pipeline_survives_a_dead_parse_worker(monkeypatch):
+    monkeypatch.setattr(transfermarkt_pipeline, '_parse_and_map', _crash_on_player_2)
+    scraper = make_scraper()
+    urls = [f"https://www.transfermarkt.it/player/profil/spieler/{i}" for i in range(1, 13)]
+
+    results = run_pipeline(urls, fetch_workers=3, parse_workers=2, queue_size=2, scraper=scraper)
+
+    # Nessun URL perso: dopo la morte del processo le pagine restanti sono errori
+    assert len(results) == len(urls) and all(results)
+    assert 'error' in results[1] and results[1]['url'] == urls[1]
+    assert all('error' in r or r['data']['name'] == 'Filipe Relvas' for r in results)
+
+
+if __name__ == "__main__":
+    test_pipeline_parses_in_worker_processes()
+    print("✅ Test pipeline passato")
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test per il matcher fuzzy a indice di token (integrate_multilang_to_db)
+"""
+
+from integrate_multilang_to_db import POSITION_TO_ABBREVIATION, map_position_to_abbreviation, map_position_to_general_role
+from transfermarkt_positions import TokenIndexMatcher, tokenize
+
+
+def test_tokenize():
+    assert tokenize('Left Center-Back') == ('left', 'centre', 'back')
+    assert tokenize('Right Wingback') == ('right', 'wing')
+
+
+def test_exact_and_fuzzy_matches():
+    matcher = TokenIndexMatcher(POSITION_TO_ABBREVIATION)
+    assert matcher.match('Centre-Back') == ('Centre-Back', 'DC', 1.0, False)
+    assert matcher.match('Center Forward').value == 'ATT'
+    assert matcher.match('Attack - Left Winger').value == 'AS'
+    assert matcher.match('Left Midfielder').value == 'CS'
+    assert matcher.match('Right Wingback').value == 'ED'
+
+
+def test_below_min_score_is_not_a_match():
+    matcher = TokenIndexMatcher(POSITION_TO_ABBREVIATION, name='test')
+    # "Winger" vale quanto Left Winger e Right Winger: confidenza dimezzata, sotto soglia
+    assert matcher.match('Winger') is None
+    assert matcher.match('Striker') is None
+    assert matcher.lookup('Midfield') is None
+    assert matcher.stats()['unmatched'] == {'Midfield': 1}
+
+
+def test_partial_matches_are_flagged_and_follow_vocabulary_order():
+    matcher = TokenIndexMatcher(POSITION_TO_ABBREVIATION, name='test')
+    assert matcher.partial_match('Winger') == ('Left Winger', 'AS', None, True)
+    assert matcher.partial_match('Striker').value == 'SP'
+    assert matcher.partial_match('Midfield').value == 'MED'
+    # Chiavi contenute nell'input: la prima del vocabolario
+    assert matcher.partial_match('Left Winger Right Winger').value == 'AS'
+    assert matcher.partial_match('Second Striker Centre-Forward').value == 'SP'
+    assert matcher.partial_match('Avant-centre') is None
+    assert matcher.match('Centre-Back').partial is False
+
+
+def test_unknown_are_not_matched():
+    matcher = TokenIndexMatcher(POSITION_TO_ABBREVIATION, name='test')
+    # Un solo token in comune ("centre") non basta
+    assert matcher.match('Avant-centre') is None
+    assert matcher.match('Defensa central') is None
+
+    assert matcher.lookup('Sweeper') is None
+    assert matcher.lookup('Sweeper') is None
+    assert matcher.lookup('Left-Back').value == 'TS'
+    assert matcher.stats()['unmatched'] == {'Sweeper': 2}
+
+
+def test_unmatched_inputs_are_capped():
+    matcher = TokenIndexMatcher(POSITION_TO_ABBREVIATION, name='test', max_unmatched=2)
+    for text in ('Libero', 'Sweeper', 'Regista', 'Trequartista', 'Libero'):
+        matcher.lookup(text)
+    stats = matcher.stats()
+    assert stats['unmatched'] == {'Libero': 2, 'Sweeper': 1}
+    assert stats['unmatched_overflow'] == 2
+
+
+def test_mapping_functions():
+    assert map_position_to_abbreviation('Midfield - Left Midfield') == 'CS'
+    assert map_position_to_abbreviation('Left Back') == 'TS'
+    # Stesse abbreviazioni della ricerca per sottostringa storica
+    assert map_position_to_abbreviation('Winger') == 'AS'
+    assert map_position_to_abbreviation('Striker') == 'SP'
+    assert map_position_to_abbreviation('Midfield') == 'MED'
+    assert map_position_to_abbreviation('Left Winger Right Winger') == 'AS'
+    assert map_position_to_abbreviation('Second Striker Centre-Forward') == 'SP'
+    # Nessuna abbreviazione inventata: ruolo generale o None
+    assert map_position_to_abbreviation('Defender') == 'DC'
+    assert map_position_to_abbreviation('Sweeper') is None
+    assert map_position_to_abbreviation(None) is None
+    assert map_position_to_general_role('Defender - Centre-Back') == 'Difensore'
+    assert map_position_to_general_role('Striker') == 'Attaccante'
+    assert map_position_to_general_role('Sweeper') == 'Sconosciuto'
+
+
+if __name__ == "__main__":
+    test_tokenize()
+    test_exact_and_fuzzy_matches()
+    test_below_min_score_is_not_a_match()
+    test_partial_matches_are_flagged_and_follow_vocabulary_order()
+    test_unknown_are_not_matched()
+    test_unmatched_inputs_are_capped()
+    test_mapping_functions()
+    print("✅ Test matcher posizioni passati")
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Test per il normalizzatore compilato delle posizioni
+"""
+
+from transfermarkt_mapping import get_role_abbreviation, map_position_to_role, map_positions
+from transfermarkt_positions import POSITION_PREFIXES, POSITIONS, ROLE_ABBREVIATIONS, PositionNormalizer
+
+
+def vocabulary():
+    base = list(ROLE_ABBREVIATIONS) + ['Defender - Centre-Back', 'Goalkeeper', 'Sconosciuto', '', '  Punta  ']
+    return base + [prefix + position for prefix in POSITION_PREFIXES for position in base]
+
+
+def test_same_result_as_reference():
+    normalizer = PositionNormalizer()
+    for position in vocabulary():
+        assert normalizer.abbreviation(position) == normalizer.abbreviation_linear(position), position
+        assert normalizer.role(position) == normalizer.role_linear(position), position
+
+
+def test_prefix_trie():
+    assert POSITIONS.strip_prefixes('Difesa - Terzino sinistro') == 'Terzino sinistro'
+    assert POSITIONS.strip_prefixes('Mittelfeld - Zentrales Mittelfeld') == 'Zentrales Mittelfeld'
+    assert POSITIONS.strip_prefixes('Milieu - Milieu central') == 'Milieu central'
+    assert POSITIONS.strip_prefixes('Midfield') == 'Midfield'
+
+
+def test_mapping_functions_and_batch():
+    assert get_role_abbreviation('Attacco - Seconda punta') == 'SS'
+    assert get_role_abbreviation('Linksverteidiger') == 'LB'
+    assert get_role_abbreviation('') == 'MF'
+    assert map_position_to_role('Difesa - Esterno sinistro') == 'Terzino'
+    assert map_position_to_role(None) == 'Centrocampo'
+    assert map_positions(['Portiere', 'Left Winger', 'Portiere']) == [
+        ('Goalkeeper', 'GK'), ('Ala', 'LW'), ('Goalkeeper', 'GK')]
+
+
+def test_memoized():
+    normalizer = PositionNormalizer()
+    normalizer.abbreviations_batch(['Striker'] * 10)
+    normalizer.abbreviation('Striker')
+    info = normalizer.cache_info()['abbreviation']
+    assert info['misses'] == 1 and info['hits'] == 1
+
+
+if __name__ == "__main__":
+    test_same_result_as_reference()
+    test_prefix_trie()
+    test_mapping_functions_and_batch()
+    test_memoized()
+    print("✅ Test normalizzatore posizioni passati")
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Test per l'estrattore a passaggio singolo della pagina profilo
+"""
+
+import os
+
+from transfermarkt_fields import PROFILE_FIELD_SPEC, PROFILE_FIELDS
+from transfermarkt_parsing import make_soup
+
+FIXTURE = os.path.join(os.path.dirname(__file__), 'fixtures', 'transfermarkt_profile_it.html')
+
+
+def load_doc(partial=False):
+    with open(FIXTURE, 'rb') as f:
+        return PROFILE_FIELDS.extract(make_soup(f.read(), partial=partial))
+
+
+def test_all_regions_found_in_one_walk():
+    for partial in (False, True):
+        doc = load_doc(partial)
+        assert set(doc.regions) == {name for name, _, _ in PROFILE_FIELD_SPEC}
+        assert doc.region('shirt_number').get_text() == '#4'
+
+
+def test_info_pairs_and_agent():
+    doc = load_doc()
+    pairs = {label.get_text(strip=True): value.get_text(strip=True) for label, value in doc.info_pairs()}
+    assert pairs['Altezza:'] == '1,92\xa0m'
+    assert pairs['Scadenza contratto:'] == '30/06/2028'
+    assert len(doc.info_spans) == 2 * len(pairs)
+    assert doc.agent_value().get_text(strip=True) == 'Gestifute'
+    assert [dd.get_text(strip=True) for dd in doc.dd_tags] == ['Difensore centrale', 'Mediano']
+
+
+if __name__ == "__main__":
+    test_all_regions_found_in_one_walk()
+    test_info_pairs_and_agent()
+    print("✅ Tutti i test estrattore passati")
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Test per il rate limiter per dominio (token bucket + AIMD + Retry-After)
+"""
+
+import time
+
+from fake_http import FakeSession
+from transfermarkt_rate_limiter import (
+    DomainRateLimiter,
+    TokenBucket,
+    get_rate_limiter,
+    parse_retry_after,
+    rate_limited_get,
+)
+
+
+def test_parse_retry_after():
+    assert parse_retry_after('3') == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0.0
+    assert parse_retry_after('nonsense') is None
+
+
+def test_aimd_rate_adjustment():
+    bucket = TokenBucket(rate=4.0, min_rate=1.0, max_rate=5.0, increase=0.5)
+    bucket.on_success()
+    assert bucket.rate == 4.5
+    bucket.on_throttle(retry_after=0)
+    assert bucket.rate == 2.25
+    bucket.on_throttle(retry_after=0)
+    bucket.on_throttle(retry_after=0)
+    assert bucket.rate == 1.0
+    for _ in range(20):
+        bucket.on_success()
+    assert bucket.rate == 5.0
+
+
+def test_buckets_are_per_domain_and_shared():
+    limiter = DomainRateLimiter()
+    it_bucket = limiter.bucket_for("https://www.transfermarkt.it/x/profil/spieler/1")
+    assert it_bucket is limiter.bucket_for("https://www.transfermarkt.it/y/profil/spieler/2")
+    assert it_bucket is not limiter.bucket_for("https://www.transfermarkt.es/x/profil/spieler/1")
+    assert set(limiter.buckets) >= {'transfermarkt.it', 'transfermarkt.com.br'}
+    assert get_rate_limiter() is get_rate_limiter()
+
+
+def test_retry_after_is_honoured():
+    limiter = DomainRateLimiter(rate=100, burst=100, max_rate=100)
+    session = FakeSession(statuses=[(429, {'Retry-After': '1'}), (200, {})])
+    url = "https://www.transfermarkt.it/x/profil/spieler/1"
+
+    response = rate_limited_get(session, url, limiter, timeout=5)
+
+    assert response.status_code == 200
+    assert len(session.calls) == 2
+    assert session.call_times[1] - session.call_times[0] >= 0.95
+    assert limiter.stats()['transfermarkt.it']['throttled'] == 1
+
+
+def test_long_retry_after_is_capped_and_not_waited():
+    limiter = DomainRateLimiter(rate=100, burst=100, max_rate=100, max_pause=30)
+    session = FakeSession(statuses=[(429, {'Retry-After': '86400'}), (200, {})])
+    url = "https://www.transfermarkt.it/x/profil/spieler/1"
+
+    started = time.monotonic()
+    response = rate_limited_get(session, url, limiter, timeout=5, max_wait=5)
+
+    # Nessun nuovo tentativo: il throttle torna subito al chiamante
+    assert response.status_code == 429
+    assert len(session.calls) == 1
+    assert time.monotonic() - started < 1
+    assert 29 < limiter.stats()['transfermarkt.it']['blocked_for'] <= 30
+
+
+if __name__ == "__main__":
+    test_parse_retry_after()
+    test_aimd_rate_adjustment()
+    test_buckets_are_per_domain_and_shared()
+    test_retry_after_is_honoured()
+    test_long_retry_after_is_capped_and_not_waited()
+    print("✅ Tutti i test rate limiter passati")
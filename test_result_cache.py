@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Test per la cache dei risultati di /api/scrape (memoria + Redis, stale-while-revalidate)
+"""
+
+import tempfile
+import threading
+
+import pytest
+
+from fake_http import etag_session
+from transfermarkt_cache import DiskHTMLCache, fetch_html
+from transfermarkt_result_cache import HIT, MISS, STALE, ResultCache
+from transfermarkt_singleflight import SingleFlight
+
+KEY = 'transfermarkt.es/363227'
+
+
+class FakeRedis:
+    """Client Redis-compatibile in memoria (get / set con ex / delete)"""
+
+    def __init__(self, fail=False):
+        self.data = {}
+        self.expiry = {}
+        self.fail = fail
+
+    def get(self, key):
+        if self.fail:
+            raise ConnectionError('redis down')
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        if self.fail:
+            raise ConnectionError('redis down')
+        self.data[key] = value.encode('utf-8')
+        self.expiry[key] = ex
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+
+class Scraper:
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = 0
+        self.refreshed = threading.Event()
+
+    def __call__(self):
+        self.calls += 1
+        result = self.results.pop(0)
+        if self.calls > 1:
+            self.refreshed.set()
+        return result
+
+
+def age(cache, key, seconds):
+    """Invecchia la entry in memoria di `seconds` secondi"""
+    stored_at, value = cache._memory[key]
+    cache._memory[key] = (stored_at - seconds, value)
+
+
+def test_fresh_hit_and_errors_are_not_cached():
+    cache = ResultCache(ttl=60, stale_ttl=600, redis_url=None)
+    scraper = Scraper({'error': 'Network error'}, {'market_value': 1.0})
+
+    assert cache.get_or_compute(KEY, scraper) == ({'error': 'Network error'}, MISS)
+    assert cache.get_or_compute(KEY, scraper) == ({'market_value': 1.0}, MISS)
+    assert cache.get_or_compute(KEY, scraper) == ({'market_value': 1.0}, HIT)
+    assert scraper.calls == 2
+    assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 2
+
+
+def test_stale_result_is_served_while_refreshing():
+    cache = ResultCache(ttl=60, stale_ttl=600, redis_url=None)
+    scraper = Scraper({'market_value': 1.0}, {'market_value': 2.0})
+    cache.get_or_compute(KEY, scraper)
+    age(cache, KEY, 120)
+
+    assert cache.get_or_compute(KEY, scraper) == ({'market_value': 1.0}, STALE)
+    assert scraper.refreshed.wait(2)
+    cache.shutdown()
+    assert cache.get_or_compute(KEY, scraper) == ({'market_value': 2.0}, HIT)
+    assert cache.stats()['refreshes'] == 1
+
+    # Oltre stale_ttl si rifà lo scraping nella richiesta
+    age(cache, KEY, 1200)
+    scraper.results.append({'market_value': 3.0})
+    assert cache.get_or_compute(KEY, scraper) == ({'market_value': 3.0}, MISS)
+
+
+def test_failed_refresh_keeps_the_stale_result():
+    cache = ResultCache(ttl=60, stale_ttl=600, redis_url=None)
+    cache.put(KEY, {'market_value': 1.0})
+    age(cache, KEY, 120)
+
+    cache.get_or_compute(KEY, Scraper(None))
+    cache.shutdown()
+
+    assert cache.stats()['refresh_errors'] == 1
+    assert cache.get_or_compute(KEY, Scraper())[0] == {'market_value': 1.0}
+
+
+def test_redis_tier_is_shared_between_workers():
+    redis = FakeRedis()
+    first = ResultCache(namespace='scraper_api', ttl=60, stale_ttl=600, redis_client=redis)
+    second = ResultCache(namespace='scraper_api', ttl=60, stale_ttl=600, redis_client=redis)
+
+    first.get_or_compute(KEY, Scraper({'name': 'James Penrice'}))
+
+    assert redis.expiry == {'tm:result:scraper_api:' + KEY: 600}
+    assert second.get_or_compute(KEY, Scraper()) == ({'name': 'James Penrice'}, HIT)
+    assert second.stats()['redis_loads'] == 1
+
+    second.invalidate(KEY)
+    assert redis.data == {}
+
+
+def test_redis_errors_fall_back_to_memory():
+    cache = ResultCache(ttl=60, stale_ttl=600, redis_client=FakeRedis(fail=True))
+
+    assert cache.get_or_compute(KEY, Scraper({'name': 'x'})) == ({'name': 'x'}, MISS)
+    assert cache.get_or_compute(KEY, Scraper()) == ({'name': 'x'}, HIT)
+
+
+def test_corrupt_redis_entry_is_a_miss():
+    redis = FakeRedis()
+    redis.data['tm:result:default:' + KEY] = b'{not json'
+    cache = ResultCache(ttl=60, stale_ttl=600, redis_client=redis)
+
+    assert cache.get_or_compute(KEY, Scraper({'name': 'x'})) == ({'name': 'x'}, MISS)
+    assert cache.get_or_compute(KEY, Scraper()) == ({'name': 'x'}, HIT)
+
+
+def test_refresh_revalidates_the_html_cache():
+    with tempfile.TemporaryDirectory() as tmp:
+        # Pagina ancora fresca per la cache HTML, risultato già stale
+        html_cache = DiskHTMLCache(tmp, ttl=3600)
+        session = etag_session()
+        url = "https://www.transfermarkt.es/x/profil/spieler/363227"
+        refreshed = threading.Event()
+
+        def scrape():
+            html = fetch_html(session, url, 10, html_cache, KEY)
+            if len(session.calls) > 1:
+                refreshed.set()
+            return {'html': html.decode()}
+
+        cache = ResultCache(ttl=60, stale_ttl=600, redis_url=None)
+        cache.get_or_compute(KEY, scrape)
+        age(cache, KEY, 120)
+
+        assert cache.get_or_compute(KEY, scrape)[1] == STALE
+        assert refreshed.wait(2)
+        cache.shutdown()
+        # GET condizionale anche se la copia su disco è entro il TTL
+        assert session.calls[-1]['If-None-Match'] == '"v1"'
+
+        # Fuori dal refresh la cache HTML torna a servire dal disco
+        fetch_html(session, url, 10, html_cache, KEY)
+        assert len(session.calls) == 2
+
+
+def test_zero_ttl_disables_the_cache():
+    cache = ResultCache(ttl=0, redis_url=None)
+    scraper = Scraper({'name': 'x'}, {'name': 'x'})
+    cache.get_or_compute(KEY, scraper)
+    assert cache.get_or_compute(KEY, scraper)[1] == MISS
+    assert scraper.calls == 2
+
+
+def test_scraper_api_serves_cached_results(monkeypatch):
+    import scraper_api
+
+    calls = []
+
+    def extract(url):
+        calls.append(url)
+        return {'name': 'James Penrice', 'transfermarkt_id': '363227'}
+
+    monkeypatch.setattr(scraper_api, 'extract_and_map_to_database', extract)
+    monkeypatch.setattr(scraper_api, 'inflight', SingleFlight())
+    monkeypatch.setattr(scraper_api, 'results', ResultCache(ttl=60, stale_ttl=600, redis_url=None))
+    client = scraper_api.app.test_client()
+
+    first = client.post('/api/scrape', json={'url': 'https://www.transfermarkt.es/a/profil/spieler/363227'})
+    second = client.post('/api/scrape', json={'url': 'https://www.transfermarkt.es/b/profil/spieler/363227/fromCaptcha/1'})
+
+    assert (first.headers['X-Cache'], second.headers['X-Cache']) == ('MISS', 'HIT')
+    assert second.get_json()['data']['name'] == 'James Penrice'
+    assert len(calls) == 1
+    assert client.get('/api/stats').get_json()['results']['hits'] == 1
+
+
+def test_api_scraper_get_endpoint_serves_cached_results(monkeypatch):
+    import api_scraper
+
+    calls = []
+
+    def get_player_info(url):
+        calls.append(url)
+        return {'name': 'James Penrice', 'id': '363227'}
+
+    monkeypatch.setattr(api_scraper, 'get_player_info', get_player_info)
+    monkeypatch.setattr(api_scraper, 'results', ResultCache(ttl=60, stale_ttl=600, redis_url=None))
+    client = api_scraper.app.test_client()
+
+    first = client.get('/api/scrape-url', query_string={'url': 'https://www.transfermarkt.es/a/profil/spieler/363227'})
+    second = client.get('/api/scrape-url', query_string={'url': 'https://www.transfermarkt.es/b/profil/spieler/363227'})
+
+    assert (first.headers['X-Cache'], second.headers['X-Cache']) == ('MISS', 'HIT')
+    assert second.get_json()['data']['name'] == 'James Penrice'
+    assert len(calls) == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-q'])
@@ -3,7 +3,7 @@
 Test per verificare le abbreviazioni dei ruoli
 """
 
-from transfermarkt_scraper import get_role_abbreviation
+from transfermarkt_mapping import get_role_abbreviation
 
 # Test cases con posizioni da Transfermarkt
 test_cases = [
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Test per l'API ASGI e il percorso di download asincrono
+(rate limiter, cache condizionale, hedging, endpoint Starlette)
+"""
+
+import asyncio
+
+import pytest
+
+import scraper_registry
+from fake_http import FakeAsyncClient, FakeSession, etag_session
+from test_canonical_edition import FIXTURE_EN
+from transfermarkt_cache import DiskHTMLCache, fetch_html_async
+from transfermarkt_hedging import HedgedFetcher, LatencyTracker
+from transfermarkt_rate_limiter import DomainRateLimiter, rate_limited_get_async
+
+URL = "https://www.transfermarkt.co.uk/filipe-relvas/profil/spieler/567497"
+
+
+def delayed(value, delay, error=None):
+    async def call():
+        await asyncio.sleep(delay)
+        if error:
+            raise error
+        return value
+    return call
+
+
+def test_async_retry_after_is_honoured():
+    limiter = DomainRateLimiter(rate=100, burst=100, max_rate=100)
+    client = FakeAsyncClient(FakeSession(statuses=[(429, {'Retry-After': '1'}), (200, {})]))
+
+    response = asyncio.run(rate_limited_get_async(client, URL, limiter, timeout=5))
+
+    assert response.status_code == 200
+    assert client.session.call_times[1] - client.session.call_times[0] >= 0.95
+    assert limiter.stats()['transfermarkt.co.uk']['throttled'] == 1
+
+
+def test_async_fetch_revalidates_with_etag(tmp_path):
+    cache = DiskHTMLCache(str(tmp_path), ttl=0)
+    client = FakeAsyncClient(etag_session())
+
+    first = asyncio.run(fetch_html_async(client, URL, 5, cache=cache, cache_key='transfermarkt.co.uk/567497'))
+    second = asyncio.run(fetch_html_async(client, URL, 5, cache=cache, cache_key='transfermarkt.co.uk/567497'))
+
+    assert first == second == b'<html>v1</html>'
+    assert client.session.calls[1] == {'If-None-Match': '"v1"', 'If-Modified-Since': 'Mon, 01 Jan 2024 00:00:00 GMT'}
+
+
+def test_async_hedging():
+    fetcher = HedgedFetcher(LatencyTracker(default_delay=0.05), max_workers=1)
+
+    assert asyncio.run(fetcher.fetch_async(delayed('primary', 0), delayed('backup', 0))) == ('primary', False)
+    assert asyncio.run(fetcher.fetch_async(delayed('primary', 0.5), delayed('backup', 0.01))) == ('backup', True)
+    with pytest.raises(KeyError):
+        asyncio.run(fetcher.fetch_async(delayed(None, 0.1, KeyError('primary')), delayed(None, 0, ValueError('mirror'))))
+    assert fetcher.stats()['backup_wins'] == 1
+
+
+@pytest.fixture
+def asgi_app(monkeypatch):
+    """App ASGI con Transfermarkt simulato (fixture inglese) e registro senza cache"""
+    pytest.importorskip('starlette')
+    httpx = pytest.importorskip('httpx')
+    import scraper_asgi
+
+    with open(FIXTURE_EN, 'rb') as f:
+        html = f.read()
+    upstream = []
+
+    def handler(request):
+        upstream.append(str(request.url))
+        return httpx.Response(200, content=html)
+
+    monkeypatch.setattr(scraper_registry, '_registry', None)
+    scraper_registry.configure_registry(
+        cache=None, partial_parse=True, rate_limiter=DomainRateLimiter(rate=100, burst=100, max_rate=100))
+    app = scraper_asgi.create_app(transport=httpx.MockTransport(handler))
+    return app, upstream
+
+
+def call(app, method, path, **kwargs):
+    import httpx
+
+    async def run():
+        async with app.router.lifespan_context(app):
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url='http://asgi') as client:
+                return await client.request(method, path, **kwargs)
+    return asyncio.run(run())
+
+
+def test_scrape_endpoint(asgi_app):
+    app, upstream = asgi_app
+
+    response = call(app, 'POST', '/api/scrape', json={'url': URL + '/fromCaptcha/1'})
+
+    assert response.status_code == 200
+    data = response.json()['data']
+    assert data['transfermarkt_id'] == '567497'
+    assert data['specific_position'] == 'DC'
+    assert upstream == [URL]
+
+
+def test_other_endpoints(asgi_app):
+    app, upstream = asgi_app
+
+    assert call(app, 'POST', '/api/scrape', json={}).status_code == 400
+    assert call(app, 'GET', '/api/health').json()['status'] == 'ok'
+    languages = call(app, 'GET', '/api/supported-languages').json()['languages']
+    assert {language['code'] for language in languages} == {'it', 'es', 'de', 'en', 'fr', 'pt'}
+    assert call(app, 'GET', '/api/stats').json()['in_flight'] == 0
+    assert upstream == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-q'])
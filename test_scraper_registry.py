@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Test per il registro degli scraper (istanze riusate e statistiche pool)
+Usa un piccolo server HTTP locale, nessuna richiesta verso Transfermarkt
+"""
+
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from scraper_registry import ScraperRegistry
+
+
+class OkHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        body = b'ok'
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_instances_are_reused_and_not_shared():
+    registry = ScraperRegistry()
+
+    with registry.scraper('transfermarkt') as first:
+        with registry.scraper('transfermarkt') as second:
+            assert first is not second
+            assert first.session is second.session
+
+    with registry.scraper('transfermarkt') as again:
+        assert again in (first, second)
+
+    assert registry.pool_stats()['transfermarkt']['instances'] == 2
+
+
+def test_pool_stats_report_connection_reuse():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), OkHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        registry = ScraperRegistry()
+        session = registry.session('transfermarkt')
+        url = f"http://127.0.0.1:{server.server_address[1]}/"
+        for _ in range(5):
+            assert session.get(url, timeout=5).text == 'ok'
+
+        stats = registry.pool_stats()['transfermarkt']
+        assert stats['requests'] == 5
+        assert stats['connections_opened'] == 1
+        assert stats['reuse_ratio'] == 0.8
+    finally:
+        server.shutdown()
+
+
+def test_batch_does_not_replace_the_shared_adapter():
+    registry = ScraperRegistry()
+
+    with registry.scraper('transfermarkt') as scraper:
+        shared = scraper.session.get_adapter('https://')
+        scraper._ensure_pool_size(64)
+        assert scraper.session.get_adapter('https://') is shared
+
+    # Sessione propria: pool allargato, retry dell'adapter registro mantenuti
+    from transfermarkt_scraper import TransfermarktScraper
+    own = TransfermarktScraper()
+    own.session.mount('https://', shared)
+    own._ensure_pool_size(64)
+    resized = own.session.get_adapter('https://')
+    assert resized is not shared and resized._pool_maxsize == 64
+    assert resized.max_retries is shared.max_retries
+    assert resized._pool_connections == shared._pool_connections
+
+
+def test_instances_are_capped_and_waits_are_counted():
+    registry = ScraperRegistry(max_instances=2, acquire_timeout=0.05)
+    first = registry.acquire('transfermarkt')
+    second = registry.acquire('transfermarkt')
+
+    # Limite raggiunto: attesa, poi errore se nessuna istanza torna libera
+    try:
+        registry.acquire('transfermarkt')
+    except TimeoutError:
+        pass
+    else:
+        raise AssertionError("oltre max_instances acquire deve attendere")
+
+    # Un'istanza restituita durante l'attesa viene riusata
+    registry.acquire_timeout = 2
+    threading.Timer(0.05, registry.release, ('transfermarkt', first)).start()
+    started = time.monotonic()
+    assert registry.acquire('transfermarkt') is first
+    assert time.monotonic() - started < 1
+    registry.release('transfermarkt', first)
+    registry.release('transfermarkt', second)
+
+    registry.session('transfermarkt')
+    stats = registry.pool_stats()['transfermarkt']
+    assert (stats['instances'], stats['max_instances'], stats['waits']) == (2, 2, 2)
+
+
+if __name__ == "__main__":
+    test_instances_are_reused_and_not_shared()
+    test_pool_stats_report_connection_reuse()
+    test_batch_does_not_replace_the_shared_adapter()
+    test_instances_are_capped_and_waits_are_counted()
+    print("✅ Tutti i test registro passati")
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Test per la fusione delle richieste contemporanee per lo stesso giocatore
+"""
+
+import time
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from transfermarkt_singleflight import SingleFlight, player_flight_key
+
+
+def test_player_flight_key_normalizes_urls():
+    key = player_flight_key("https://www.transfermarkt.es/james-penrice/profil/spieler/363227")
+    assert key == 'transfermarkt.es/363227'
+    assert player_flight_key("https://transfermarkt.es/x/profil/spieler/363227/fromCaptcha/1") == key
+    assert player_flight_key("https://www.transfermarkt.it/james-penrice/profil/spieler/363227") != key
+    assert player_flight_key("https://www.transfermarkt.es/no-id") == "https://www.transfermarkt.es/no-id"
+
+
+def test_concurrent_calls_share_one_execution():
+    inflight = SingleFlight()
+    calls = []
+    release = threading.Event()
+
+    def scrape():
+        calls.append(1)
+        release.wait(2)
+        return {'name': 'James Penrice'}
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        futures = [executor.submit(inflight.do, 'transfermarkt.es/363227', scrape) for _ in range(5)]
+        while inflight.stats()['shared'] < 4:
+            time.sleep(0.01)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert calls == [1]
+    assert all(result is results[0] for result in results)
+    assert inflight.stats() == {'in_flight': 0, 'executions': 1, 'shared': 4}
+
+    # A scraping terminato la chiave è libera
+    inflight.do('transfermarkt.es/363227', scrape)
+    assert len(calls) == 2
+
+
+def test_errors_reach_every_waiter():
+    inflight = SingleFlight()
+    started = threading.Event()
+
+    def fail():
+        started.set()
+        time.sleep(0.1)
+        raise ValueError('network')
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        leader = executor.submit(inflight.do, 'k', fail)
+        started.wait(1)
+        followers = [executor.submit(inflight.do, 'k', fail) for _ in range(2)]
+        for future in [leader] + followers:
+            with pytest.raises(ValueError):
+                future.result()
+    assert inflight.stats()['executions'] == 1
+
+
+def test_async_calls_share_one_task_and_survive_cancellation():
+    inflight = SingleFlight()
+    calls = []
+
+    async def scrape():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {'name': 'James Penrice'}
+
+    async def run():
+        first = asyncio.ensure_future(inflight.do_async('k', scrape))
+        others = [asyncio.ensure_future(inflight.do_async('k', scrape)) for _ in range(3)]
+        await asyncio.sleep(0)
+        # Il primo client si disconnette: gli altri ricevono comunque il risultato
+        first.cancel()
+        return await asyncio.gather(*others)
+
+    results = asyncio.run(run())
+
+    assert calls == [1]
+    assert results[0] == {'name': 'James Penrice'} and all(r is results[0] for r in results)
+    assert inflight.stats() == {'in_flight': 0, 'executions': 1, 'shared': 3}
+
+
+def test_asgi_scrapes_a_player_once(monkeypatch):
+    pytest.importorskip('starlette')
+    httpx = pytest.importorskip('httpx')
+    import scraper_asgi
+    import scraper_registry
+    from test_canonical_edition import FIXTURE_EN
+    from transfermarkt_rate_limiter import DomainRateLimiter
+
+    with open(FIXTURE_EN, 'rb') as f:
+        html = f.read()
+    upstream = []
+
+    def handler(request):
+        upstream.append(str(request.url))
+        return httpx.Response(200, content=html)
+
+    monkeypatch.setattr(scraper_registry, '_registry', None)
+    monkeypatch.setattr(scraper_asgi, 'inflight', SingleFlight())
+    scraper_registry.configure_registry(
+        cache=None, partial_parse=True, rate_limiter=DomainRateLimiter(rate=100, burst=100, max_rate=100))
+    app = scraper_asgi.create_app(transport=httpx.MockTransport(handler))
+    url = "https://www.transfermarkt.co.uk/filipe-relvas/profil/spieler/567497"
+
+    async def run():
+        async with app.router.lifespan_context(app):
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url='http://asgi') as client:
+                return await asyncio.gather(*(
+                    client.post('/api/scrape', json={'url': url if i % 2 else url + '/fromCaptcha/1'})
+                    for i in range(4)))
+
+    responses = asyncio.run(run())
+
+    assert [r.status_code for r in responses] == [200] * 4
+    assert len({r.json()['data']['transfermarkt_id'] for r in responses}) == 1
+    assert upstream == [url]
+    assert scraper_asgi.inflight.stats()['shared'] == 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-q'])
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Test per il crawler delle rose (squadre e campionati)
+Le pagine sono servite da una sessione finta, nessuna richiesta reale
+"""
+
+from fake_http import FakeResponse
+from test_batch_scraper import make_scraper
+from transfermarkt_squad_crawler import SquadCrawler
+
+BASE = "https://www.transfermarkt.it"
+
+COMPETITION_HTML = b"""
+<table class="items">
+  <tr><td><a href="/ssc-neapel/startseite/verein/6195/saison_id/2024">Napoli</a></td>
+      <td><a href="/ssc-neapel/kader/verein/6195/saison_id/2024">25</a></td></tr>
+  <tr><td><a href="/inter-mailand/startseite/verein/46/saison_id/2024">Inter</a></td></tr>
+</table>
+"""
+
+NAPOLI_HTML = b"""
+<table class="items">
+  <tr><td><a href="/alex-meret/profil/spieler/340918"><img></a></td>
+      <td><a href="/alex-meret/profil/spieler/340918">Alex Meret</a></td>
+      <td><a href="/alex-meret/leistungsdaten/spieler/340918/saison/2024">30</a></td></tr>
+  <tr><td><a href="/amir-rrahmani/profil/spieler/207929">Amir Rrahmani</a></td></tr>
+</table>
+<a href="/news/spieler-des-tages">News</a>
+"""
+
+INTER_HTML = b"""
+<table class="items">
+  <tr><td><a href="/yann-sommer/profil/spieler/42205">Yann Sommer</a></td></tr>
+  <tr><td><a href="https://www.transfermarkt.it/amir-rrahmani/profil/spieler/207929">Amir Rrahmani</a></td></tr>
+</table>
+"""
+
+PAGES = {
+    f"{BASE}/serie-a/startseite/wettbewerb/IT1": COMPETITION_HTML,
+    f"{BASE}/ssc-neapel/kader/verein/6195/saison_id/2024": NAPOLI_HTML,
+    f"{BASE}/inter-mailand/kader/verein/46/saison_id/2024": INTER_HTML,
+}
+
+
+def make_crawler():
+    scraper = make_scraper()
+    profile_get = scraper.session.get
+
+    def get(url, **kwargs):
+        if url in PAGES:
+            return FakeResponse(PAGES[url])
+        return profile_get(url, **kwargs)
+
+    scraper.session.get = get
+    return SquadCrawler(scraper)
+
+
+def test_club_page_deduplicates_players():
+    crawler = make_crawler()
+    urls = crawler.crawl_player_urls(f"{BASE}/ssc-neapel/kader/verein/6195/saison_id/2024")
+    assert urls == [
+        f"{BASE}/alex-meret/profil/spieler/340918",
+        f"{BASE}/amir-rrahmani/profil/spieler/207929",
+    ]
+
+
+def test_competition_page_crawls_every_club():
+    crawler = make_crawler()
+    urls = crawler.crawl_player_urls(f"{BASE}/serie-a/startseite/wettbewerb/IT1")
+    ids = [crawler.scraper.extract_player_id(u) for u in urls]
+    assert ids == ['340918', '207929', '42205']
+
+
+def test_crawl_feeds_batch_scrape():
+    crawler = make_crawler()
+    players = crawler.crawl(f"{BASE}/serie-a/startseite/wettbewerb/IT1", concurrency=3)
+    assert len(players) == 3
+    assert all('error' not in p for p in players)
+    assert [p['id'] for p in players] == ['340918', '207929', '42205']
+
+
+if __name__ == "__main__":
+    test_club_page_deduplicates_players()
+    test_competition_page_crawls_every_club()
+    test_crawl_feeds_batch_scrape()
+    print("✅ Test crawler rose passati")
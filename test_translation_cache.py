@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Test per la cache delle traduzioni (LRU + SQLite)
+"""
+
+import os
+import tempfile
+import threading
+
+from transfermarkt_multilang_scraper import MultiLangTransfermarktScraper
+from transfermarkt_translation_cache import DEFAULT_TRANSLATION_DB, TranslationCache
+
+
+def test_memory_then_disk_then_miss():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'translations.sqlite')
+        calls = []
+
+        def translate(text):
+            calls.append(text)
+            return {'Spagna': 'Spain', 'Scozia': 'Scotland'}[text]
+
+        cache = TranslationCache(path, max_entries=1)
+        assert cache.get_or_translate('it', 'Spagna', translate) == 'Spain'
+        assert cache.get_or_translate('it', 'Spagna', translate) == 'Spain'
+        assert cache.get_or_translate('it', 'Scozia', translate) == 'Scotland'
+        # 'Spagna' è uscita dall'LRU (max 1) ma è ancora su disco
+        assert cache.get_or_translate('it', 'Spagna', translate) == 'Spain'
+        assert calls == ['Spagna', 'Scozia']
+        assert cache.stats()['memory_hits'] == 1
+        assert cache.stats()['disk_hits'] == 1
+        assert cache.stats()['misses'] == 2
+        cache.close()
+
+        # Un nuovo processo trova le traduzioni su disco
+        cache = TranslationCache(path)
+        assert cache.get('it', 'Scozia') == 'Scotland'
+        assert cache.get('es', 'Scozia') is None
+        cache.close()
+
+
+def test_invalidate():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = TranslationCache(os.path.join(tmp, 'translations.sqlite'))
+        cache.put('it', 'Spagna', 'Spain')
+        cache.put('it', 'Celtic', 'Celtic')
+        cache.put('es', 'España', 'Spain')
+
+        assert cache.invalidate('it', 'Celtic') == 1
+        assert cache.get('it', 'Celtic') is None
+        assert cache.invalidate(source_lang='it') == 1
+        assert cache.get('es', 'España') == 'Spain'
+        assert cache.invalidate() == 1
+        assert cache.get('es', 'España') is None
+        cache.close()
+
+
+def test_scraper_translates_each_string_once():
+    scraper = MultiLangTransfermarktScraper(translation_cache=TranslationCache(path=None))
+    calls = []
+
+    def remote(text, source_lang):
+        calls.append((source_lang, text))
+        return text.upper()
+
+    scraper._translate_remote = remote
+    for _ in range(100):
+        assert scraper.translate_to_english('Spagna', 'it') == 'SPAGNA'
+    assert calls == [('it', 'Spagna')]
+
+
+def test_default_store_does_not_depend_on_cwd():
+    if 'TM_TRANSLATION_CACHE' in os.environ or 'TM_CACHE_DIR' in os.environ:
+        return
+    assert os.path.isabs(DEFAULT_TRANSLATION_DB)
+    assert os.path.dirname(os.path.dirname(DEFAULT_TRANSLATION_DB)) == os.path.dirname(os.path.abspath(__file__))
+
+
+def test_memory_hits_do_not_wait_for_disk_reads():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = TranslationCache(os.path.join(tmp, 'translations.sqlite'))
+        cache.put('it', 'Spagna', 'Spain')
+
+        # Una lettura su disco in corso (lock SQLite occupato) non blocca l'LRU
+        with cache._db_lock:
+            result = []
+            reader = threading.Thread(target=lambda: result.append(cache.get('it', 'Spagna')))
+            reader.start()
+            reader.join(1)
+        assert result == ['Spain']
+        cache.close()
+
+
+if __name__ == "__main__":
+    test_memory_then_disk_then_miss()
+    test_invalidate()
+    test_scraper_translates_each_string_once()
+    test_default_store_does_not_depend_on_cwd()
+    test_memory_hits_do_not_wait_for_disk_reads()
+    print("✅ Test cache traduzioni passati")
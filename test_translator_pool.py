@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Test per il pool di traduttori per coppia di lingue
+"""
+
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import transfermarkt_translation_backends as backends
+from transfermarkt_multilang_scraper import MultiLangTransfermarktScraper
+from transfermarkt_translation_backends import TranslatorPool
+from transfermarkt_translation_cache import TranslationCache
+
+
+class ExclusiveTranslator:
+    """Traduttore finto che fallisce se usato da due thread insieme"""
+
+    def __init__(self, source, target):
+        self.source = source
+        self.target = target
+        self.busy = threading.Lock()
+
+    def translate(self, text):
+        assert self.busy.acquire(blocking=False), "client condiviso tra thread"
+        try:
+            time.sleep(0.001)
+            return f"{self.source}:{text}"
+        finally:
+            self.busy.release()
+
+
+def fake_make_translator(created):
+    def make(backend, source, target='en'):
+        created.append((backend, source, target))
+        return ExclusiveTranslator(source, target)
+    return make
+
+
+def test_mixed_languages_reuse_clients(monkeypatch):
+    created = []
+    monkeypatch.setattr(backends, 'make_translator', fake_make_translator(created))
+    pool = TranslatorPool()
+
+    for _ in range(3):
+        for source in ('it', 'es', 'de'):
+            with pool.translator('google', source) as translator:
+                assert translator.translate('x') == f'{source}:x'
+
+    # Un client per lingua, riusato nonostante l'alternanza
+    assert sorted(created) == [('google', 'de', 'en'), ('google', 'es', 'en'), ('google', 'it', 'en')]
+    assert pool.stats()['reused'] == 6
+
+
+def test_concurrent_requests_do_not_share_clients(monkeypatch):
+    created = []
+    monkeypatch.setattr(backends, 'make_translator', fake_make_translator(created))
+    scraper = MultiLangTransfermarktScraper(translation_cache=TranslationCache(path=None),
+                                            translator_pool=TranslatorPool())
+
+    jobs = [(f'testo {i}', ('it', 'es', 'fr')[i % 3]) for i in range(90)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda job: scraper.translate_to_english(*job), jobs))
+
+    assert results == [f'{lang}:{text}' for text, lang in jobs]
+    # Al massimo un client per thread e per lingua
+    assert len(created) <= 8 * 3
+    assert scraper.translator_pool.stats()['in_use'] == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, '-q'])
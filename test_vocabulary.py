@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Test per il vocabolario generato di paesi e piede preferito
+"""
+
+from transfermarkt_mapping import map_feet, map_foot, map_nationalities, map_nationality
+from transfermarkt_multilang_scraper import MultiLangTransfermarktScraper
+from transfermarkt_vocabulary import COUNTRIES, LANGUAGES, NATIONALITIES, country_code, country_name, nationalities
+
+
+def test_countries_in_all_languages():
+    assert len(COUNTRIES) > 250
+    for names in COUNTRIES.values():
+        assert set(names) == set(LANGUAGES)
+    assert country_name('DE', 'it') == 'Germania'
+    assert country_name('GB-SCT', 'fr') == 'Écosse'
+
+
+def test_nationality_in_every_language():
+    for name in ('Costa d\'Avorio', 'Costa de Marfil', 'Elfenbeinküste', "Côte d'Ivoire", 'Costa do Marfim', 'Ivory Coast'):
+        assert map_nationality(name) == 'Ivory Coast', name
+    assert map_nationality('  KOREA,  SOUTH ') == 'South Korea'
+    assert map_nationality('Republik Korea') == 'South Korea'
+    assert map_nationality('Turquia') == map_nationality('Turquía') == 'Turkey'
+    assert country_code('Inghilterra') == 'GB-ENG'
+    # Fuori vocabolario: comportamento storico
+    assert map_nationality('atlantide') == 'Atlantide'
+    assert map_nationality('') == ''
+
+
+def test_canonical_strings_are_interned():
+    spain = {NATIONALITIES[alias] for alias in ('spagna', 'españa', 'spanien', 'espagne', 'espanha', 'spain')}
+    assert len(spain) == 1
+    a, b = nationalities(['Spagna', 'España'])
+    assert a is b
+
+
+def test_foot_vocabulary():
+    assert map_foot('beidfüßig') == 'Both'
+    assert map_foot('Izquierdo') == 'Left'
+    assert map_foot('') == 'Right'
+    assert map_feet(['destro', 'gauche', 'ambos']) == ['Right', 'Left', 'Both']
+    # Stesso vocabolario dello scraper multilingua
+    for alias, value in MultiLangTransfermarktScraper.FOOT_TRANSLATIONS.items():
+        assert map_foot(alias).lower() == value
+
+
+def test_batch_mapping():
+    column = ['Italia', 'Italie', 'Brasil', 'Italia', 'Nowhere']
+    assert map_nationalities(column) == ['Italy', 'Italy', 'Brazil', 'Italy', 'Nowhere']
+
+
+if __name__ == "__main__":
+    test_countries_in_all_languages()
+    test_nationality_in_every_language()
+    test_canonical_strings_are_interned()
+    test_foot_vocabulary()
+    test_batch_mapping()
+    print("✅ Test vocabolario passati")
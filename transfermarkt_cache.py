@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Cache HTML su disco per le pagine profilo Transfermarkt
+
+Le pagine vengono salvate compresse (gzip) insieme ai metadati HTTP
+(ETag / Last-Modified). Entro il TTL la pagina viene servita dal disco senza
+richieste di rete; scaduto il TTL viene rivalidata con una GET condizionale
+(If-None-Match / If-Modified-Since) e, se il server risponde 304, si riusa la
+copia locale. Dentro `with revalidate():` anche le copie ancora fresche
+vengono rivalidate (usato dal refresh della cache dei risultati).
+
+Uso:
+    from transfermarkt_cache import DiskHTMLCache
+    from transfermarkt_scraper import TransfermarktScraper
+
+    scraper = TransfermarktScraper(cache=DiskHTMLCache('.tm_cache', ttl=6 * 3600))
+"""
+
+import os
+import gzip
+import json
+import time
+import tempfile
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from transfermarkt_domains import match_domain
+from transfermarkt_rate_limiter import rate_limited_get, rate_limited_get_async
+
+
+# Rivalidazione forzata attiva nel contesto corrente (thread o task asyncio)
+_revalidating: ContextVar[bool] = ContextVar('tm_cache_revalidate', default=False)
+
+
+@contextmanager
+def revalidate():
+    """Nel blocco fetch_html ignora il TTL: ogni copia in cache passa da una GET condizionale"""
+    token = _revalidating.set(True)
+    try:
+        yield
+    finally:
+        _revalidating.reset(token)
+
+
+def make_cache_key(url: str, player_id: str) -> str:
+    """Chiave di cache: dominio lingua + ID giocatore (es: 'transfermarkt.es/363227')"""
+    domain = match_domain(url) or urlparse(url).netloc.lower()
+    return f"{domain}/{player_id}"
+
+
+class HTMLCache(ABC):
+    """
+    Interfaccia della cache delle risposte
+    
+    Una entry è un dizionario con le chiavi:
+        html           - contenuto della pagina (bytes)
+        etag           - header ETag della risposta (o None)
+        last_modified  - header Last-Modified della risposta (o None)
+        fetched_at     - timestamp dell'ultima validazione (epoch)
+    """
+    
+    ttl = 0
+    
+    @abstractmethod
+    def get(self, key: str) -> Optional[Dict]:
+        ...
+    
+    @abstractmethod
+    def put(self, key: str, html: bytes, etag: Optional[str] = None, last_modified: Optional[str] = None):
+        ...
+    
+    @abstractmethod
+    def touch(self, key: str):
+        """Segna la entry come appena rivalidata (risposta 304)"""
+    
+    @abstractmethod
+    def delete(self, key: str):
+        ...
+    
+    def is_fresh(self, entry: Dict) -> bool:
+        return time.time() - entry.get('fetched_at', 0) < self.ttl
+
+
+class DiskHTMLCache(HTMLCache):
+    """Cache su disco: <cache_dir>/<dominio>/<player_id>.html.gz + .json"""
+    
+    def __init__(self, cache_dir: str = '.tm_cache', ttl: float = 24 * 3600):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        os.makedirs(cache_dir, exist_ok=True)
+    
+    def _paths(self, key: str):
+        domain, _, player_id = key.rpartition('/')
+        folder = os.path.join(self.cache_dir, domain.replace(os.sep, '_') or '_')
+        return (
+            folder,
+            os.path.join(folder, f"{player_id}.html.gz"),
+            os.path.join(folder, f"{player_id}.json"),
+        )
+    
+    def get(self, key: str) -> Optional[Dict]:
+        _, html_path, meta_path = self._paths(key)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            with gzip.open(html_path, 'rb') as f:
+                entry['html'] = f.read()
+            return entry
+        except (OSError, ValueError, EOFError):
+            return None
+    
+    def put(self, key: str, html: bytes, etag: Optional[str] = None, last_modified: Optional[str] = None):
+        folder, html_path, meta_path = self._paths(key)
+        os.makedirs(folder, exist_ok=True)
+        
+        self._atomic_write(html_path, gzip.compress(html))
+        self._write_meta(meta_path, {
+            'etag': etag,
+            'last_modified': last_modified,
+            'fetched_at': time.time(),
+        })
+    
+    def touch(self, key: str):
+        _, _, meta_path = self._paths(key)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return
+        meta['fetched_at'] = time.time()
+        self._write_meta(meta_path, meta)
+    
+    def delete(self, key: str):
+        _, html_path, meta_path = self._paths(key)
+        for path in (html_path, meta_path):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+    
+    def _write_meta(self, path: str, meta: Dict):
+        self._atomic_write(path, json.dumps(meta).encode('utf-8'))
+    
+    def _atomic_write(self, path: str, data: bytes):
+        # Scrittura su file temporaneo + rename: mai entry a metà in caso di crash
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+
+def _get(session, url: str, timeout: float, headers: Optional[Dict], rate_limiter):
+    if rate_limiter is None:
+        return session.get(url, timeout=timeout, headers=headers)
+    return rate_limited_get(session, url, rate_limiter, timeout=timeout, headers=headers)
+
+
+def fetch_html(session, url: str, timeout: float, cache: Optional[HTMLCache] = None,
+               cache_key: Optional[str] = None, rate_limiter=None) -> bytes:
+    """
+    Scarica una pagina usando la cache se disponibile
+    
+    Args:
+        session: requests.Session da usare per la richiesta
+        url: URL da scaricare
+        timeout: Timeout della richiesta in secondi
+        cache: Cache delle risposte (None = nessuna cache)
+        cache_key: Chiave della pagina nella cache (vedi make_cache_key)
+        rate_limiter: DomainRateLimiter da rispettare (None = nessun limite)
+        
+    Returns:
+        Contenuto HTML della pagina (bytes)
+        
+    Raises:
+        requests.RequestException in caso di errore di rete o HTTP
+    """
+    if cache is None or not cache_key:
+        response = _get(session, url, timeout, None, rate_limiter)
+        response.raise_for_status()
+        return response.content
+    
+    entry = cache.get(cache_key)
+    if entry and cache.is_fresh(entry) and not _revalidating.get():
+        print(f"💾 Cache hit: {cache_key}")
+        return entry['html']
+    
+    response = _get(session, url, timeout, _conditional_headers(entry), rate_limiter)
+    
+    if response.status_code == 304:
+        if not entry:
+            import requests
+            
+            raise requests.HTTPError(_UNEXPECTED_304.format(url), response=response)
+        print(f"💾 Cache rivalidata (304): {cache_key}")
+        cache.touch(cache_key)
+        return entry['html']
+    
+    response.raise_for_status()
+    _store(cache, cache_key, response)
+    return response.content
+
+
+# 304 senza una copia locale da riusare: il corpo è vuoto, non è una pagina senza dati
+_UNEXPECTED_304 = "304 Not Modified senza copia in cache per {}"
+
+
+def _conditional_headers(entry: Optional[Dict]) -> Optional[Dict]:
+    """Header per la rivalidazione condizionale di una copia scaduta"""
+    headers = {}
+    if entry:
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+    return headers or None
+
+
+def _store(cache: HTMLCache, cache_key: str, response):
+    cache.put(
+        cache_key,
+        response.content,
+        etag=response.headers.get('ETag'),
+        last_modified=response.headers.get('Last-Modified'),
+    )
+
+
+async def _get_async(client, url: str, timeout: float, headers: Optional[Dict], rate_limiter):
+    if rate_limiter is None:
+        return await client.get(url, timeout=timeout, headers=headers)
+    return await rate_limited_get_async(client, url, rate_limiter, timeout=timeout, headers=headers)
+
+
+async def fetch_html_async(client, url: str, timeout: float, cache: Optional[HTMLCache] = None,
+                           cache_key: Optional[str] = None, rate_limiter=None) -> bytes:
+    """
+    Come fetch_html con un client asincrono (es: httpx.AsyncClient)
+    
+    Letture e scritture della cache su disco girano in un thread, così
+    l'event loop resta libero per le altre richieste.
+    
+    Raises:
+        httpx.HTTPError in caso di errore di rete o HTTP
+    """
+    import asyncio
+    
+    if cache is None or not cache_key:
+        response = await _get_async(client, url, timeout, None, rate_limiter)
+        response.raise_for_status()
+        return response.content
+    
+    entry = await asyncio.to_thread(cache.get, cache_key)
+    if entry and cache.is_fresh(entry) and not _revalidating.get():
+        print(f"💾 Cache hit: {cache_key}")
+        return entry['html']
+    
+    response = await _get_async(client, url, timeout, _conditional_headers(entry), rate_limiter)
+    
+    if response.status_code == 304:
+        if not entry:
+            import httpx
+            
+            raise httpx.HTTPStatusError(_UNEXPECTED_304.format(url), request=response.request, response=response)
+        print(f"💾 Cache rivalidata (304): {cache_key}")
+        await asyncio.to_thread(cache.touch, cache_key)
+        return entry['html']
+    
+    response.raise_for_status()
+    await asyncio.to_thread(_store, cache, cache_key, response)
+    return response.content
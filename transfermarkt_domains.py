@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Domini Transfermarkt supportati
+Mappatura dominio -> lingua condivisa da scraper, cache e rate limiter.
+Non dipende da librerie esterne.
+"""
+
+import re
+from typing import Optional
+from urllib.parse import urlparse
+
+# Mappatura domini -> lingua
+DOMAIN_LANGUAGE_MAP = {
+    'transfermarkt.it': 'it',
+    'transfermarkt.es': 'es',
+    'transfermarkt.de': 'de',
+    'transfermarkt.co.uk': 'en',
+    'transfermarkt.com': 'en',
+    'transfermarkt.fr': 'fr',
+    'transfermarkt.pt': 'pt',
+    'transfermarkt.com.br': 'pt',
+}
+
+# Lingue esposte dalle API (/api/supported-languages)
+SUPPORTED_LANGUAGES = [
+    {'code': 'it', 'name': 'Italiano', 'domain': 'transfermarkt.it'},
+    {'code': 'es', 'name': 'Spagnolo', 'domain': 'transfermarkt.es'},
+    {'code': 'de', 'name': 'Tedesco', 'domain': 'transfermarkt.de'},
+    {'code': 'en', 'name': 'Inglese', 'domain': 'transfermarkt.co.uk'},
+    {'code': 'fr', 'name': 'Francese', 'domain': 'transfermarkt.fr'},
+    {'code': 'pt', 'name': 'Portoghese', 'domain': 'transfermarkt.pt'},
+]
+
+# Edizione di riferimento: l'ID giocatore è lo stesso su tutti i domini
+CANONICAL_DOMAIN = 'transfermarkt.co.uk'
+
+# Mirror con la stessa lingua (per gli altri domini si usa CANONICAL_DOMAIN)
+MIRROR_DOMAINS = {
+    'transfermarkt.co.uk': 'transfermarkt.com',
+    'transfermarkt.com': 'transfermarkt.co.uk',
+    'transfermarkt.pt': 'transfermarkt.com.br',
+    'transfermarkt.com.br': 'transfermarkt.pt',
+}
+
+# Slug del giocatore nel percorso profilo (/<slug>/profil/spieler/<id>)
+_PROFILE_SLUG_PATTERN = re.compile(r'^/([^/]+)/[^/]+/spieler/')
+
+
+def match_domain(url: str) -> Optional[str]:
+    """Restituisce il dominio Transfermarkt (chiave di DOMAIN_LANGUAGE_MAP) dell'URL"""
+    netloc = urlparse(url).netloc.lower()
+    
+    # Il match più lungo vince (transfermarkt.com.br prima di transfermarkt.com)
+    best = None
+    for domain_pattern in DOMAIN_LANGUAGE_MAP:
+        if domain_pattern in netloc and (best is None or len(domain_pattern) > len(best)):
+            best = domain_pattern
+    return best
+
+
+def clean_url(url: str) -> str:
+    """Rimuove parametri extra come /fromCaptcha/1"""
+    if '/fromCaptcha' in url or '/fromCatpcha' in url:
+        url = url.split('/fromC')[0]
+    return url
+
+
+def detect_language(url: str) -> str:
+    """Rileva la lingua dal dominio dell'URL (default: inglese)"""
+    domain = match_domain(url)
+    return DOMAIN_LANGUAGE_MAP[domain] if domain else 'en'
+
+
+def edition_url(url: str, player_id: str, domain: str = CANONICAL_DOMAIN) -> str:
+    """
+    URL della stessa pagina profilo su un'altra edizione di Transfermarkt
+    
+    Es: edition_url('https://www.transfermarkt.es/james-penrice/profil/spieler/363227', '363227')
+        -> 'https://www.transfermarkt.co.uk/james-penrice/profil/spieler/363227'
+    """
+    match = _PROFILE_SLUG_PATTERN.match(urlparse(url).path)
+    slug = match.group(1) if match else 'spieler'
+    return f"https://www.{domain}/{slug}/profil/spieler/{player_id}"
+
+
+def mirror_domain(domain: Optional[str]) -> str:
+    """Dominio alternativo da cui scaricare la stessa pagina (stessa lingua se possibile)"""
+    return MIRROR_DOMAINS.get(domain, CANONICAL_DOMAIN)
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Specifica dichiarativa dei campi della pagina profilo Transfermarkt
+
+Entrambi gli scraper leggono le stesse regioni della pagina. Invece di una
+serie di soup.find / find_all (ognuna una scansione dell'intero albero), la
+specifica viene compilata una volta in un indice tag -> classe -> regione e
+applicata con un'unica visita dell'albero, che raccoglie anche le coppie
+label/valore della info-table, i <dd> per il fallback del ruolo e la label
+dell'agente. Il costo dell'estrazione cresce con la dimensione della pagina,
+non con (numero di campi x dimensione della pagina).
+
+Uso:
+    from transfermarkt_fields import PROFILE_FIELDS
+
+    doc = PROFILE_FIELDS.extract(soup)
+    name_tag = doc.region('headline')
+    for label_tag, value_tag in doc.info_pairs():
+        ...
+"""
+
+import re
+from typing import Dict, List, Tuple
+
+# (regione, tag, classe CSS): viene presa la prima occorrenza nel documento
+PROFILE_FIELD_SPEC = (
+    ('headline', 'h1', 'data-header__headline-wrapper'),
+    ('shirt_number', 'span', 'data-header__shirt-number'),
+    ('profile_image', 'img', 'data-header__profile-image'),
+    ('club', 'span', 'data-header__club'),
+    ('market_value_header', 'a', 'data-header__market-value-wrapper'),
+    ('market_value_widget', 'div', 'tm-player-market-value-development__current-value'),
+    ('info_table', 'div', 'info-table'),
+    ('detail_position', 'div', 'detail-position'),
+    ('grid_view', 'div', 'grid-view'),
+)
+
+INFO_SPAN_CLASS = 'info-table__content'
+INFO_LABEL_CLASS = 'info-table__content--regular'
+INFO_VALUE_CLASS = 'info-table__content--bold'
+AGENT_LABEL_RE = re.compile(r'Agente|Agent', re.IGNORECASE)
+
+
+class ProfileDocument:
+    """Risultato della visita: regioni e collezioni raccolte in un solo passaggio"""
+    
+    __slots__ = ('regions', 'info_spans', 'dd_tags', 'agent_label')
+    
+    def __init__(self):
+        self.regions = {}
+        self.info_spans = []
+        self.dd_tags = []
+        self.agent_label = None
+    
+    def region(self, name: str):
+        return self.regions.get(name)
+    
+    def next_value(self, index: int):
+        """Span valore (--bold) che segue la label info_spans[index] nello stesso contenitore"""
+        label = self.info_spans[index]
+        for span in self.info_spans[index + 1:]:
+            if span.parent is label.parent and INFO_VALUE_CLASS in span.get('class', ()):
+                return span
+        return None
+    
+    def info_pairs(self) -> List[Tuple]:
+        """Coppie (label, valore) della info-table"""
+        pairs = []
+        for i, span in enumerate(self.info_spans):
+            if INFO_LABEL_CLASS in span.get('class', ()):
+                value = self.next_value(i)
+                if value is not None:
+                    pairs.append((span, value))
+        return pairs
+    
+    def agent_value(self):
+        """Valore associato alla label dell'agente"""
+        label = self.agent_label
+        if label is None:
+            return None
+        for i, span in enumerate(self.info_spans):
+            if span is label:
+                return self.next_value(i)
+        # Label fuori dalla info-table: primo valore nel contenitore
+        parent = label.find_parent()
+        return parent.find('span', class_=INFO_VALUE_CLASS) if parent else None
+
+
+class CompiledFieldSpec:
+    """Specifica compilata in un indice tag -> classe -> regione"""
+    
+    def __init__(self, spec=PROFILE_FIELD_SPEC):
+        self.spec = spec
+        self.index: Dict[str, Dict[str, str]] = {}
+        for name, tag, css_class in spec:
+            self.index.setdefault(tag, {})[css_class] = name
+    
+    def extract(self, soup) -> ProfileDocument:
+        """Visita l'albero una volta sola e popola un ProfileDocument"""
+        doc = ProfileDocument()
+        regions = doc.regions
+        index = self.index
+        info_table = None
+        
+        for tag in soup.descendants:
+            name = tag.name
+            if name is None:
+                continue  # NavigableString
+            
+            classes = tag.get('class') or ()
+            wanted = index.get(name)
+            if wanted:
+                for css_class in classes:
+                    region = wanted.get(css_class)
+                    if region and region not in regions:
+                        regions[region] = tag
+                        if region == 'info_table':
+                            info_table = tag
+                        break
+            
+            if name == 'span':
+                if (INFO_SPAN_CLASS in classes and info_table is not None
+                        and _is_inside(tag, info_table)):
+                    doc.info_spans.append(tag)
+                if doc.agent_label is None:
+                    text = tag.string
+                    if text and AGENT_LABEL_RE.search(text):
+                        doc.agent_label = tag
+            elif name == 'dd':
+                doc.dd_tags.append(tag)
+        
+        return doc
+
+
+def _is_inside(tag, ancestor) -> bool:
+    for parent in tag.parents:
+        if parent is ancestor:
+            return True
+    return False
+
+
+# Specifica compilata una volta all'import, condivisa dagli scraper
+PROFILE_FIELDS = CompiledFieldSpec()
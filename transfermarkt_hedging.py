@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Richieste "hedged" tra le edizioni di Transfermarkt
+
+Lo stesso ID giocatore è disponibile su più domini. Se l'edizione richiesta
+non risponde entro un ritardo derivato dal p95 delle latenze recenti, parte
+una seconda richiesta verso un mirror (vedi mirror_domain) e vince la prima
+che termina con successo; l'altra viene annullata se non è ancora partita,
+altrimenti il suo risultato viene scartato. Solo le richieste lente (oltre il
+p95, circa 1 su 20) generano traffico in più. Il ritardo parte quando la
+richiesta principale è davvero in esecuzione: sotto carico l'attesa nella coda
+del pool non fa partire richieste di riserva.
+
+Uso:
+    from transfermarkt_hedging import get_hedged_fetcher
+
+    fetcher = get_hedged_fetcher()           # unico per processo
+    html, used_backup = fetcher.fetch(lambda: get(primary_url), lambda: get(mirror_url))
+    html, used_backup = await fetcher.fetch_async(lambda: get_async(primary_url), lambda: get_async(mirror_url))
+"""
+
+import time
+import threading
+from collections import deque
+from contextvars import copy_context
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+
+from scraper_registry import DEFAULT_POOL_MAXSIZE
+
+T = TypeVar('T')
+
+# Una richiesta principale e una di riserva per ogni connessione del registro
+DEFAULT_HEDGE_WORKERS = 2 * DEFAULT_POOL_MAXSIZE
+
+
+class LatencyTracker:
+    """Finestra mobile delle latenze della richiesta principale"""
+
+    def __init__(self, window: int = 200, percentile: float = 0.95, default_delay: float = 1.5,
+                 min_delay: float = 0.25, min_samples: int = 20):
+        """
+        Args:
+            window: Numero di latenze recenti considerate
+            percentile: Percentile usato come ritardo prima del mirror
+            default_delay: Ritardo finché non ci sono min_samples misure
+            min_delay: Ritardo minimo (evita di raddoppiare le richieste veloci)
+            min_samples: Misure necessarie prima di usare il percentile
+        """
+        self.samples = deque(maxlen=window)
+        self.percentile = percentile
+        self.default_delay = default_delay
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        with self._lock:
+            self.samples.append(seconds)
+
+    def hedge_delay(self) -> float:
+        """Attesa prima di inviare la richiesta al mirror"""
+        with self._lock:
+            if len(self.samples) < self.min_samples:
+                return self.default_delay
+            ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, int(len(ordered) * self.percentile))
+        return max(self.min_delay, ordered[index])
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            samples = len(self.samples)
+        return {'samples': samples, 'hedge_delay': round(self.hedge_delay(), 3)}
+
+
+class HedgedFetcher:
+    """Esegue una richiesta principale e, se lenta, una di riserva in parallelo"""
+
+    def __init__(self, tracker: Optional[LatencyTracker] = None, max_workers: int = DEFAULT_HEDGE_WORKERS):
+        self.tracker = tracker or LatencyTracker()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='tm-hedge')
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.hedged = 0
+        self.backup_wins = 0
+
+    def fetch(self, primary: Callable[[], T], backup: Callable[[], T]) -> Tuple[T, bool]:
+        """
+        Esegue `primary`; se non termina entro il ritardo di hedge esegue anche `backup`
+
+        Returns:
+            (risultato, True se ha vinto la richiesta di riserva)
+
+        Raises:
+            L'eccezione della richiesta principale se falliscono entrambe
+        """
+        began = threading.Event()
+        started = []
+
+        def run_primary():
+            started.append(time.monotonic())
+            began.set()
+            return primary()
+
+        # Le richieste girano nel pool con il contesto del chiamante (es. revalidate della cache)
+        first = self._executor.submit(copy_context().run, run_primary)
+        # Le latenze misurate sono sempre quelle della richiesta principale, dal suo avvio
+        first.add_done_callback(
+            lambda f: not f.cancelled() and f.exception() is None and self.tracker.record(time.monotonic() - started[0]))
+        with self._lock:
+            self.requests += 1
+
+        # Il tempo in coda nel pool non conta nel ritardo di hedge
+        began.wait()
+        done, _ = wait([first], timeout=self.tracker.hedge_delay())
+        if done:
+            return first.result(), False
+
+        with self._lock:
+            self.hedged += 1
+        second = self._executor.submit(copy_context().run, backup)
+        pending = {first, second}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    for other in pending:
+                        other.cancel()
+                    if future is second:
+                        with self._lock:
+                            self.backup_wins += 1
+                    return future.result(), future is second
+
+        return first.result(), False
+
+    async def fetch_async(self, primary: Callable[[], Awaitable[T]],
+                          backup: Callable[[], Awaitable[T]]) -> Tuple[T, bool]:
+        """
+        Come fetch, con coroutine al posto dei thread (API asincrona)
+
+        La richiesta che perde viene annullata anche se è già in volo.
+        """
+        import asyncio
+
+        started = time.monotonic()
+        first = asyncio.ensure_future(primary())
+        first.add_done_callback(
+            lambda f: not f.cancelled() and f.exception() is None and self.tracker.record(time.monotonic() - started))
+        with self._lock:
+            self.requests += 1
+
+        done, _ = await asyncio.wait({first}, timeout=self.tracker.hedge_delay())
+        if done:
+            return first.result(), False
+
+        with self._lock:
+            self.hedged += 1
+        second = asyncio.ensure_future(backup())
+        pending = {first, second}
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    for other in pending:
+                        other.cancel()
+                    if task is second:
+                        with self._lock:
+                            self.backup_wins += 1
+                    return task.result(), task is second
+
+        return first.result(), False
+
+    def stats(self) -> Dict:
+        with self._lock:
+            stats = {
+                'requests': self.requests,
+                'hedged': self.hedged,
+                'backup_wins': self.backup_wins,
+            }
+        stats.update(self.tracker.snapshot())
+        return stats
+
+
+_shared_fetcher = None
+_shared_lock = threading.Lock()
+
+
+def get_hedged_fetcher() -> HedgedFetcher:
+    """Restituisce l'hedged fetcher condiviso dal processo"""
+    global _shared_fetcher
+    if _shared_fetcher is None:
+        with _shared_lock:
+            if _shared_fetcher is None:
+                _shared_fetcher = HedgedFetcher()
+    return _shared_fetcher
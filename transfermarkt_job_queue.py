@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Coda di job di scraping in background per le API Flask
+
+POST /api/scrape-batch crea un job con molti URL e risponde subito con il
+suo ID; un pool di worker condiviso elabora gli URL e GET /api/jobs/<id>
+restituisce avanzamento e risultati per URL. I worker HTTP di Flask non
+restano occupati per tutta la durata dello scraping.
+
+POST /api/scrape-stream usa lo stesso pool, ma invia ogni risultato appena è
+pronto (NDJSON o server-sent events) e chiude con un frame di riepilogo.
+
+I job stanno in memoria: quelli terminati vengono rimossi dopo `ttl` secondi
+(o quando si supera `max_jobs`). Per batch lunghi da riprendere dopo un
+riavvio c'è transfermarkt_jobs.BatchJob (journal su disco).
+
+Uso:
+    from transfermarkt_job_queue import JobQueue
+
+    jobs = JobQueue(process=lambda url: {'name': ...}, workers=8)
+    job = jobs.submit(urls)
+    jobs.get(job.id).to_dict()
+
+    for chunk in encode_stream(jobs.stream(urls), 'ndjson'):
+        ...
+"""
+
+import os
+import json
+import time
+import uuid
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+COMPLETED = 'completed'
+
+# Formati di POST /api/scrape-stream -> content type
+STREAM_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'sse': 'text/event-stream',
+}
+
+# Limiti di default (sovrascrivibili da env)
+DEFAULT_JOB_WORKERS = int(os.environ.get('TM_JOB_WORKERS', 8))
+MAX_BATCH_URLS = int(os.environ.get('TM_BATCH_MAX_URLS', 500))
+
+
+class ScrapeJob:
+    """Un batch di URL e lo stato di ciascuno"""
+
+    def __init__(self, urls: List[str]):
+        self.id = uuid.uuid4().hex
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.items = [{'url': url, 'status': QUEUED} for url in urls]
+        self._remaining = len(urls)
+        self._lock = threading.Lock()
+
+    def _update(self, index: int, **fields):
+        with self._lock:
+            item = self.items[index]
+            item.update(fields)
+            if item['status'] in (DONE, FAILED):
+                self._remaining -= 1
+                if self._remaining == 0:
+                    self.finished_at = time.time()
+
+    @property
+    def finished(self) -> bool:
+        return self.finished_at is not None
+
+    def to_dict(self, include_results: bool = True) -> Dict:
+        """Avanzamento (e risultati per URL, nell'ordine di invio)"""
+        with self._lock:
+            counts = {QUEUED: 0, RUNNING: 0, DONE: 0, FAILED: 0}
+            for item in self.items:
+                counts[item['status']] += 1
+            total = len(self.items)
+            if self.finished:
+                status = COMPLETED
+            elif counts[RUNNING] or counts[DONE] or counts[FAILED]:
+                status = RUNNING
+            else:
+                status = QUEUED
+            job = {
+                'id': self.id,
+                'status': status,
+                'total': total,
+                'queued': counts[QUEUED],
+                'running': counts[RUNNING],
+                'done': counts[DONE],
+                'failed': counts[FAILED],
+                'progress': round((counts[DONE] + counts[FAILED]) / total, 4) if total else 1.0,
+                'created_at': self.created_at,
+                'finished_at': self.finished_at,
+            }
+            if include_results:
+                job['results'] = [dict(item) for item in self.items]
+        return job
+
+
+class JobQueue:
+    """Job in memoria elaborati da un pool di worker condiviso"""
+
+    def __init__(self, process: Callable[[str], Dict], workers: int = DEFAULT_JOB_WORKERS,
+                 max_jobs: int = 1000, ttl: float = 3600.0):
+        """
+        Args:
+            process: Funzione url -> dizionario dei dati ({"error": ...} se fallisce)
+            workers: URL elaborati in parallelo (tra tutti i job)
+            max_jobs: Job conservati al massimo (i terminati più vecchi vengono rimossi)
+            ttl: Secondi per cui un job terminato resta consultabile
+        """
+        self.process = process
+        self.workers = workers
+        self.max_jobs = max_jobs
+        self.ttl = ttl
+        self._jobs: 'OrderedDict[str, ScrapeJob]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _pool(self) -> ThreadPoolExecutor:
+        # Creato al primo job: importare l'API non avvia thread
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='tm-batch')
+        return self._executor
+
+    def _start(self, urls: List[str]) -> Tuple[ScrapeJob, List[Future]]:
+        job = ScrapeJob(urls)
+        with self._lock:
+            self._prune()
+            self._jobs[job.id] = job
+            pool = self._pool()
+        return job, [pool.submit(self._run, job, index, url) for index, url in enumerate(urls)]
+
+    def submit(self, urls: List[str]) -> ScrapeJob:
+        """Crea un job e mette in coda i suoi URL"""
+        job, _ = self._start(urls)
+        print(f"📋 Job {job.id}: {len(urls)} URL in coda")
+        return job
+
+    def stream(self, urls: List[str]) -> Iterator[Dict]:
+        """
+        Come submit, ma restituisce ogni risultato appena è pronto
+
+        Frame, nell'ordine:
+            {"type": "start", "job_id": ..., "total": N}
+            {"type": "result", "index": i, "url": ..., "status": "done", "data": {...}}
+                (oppure "status": "failed" con "error"), uno per URL in ordine di completamento
+            {"type": "summary", "job_id": ..., "total": N, "done": ..., "failed": ..., "elapsed": secondi}
+
+        Se chi legge si ferma (client disconnesso) gli URL non ancora
+        partiti vengono annullati e segnati come falliti.
+        """
+        started = time.monotonic()
+        job, futures = self._start(urls)
+        print(f"📡 Job {job.id}: {len(urls)} URL in streaming")
+        positions = {future: index for index, future in enumerate(futures)}
+
+        try:
+            yield {'type': 'start', 'job_id': job.id, 'total': len(urls)}
+            for future in as_completed(futures):
+                index = positions[future]
+                with job._lock:
+                    item = dict(job.items[index])
+                yield {'type': 'result', 'index': index, **item}
+        finally:
+            for index, future in enumerate(futures):
+                if future.cancel():
+                    job._update(index, status=FAILED, error='Stream interrotto dal client')
+
+        progress = job.to_dict(include_results=False)
+        yield {
+            'type': 'summary',
+            'job_id': job.id,
+            'total': progress['total'],
+            'done': progress['done'],
+            'failed': progress['failed'],
+            'elapsed': round(time.monotonic() - started, 3),
+        }
+
+    def _run(self, job: ScrapeJob, index: int, url: str):
+        job._update(index, status=RUNNING)
+        try:
+            data = self.process(url)
+        except Exception as e:
+            data = {"error": f"Errore inaspettato: {str(e)}"}
+        if data is None or 'error' in data:
+            job._update(index, status=FAILED, error=(data or {}).get('error', 'Unable to extract data'))
+        else:
+            job._update(index, status=DONE, data=data)
+
+    def get(self, job_id: str) -> Optional[ScrapeJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _prune(self):
+        """Rimuove i job terminati scaduti (e i più vecchi oltre max_jobs)"""
+        now = time.time()
+        for job_id in [j.id for j in self._jobs.values() if j.finished and now - j.finished_at > self.ttl]:
+            del self._jobs[job_id]
+        finished = [j.id for j in self._jobs.values() if j.finished]
+        while len(self._jobs) >= self.max_jobs and finished:
+            del self._jobs[finished.pop(0)]
+
+    def stats(self) -> Dict:
+        with self._lock:
+            jobs = list(self._jobs.values())
+        active = [job for job in jobs if not job.finished]
+        return {
+            'jobs': len(jobs),
+            'active_jobs': len(active),
+            'queued_urls': sum(1 for job in active for item in job.items if item['status'] == QUEUED),
+            'workers': self.workers,
+        }
+
+    def shutdown(self, wait: bool = True):
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=not wait)
+            self._executor = None
+
+
+def parse_batch_urls(payload) -> List[str]:
+    """
+    URL dal body di POST /api/scrape-batch ({"urls": [...]})
+
+    Raises:
+        ValueError: body non valido, lista vuota o oltre MAX_BATCH_URLS
+    """
+    urls = payload.get('urls') if isinstance(payload, dict) else None
+    if not isinstance(urls, list) or not urls:
+        raise ValueError('Fornire {"urls": ["...", ...]} con almeno un URL')
+    if len(urls) > MAX_BATCH_URLS:
+        raise ValueError(f'Troppi URL: {len(urls)} (massimo {MAX_BATCH_URLS} per job)')
+    if not all(isinstance(url, str) and url.strip() for url in urls):
+        raise ValueError('Ogni URL deve essere una stringa non vuota')
+    return [url.strip() for url in urls]
+
+
+def stream_format(requested: Optional[str], accept: str = '') -> str:
+    """
+    Formato dello stream: ?format=ndjson|sse, altrimenti dall'header Accept (default ndjson)
+
+    Raises:
+        ValueError: formato sconosciuto
+    """
+    if requested:
+        if requested not in STREAM_FORMATS:
+            raise ValueError(f"Formato sconosciuto: '{requested}' (usa {' o '.join(STREAM_FORMATS)})")
+        return requested
+    return 'sse' if 'text/event-stream' in (accept or '') else 'ndjson'
+
+
+def encode_frame(frame: Dict, fmt: str) -> str:
+    """Una riga JSON (NDJSON) oppure un evento server-sent con il tipo del frame"""
+    payload = json.dumps(frame, ensure_ascii=False, default=str)
+    if fmt == 'sse':
+        return f"event: {frame['type']}\ndata: {payload}\n\n"
+    return payload + '\n'
+
+
+def encode_stream(frames: Iterator[Dict], fmt: str) -> Iterator[str]:
+    """Codifica i frame di JobQueue.stream; chiudere questo iteratore chiude anche lo stream"""
+    try:
+        for frame in frames:
+            yield encode_frame(frame, fmt)
+    finally:
+        frames.close()
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Job di scraping in batch riprendibili, con journal di checkpoint
+
+Ogni job vive in una cartella con un journal append-only (journal.jsonl):
+una riga JSON per evento ('pending', 'done', 'failed') scritta e sincronizzata
+su disco appena il giocatore è completato. Lo stato di ogni giocatore è
+l'ultimo evento registrato, quindi dopo un crash o un Ctrl-C il job riparte
+esattamente dai giocatori non ancora completati, e con `retry` si rieseguono
+solo quelli falliti.
+
+Uso:
+    python transfermarkt_jobs.py start jobs/serie_a urls.txt
+    python transfermarkt_jobs.py resume jobs/serie_a
+    python transfermarkt_jobs.py retry jobs/serie_a
+    python transfermarkt_jobs.py status jobs/serie_a
+    python transfermarkt_jobs.py export jobs/serie_a -o serie_a.json
+
+    oppure:
+    from transfermarkt_jobs import BatchJob
+    job = BatchJob('jobs/serie_a')
+    job.add(urls)
+    job.run()
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterable, List, Optional
+
+from transfermarkt_scraper import TransfermarktScraper
+
+PENDING = 'pending'
+DONE = 'done'
+FAILED = 'failed'
+
+
+class BatchJob:
+    """Job di scraping con journal append-only in `job_dir/journal.jsonl`"""
+
+    JOURNAL_NAME = 'journal.jsonl'
+
+    def __init__(self, job_dir: str, scraper: Optional[TransfermarktScraper] = None):
+        """
+        Args:
+            job_dir: Cartella del job (creata se non esiste)
+            scraper: Scraper da usare (default: nuovo TransfermarktScraper con parsing parziale)
+        """
+        self.job_dir = job_dir
+        self.journal_path = os.path.join(job_dir, self.JOURNAL_NAME)
+        self.scraper = scraper or TransfermarktScraper(partial_parse=True)
+        self._lock = threading.Lock()
+        # player_id -> ultimo evento del journal
+        self._entries: Dict[str, Dict] = {}
+
+        os.makedirs(job_dir, exist_ok=True)
+        self._replay()
+
+    def _replay(self):
+        """Ricostruisce lo stato rileggendo il journal"""
+        if not os.path.exists(self.journal_path):
+            return
+        line = ''
+        with open(self.journal_path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # Ultima riga troncata da un crash durante la scrittura
+                    continue
+                self._entries[entry['player_id']] = entry
+        if line and not line.endswith('\n'):
+            # Chiude la riga troncata così i nuovi eventi partono da una riga nuova
+            with open(self.journal_path, 'a', encoding='utf-8') as f:
+                f.write('\n')
+
+    def _append(self, entries: List[Dict]):
+        """Aggiunge eventi al journal e li sincronizza su disco"""
+        with self._lock:
+            with open(self.journal_path, 'a', encoding='utf-8') as f:
+                for entry in entries:
+                    f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            for entry in entries:
+                self._entries[entry['player_id']] = entry
+
+    def add(self, urls: Iterable[str]) -> int:
+        """
+        Aggiunge URL al job come 'pending' (gli ID già presenti vengono ignorati)
+
+        Returns:
+            Numero di giocatori aggiunti
+        """
+        entries = []
+        seen = set(self._entries)
+        for url in urls:
+            player_id = self.scraper.extract_player_id(url)
+            if not player_id:
+                print(f"⚠️  ID giocatore non trovato nell'URL: {url}")
+                continue
+            if player_id in seen:
+                continue
+            seen.add(player_id)
+            entries.append({'event': PENDING, 'player_id': player_id, 'url': url, 'ts': time.time()})
+        if entries:
+            self._append(entries)
+        return len(entries)
+
+    def ids(self, event: str) -> List[str]:
+        """ID dei giocatori il cui ultimo evento è `event`"""
+        return [pid for pid, entry in self._entries.items() if entry['event'] == event]
+
+    def status(self) -> Dict[str, int]:
+        """Conteggio dei giocatori per stato"""
+        counts = {PENDING: 0, DONE: 0, FAILED: 0}
+        for entry in self._entries.values():
+            counts[entry['event']] += 1
+        counts['total'] = len(self._entries)
+        return counts
+
+    def results(self) -> Dict[str, Dict]:
+        """Dati dei giocatori completati, per ID"""
+        return {pid: entry['data'] for pid, entry in self._entries.items() if entry['event'] == DONE}
+
+    def errors(self) -> Dict[str, str]:
+        """Errore dell'ultimo tentativo dei giocatori falliti, per ID"""
+        return {pid: entry['error'] for pid, entry in self._entries.items() if entry['event'] == FAILED}
+
+    def run(self, concurrency: int = 8, retry_failed: bool = False) -> Dict[str, int]:
+        """
+        Esegue i giocatori in attesa (e i falliti se retry_failed)
+
+        Ogni risultato viene scritto nel journal appena disponibile: se il
+        processo si interrompe, il lavoro completato non va perso.
+
+        Returns:
+            Stato del job al termine (vedi status)
+        """
+        todo = [self._entries[pid] for pid in self.ids(PENDING)]
+        if retry_failed:
+            todo += [self._entries[pid] for pid in self.ids(FAILED)]
+
+        if not todo:
+            print("✅ Nessun giocatore da elaborare")
+            return self.status()
+
+        concurrency = max(1, int(concurrency))
+        self.scraper._ensure_pool_size(concurrency)
+        print(f"🚀 Job {self.job_dir}: {len(todo)} giocatori da elaborare")
+
+        executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='tm-job')
+        try:
+            futures = {executor.submit(self.scraper.get_player_info, entry['url']): entry for entry in todo}
+            for future in as_completed(futures):
+                entry = futures[future]
+                try:
+                    data = future.result()
+                except Exception as e:
+                    data = {"error": f"Errore inaspettato: {str(e)}"}
+                record = {'player_id': entry['player_id'], 'url': entry['url'], 'ts': time.time()}
+                if 'error' in data:
+                    record.update(event=FAILED, error=data['error'])
+                else:
+                    record.update(event=DONE, data=data)
+                self._append([record])
+        except KeyboardInterrupt:
+            print("\n⏸️  Interrotto: i giocatori completati sono salvati nel journal, riprendi con 'resume'")
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown(wait=True)
+
+        status = self.status()
+        print(f"📦 Job: {status[DONE]} completati, {status[FAILED]} falliti, {status[PENDING]} in attesa")
+        return status
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Job di scraping Transfermarkt riprendibili")
+    parser.add_argument('command', choices=['start', 'resume', 'retry', 'status', 'export'])
+    parser.add_argument('job_dir', help="Cartella del job")
+    parser.add_argument('urls_file', nargs='?', help="File con un URL profilo per riga (solo 'start')")
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('-o', '--output', default=None, help="File di output per 'export'")
+    args = parser.parse_args()
+
+    job = BatchJob(args.job_dir)
+
+    if args.command == 'start':
+        if not args.urls_file:
+            parser.error("'start' richiede il file degli URL")
+        with open(args.urls_file, encoding='utf-8') as f:
+            urls = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+        print(f"➕ {job.add(urls)} giocatori aggiunti al job")
+
+    if args.command in ('start', 'resume', 'retry'):
+        try:
+            job.run(concurrency=args.concurrency, retry_failed=args.command == 'retry')
+        except KeyboardInterrupt:
+            return 130
+    elif args.command == 'status':
+        print(json.dumps(job.status(), indent=2))
+        for player_id, error in job.errors().items():
+            print(f"   ❌ {player_id}: {error}")
+    elif args.command == 'export':
+        output = args.output or os.path.join(args.job_dir, 'results.json')
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(list(job.results().values()), f, ensure_ascii=False, indent=2)
+        print(f"💾 Risultati salvati in: {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Classificatore multilingua delle label della info-table Transfermarkt
+
+Le regole (campo -> parole chiave, in ordine di priorità) vengono compilate
+all'import in un'unica regex ad alternanza dentro un lookahead, che trova in
+un solo passaggio tutte le parole chiave presenti nella label, anche
+sovrapposte. Le alternative sono ordinate per priorità del campo, quindi il
+risultato è identico a una catena di if/elif con any(keyword in label ...),
+ma senza ricostruire le liste e riscandire la label per ogni ramo.
+Le label si ripetono tra le pagine: il risultato viene memorizzato.
+
+Uso:
+    from transfermarkt_labels import InfoField, PROFILE_LABELS
+
+    PROFILE_LABELS.classify('data di nascita/età:')   # InfoField.BIRTH
+"""
+
+import re
+from enum import Enum
+from typing import Dict, Optional, Sequence, Tuple
+
+
+class InfoField(Enum):
+    """Campi riconosciuti nelle label della info-table"""
+    BIRTH = 'birth'
+    BIRTH_PLACE = 'birth_place'
+    HEIGHT = 'height'
+    WEIGHT = 'weight'
+    NATIONALITY = 'nationality'
+    POSITION = 'position'
+    FOOT = 'foot'
+    MARKET_VALUE = 'market_value'
+    CONTRACT = 'contract'
+
+
+class LabelClassifier:
+    """Mappa una label (minuscola) sul primo campo, in ordine di priorità, di cui contiene una parola chiave"""
+    
+    def __init__(self, rules: Sequence[Tuple[InfoField, Sequence[str]]], cache_size: int = 4096):
+        self.rules = tuple((field, tuple(keywords)) for field, keywords in rules)
+        self.cache_size = cache_size
+        self._cache: Dict[str, Optional[InfoField]] = {}
+        
+        # Parola chiave -> campo (vince la regola con priorità più alta)
+        self._keyword_field: Dict[str, InfoField] = {}
+        for field, keywords in self.rules:
+            for keyword in keywords:
+                self._keyword_field.setdefault(keyword, field)
+        self._priority = {field: i for i, (field, _) in enumerate(self.rules)}
+        
+        # Lookahead: trova una parola chiave a ogni posizione, anche sovrapposta.
+        # A parità di posizione vince la prima alternativa, cioè il campo più prioritario.
+        alternatives = '|'.join(re.escape(keyword) for keyword in self._keyword_field)
+        self._pattern = re.compile(f'(?=({alternatives}))')
+    
+    def classify(self, label: str) -> Optional[InfoField]:
+        """Restituisce il campo della label o None"""
+        try:
+            return self._cache[label]
+        except KeyError:
+            pass
+        
+        best = None
+        best_priority = len(self.rules)
+        for match in self._pattern.finditer(label):
+            field = self._keyword_field[match.group(1)]
+            priority = self._priority[field]
+            if priority < best_priority:
+                best, best_priority = field, priority
+                if priority == 0:
+                    break
+        
+        if len(self._cache) < self.cache_size:
+            self._cache[label] = best
+        return best
+    
+    def classify_linear(self, label: str) -> Optional[InfoField]:
+        """Implementazione di riferimento (catena di any), usata da test e benchmark"""
+        for field, keywords in self.rules:
+            if any(keyword in label for keyword in keywords):
+                return field
+        return None
+
+
+# Label lette da TransfermarktScraper (IT, EN, DE, ES, FR)
+PROFILE_LABELS = LabelClassifier([
+    (InfoField.BIRTH, ['data di nascita', 'date of birth', 'nato il', 'geboren', 'f. nacim', 'edad', 'né le']),
+    (InfoField.BIRTH_PLACE, ['luogo', 'place', 'lugar', 'lieu']),
+    (InfoField.HEIGHT, ['altezza', 'height', 'altura', 'taille', 'größe']),
+    (InfoField.WEIGHT, ['peso', 'weight', 'poids', 'gewicht']),
+    (InfoField.NATIONALITY, ['nazionalità', 'citizenship', 'nacionalidad', 'nationalité', 'staatsbürgerschaft']),
+    (InfoField.POSITION, ['posizione', 'position', 'posición']),
+    (InfoField.FOOT, ['piede', 'foot', 'pie', 'pied', 'fuß']),
+    (InfoField.CONTRACT, ['scadenza', 'contratto', 'contract', 'expires', 'contrato hasta', 'fin de contrat', 'vertrag bis']),
+])
+
+# Label lette da MultiLangTransfermarktScraper (IT, EN, ES, DE, FR, PT)
+MULTILANG_LABELS = LabelClassifier([
+    (InfoField.BIRTH, ['birth', 'nascita', 'nacim', 'nacimiento', 'geburt', 'naissance', 'nascimento', 'edad', 'age', 'età']),
+    (InfoField.HEIGHT, ['height', 'altezza', 'altura', 'größe', 'taille']),
+    # "lugar de nac" / "place of birth": la nazionalità si legge dalla bandiera
+    (InfoField.NATIONALITY, ['citizenship', 'nazionalità', 'nacionalidad', 'nationalität', 'nationalité', 'nacionalidade', 'lugar', 'place']),
+    (InfoField.POSITION, ['position', 'posizione', 'posición', 'posição']),
+    (InfoField.FOOT, ['foot', 'piede', 'pie', 'fuß', 'pied', 'pé']),
+    (InfoField.MARKET_VALUE, ['market value', 'valore', 'valor', 'marktwert', 'valeur']),
+    (InfoField.CONTRACT, ['contract', 'contratto', 'contrato', 'vertrag']),
+])
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Mappatura dei dati Transfermarkt al formato del database scouting
+
+Funzioni pure (solo libreria standard): si importano senza requests, bs4 o
+deep-translator, quindi sono utilizzabili da test, script e API senza
+caricare lo stack di scraping.
+
+Uso:
+    from transfermarkt_mapping import map_to_database_format, get_role_abbreviation
+    get_role_abbreviation("Difensore centrale")     # 'CB'
+"""
+
+import re
+from typing import Dict, List, Tuple
+
+import transfermarkt_vocabulary as vocabulary
+from transfermarkt_positions import POSITIONS
+
+
+def map_position_to_role(position: str) -> str:
+    """
+    Mappa la posizione Transfermarkt al ruolo generale (SEMPRE IN INGLESE)
+    
+    Ruoli generali disponibili:
+    - Goalkeeper
+    - Defender
+    - Terzino (Full-back)
+    - Centrocampo (Midfielder)
+    - Ala (Winger)
+    - Forward
+    
+    Parole chiave e priorità sono in transfermarkt_positions.ROLE_KEYWORDS.
+    """
+    return POSITIONS.role(position)
+
+
+def map_foot(foot: str) -> str:
+    """Mappa il piede preferito al formato database (SEMPRE IN INGLESE)"""
+    return vocabulary.foot(foot, 'Right')
+
+
+# Nazionalità in qualsiasi lingua (minuscolo) -> Inglese; tabella generata, vedi transfermarkt_vocabulary
+NATIONALITY_MAPPING = vocabulary.NATIONALITIES
+
+
+def map_nationality(nationality: str) -> str:
+    """Mappa la nazionalità al formato inglese standard (SEMPRE IN INGLESE)"""
+    if not nationality:
+        return ''
+    
+    result = vocabulary.nationality(nationality)
+    if result:
+        return result
+    
+    # Se non trovato, capitalizza e ritorna
+    return nationality.strip().title()
+
+
+def map_nationalities(nationalities: List[str]) -> List[str]:
+    """map_nationality per una lista (es. una colonna Excel), un lookup per valore distinto"""
+    distinct = {nationality: map_nationality(nationality) for nationality in set(nationalities)}
+    return [distinct[nationality] for nationality in nationalities]
+
+
+def map_feet(feet: List[str]) -> List[str]:
+    """map_foot per una lista di valori"""
+    return vocabulary.feet(feet, 'Right')
+
+
+def get_role_abbreviation(position: str) -> str:
+    """
+    Mappa la posizione Transfermarkt all'abbreviazione usata nel campo tattico (SEMPRE IN INGLESE)
+    
+    Args:
+        position: Posizione da Transfermarkt (es: "Terzino sinistro", "Left-Back", "Linksverteidiger")
+        
+    Returns:
+        Abbreviazione inglese (es: "LB", "CB", "ST"); la mappa è
+        transfermarkt_positions.ROLE_ABBREVIATIONS
+    """
+    return POSITIONS.abbreviation(position)
+
+
+def map_positions(positions: List[str]) -> List[Tuple[str, str]]:
+    """(ruolo generale, abbreviazione) per una lista di posizioni in una sola chiamata"""
+    return POSITIONS.normalize_batch(positions)
+
+
+def extract_market_value_number(market_value: str) -> int:
+    """Estrae il valore numerico dal valore di mercato"""
+    if not market_value:
+        return 3
+    
+    # Cerca pattern come "3,50 mln €"
+    import re
+    match = re.search(r'(\d+[,.]?\d*)', market_value)
+    if match:
+        value = float(match.group(1).replace(',', '.'))
+        if 'mln' in market_value.lower() or 'mil' in market_value.lower():
+            return int(value)
+        elif 'mila' in market_value.lower() or 'k' in market_value.lower():
+            return 1
+    
+    return 3
+
+
+# Funzione generate_notes() rimossa - le note devono essere compilate manualmente dallo scout
+
+
+def map_to_database_format(tm_data: Dict) -> Dict:
+    """
+    Mappa i dati di Transfermarkt al formato del database scouting
+    
+    Args:
+        tm_data: Dati estratti da Transfermarkt
+        
+    Returns:
+        Dizionario nel formato del database
+    """
+    # Estrai posizioni
+    position = tm_data.get('position', '')
+    natural_pos = tm_data.get('natural_position', '')
+    other_pos = tm_data.get('other_positions', '')
+    
+    # Calcola abbreviazioni
+    general_role, position_abbr = POSITIONS.normalize(position)
+    natural_abbr = POSITIONS.abbreviation(natural_pos) if natural_pos else None
+    other_abbr = POSITIONS.abbreviation(other_pos) if other_pos else None
+    
+    # Mappa al formato database
+    db_data = {
+        'name': tm_data.get('name', ''),
+        'birth_year': tm_data.get('birth_year'),
+        'birth_place': tm_data.get('birth_place', ''),
+        'team': tm_data.get('current_club', ''),
+        'nationality': map_nationality(tm_data.get('nationality_primary', '')),  # INGLESE
+        'height_cm': tm_data.get('height_cm'),
+        'weight_kg': tm_data.get('weight_kg'),
+        'shirt_number': tm_data.get('shirt_number'),
+        'general_role': general_role,
+        'specific_position': position_abbr,  # Abbreviazione INGLESE
+        'preferred_foot': map_foot(tm_data.get('preferred_foot', '')),  # INGLESE
+        'market_value': f"{tm_data.get('market_value', 3):.2f} mln €" if tm_data.get('market_value') else '3.00 mln €',
+        'market_value_updated': tm_data.get('market_value_updated', ''),
+        'contract_expiry': tm_data.get('contract_expiry', ''),
+        'transfermarkt_link': tm_data.get('url', ''),
+        'profile_image': tm_data.get('profile_image', ''),
+        'natural_position': natural_abbr,  # Usa abbreviazione
+        'other_positions': other_abbr,  # Usa abbreviazione
+        'field_position_x': tm_data.get('field_position_x'),
+        'field_position_y': tm_data.get('field_position_y'),
+        'current_value': int(tm_data.get('market_value', 3)) if tm_data.get('market_value') else 3,
+        'potential_value': int(tm_data.get('market_value', 3)) if tm_data.get('market_value') else 3,
+        # Campi da compilare manualmente dallo scout (lasciati vuoti)
+        'priority': None,
+        'director_feedback': None,
+        'check_type': None,
+        'notes': None,
+        # Mantieni anche i nomi completi per riferimento
+        'position_full_name': position,
+        'natural_position_full_name': natural_pos,
+        'other_positions_full_name': other_pos
+    }
+    
+    return db_data
@@ -15,6 +15,8 @@ Tutti i dati vengono tradotti in inglese per consistenza nel database.
 
 Requisiti:
     pip install requests beautifulsoup4 lxml deep-translator
+    (deep-translator non serve con translation_backend='offline')
+    pip install httpx  (solo per get_player_info_async, usato da scraper_asgi.py)
 
 Uso:
     python transfermarkt_multilang_scraper.py
@@ -23,31 +25,32 @@ Uso:
     from transfermarkt_multilang_scraper import MultiLangTransfermarktScraper
     scraper = MultiLangTransfermarktScraper()
     data = scraper.get_player_info("https://www.transfermarkt.es/james-penrice/profil/spieler/363227")
+    data = await scraper.get_player_info_async(url, client)    # client: httpx.AsyncClient
 """
 
 import re
 import json
-import requests
-from bs4 import BeautifulSoup
 from datetime import datetime
-from typing import Dict, Optional, List
-from urllib.parse import urlparse
-from deep_translator import GoogleTranslator
+from typing import Dict, Optional, List, Tuple
+
+# requests e bs4 vengono importati al primo uso (vedi transfermarkt_parsing)
+
+from transfermarkt_cache import HTMLCache, fetch_html, fetch_html_async, make_cache_key
+from transfermarkt_fields import PROFILE_FIELDS
+from transfermarkt_labels import MULTILANG_LABELS, InfoField
+from transfermarkt_parsing import make_soup
+from transfermarkt_rate_limiter import DomainRateLimiter, get_rate_limiter
+from transfermarkt_domains import DOMAIN_LANGUAGE_MAP, detect_language, edition_url, match_domain, mirror_domain
+from transfermarkt_hedging import HedgedFetcher, get_hedged_fetcher
+from transfermarkt_translation_backends import DEFAULT_TRANSLATION_BACKEND, TranslatorPool, get_translator_pool
+from transfermarkt_translation_cache import TranslationCache, get_translation_cache
+from transfermarkt_vocabulary import FEET
 
 class MultiLangTransfermarktScraper:
     """Scraper multilingua per Transfermarkt con traduzione automatica"""
     
     # Mappatura domini -> lingua
-    DOMAIN_LANGUAGE_MAP = {
-        'transfermarkt.it': 'it',
-        'transfermarkt.es': 'es',
-        'transfermarkt.de': 'de',
-        'transfermarkt.co.uk': 'en',
-        'transfermarkt.com': 'en',
-        'transfermarkt.fr': 'fr',
-        'transfermarkt.pt': 'pt',
-        'transfermarkt.com.br': 'pt',
-    }
+    DOMAIN_LANGUAGE_MAP = DOMAIN_LANGUAGE_MAP
     
     # Traduzioni manuali per ruoli comuni (più affidabili della traduzione automatica)
     POSITION_TRANSLATIONS = {
@@ -121,46 +124,58 @@ class MultiLangTransfermarktScraper:
         'Centroavante': 'Centre-Forward',
     }
     
-    # Traduzioni per piede preferito
-    FOOT_TRANSLATIONS = {
-        'destro': 'right',
-        'sinistro': 'left',
-        'ambidestro': 'both',
-        'derecho': 'right',
-        'izquierdo': 'left',
-        'ambidiestro': 'both',
-        'rechts': 'right',
-        'links': 'left',
-        'beidfüßig': 'both',
-        'droit': 'right',
-        'gauche': 'left',
-        'ambidextre': 'both',
-        'direito': 'right',
-        'esquerdo': 'left',
-        'ambidestro': 'both',
+    # Traduzioni per piede preferito (stesso vocabolario di map_foot, in minuscolo)
+    FOOT_TRANSLATIONS = {alias: value.lower() for alias, value in FEET.items()}
+    
+    # Header HTTP delle richieste a Transfermarkt (sessione requests e client asincrono)
+    HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Connection': 'keep-alive',
     }
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Connection': 'keep-alive',
-        })
-        self.translator = None
-        self.detected_language = None
+    def __init__(self, cache: Optional[HTMLCache] = None,
+                 rate_limiter: Optional[DomainRateLimiter] = None,
+                 session: Optional['requests.Session'] = None,
+                 partial_parse: bool = False,
+                 translation_cache: Optional[TranslationCache] = None,
+                 translation_backend: Optional[str] = None,
+                 canonical_edition: bool = False,
+                 hedge: bool = False,
+                 hedged_fetcher: Optional[HedgedFetcher] = None,
+                 translator_pool: Optional[TranslatorPool] = None):
+        """
+        Args:
+            cache: Cache opzionale delle pagine profilo (es: DiskHTMLCache)
+            rate_limiter: Rate limiter per dominio (default: quello condiviso dal processo)
+            session: Sessione HTTP da riusare (default: nuova sessione)
+            partial_parse: Costruisce solo le regioni HTML lette dall'estrattore
+            translation_cache: Cache delle traduzioni (default: quella condivisa dal processo)
+            translation_backend: 'google' oppure 'offline' (default: env TM_TRANSLATION_BACKEND o 'google')
+            canonical_edition: Scarica sempre l'edizione inglese (stesso ID giocatore)
+                e la analizza senza traduzioni; 'source_language' resta la lingua dell'URL
+            hedge: Se l'edizione richiesta è lenta (oltre il p95) interroga anche un mirror
+            hedged_fetcher: Fetcher per le richieste hedged (default: quello condiviso dal processo)
+            translator_pool: Pool dei client di traduzione (default: quello condiviso dal processo)
+        """
+        import requests
+        
+        self.cache = cache
+        self.translation_cache = translation_cache or get_translation_cache()
+        self.partial_parse = partial_parse
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self.session = session or requests.Session()
+        self.session.headers.update(self.HEADERS)
+        self.translation_backend = translation_backend or DEFAULT_TRANSLATION_BACKEND
+        self.canonical_edition = canonical_edition
+        self.hedged_fetcher = (hedged_fetcher or get_hedged_fetcher()) if hedge else None
+        # Client di traduzione presi in prestito dal pool per ogni richiesta:
+        # nessuno stato di lingua sull'istanza, condivisibile tra thread
+        self.translator_pool = translator_pool or get_translator_pool()
     
     def detect_language_from_url(self, url: str) -> str:
         """Rileva la lingua dal dominio dell'URL"""
-        parsed = urlparse(url)
-        domain = parsed.netloc
-        
-        for domain_pattern, lang in self.DOMAIN_LANGUAGE_MAP.items():
-            if domain_pattern in domain:
-                return lang
-        
-        # Default: inglese
-        return 'en'
+        return detect_language(url)
     
     def translate_to_english(self, text: str, source_lang: str) -> str:
         """Traduce il testo in inglese"""
@@ -168,53 +183,150 @@ class MultiLangTransfermarktScraper:
             return text
         
         try:
-            # Inizializza traduttore se necessario
-            if not self.translator or self.translator.source != source_lang:
-                self.translator = GoogleTranslator(source=source_lang, target='en')
-            
-            return self.translator.translate(text)
+            # Il vocabolario offline è già locale: la cache servirebbe solo a
+            # fissare i testi non tradotti
+            if self.translation_backend == 'offline':
+                return self._translate_remote(text, source_lang)
+            return self.translation_cache.get_or_translate(source_lang, text, lambda t: self._translate_remote(t, source_lang))
         except Exception as e:
             print(f"⚠️  Translation error '{text}': {e}")
             return text
     
+    def _translate_remote(self, text: str, source_lang: str) -> str:
+        """Chiamata al traduttore online (solo per i miss della cache)"""
+        with self.translator_pool.translator(self.translation_backend, source_lang, 'en') as translator:
+            return translator.translate(text)
+    
     def translate_position(self, position: str, source_lang: str) -> str:
         """Traduce il ruolo usando dizionario manuale o traduttore"""
-        if not position:
-            return ""
+        translated, text = self._translate_local('position', position, source_lang)
+        if translated is not None:
+            return translated
+        
+        # Altrimenti usa traduttore automatico
+        return self.translate_to_english(text, source_lang)
+    
+    def translate_foot(self, foot: str, source_lang: str) -> str:
+        """Traduce il piede preferito"""
+        translated, text = self._translate_local('foot', foot, source_lang)
+        if translated is not None:
+            return translated
         
-        # Pulisci il testo
-        position_clean = self.clean_text(position)
+        # Altrimenti usa traduttore
+        return self.translate_to_english(text, source_lang).lower()
+    
+    def _translate_local(self, kind: str, text: str, source_lang: str) -> Tuple[Optional[str], str]:
+        """
+        Traduzione senza rete: dizionari manuali o testo già in inglese
         
-        # Rimuovi prefissi come "Difesa - ", "Centrocampo - ", etc.
-        position_clean = re.sub(r'^(Difesa|Centrocampo|Attacco|Defense|Midfield|Attack|Defensa|Mediocampo|Ataque|Abwehr|Mittelfeld|Angriff|Défense|Milieu|Attaque|Defesa|Meio-campo|Ataque)\s*-\s*', '', position_clean, flags=re.IGNORECASE)
+        Args:
+            kind: 'position', 'foot' o 'text'
+            
+        Returns:
+            (traduzione o None se serve il traduttore, testo normalizzato da tradurre)
+        """
+        if not text:
+            return "", ""
         
-        # Cerca traduzione manuale
-        if position_clean in self.POSITION_TRANSLATIONS:
-            return self.POSITION_TRANSLATIONS[position_clean]
+        if kind == 'position':
+            # Pulisci il testo
+            position_clean = self.clean_text(text)
+            
+            # Rimuovi prefissi come "Difesa - ", "Centrocampo - ", etc.
+            position_clean = re.sub(r'^(Difesa|Centrocampo|Attacco|Defender|Defense|Midfield|Attack|Defensa|Mediocampo|Ataque|Abwehr|Mittelfeld|Angriff|Défense|Milieu|Attaque|Defesa|Meio-campo|Ataque)\s*-\s*', '', position_clean, flags=re.IGNORECASE)
+            
+            # Cerca traduzione manuale
+            if position_clean in self.POSITION_TRANSLATIONS:
+                return self.POSITION_TRANSLATIONS[position_clean], position_clean
+            text = position_clean
         
-        # Altrimenti usa traduttore automatico
-        if source_lang != 'en':
-            return self.translate_to_english(position_clean, source_lang)
+        elif kind == 'foot':
+            foot_lower = text.lower().strip()
+            
+            # Cerca traduzione manuale
+            if foot_lower in self.FOOT_TRANSLATIONS:
+                return self.FOOT_TRANSLATIONS[foot_lower], foot_lower
+            text = foot_lower
         
-        return position_clean
+        if source_lang == 'en':
+            return text, text
+        return None, text
     
-    def translate_foot(self, foot: str, source_lang: str) -> str:
-        """Traduce il piede preferito"""
-        if not foot:
-            return ""
+    def translate_batch(self, texts: List[str], source_lang: str) -> Dict[str, str]:
+        """
+        Traduce più testi con una sola richiesta al traduttore
+        
+        I testi già in cache non vengono inviati; in caso di errore del
+        traduttore ogni testo resta invariato (come translate_to_english).
         
-        foot_lower = foot.lower().strip()
+        Returns:
+            Dizionario testo originale -> traduzione
+        """
+        unique = list(dict.fromkeys(t for t in texts if t))
+        if source_lang == 'en':
+            return {t: t for t in unique}
+        if self.translation_backend == 'offline':
+            return {t: self._translate_remote(t, source_lang) for t in unique}
         
-        # Cerca traduzione manuale
-        if foot_lower in self.FOOT_TRANSLATIONS:
-            return self.FOOT_TRANSLATIONS[foot_lower]
+        result = {}
+        misses = []
+        for text in unique:
+            cached = self.translation_cache.get(source_lang, text)
+            if cached is None:
+                misses.append(text)
+            else:
+                result[text] = cached
         
-        # Altrimenti usa traduttore
-        if source_lang != 'en':
-            translated = self.translate_to_english(foot_lower, source_lang)
-            return translated.lower()
+        if misses:
+            try:
+                translated = self._translate_remote_batch(misses, source_lang)
+            except Exception as e:
+                print(f"⚠️  Batch translation error ({len(misses)} texts): {e}")
+                translated = {}
+            for text in misses:
+                translation = translated.get(text)
+                if translation:
+                    self.translation_cache.put(source_lang, text, translation)
+                result[text] = translation or text
+        
+        return result
+    
+    # Limite di caratteri per richiesta del traduttore online (5000, con margine)
+    MAX_BATCH_CHARS = 4500
+    
+    def _translate_remote_batch(self, texts: List[str], source_lang: str) -> Dict[str, str]:
+        """
+        Traduce una lista di testi in una richiesta (una riga per testo)
+        
+        Se il traduttore non restituisce lo stesso numero di righe si ripiega
+        su una richiesta per testo.
+        """
+        # Testi su più righe non si possono separare nel risultato
+        single = [t for t in texts if '\n' in t]
+        lines = [t for t in texts if '\n' not in t]
+        
+        chunks: List[List[str]] = []
+        size = 0
+        for text in lines:
+            if not chunks or size + len(text) + 1 > self.MAX_BATCH_CHARS:
+                chunks.append([])
+                size = 0
+            chunks[-1].append(text)
+            size += len(text) + 1
         
-        return foot_lower
+        result = {}
+        for chunk in chunks:
+            translated = self._translate_remote('\n'.join(chunk), source_lang) if len(chunk) > 1 else None
+            parts = translated.split('\n') if translated else []
+            if len(parts) == len(chunk):
+                result.update((text, part.strip()) for text, part in zip(chunk, parts))
+            else:
+                single.extend(chunk)
+        
+        for text in single:
+            result[text] = self._translate_remote(text, source_lang)
+        
+        return result
     
     def extract_player_id(self, url: str) -> Optional[str]:
         """Estrae l'ID del giocatore dall'URL"""
@@ -270,10 +382,12 @@ class MultiLangTransfermarktScraper:
         Returns:
             Dizionario con tutti i dati in inglese
         """
+        import requests
+        
         try:
             # Rileva lingua dall'URL
-            self.detected_language = self.detect_language_from_url(url)
-            print(f"🌍 Detected language: {self.detected_language.upper()}")
+            language = self.detect_language_from_url(url)
+            print(f"🌍 Detected language: {language.upper()}")
             
             # Estrai ID giocatore
             player_id = self.extract_player_id(url)
@@ -282,144 +396,49 @@ class MultiLangTransfermarktScraper:
             
             print(f"📥 Downloading data for player ID: {player_id}")
             
-            # Scarica pagina
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'lxml')
-            
-            # Dati del giocatore
-            player_data = {
-                'player_id': player_id,
-                'url': url,
-                'source_language': self.detected_language
-            }
-            
-            # Nome
-            name_tag = soup.find('h1', class_='data-header__headline-wrapper')
-            if name_tag:
-                player_data['name'] = self.clean_text(name_tag.get_text())
-            
-            # Info box principale
-            info_table = soup.find('div', class_='info-table')
-            if info_table:
-                # Trova tutte le coppie label-value
-                labels = info_table.find_all('span', class_='info-table__content--regular')
-                
-                for label_tag in labels:
-                    # Il valore è nel prossimo span con classe --bold
-                    value_tag = label_tag.find_next_sibling('span', class_='info-table__content--bold')
-                    if not value_tag:
-                        continue
-                    
-                    label = self.clean_text(label_tag.get_text()).lower()
-                    value = self.clean_text(value_tag.get_text())
-                    
-                    # Data di nascita / età
-                    if any(keyword in label for keyword in ['birth', 'nascita', 'nacim', 'nacimiento', 'geburt', 'naissance', 'nascimento', 'edad', 'age', 'età']):
-                        # Estrai anno
-                        year_match = re.search(r'\b(19|20)\d{2}\b', value)
-                        if year_match:
-                            player_data['birth_year'] = int(year_match.group(0))
-                        
-                        # Estrai età
-                        age_match = re.search(r'\((\d+)\)', value)
-                        if age_match:
-                            player_data['age'] = int(age_match.group(1))
-                    
-                    # Altezza
-                    elif any(keyword in label for keyword in ['height', 'altezza', 'altura', 'größe', 'taille', 'height']):
-                        # Supporta formati: "1,77 m", "1.77 m", "177 cm"
-                        height_match = re.search(r'(\d+)[,.](\d+)\s*m', value)
-                        if height_match:
-                            meters = float(f"{height_match.group(1)}.{height_match.group(2)}")
-                            player_data['height_cm'] = int(meters * 100)
-                        else:
-                            # Prova formato cm
-                            cm_match = re.search(r'(\d+)\s*cm', value)
-                            if cm_match:
-                                player_data['height_cm'] = int(cm_match.group(1))
-                    
-                    # Nazionalità (cerca anche "lugar de nac" per nazionalità)
-                    elif any(keyword in label for keyword in ['citizenship', 'nazionalità', 'nacionalidad', 'nationalität', 'nationalité', 'nacionalidade', 'lugar', 'place']):
-                        # Estrai nome paese (ignora città)
-                        # Cerca img con alt che contiene il nome del paese
-                        img_tag = value_tag.find('img', alt=True)
-                        if img_tag and img_tag.get('alt'):
-                            nationality = img_tag['alt']
-                            if self.detected_language != 'en':
-                                player_data['nationality_primary'] = self.translate_to_english(nationality, self.detected_language)
-                            else:
-                                player_data['nationality_primary'] = nationality
-                        elif value and not any(x in value.lower() for x in ['unknown', 'n/a', '-']):
-                            # Fallback: usa il testo
-                            if self.detected_language != 'en':
-                                player_data['nationality_primary'] = self.translate_to_english(value, self.detected_language)
-                            else:
-                                player_data['nationality_primary'] = value
-                    
-                    # Posizione
-                    elif any(keyword in label for keyword in ['position', 'posizione', 'posición', 'position', 'posição']):
-                        player_data['position'] = self.translate_position(value, self.detected_language)
-                    
-                    # Piede preferito
-                    elif any(keyword in label for keyword in ['foot', 'piede', 'pie', 'fuß', 'pied', 'pé']):
-                        player_data['preferred_foot'] = self.translate_foot(value, self.detected_language)
-                    
-                    # Valore di mercato
-                    elif any(keyword in label for keyword in ['market value', 'valore', 'valor', 'marktwert', 'valeur']):
-                        player_data['market_value'] = self.parse_market_value(value)
-                    
-                    # Scadenza contratto
-                    elif any(keyword in label for keyword in ['contract', 'contratto', 'contrato', 'vertrag']):
-                        date_match = re.search(r'\b(19|20)\d{2}\b', value)
-                        if date_match:
-                            player_data['contract_expiry'] = date_match.group(0)
+            # Scarica pagina (o copia in cache)
+            html, edition = self.fetch_profile(url, player_id)
             
-            # Squadra attuale
-            current_club = soup.find('span', class_='data-header__club')
-            if current_club:
-                club_name = current_club.get_text().strip()
-                # Traduce nome squadra se necessario
-                if self.detected_language != 'en':
-                    player_data['team'] = self.translate_to_english(club_name, self.detected_language)
-                else:
-                    player_data['team'] = club_name
+            return self.parse_player_page(html, url, player_id, edition=edition)
             
-            # Immagine profilo
-            img_tag = soup.find('img', class_='data-header__profile-image')
-            if img_tag and img_tag.get('src'):
-                player_data['profile_image'] = img_tag['src']
+        except requests.RequestException as e:
+            print(f"❌ Network error: {e}")
+            return {"error": f"Network error: {str(e)}"}
+        except Exception as e:
+            print(f"❌ Extraction error: {e}")
+            import traceback
+            traceback.print_exc()
+            return {"error": f"Extraction error: {str(e)}"}
+    
+    async def get_player_info_async(self, url: str, client) -> Dict:
+        """
+        Come get_player_info, con download non bloccante
+        
+        La pagina si scarica con il client asincrono condiviso (rate limiter,
+        cache e hedging inclusi); parsing e traduzione, che sono sincroni,
+        girano in un thread del pool di asyncio.
+        
+        Args:
+            url: URL del profilo Transfermarkt (qualsiasi lingua)
+            client: httpx.AsyncClient (header: vedi HEADERS)
+        """
+        import asyncio
+        import httpx
+        
+        try:
+            language = self.detect_language_from_url(url)
+            print(f"🌍 Detected language: {language.upper()}")
             
-            # Ruolo naturale e altri ruoli
-            role_section = soup.find('div', class_='detail-position')
-            if role_section:
-                # Ruolo naturale
-                natural_role = role_section.find('dt', string=re.compile(r'Main position|Ruolo naturale|Posición principal|Hauptposition|Position principale|Posição principal', re.IGNORECASE))
-                if natural_role:
-                    natural_role_value = natural_role.find_next_sibling('dd')
-                    if natural_role_value:
-                        player_data['natural_position'] = self.translate_position(
-                            self.clean_text(natural_role_value.get_text()),
-                            self.detected_language
-                        )
-                
-                # Altri ruoli
-                other_roles = role_section.find('dt', string=re.compile(r'Other position|Altro ruolo|Otra posición|Weitere Position|Autre position|Outra posição', re.IGNORECASE))
-                if other_roles:
-                    other_roles_value = other_roles.find_next_sibling('dd')
-                    if other_roles_value:
-                        player_data['other_positions'] = self.translate_position(
-                            self.clean_text(other_roles_value.get_text()),
-                            self.detected_language
-                        )
+            player_id = self.extract_player_id(url)
+            if not player_id:
+                return {"error": "Player ID not found in URL"}
             
-            print(f"✅ Data extracted successfully for {player_data.get('name', 'Unknown')}")
-            print(f"   Fields extracted: {', '.join(player_data.keys())}")
+            print(f"📥 Downloading data for player ID: {player_id}")
+            html, edition = await self.fetch_profile_async(url, player_id, client)
             
-            return player_data
+            return await asyncio.to_thread(self.parse_player_page, html, url, player_id, edition)
             
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             print(f"❌ Network error: {e}")
             return {"error": f"Network error: {str(e)}"}
         except Exception as e:
@@ -427,6 +446,311 @@ class MultiLangTransfermarktScraper:
             import traceback
             traceback.print_exc()
             return {"error": f"Extraction error: {str(e)}"}
+    
+    def fetch_url(self, url: str, player_id: str) -> str:
+        """URL effettivamente scaricato: l'edizione inglese in modalità canonical_edition"""
+        if self.canonical_edition:
+            return edition_url(url, player_id)
+        return url
+    
+    def fetch_player_page(self, url: str, player_id: str) -> bytes:
+        """
+        Scarica l'HTML della pagina profilo (cache e rate limiter inclusi)
+        
+        Raises:
+            requests.RequestException in caso di errore di rete o HTTP
+        """
+        return self._fetch_edition(self.fetch_url(url, player_id), player_id)
+    
+    def fetch_profile(self, url: str, player_id: str) -> Tuple[bytes, str]:
+        """
+        Come fetch_player_page, con hedging sul mirror se attivo
+        
+        Returns:
+            (HTML, URL dell'edizione effettivamente usata)
+        """
+        fetch_url = self.fetch_url(url, player_id)
+        if self.hedged_fetcher is None:
+            return self._fetch_edition(fetch_url, player_id), fetch_url
+        
+        backup_url = edition_url(fetch_url, player_id, mirror_domain(match_domain(fetch_url)))
+        html, used_backup = self.hedged_fetcher.fetch(
+            lambda: self._fetch_edition(fetch_url, player_id),
+            lambda: self._fetch_edition(backup_url, player_id),
+        )
+        if used_backup:
+            print(f"🔀 Mirror più veloce: {backup_url}")
+            return html, backup_url
+        return html, fetch_url
+    
+    def _fetch_edition(self, fetch_url: str, player_id: str) -> bytes:
+        return fetch_html(self.session, fetch_url, timeout=10, cache=self.cache,
+                          cache_key=make_cache_key(fetch_url, player_id),
+                          rate_limiter=self.rate_limiter)
+    
+    async def fetch_profile_async(self, url: str, player_id: str, client) -> Tuple[bytes, str]:
+        """Come fetch_profile con un client asincrono"""
+        fetch_url = self.fetch_url(url, player_id)
+        if self.hedged_fetcher is None:
+            return await self._fetch_edition_async(client, fetch_url, player_id), fetch_url
+        
+        backup_url = edition_url(fetch_url, player_id, mirror_domain(match_domain(fetch_url)))
+        html, used_backup = await self.hedged_fetcher.fetch_async(
+            lambda: self._fetch_edition_async(client, fetch_url, player_id),
+            lambda: self._fetch_edition_async(client, backup_url, player_id),
+        )
+        if used_backup:
+            print(f"🔀 Mirror più veloce: {backup_url}")
+            return html, backup_url
+        return html, fetch_url
+    
+    async def _fetch_edition_async(self, client, fetch_url: str, player_id: str) -> bytes:
+        return await fetch_html_async(client, fetch_url, timeout=10, cache=self.cache,
+                                      cache_key=make_cache_key(fetch_url, player_id),
+                                      rate_limiter=self.rate_limiter)
+    
+    def parse_player_page(self, html, url: str, player_id: str, edition: Optional[str] = None) -> Dict:
+        """
+        Estrae e traduce i dati del giocatore dall'HTML già scaricato
+        
+        I testi da tradurre della pagina vengono inviati al traduttore con
+        una sola richiesta (vedi translate_batch).
+        
+        Args:
+            html: Contenuto HTML (bytes o str) della pagina profilo
+            url: URL del profilo Transfermarkt
+            player_id: ID del giocatore estratto dall'URL
+            edition: URL della pagina scaricata, se diverso da quello richiesto
+                (default: vedi fetch_url)
+            
+        Returns:
+            Dizionario con tutti i dati in inglese
+        """
+        page = self._extract_page(html, url, player_id, edition)
+        self._apply_translations([page])
+        return self._finish_page(page)
+    
+    def parse_player_pages(self, pages: List[Tuple[bytes, str, str, Optional[str]]]) -> List[Dict]:
+        """
+        Estrae e traduce più pagine con una richiesta di traduzione per lingua
+        
+        Args:
+            pages: Tuple (html, url, player_id, edition) - vedi parse_player_page
+            
+        Returns:
+            Lista di dizionari nello stesso ordine; una pagina non analizzabile
+            restituisce 'error' e 'url'
+        """
+        extracted = []
+        for html, url, player_id, edition in pages:
+            try:
+                extracted.append(self._extract_page(html, url, player_id, edition))
+            except Exception as e:
+                print(f"❌ Extraction error: {e}")
+                extracted.append({"error": f"Extraction error: {str(e)}", "url": url})
+        
+        self._apply_translations([page for page in extracted if 'error' not in page])
+        return [page if 'error' in page else self._finish_page(page) for page in extracted]
+    
+    def get_players_info(self, urls: List[str], concurrency: int = 8) -> List[Dict]:
+        """
+        Scarica più profili in parallelo e li traduce in blocco
+        
+        Args:
+            urls: URL dei profili Transfermarkt (anche in lingue diverse)
+            concurrency: Numero massimo di download contemporanei
+            
+        Returns:
+            Lista di dizionari nello stesso ordine degli URL; in caso di errore
+            l'elemento contiene 'error' e 'url'
+        """
+        import requests
+        from concurrent.futures import ThreadPoolExecutor
+        
+        results: List[Optional[Dict]] = [None] * len(urls)
+        
+        def fetch(index_url):
+            index, url = index_url
+            player_id = self.extract_player_id(url)
+            if not player_id:
+                results[index] = {"error": "Player ID not found in URL", "url": url}
+                return None
+            try:
+                html, edition = self.fetch_profile(url, player_id)
+            except requests.RequestException as e:
+                results[index] = {"error": f"Network error: {str(e)}", "url": url}
+                return None
+            except Exception as e:
+                # Cache, hedging, decodifica: l'errore resta sull'URL, il batch continua
+                results[index] = {"error": f"Unexpected error: {str(e)}", "url": url}
+                return None
+            return index, (html, url, player_id, edition)
+        
+        with ThreadPoolExecutor(max_workers=max(1, int(concurrency)), thread_name_prefix='tm-multilang') as executor:
+            fetched = [item for item in executor.map(fetch, enumerate(urls)) if item]
+        
+        parsed = self.parse_player_pages([page for _, page in fetched])
+        for (index, _), data in zip(fetched, parsed):
+            results[index] = data
+        
+        failed = sum(1 for r in results if 'error' in r)
+        print(f"📦 Batch completed: {len(results) - failed} ok, {failed} errors out of {len(results)} URLs")
+        return results
+    
+    def _extract_page(self, html, url: str, player_id: str, edition: Optional[str] = None) -> Dict:
+        """
+        Estrae i dati della pagina lasciando da parte i testi da tradurre
+        
+        Returns:
+            {'data': dati del giocatore, 'language': lingua della pagina,
+             'pending': [(campo, tipo, testo), ...] da tradurre}
+        """
+        source_language = self.detect_language_from_url(url)
+        # Edizione analizzata e sua lingua (canonical_edition o mirror dell'hedging)
+        edition = edition or self.fetch_url(url, player_id)
+        page_language = self.detect_language_from_url(edition)
+        pending: List[Tuple[str, str, str]] = []
+        soup = make_soup(html, partial=self.partial_parse)
+        
+        # Un'unica visita dell'albero raccoglie tutte le regioni della specifica
+        doc = PROFILE_FIELDS.extract(soup)
+        
+        # Dati del giocatore
+        player_data = {
+            'player_id': player_id,
+            'url': url,
+            'source_language': source_language
+        }
+        if edition != url:
+            player_data['edition_url'] = edition
+        
+        def defer(field: str, kind: str, text: str):
+            # Il testo originale tiene il posto del campo fino alla traduzione
+            player_data[field] = text
+            pending.append((field, kind, text))
+        
+        # Nome
+        name_tag = doc.region('headline')
+        if name_tag:
+            player_data['name'] = self.clean_text(name_tag.get_text())
+        
+        # Info box principale
+        if doc.region('info_table'):
+            # Coppie label-value (il valore è il prossimo span con classe --bold)
+            for label_tag, value_tag in doc.info_pairs():
+                label = self.clean_text(label_tag.get_text()).lower()
+                value = self.clean_text(value_tag.get_text())
+                field = MULTILANG_LABELS.classify(label)
+                
+                # Data di nascita / età
+                if field is InfoField.BIRTH:
+                    # Estrai anno
+                    year_match = re.search(r'\b(19|20)\d{2}\b', value)
+                    if year_match:
+                        player_data['birth_year'] = int(year_match.group(0))
+                    
+                    # Estrai età
+                    age_match = re.search(r'\((\d+)\)', value)
+                    if age_match:
+                        player_data['age'] = int(age_match.group(1))
+                
+                # Altezza
+                elif field is InfoField.HEIGHT:
+                    # Supporta formati: "1,77 m", "1.77 m", "177 cm"
+                    height_match = re.search(r'(\d+)[,.](\d+)\s*m', value)
+                    if height_match:
+                        meters = float(f"{height_match.group(1)}.{height_match.group(2)}")
+                        player_data['height_cm'] = int(meters * 100)
+                    else:
+                        # Prova formato cm
+                        cm_match = re.search(r'(\d+)\s*cm', value)
+                        if cm_match:
+                            player_data['height_cm'] = int(cm_match.group(1))
+                
+                # Nazionalità (cerca anche "lugar de nac" per nazionalità)
+                elif field is InfoField.NATIONALITY:
+                    # Estrai nome paese (ignora città)
+                    # Cerca img con alt che contiene il nome del paese
+                    img_tag = value_tag.find('img', alt=True)
+                    if img_tag and img_tag.get('alt'):
+                        defer('nationality_primary', 'text', img_tag['alt'])
+                    elif value and not any(x in value.lower() for x in ['unknown', 'n/a', '-']):
+                        # Fallback: usa il testo
+                        defer('nationality_primary', 'text', value)
+                
+                # Posizione
+                elif field is InfoField.POSITION:
+                    defer('position', 'position', value)
+                
+                # Piede preferito
+                elif field is InfoField.FOOT:
+                    defer('preferred_foot', 'foot', value)
+                
+                # Valore di mercato
+                elif field is InfoField.MARKET_VALUE:
+                    player_data['market_value'] = self.parse_market_value(value)
+                
+                # Scadenza contratto
+                elif field is InfoField.CONTRACT:
+                    date_match = re.search(r'\b(19|20)\d{2}\b', value)
+                    if date_match:
+                        player_data['contract_expiry'] = date_match.group(0)
+        
+        # Squadra attuale
+        current_club = doc.region('club')
+        if current_club:
+            club_name = current_club.get_text().strip()
+            # Nome squadra da tradurre se necessario
+            defer('team', 'text', club_name)
+        
+        # Immagine profilo
+        img_tag = doc.region('profile_image')
+        if img_tag and img_tag.get('src'):
+            player_data['profile_image'] = img_tag['src']
+        
+        # Ruolo naturale e altri ruoli
+        role_section = doc.region('detail_position')
+        if role_section:
+            # Ruolo naturale
+            natural_role = role_section.find('dt', string=re.compile(r'Main position|Ruolo naturale|Posición principal|Hauptposition|Position principale|Posição principal', re.IGNORECASE))
+            if natural_role:
+                natural_role_value = natural_role.find_next_sibling('dd')
+                if natural_role_value:
+                    defer('natural_position', 'position', self.clean_text(natural_role_value.get_text()))
+            
+            # Altri ruoli
+            other_roles = role_section.find('dt', string=re.compile(r'Other position|Altro ruolo|Otra posición|Weitere Position|Autre position|Outra posição', re.IGNORECASE))
+            if other_roles:
+                other_roles_value = other_roles.find_next_sibling('dd')
+                if other_roles_value:
+                    defer('other_positions', 'position', self.clean_text(other_roles_value.get_text()))
+        
+        return {'data': player_data, 'language': page_language, 'pending': pending}
+    
+    def _apply_translations(self, pages: List[Dict]):
+        """Traduce i testi in sospeso di più pagine: una richiesta per lingua"""
+        remote: Dict[str, List[Tuple[Dict, str, str, str]]] = {}
+        for page in pages:
+            for field, kind, text in page['pending']:
+                translated, text = self._translate_local(kind, text, page['language'])
+                if translated is not None:
+                    page['data'][field] = translated
+                else:
+                    remote.setdefault(page['language'], []).append((page['data'], field, kind, text))
+        
+        for source_lang, items in remote.items():
+            translations = self.translate_batch([text for _, _, _, text in items], source_lang)
+            for data, field, kind, text in items:
+                translated = translations.get(text, text)
+                data[field] = translated.lower() if kind == 'foot' else translated
+    
+    def _finish_page(self, page: Dict) -> Dict:
+        player_data = page['data']
+        
+        print(f"✅ Data extracted successfully for {player_data.get('name', 'Unknown')}")
+        print(f"   Fields extracted: {', '.join(player_data.keys())}")
+        
+        return player_data
 
 
 def main():
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Parsing HTML delle pagine profilo Transfermarkt
+
+Una pagina profilo pesa alcune centinaia di KB, ma gli scraper leggono solo
+poche regioni: intestazione (nome, numero, foto, squadra, valore), info-table,
+detail-position, widget del valore di mercato e grid-view delle statistiche.
+In modalità parziale il parser lxml materializza solo quei sottoalberi
+(SoupStrainer), riducendo CPU e memoria per pagina.
+
+bs4 (e lxml) vengono importati alla prima pagina analizzata.
+"""
+
+from functools import lru_cache
+
+# Classi CSS delle regioni lette dagli estrattori (il sottoalbero viene tenuto intero)
+PROFILE_REGION_CLASSES = frozenset({
+    'data-header__headline-wrapper',    # nome + numero di maglia
+    'data-header__profile-image',       # foto profilo
+    'data-header__club',                # squadra attuale
+    'data-header__market-value-wrapper',  # valore di mercato (header)
+    'info-table',                       # dati anagrafici, contratto, agente
+    'detail-position',                  # ruolo naturale / altri ruoli / campo
+    'tm-player-market-value-development__current-value',  # widget valore di mercato
+    'grid-view',                        # statistiche carriera
+})
+
+
+def _is_profile_region(css_class) -> bool:
+    # Durante il parsing l'attributo class può arrivare come stringa unica
+    # ("info-table info-table--right-space"): controlla ogni singola classe
+    return bool(css_class) and any(c in PROFILE_REGION_CLASSES for c in css_class.split())
+
+
+@lru_cache(maxsize=None)
+def profile_strainer():
+    """SoupStrainer delle regioni profilo (creato al primo uso)"""
+    from bs4 import SoupStrainer
+    return SoupStrainer(class_=_is_profile_region)
+
+
+def make_soup(html, partial: bool = False) -> 'BeautifulSoup':
+    """
+    Crea il BeautifulSoup della pagina profilo
+    
+    Args:
+        html: Contenuto HTML (bytes o str)
+        partial: Se True costruisce solo le regioni in PROFILE_REGION_CLASSES
+    """
+    from bs4 import BeautifulSoup
+    
+    if partial:
+        return BeautifulSoup(html, 'lxml', parse_only=profile_strainer())
+    return BeautifulSoup(html, 'lxml')
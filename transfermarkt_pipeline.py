@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Pipeline di scraping a due stadi: download (I/O) e parsing (CPU) separati
+
+Il parsing con BeautifulSoup tiene il GIL, quindi anche con il download
+concorrente un solo processo non usa più di un core. Qui i thread di download
+mettono l'HTML grezzo in una coda limitata e un ProcessPoolExecutor di worker
+esegue estrazione + map_to_database_format: su una macchina a 16 core si
+analizzano 16 pagine alla volta.
+
+Backpressure: se i parser sono indietro la coda si riempie e i thread di
+download si fermano; il numero di pagine inviate ai processi e non ancora
+completate è limitato da max_in_flight.
+
+Uso:
+    python transfermarkt_pipeline.py urls.txt --fetch-workers 16 --parse-workers 16 -o risultati.json
+
+    oppure:
+    from transfermarkt_pipeline import run_pipeline
+    results = run_pipeline(urls, fetch_workers=16, parse_workers=16)
+"""
+
+import os
+import sys
+import json
+import queue
+import argparse
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional
+
+from transfermarkt_mapping import map_to_database_format
+from transfermarkt_scraper import TransfermarktScraper
+
+# Marcatore di fine lavoro per la coda HTML
+_DONE = object()
+
+# Scraper del processo worker (creato dall'initializer)
+_worker_scraper = None
+
+
+def _init_parse_worker(partial_parse: bool):
+    global _worker_scraper
+    _worker_scraper = TransfermarktScraper(partial_parse=partial_parse)
+
+
+def _parse_and_map(html: bytes, url: str, player_id: str) -> Dict:
+    """Eseguito nei processi worker: estrazione + mappatura al formato database"""
+    player_data = _worker_scraper.parse_player_page(html, url, player_id)
+    return {
+        'url': url,
+        'player_id': player_id,
+        'data': player_data,
+        'db_format': map_to_database_format(player_data),
+    }
+
+
+def run_pipeline(urls: List[str], fetch_workers: int = 8, parse_workers: Optional[int] = None,
+                 queue_size: int = 64, max_in_flight: Optional[int] = None,
+                 partial_parse: bool = True, scraper: Optional[TransfermarktScraper] = None) -> List[Dict]:
+    """
+    Scarica e analizza una lista di profili con download e parsing in parallelo
+    
+    Args:
+        urls: URL dei profili Transfermarkt
+        fetch_workers: Thread di download
+        parse_workers: Processi di parsing (default: numero di core)
+        queue_size: Pagine scaricate in attesa di parsing (oltre, i download si fermano)
+        max_in_flight: Pagine inviate ai processi e non ancora completate (default: 2 x parse_workers)
+        partial_parse: Parsing solo delle regioni utili della pagina
+        scraper: Scraper usato per i download (default: nuovo TransfermarktScraper)
+        
+    Returns:
+        Lista nello stesso ordine degli URL. Ogni elemento contiene 'url' e
+        'data' + 'db_format', oppure 'error'.
+    """
+    import requests
+    
+    parse_workers = parse_workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or 2 * parse_workers
+    scraper = scraper or TransfermarktScraper()
+    scraper._ensure_pool_size(fetch_workers)
+    
+    results: List[Optional[Dict]] = [None] * len(urls)
+    url_queue = queue.Queue()
+    html_queue = queue.Queue(maxsize=queue_size)
+    in_flight = threading.BoundedSemaphore(max_in_flight)
+    
+    for item in enumerate(urls):
+        url_queue.put(item)
+    
+    def fetch_worker():
+        try:
+            while True:
+                try:
+                    index, url = url_queue.get_nowait()
+                except queue.Empty:
+                    break
+                player_id = scraper.extract_player_id(url)
+                if not player_id:
+                    results[index] = {'url': url, 'error': "ID giocatore non trovato nell'URL"}
+                    continue
+                try:
+                    html = scraper.fetch_player_page(url, player_id)
+                except requests.RequestException as e:
+                    results[index] = {'url': url, 'error': f"Errore connessione: {str(e)}"}
+                    continue
+                except Exception as e:
+                    results[index] = {'url': url, 'error': f"Errore inaspettato: {str(e)}"}
+                    continue
+                # Bloccante se la coda è piena: backpressure verso i download
+                html_queue.put((index, url, player_id, html))
+        finally:
+            html_queue.put(_DONE)
+    
+    fetchers = [threading.Thread(target=fetch_worker, name=f'tm-fetch-{i}', daemon=True)
+                for i in range(max(1, fetch_workers))]
+    for thread in fetchers:
+        thread.start()
+    
+    print(f"🚚 Pipeline: {len(urls)} URL, {len(fetchers)} download, {parse_workers} parser, coda {queue_size}")
+    
+    with ProcessPoolExecutor(max_workers=parse_workers, initializer=_init_parse_worker,
+                             initargs=(partial_parse,)) as pool:
+        def on_done(future, index, url):
+            try:
+                results[index] = future.result()
+            except Exception as e:
+                results[index] = {'url': url, 'error': f"Errore inaspettato: {str(e)}"}
+            in_flight.release()
+        
+        finished_fetchers = 0
+        while finished_fetchers < len(fetchers):
+            item = html_queue.get()
+            if item is _DONE:
+                finished_fetchers += 1
+                continue
+            index, url, player_id, html = item
+            # Limita le pagine in lavorazione nei processi
+            in_flight.acquire()
+            try:
+                future = pool.submit(_parse_and_map, html, url, player_id)
+            except BrokenProcessPool as e:
+                # Un processo di parsing è morto (es. OOM): la pagina fallisce, la coda
+                # continua a svuotarsi finché tutti i download hanno finito
+                in_flight.release()
+                results[index] = {'url': url, 'error': f"Processo di parsing terminato: {str(e)}"}
+                continue
+            future.add_done_callback(lambda f, index=index, url=url: on_done(f, index, url))
+    
+    failed = sum(1 for r in results if 'error' in r)
+    print(f"📦 Pipeline completata: {len(results) - failed} ok, {failed} errori su {len(results)} URL")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scraping Transfermarkt con download e parsing in parallelo")
+    parser.add_argument('urls_file', help="File con un URL profilo per riga")
+    parser.add_argument('--fetch-workers', type=int, default=8)
+    parser.add_argument('--parse-workers', type=int, default=None, help="Default: numero di core")
+    parser.add_argument('--queue-size', type=int, default=64)
+    parser.add_argument('--max-in-flight', type=int, default=None)
+    parser.add_argument('--full-parse', action='store_true', help="Disattiva il parsing parziale")
+    parser.add_argument('-o', '--output', default='pipeline_results.json')
+    args = parser.parse_args()
+    
+    with open(args.urls_file, encoding='utf-8') as f:
+        urls = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+    
+    results = run_pipeline(
+        urls,
+        fetch_workers=args.fetch_workers,
+        parse_workers=args.parse_workers,
+        queue_size=args.queue_size,
+        max_in_flight=args.max_in_flight,
+        partial_parse=not args.full_parse,
+    )
+    
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"💾 Risultati salvati in: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,510 @@
+#!/usr/bin/env python3
+"""
+Normalizzazione compilata delle posizioni Transfermarkt
+
+Le tabelle (prefissi di reparto, abbreviazioni, parole chiave dei ruoli
+generali) vengono compilate una sola volta all'import:
+    - trie dei prefissi multilingua ("Difesa - ", "Abwehr - ", ...),
+      tradotto in un'unica regex e rimosso in un solo passaggio sulla stringa
+    - indice esatto e chiavi minuscole precalcolate per la ricerca parziale
+    - una regex ad alternanza per ruolo generale, in ordine di priorità
+Il risultato per posizione è memorizzato in un LRU: in un batch le stesse
+poche decine di posizioni si ripetono migliaia di volte.
+
+Le funzioni *_linear sono l'implementazione di riferimento (quella storica
+di get_role_abbreviation / map_position_to_role), usata da test e benchmark.
+
+TokenIndexMatcher è il matcher fuzzy per vocabolari di ruoli già in inglese
+(integrate_multilang_to_db): indice invertito token -> chiavi, pesi IDF e
+punteggio di confidenza; gli input senza corrispondenza vengono registrati.
+
+Uso:
+    from transfermarkt_positions import POSITIONS
+
+    POSITIONS.abbreviation('Difesa - Terzino sinistro')   # 'LB'
+    POSITIONS.role('Left Winger')                         # 'Ala'
+    POSITIONS.normalize_batch(['Portiere', 'Striker'])    # [('Goalkeeper', 'GK'), ('Forward', 'ST')]
+"""
+
+import re
+import math
+import threading
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+# Prefissi di reparto rimossi prima della ricerca dell'abbreviazione
+POSITION_PREFIXES = (
+    'Difesa - ', 'Centrocampo - ', 'Attacco - ',
+    'Defense - ', 'Midfield - ', 'Attack - ',
+    'Abwehr - ', 'Mittelfeld - ', 'Sturm - ',
+    'Défense - ', 'Milieu - ', 'Attaque - ',
+)
+
+# Mappa completa delle abbreviazioni INGLESI (allineata con TacticalFieldSimple.js).
+# L'ordine conta: la ricerca parziale restituisce la prima chiave compatibile.
+ROLE_ABBREVIATIONS = {
+    # Portieri -> GK
+    'Portiere': 'GK',
+    'Porta': 'GK',
+    'GK': 'GK',
+    'Goalkeeper': 'GK',
+    'Torwart': 'GK',
+    'Gardien': 'GK',
+    'Portero': 'GK',
+
+    # Difensori centrali -> CB
+    'Difensore centrale': 'CB',
+    'Difensore centrale sinistro': 'LCB',
+    'Difensore centrale destro': 'RCB',
+    'CB': 'CB',
+    'CB-L': 'LCB',
+    'CB-R': 'RCB',
+    'Centre-Back': 'CB',
+    'Center-Back': 'CB',
+    'Innenverteidiger': 'CB',
+    'Défenseur central': 'CB',
+    'Defensa central': 'CB',
+
+    # Terzini -> LB/RB
+    'Terzino sinistro': 'LB',
+    'Terzino destro': 'RB',
+    'LB': 'LB',
+    'RB': 'RB',
+    'Left-Back': 'LB',
+    'Right-Back': 'RB',
+    'Linksverteidiger': 'LB',
+    'Rechtsverteidiger': 'RB',
+    'Latéral gauche': 'LB',
+    'Latéral droit': 'RB',
+    'Lateral izquierdo': 'LB',
+    'Lateral derecho': 'RB',
+
+    # Esterni (wingback) -> LWB/RWB
+    'Esterno sinistro': 'LWB',
+    'Esterno destro': 'RWB',
+    'Esterno di sinistra': 'LWB',
+    'Esterno di destra': 'RWB',
+    'LWB': 'LWB',
+    'RWB': 'RWB',
+    'Left Wing-Back': 'LWB',
+    'Right Wing-Back': 'RWB',
+    'Linker Flügelverteidiger': 'LWB',
+    'Rechter Flügelverteidiger': 'RWB',
+
+    # Mediani -> DM
+    'Mediano': 'DM',
+    'Mediano sinistro': 'LDM',
+    'Mediano destro': 'RDM',
+    'CDM': 'DM',
+    'CDM-L': 'LDM',
+    'CDM-R': 'RDM',
+    'Defensive Midfield': 'DM',
+    'Defensives Mittelfeld': 'DM',
+    'Milieu défensif': 'DM',
+    'Mediocampista defensivo': 'DM',
+
+    # Centrocampisti centrali -> CM
+    'Centrocampista': 'CM',
+    'Centrocampista centrale': 'CM',
+    'Centrocampista sinistro': 'LCM',
+    'Centrocampista destro': 'RCM',
+    'CM': 'CM',
+    'CM-L': 'LCM',
+    'CM-R': 'RCM',
+    'Central Midfield': 'CM',
+    'Zentrales Mittelfeld': 'CM',
+    'Milieu central': 'CM',
+    'Mediocampista central': 'CM',
+
+    # Mezzali -> LCM/RCM
+    'Mezzala sinistra': 'LCM',
+    'Mezzala destra': 'RCM',
+    'LCM': 'LCM',
+    'RCM': 'RCM',
+
+    # Trequartisti -> AM
+    'Trequartista': 'AM',
+    'Trequartista sinistro': 'LAM',
+    'Trequartista destro': 'RAM',
+    'CAM': 'AM',
+    'CAM-L': 'LAM',
+    'CAM-R': 'RAM',
+    'Attacking Midfield': 'AM',
+    'Offensives Mittelfeld': 'AM',
+    'Milieu offensif': 'AM',
+    'Mediocampista ofensivo': 'AM',
+
+    # Ali -> LW/RW
+    'Ala sinistra': 'LW',
+    'Ala destra': 'RW',
+    'LW': 'LW',
+    'RW': 'RW',
+    'Left Winger': 'LW',
+    'Right Winger': 'RW',
+    'Linksaußen': 'LW',
+    'Rechtsaußen': 'RW',
+    'Ailier gauche': 'LW',
+    'Ailier droit': 'RW',
+    'Extremo izquierdo': 'LW',
+    'Extremo derecho': 'RW',
+
+    # Seconde punte -> SS
+    'Seconda punta': 'SS',
+    'Seconda punta sinistra': 'LSS',
+    'Seconda punta destra': 'RSS',
+    'SS': 'SS',
+    'SS-L': 'LSS',
+    'SS-R': 'RSS',
+    'Second Striker': 'SS',
+    'Hängende Spitze': 'SS',
+    'Deuxième attaquant': 'SS',
+    'Segundo delantero': 'SS',
+
+    # Attaccanti -> ST
+    'Attaccante': 'ST',
+    'Attaccante sinistro': 'LST',
+    'Attaccante destro': 'RST',
+    'Punta': 'ST',
+    'ST': 'ST',
+    'ST-L': 'LST',
+    'ST-R': 'RST',
+    'Centre-Forward': 'ST',
+    'Center-Forward': 'ST',
+    'Striker': 'ST',
+    'Mittelstürmer': 'ST',
+    'Avant-centre': 'ST',
+    'Delantero centro': 'ST',
+}
+
+# Ruolo generale (SEMPRE IN INGLESE) -> parole chiave, in ordine di priorità
+ROLE_KEYWORDS = (
+    # Portieri -> Goalkeeper
+    ('Goalkeeper', ('portiere', 'goalkeeper', 'porta', 'torwart', 'gardien', 'portero')),
+    # Terzini (esterni inclusi) - PRIMA dei difensori centrali per evitare conflitti con "back"
+    ('Terzino', ('terzino', 'left-back', 'right-back', 'esterno', 'wing-back', 'wingback', 'außenverteidiger', 'latéral', 'lateral')),
+    # Difensori centrali - DOPO i terzini -> Defender
+    ('Defender', ('difensore', 'difesa', 'centre-back', 'center-back', 'defender', 'innenverteidiger', 'défenseur', 'defensa')),
+    # Centrocampo - PRIMA di Ali e Attaccanti per catturare mezzala, trequartista, ecc.
+    ('Centrocampo', ('centrocampo', 'centrocampista', 'mediano', 'mezzala', 'trequartista', 'midfield', 'mittelfeld', 'milieu', 'mediocampista')),
+    # Ali - PRIMA degli attaccanti per evitare conflitti -> Ala
+    ('Ala', ('ala', 'winger', 'flügel', 'ailier', 'extremo')),
+    # Attaccanti (punte e seconde punte) -> Forward
+    ('Forward', ('attaccante', 'attacco', 'punta', 'striker', 'forward', 'seconda punta', 'second striker', 'stürmer', 'avant', 'delantero')),
+)
+
+DEFAULT_ABBREVIATION = 'MF'
+DEFAULT_ROLE = 'Centrocampo'
+
+_END = ''  # Marcatore di fine prefisso nei nodi del trie
+
+
+class PositionNormalizer:
+    """Posizione Transfermarkt -> (ruolo generale, abbreviazione), compilato e memorizzato"""
+
+    def __init__(self, prefixes: Sequence[str] = POSITION_PREFIXES,
+                 abbreviations: Optional[Dict[str, str]] = None,
+                 role_keywords: Sequence[Tuple[str, Sequence[str]]] = ROLE_KEYWORDS,
+                 cache_size: int = 4096):
+        self.prefixes = tuple(prefixes)
+        self.abbreviations = dict(ROLE_ABBREVIATIONS if abbreviations is None else abbreviations)
+        self.role_keywords = tuple((role, tuple(keywords)) for role, keywords in role_keywords)
+
+        # Trie dei prefissi (dict annidati carattere -> nodo, _END nei nodi finali),
+        # compilato in una regex: i prefissi comuni ("Mi" di Midfield/Milieu/Mittelfeld)
+        # vengono confrontati una volta sola e la sostituzione gira in C
+        self._trie: Dict[str, dict] = {}
+        for prefix in self.prefixes:
+            node = self._trie
+            for char in prefix:
+                node = node.setdefault(char, {})
+            node[_END] = prefix
+        self._prefix_pattern = re.compile(_trie_regex(self._trie)) if self.prefixes else None
+
+        # Chiavi minuscole precalcolate, nell'ordine della mappa
+        self._lower_keys = tuple((key.lower(), value) for key, value in self.abbreviations.items())
+
+        # Una regex per ruolo, provate in ordine di priorità
+        self._role_patterns = tuple(
+            (role, re.compile('|'.join(re.escape(keyword) for keyword in keywords)))
+            for role, keywords in self.role_keywords
+        )
+
+        self.abbreviation = lru_cache(maxsize=cache_size)(self._abbreviation)
+        self.role = lru_cache(maxsize=cache_size)(self._role)
+
+    def strip_prefixes(self, position: str) -> str:
+        """Rimuove i prefissi di reparto (ovunque compaiano) e gli spazi esterni"""
+        if self._prefix_pattern is not None:
+            position = self._prefix_pattern.sub('', position)
+        return position.strip()
+
+    def _abbreviation(self, position: str) -> str:
+        if not position:
+            return DEFAULT_ABBREVIATION
+
+        clean_pos = self.strip_prefixes(position)
+        abbreviation = self.abbreviations.get(clean_pos) or self.abbreviations.get(position)
+        if abbreviation:
+            return abbreviation
+
+        # Corrispondenza parziale (case insensitive), prima chiave compatibile
+        lower_pos = clean_pos.lower()
+        for key, value in self._lower_keys:
+            if key in lower_pos or lower_pos in key:
+                return value
+        return DEFAULT_ABBREVIATION
+
+    def _role(self, position: str) -> str:
+        if not position:
+            return DEFAULT_ROLE
+
+        pos_lower = position.lower()
+        for role, pattern in self._role_patterns:
+            if pattern.search(pos_lower):
+                return role
+        return DEFAULT_ROLE
+
+    def normalize(self, position: str) -> Tuple[str, str]:
+        """(ruolo generale, abbreviazione) della posizione"""
+        return self.role(position), self.abbreviation(position)
+
+    def abbreviations_batch(self, positions: Sequence[str]) -> List[str]:
+        """Abbreviazioni di una lista di posizioni (una ricerca per posizione distinta)"""
+        distinct = {position: self.abbreviation(position) for position in set(positions)}
+        return [distinct[position] for position in positions]
+
+    def roles_batch(self, positions: Sequence[str]) -> List[str]:
+        """Ruoli generali di una lista di posizioni (una ricerca per posizione distinta)"""
+        distinct = {position: self.role(position) for position in set(positions)}
+        return [distinct[position] for position in positions]
+
+    def normalize_batch(self, positions: Sequence[str]) -> List[Tuple[str, str]]:
+        """(ruolo generale, abbreviazione) per ogni posizione della lista"""
+        distinct = {position: self.normalize(position) for position in set(positions)}
+        return [distinct[position] for position in positions]
+
+    def cache_info(self) -> Dict:
+        abbreviation, role = self.abbreviation.cache_info(), self.role.cache_info()
+        return {
+            'abbreviation': {'hits': abbreviation.hits, 'misses': abbreviation.misses, 'size': abbreviation.currsize},
+            'role': {'hits': role.hits, 'misses': role.misses, 'size': role.currsize},
+        }
+
+    def cache_clear(self):
+        self.abbreviation.cache_clear()
+        self.role.cache_clear()
+
+    def abbreviation_linear(self, position: str) -> str:
+        """Implementazione di riferimento (replace in sequenza + scansione della mappa)"""
+        if not position:
+            return DEFAULT_ABBREVIATION
+        clean_pos = position
+        for prefix in self.prefixes:
+            clean_pos = clean_pos.replace(prefix, '')
+        clean_pos = clean_pos.strip()
+        if self.abbreviations.get(clean_pos):
+            return self.abbreviations[clean_pos]
+        if self.abbreviations.get(position):
+            return self.abbreviations[position]
+        lower_pos = clean_pos.lower()
+        for key, value in self.abbreviations.items():
+            if key.lower() in lower_pos or lower_pos in key.lower():
+                return value
+        return DEFAULT_ABBREVIATION
+
+    def role_linear(self, position: str) -> str:
+        """Implementazione di riferimento (catena di any)"""
+        if not position:
+            return DEFAULT_ROLE
+        pos_lower = position.lower()
+        for role, keywords in self.role_keywords:
+            if any(keyword in pos_lower for keyword in keywords):
+                return role
+        return DEFAULT_ROLE
+
+
+def _trie_regex(node: Dict[str, dict]) -> str:
+    """Regex equivalente al (sotto)trie: un'alternativa per ramo, prefissi comuni fattorizzati"""
+    branches = [re.escape(char) + _trie_regex(child) for char, child in node.items() if char != _END]
+    if not branches:
+        return ''
+    body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+    return f'(?:{body})?' if _END in node else body
+
+
+TOKEN_PATTERN = re.compile(r'[^\W_]+')
+
+# Varianti ortografiche ricondotte alla forma del vocabolario
+TOKEN_SYNONYMS = {
+    'center': 'centre',
+    'midfielder': 'midfield',
+    'wingback': 'wing',
+    'fullback': 'back',
+    'keeper': 'goalkeeper',
+}
+
+
+def tokenize(text: str) -> Tuple[str, ...]:
+    """Token minuscoli e normalizzati ('Left Center-Back' -> ('left', 'centre', 'back'))"""
+    return tuple(TOKEN_SYNONYMS.get(token, token) for token in TOKEN_PATTERN.findall(text.lower()))
+
+
+class PositionMatch(NamedTuple):
+    """Risultato di TokenIndexMatcher.match / partial_match"""
+    key: str
+    value: str
+    score: Optional[float]
+    partial: bool = False
+
+
+class TokenIndexMatcher:
+    """
+    Corrispondenza fuzzy su un vocabolario di posizioni con indice invertito
+
+    Ogni chiave è un insieme di token pesati per IDF (i token rari come
+    "goalkeeper" contano più di "back"). Per un input si valutano solo le
+    chiavi che condividono almeno un token (liste dell'indice invertito) e
+    il punteggio è il prodotto di:
+        - copertura della chiave: peso dei token comuni / peso della chiave
+        - copertura dell'input: peso dei token comuni / peso dell'input
+    I token assenti dal vocabolario pesano come i più rari ("Avant-centre" non
+    diventa "Centre-Back"); il reparto prima di " - " ("Attack - Centre-Forward")
+    viene ignorato. A pari punteggio vince la chiave che viene prima nel
+    vocabolario ("Winger" -> "Left Winger"), con confidenza divisa per il
+    numero di valori diversi in parità; sotto min_score match() restituisce
+    None.
+
+    partial_match() è un livello separato, senza punteggio (partial=True):
+    tra le chiavi dell'indice invertito cerca la prima, in ordine di
+    vocabolario, i cui token sono tutti nell'input ("Left Winger Right
+    Winger" -> "Left Winger") o che contiene tutti i token dell'input
+    ("Striker" -> "Second Striker").
+    """
+
+    def __init__(self, vocabulary: Dict[str, str], min_score: float = 0.6,
+                 name: str = 'positions', cache_size: int = 1024, max_unmatched: int = 256):
+        """
+        Args:
+            vocabulary: Chiave (es. 'Left-Back') -> valore (es. 'TS'), in ordine di preferenza
+            min_score: Confidenza minima per accettare una corrispondenza per token
+            name: Nome del vocabolario nei log
+            cache_size: Dimensione dell'LRU dei risultati
+            max_unmatched: Input senza corrispondenza distinti registrati (gli altri sono solo contati)
+        """
+        self.vocabulary = dict(vocabulary)
+        self.min_score = min_score
+        self.name = name
+        self.max_unmatched = max_unmatched
+        self._keys = tuple(self.vocabulary)
+        self._key_tokens = tuple(frozenset(tokenize(key)) for key in self._keys)
+
+        postings: Dict[str, List[int]] = {}
+        for i, tokens in enumerate(self._key_tokens):
+            for token in tokens:
+                postings.setdefault(token, []).append(i)
+        self._index: Dict[str, Tuple[int, ...]] = {token: tuple(ids) for token, ids in postings.items()}
+
+        total = len(self._keys)
+        self._weights = {token: math.log(1 + total / len(ids)) for token, ids in self._index.items()}
+        self._key_weights = tuple(sum(self._weights[t] for t in tokens) for tokens in self._key_tokens)
+        self._unknown_weight = math.log(1 + total)
+
+        self._lock = threading.Lock()
+        self.unmatched: Counter = Counter()
+        self.unmatched_overflow = 0
+        self.match = lru_cache(maxsize=cache_size)(self._match)
+        self.partial_match = lru_cache(maxsize=cache_size)(self._partial_match)
+
+    def _tokens(self, text: str) -> Tuple[set, set]:
+        """(token dell'input senza reparto, token presenti nel vocabolario)"""
+        tokens = set(tokenize(text.rpartition(' - ')[2]))
+        return tokens, {token for token in tokens if token in self._weights}
+
+    def _match(self, text: str) -> Optional[PositionMatch]:
+        if not text:
+            return None
+        if text in self.vocabulary:
+            return PositionMatch(text, self.vocabulary[text], 1.0)
+
+        weights = self._weights
+        tokens, known = self._tokens(text)
+        if not known:
+            return None
+        text_weight = (sum(weights[token] for token in known)
+                       + self._unknown_weight * (len(tokens) - len(known)))
+
+        shared: Dict[int, float] = {}
+        for token in known:
+            for i in self._index[token]:
+                shared[i] = shared.get(i, 0.0) + weights[token]
+
+        best, best_score, tied = None, 0.0, set()
+        for i, common in sorted(shared.items()):
+            score = (common / self._key_weights[i]) * (common / text_weight)
+            value = self.vocabulary[self._keys[i]]
+            if score > best_score + 1e-9:
+                best, best_score, tied = i, score, {value}
+            elif score > best_score - 1e-9:
+                # Parità: resta la chiave che viene prima nel vocabolario
+                tied.add(value)
+
+        # "Winger" vale quanto "Left Winger" e "Right Winger": vince l'ordine, con confidenza dimezzata
+        confidence = best_score / len(tied)
+        if confidence < self.min_score:
+            return None
+        key = self._keys[best]
+        return PositionMatch(key, self.vocabulary[key], round(confidence, 4))
+
+    def _partial_match(self, text: str) -> Optional[PositionMatch]:
+        if not text:
+            return None
+        tokens, known = self._tokens(text)
+        if not known:
+            return None
+
+        # Token in comune per chiave, solo tra le chiavi dell'indice invertito
+        common: Dict[int, int] = {}
+        for token in known:
+            for i in self._index[token]:
+                common[i] = common.get(i, 0) + 1
+
+        contained = [i for i, n in common.items() if n == len(self._key_tokens[i])]
+        containing = [i for i, n in common.items() if n == len(tokens)]
+        candidates = contained or containing
+        if not candidates:
+            return None
+        key = self._keys[min(candidates)]
+        return PositionMatch(key, self.vocabulary[key], None, partial=True)
+
+    def lookup(self, text: str) -> Optional[PositionMatch]:
+        """Come match(), ma registra gli input senza corrispondenza"""
+        result = self.match(text)
+        if result is None and text:
+            with self._lock:
+                first_time = text not in self.unmatched
+                if first_time and len(self.unmatched) >= self.max_unmatched:
+                    # Testo arbitrario dalle pagine: oltre il limite si conta soltanto
+                    self.unmatched_overflow += 1
+                    return None
+                self.unmatched[text] += 1
+            if first_time:
+                print(f"⚠️  Posizione non nel vocabolario '{self.name}': {text!r}")
+        return result
+
+    def stats(self) -> Dict:
+        with self._lock:
+            unmatched = dict(self.unmatched.most_common())
+        info = self.match.cache_info()
+        return {
+            'vocabulary': len(self._keys),
+            'tokens': len(self._index),
+            'cache_hits': info.hits,
+            'cache_misses': info.misses,
+            'unmatched': unmatched,
+            'unmatched_overflow': self.unmatched_overflow,
+        }
+
+
+# Compilato una volta per processo
+POSITIONS = PositionNormalizer()
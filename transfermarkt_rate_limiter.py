@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Rate limiter per dominio condiviso da tutti gli scraper Transfermarkt
+
+Ogni dominio di DOMAIN_LANGUAGE_MAP ha un token bucket. La velocità si adatta
+in stile AIMD: ogni risposta OK aumenta il rate di un passo fisso (additive
+increase), ogni 429/403/503 lo dimezza (multiplicative decrease) e blocca il
+dominio per il tempo indicato da Retry-After (al massimo max_pause secondi).
+In questo modo si resta vicini
+al massimo tollerato dal sito senza dover ripartire da capo con i job.
+
+Uso:
+    from transfermarkt_rate_limiter import get_rate_limiter, rate_limited_get
+
+    limiter = get_rate_limiter()          # unico per processo
+    response = rate_limited_get(session, url, limiter, timeout=10)
+
+    Dall'API asincrona (stessi bucket, l'attesa non blocca l'event loop):
+    response = await rate_limited_get_async(client, url, limiter, timeout=10)
+
+Configurazione (env):
+    TM_RATE_MAX_PAUSE   pausa massima di un dominio dopo un throttle, anche con
+                        Retry-After più lunghi (default 60)
+    TM_RATE_MAX_WAIT    attesa massima prima di un nuovo tentativo in
+                        rate_limited_get; oltre si restituisce la risposta di
+                        throttle (default 10)
+"""
+
+import os
+import time
+import random
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from transfermarkt_domains import DOMAIN_LANGUAGE_MAP, match_domain
+
+# Status che indicano che il sito ci sta limitando
+THROTTLE_STATUS_CODES = (403, 429, 503)
+
+# Retry-After ostili o sbagliati (86400, date lontane) non bloccano il dominio per ore
+DEFAULT_MAX_PAUSE = float(os.environ.get('TM_RATE_MAX_PAUSE', 60))
+# Attesa che chi serve una richiesta può permettersi prima di riprovare
+DEFAULT_MAX_RETRY_WAIT = float(os.environ.get('TM_RATE_MAX_WAIT', 10))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Converte l'header Retry-After (secondi o data HTTP) in secondi d'attesa"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    """Token bucket thread-safe con rate adattivo (AIMD)"""
+    
+    def __init__(self, rate: float = 2.0, burst: int = 4, min_rate: float = 0.25,
+                 max_rate: float = 10.0, increase: float = 0.1, decrease: float = 0.5,
+                 max_pause: float = DEFAULT_MAX_PAUSE):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.max_pause = max_pause
+        
+        self.tokens = float(burst)
+        self.blocked_until = 0.0
+        self.throttled = 0
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self, now: float):
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+    
+    def _reserve(self) -> float:
+        """Prende un token se disponibile; altrimenti restituisce i secondi d'attesa"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if now < self.blocked_until:
+                return self.blocked_until - now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+    
+    def acquire(self):
+        """Blocca finché non è disponibile un token"""
+        while True:
+            wait = self._reserve()
+            if not wait:
+                return
+            time.sleep(wait)
+    
+    async def acquire_async(self):
+        """Come acquire, ma cede l'event loop durante l'attesa"""
+        import asyncio
+        
+        while True:
+            wait = self._reserve()
+            if not wait:
+                return
+            await asyncio.sleep(wait)
+    
+    def on_success(self):
+        """Additive increase"""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+    
+    def on_throttle(self, retry_after: Optional[float] = None) -> float:
+        """
+        Multiplicative decrease + pausa del dominio (al massimo max_pause)
+        
+        Returns:
+            Secondi di pausa applicati
+        """
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            self.tokens = 0.0
+            self.throttled += 1
+            # Senza Retry-After: attesa pari a un intervallo al nuovo rate, con jitter
+            pause = retry_after if retry_after is not None else (1 / self.rate) * (1 + random.random())
+            pause = min(pause, self.max_pause)
+            self.blocked_until = max(self.blocked_until, time.monotonic() + pause)
+            return pause
+    
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {
+                'rate': round(self.rate, 3),
+                'tokens': round(self.tokens, 3),
+                'blocked_for': round(max(0.0, self.blocked_until - time.monotonic()), 3),
+                'throttled': self.throttled,
+            }
+
+
+class DomainRateLimiter:
+    """Un TokenBucket per ogni dominio Transfermarkt"""
+    
+    def __init__(self, domains=DOMAIN_LANGUAGE_MAP, **bucket_options):
+        self.bucket_options = bucket_options
+        self.buckets = {domain: TokenBucket(**bucket_options) for domain in domains}
+        self._lock = threading.Lock()
+    
+    def configure(self, domain: str, **bucket_options):
+        """Sostituisce il bucket di un dominio con parametri specifici"""
+        options = dict(self.bucket_options, **bucket_options)
+        with self._lock:
+            self.buckets[domain] = TokenBucket(**options)
+    
+    def bucket_for(self, url: str) -> TokenBucket:
+        domain = match_domain(url) or urlparse(url).netloc.lower()
+        bucket = self.buckets.get(domain)
+        if bucket is None:
+            with self._lock:
+                bucket = self.buckets.setdefault(domain, TokenBucket(**self.bucket_options))
+        return bucket
+    
+    def acquire(self, url: str):
+        self.bucket_for(url).acquire()
+    
+    async def acquire_async(self, url: str):
+        await self.bucket_for(url).acquire_async()
+    
+    def report(self, url: str, status_code: int, retry_after: Optional[str] = None) -> Optional[float]:
+        """
+        Registra l'esito di una richiesta
+        
+        Returns:
+            Secondi di pausa se la risposta era un throttle, altrimenti None
+        """
+        bucket = self.bucket_for(url)
+        if status_code in THROTTLE_STATUS_CODES:
+            return bucket.on_throttle(parse_retry_after(retry_after))
+        if status_code < 400:
+            bucket.on_success()
+        return None
+    
+    def stats(self) -> Dict[str, Dict]:
+        return {domain: bucket.snapshot() for domain, bucket in list(self.buckets.items())}
+
+
+_shared_limiter = None
+_shared_lock = threading.Lock()
+
+
+def get_rate_limiter() -> DomainRateLimiter:
+    """Restituisce il rate limiter condiviso dal processo"""
+    global _shared_limiter
+    if _shared_limiter is None:
+        with _shared_lock:
+            if _shared_limiter is None:
+                _shared_limiter = DomainRateLimiter()
+    return _shared_limiter
+
+
+def rate_limited_get(session, url: str, rate_limiter: DomainRateLimiter,
+                     max_retries: int = 3, max_wait: float = DEFAULT_MAX_RETRY_WAIT, **kwargs):
+    """
+    GET rispettando il rate limiter; su 429/403/503 attende e riprova
+    
+    Args:
+        max_wait: Pausa massima accettata prima di un nuovo tentativo; se il
+            dominio resta bloccato più a lungo si restituisce subito il throttle
+    
+    Returns:
+        L'ultima risposta ricevuta (può essere ancora un errore dopo max_retries)
+    """
+    for attempt in range(max_retries + 1):
+        rate_limiter.acquire(url)
+        response = session.get(url, **kwargs)
+        headers = getattr(response, 'headers', None) or {}
+        pause = rate_limiter.report(url, response.status_code, headers.get('Retry-After'))
+        if pause is None or attempt == max_retries:
+            return response
+        if pause > max_wait:
+            print(f"⏳ Throttled ({response.status_code}) su {urlparse(url).netloc} per {pause:.1f}s: nessun nuovo tentativo")
+            return response
+        print(f"⏳ Throttled ({response.status_code}) su {urlparse(url).netloc}, nuovo tentativo tra {pause:.1f}s")
+    return response
+
+
+async def rate_limited_get_async(client, url: str, rate_limiter: DomainRateLimiter,
+                                 max_retries: int = 3, max_wait: float = DEFAULT_MAX_RETRY_WAIT, **kwargs):
+    """
+    Come rate_limited_get con un client asincrono (es: httpx.AsyncClient)
+    
+    Returns:
+        L'ultima risposta ricevuta (può essere ancora un errore dopo max_retries)
+    """
+    for attempt in range(max_retries + 1):
+        await rate_limiter.acquire_async(url)
+        response = await client.get(url, **kwargs)
+        headers = getattr(response, 'headers', None) or {}
+        pause = rate_limiter.report(url, response.status_code, headers.get('Retry-After'))
+        if pause is None or attempt == max_retries:
+            return response
+        if pause > max_wait:
+            print(f"⏳ Throttled ({response.status_code}) su {urlparse(url).netloc} per {pause:.1f}s: nessun nuovo tentativo")
+            return response
+        print(f"⏳ Throttled ({response.status_code}) su {urlparse(url).netloc}, nuovo tentativo tra {pause:.1f}s")
+    return response
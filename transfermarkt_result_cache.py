@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Cache dei risultati di /api/scrape con stale-while-revalidate
+
+Dopo uno scraping riuscito il dizionario restituito dall'API (già mappato al
+formato database) viene salvato per giocatore (edizione + ID, vedi
+player_flight_key):
+    1. LRU in memoria del processo (microsecondi)
+    2. Store Redis opzionale (o compatibile: Valkey, KeyDB, Dragonfly),
+       condiviso tra i worker e i riavvii
+
+Un risultato più giovane di `ttl` viene servito così com'è. Tra `ttl` e
+`stale_ttl` viene servito subito e intanto un thread in background rifà lo
+scraping e aggiorna la cache (valore di mercato, squadra, ...). Oltre
+`stale_ttl` la richiesta rifà lo scraping. Gli errori non vengono salvati.
+
+Il refresh rilegge la pagina dentro transfermarkt_cache.revalidate(): anche
+una copia HTML ancora entro TM_CACHE_TTL viene rivalidata con una GET
+condizionale (304 = nessun download), quindi un risultato servito come 'hit'
+non è mai più vecchio di `ttl` rispetto all'ultima verifica su Transfermarkt.
+
+Uso:
+    from transfermarkt_result_cache import ResultCache
+
+    results = ResultCache(namespace='scraper_api')     # configurazione da env
+    data, status = results.get_or_compute(key, lambda: scrape(url))   # status: 'hit', 'stale', 'miss'
+
+Configurazione (env):
+    TM_RESULT_CACHE_TTL     secondi in cui un risultato è fresco (default 900, 0 = cache disattivata)
+    TM_RESULT_CACHE_STALE   età massima servita con refresh in background (default 86400)
+    TM_RESULT_CACHE_SIZE    risultati tenuti in memoria (default 2048)
+    TM_RESULT_CACHE_REDIS   URL Redis, es. redis://localhost:6379/0 (default: solo memoria)
+"""
+
+import os
+import json
+import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Tuple
+
+from transfermarkt_cache import revalidate
+
+HIT = 'hit'
+STALE = 'stale'
+MISS = 'miss'
+
+# Configurazione di default (sovrascrivibile da env)
+DEFAULT_RESULT_TTL = float(os.environ.get('TM_RESULT_CACHE_TTL', 15 * 60))
+DEFAULT_RESULT_STALE_TTL = float(os.environ.get('TM_RESULT_CACHE_STALE', 24 * 3600))
+DEFAULT_RESULT_CACHE_SIZE = int(os.environ.get('TM_RESULT_CACHE_SIZE', 2048))
+DEFAULT_RESULT_REDIS_URL = os.environ.get('TM_RESULT_CACHE_REDIS') or None
+
+# Pausa dello store Redis dopo un errore di connessione (si continua con la sola memoria)
+REDIS_RETRY_AFTER = 30.0
+
+
+def cacheable(result) -> bool:
+    """Si salvano solo i risultati riusciti (niente None né {"error": ...})"""
+    return isinstance(result, dict) and 'error' not in result
+
+
+class ResultCache:
+    """LRU in memoria davanti a uno store Redis opzionale, con refresh in background"""
+
+    def __init__(self, namespace: str = 'default', ttl: float = DEFAULT_RESULT_TTL,
+                 stale_ttl: float = DEFAULT_RESULT_STALE_TTL, max_entries: int = DEFAULT_RESULT_CACHE_SIZE,
+                 redis_url: Optional[str] = DEFAULT_RESULT_REDIS_URL, redis_client=None,
+                 refresh_workers: int = 4):
+        """
+        Args:
+            namespace: Prefisso delle chiavi (API diverse salvano formati diversi)
+            ttl: Secondi in cui un risultato è fresco (0 = cache disattivata)
+            stale_ttl: Età massima di un risultato servito con refresh in background
+            max_entries: Dimensione massima dell'LRU in memoria
+            redis_url: URL dello store Redis (None = solo memoria)
+            redis_client: Client già costruito con get/set/delete (al posto di redis_url)
+            refresh_workers: Refresh in background eseguiti in parallelo
+        """
+        self.namespace = namespace
+        self.ttl = ttl
+        self.stale_ttl = max(ttl, stale_ttl)
+        self.max_entries = max_entries
+        self.redis_url = redis_url
+        self.refresh_workers = refresh_workers
+        self._redis = redis_client
+        self._redis_down_until = 0.0
+        self._memory: 'OrderedDict[str, Tuple[float, Dict]]' = OrderedDict()
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.hits = 0
+        self.stale_hits = 0
+        self.redis_loads = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def _redis_key(self, key: str) -> str:
+        return f"tm:result:{self.namespace}:{key}"
+
+    def _store(self):
+        """Client Redis, creato alla prima richiesta (None se non configurato o in pausa)"""
+        if self._redis is None and self.redis_url is None:
+            return None
+        if time.monotonic() < self._redis_down_until:
+            return None
+        if self._redis is None:
+            try:
+                # redis-py serve solo con TM_RESULT_CACHE_REDIS
+                import redis
+
+                self._redis = redis.Redis.from_url(self.redis_url, socket_timeout=0.5, socket_connect_timeout=0.5)
+            except Exception as e:
+                self._redis_failed(e)
+                return None
+        return self._redis
+
+    def _redis_failed(self, error: Exception):
+        self._redis_down_until = time.monotonic() + REDIS_RETRY_AFTER
+        print(f"⚠️  Cache risultati Redis non disponibile ({error}): solo memoria per {REDIS_RETRY_AFTER:.0f}s")
+
+    def _remember(self, key: str, entry: Tuple[float, Dict]):
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def _lookup(self, key: str) -> Optional[Tuple[float, Dict]]:
+        """(stored_at, risultato) dalla memoria o da Redis, oppure None"""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                return entry
+
+        store = self._store()
+        if store is not None:
+            entry = None
+            try:
+                raw = store.get(self._redis_key(key))
+                if raw is not None:
+                    payload = json.loads(raw)
+                    entry = (payload['stored_at'], payload['value'])
+            except (ValueError, KeyError, TypeError) as e:
+                # Entry corrotta: trattata come miss e sovrascritta dal prossimo scraping
+                print(f"⚠️  Risultato in cache illeggibile per {key}: {e}")
+            except Exception as e:
+                self._redis_failed(e)
+            if entry is not None:
+                self._remember(key, entry)
+                with self._lock:
+                    self.redis_loads += 1
+                return entry
+        return None
+
+    def put(self, key: str, result: Dict):
+        """Salva un risultato riuscito in memoria e su Redis (con scadenza stale_ttl)"""
+        if not self.enabled or not cacheable(result):
+            return
+        entry = (time.time(), result)
+        self._remember(key, entry)
+        store = self._store()
+        if store is not None:
+            try:
+                store.set(self._redis_key(key), json.dumps({'stored_at': entry[0], 'value': result}),
+                          ex=max(1, int(self.stale_ttl)))
+            except Exception as e:
+                self._redis_failed(e)
+
+    def invalidate(self, key: str):
+        """Rimuove il risultato di un giocatore (memoria e Redis)"""
+        with self._lock:
+            self._memory.pop(key, None)
+        store = self._store()
+        if store is not None:
+            try:
+                store.delete(self._redis_key(key))
+            except Exception as e:
+                self._redis_failed(e)
+
+    def get_or_compute(self, key: str, compute: Callable[[], Dict]) -> Tuple[Dict, str]:
+        """
+        Risultato in cache o calcolato con `compute()`
+
+        Returns:
+            (risultato, 'hit' | 'stale' | 'miss'); con 'stale' è già partito il refresh
+
+        Raises:
+            Le eccezioni di `compute` (solo in caso di miss)
+        """
+        if not self.enabled:
+            return compute(), MISS
+
+        entry = self._lookup(key)
+        if entry is not None:
+            age = time.time() - entry[0]
+            if age < self.ttl:
+                with self._lock:
+                    self.hits += 1
+                return entry[1], HIT
+            if age < self.stale_ttl:
+                with self._lock:
+                    self.stale_hits += 1
+                self._refresh(key, compute)
+                return entry[1], STALE
+
+        with self._lock:
+            self.misses += 1
+        result = compute()
+        self.put(key, result)
+        return result, MISS
+
+    def _refresh(self, key: str, compute: Callable[[], Dict]):
+        """Rifà lo scraping in background (un solo refresh per chiave alla volta)"""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.refresh_workers, thread_name_prefix='tm-refresh')
+            executor = self._executor
+
+        def run():
+            try:
+                # La pagina in cache HTML può essere più vecchia del risultato: va rivalidata
+                with revalidate():
+                    result = compute()
+                if cacheable(result):
+                    self.put(key, result)
+                    with self._lock:
+                        self.refreshes += 1
+                else:
+                    # Il risultato vecchio resta servibile fino a stale_ttl
+                    with self._lock:
+                        self.refresh_errors += 1
+            except Exception as e:
+                print(f"⚠️  Refresh di {key} fallito: {e}")
+                with self._lock:
+                    self.refresh_errors += 1
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        executor.submit(run)
+
+    def stats(self) -> Dict:
+        """
+        Contatori di hit/miss, refresh e dimensione dell'LRU
+
+        redis_loads = risultati trovati solo su Redis (es. salvati da un altro worker)
+        """
+        with self._lock:
+            lookups = self.hits + self.stale_hits + self.misses
+            return {
+                'hits': self.hits,
+                'stale_hits': self.stale_hits,
+                'misses': self.misses,
+                'hit_rate': round((self.hits + self.stale_hits) / lookups, 4) if lookups else 0.0,
+                'redis_loads': self.redis_loads,
+                'refreshes': self.refreshes,
+                'refresh_errors': self.refresh_errors,
+                'refreshing': len(self._refreshing),
+                'memory_entries': len(self._memory),
+                'max_entries': self.max_entries,
+                'ttl': self.ttl,
+                'stale_ttl': self.stale_ttl,
+                'redis': self.redis_url or ('client' if self._redis is not None else None),
+            }
+
+    def shutdown(self, wait: bool = True):
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
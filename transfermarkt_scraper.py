@@ -16,18 +16,53 @@ Uso:
 
 import re
 import json
-import requests
-from bs4 import BeautifulSoup
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from urllib.parse import urlparse
 
+# requests, asyncio e bs4 vengono importati al primo uso: chi usa solo le
+# funzioni di mappatura non carica lo stack di scraping
+from transfermarkt_cache import HTMLCache, fetch_html, make_cache_key
+from transfermarkt_fields import PROFILE_FIELDS
+from transfermarkt_labels import PROFILE_LABELS, InfoField
+from transfermarkt_mapping import (
+    NATIONALITY_MAPPING,
+    extract_market_value_number,
+    get_role_abbreviation,
+    map_foot,
+    map_nationality,
+    map_position_to_role,
+    map_to_database_format,
+)
+from transfermarkt_parsing import make_soup
+from transfermarkt_rate_limiter import DomainRateLimiter, get_rate_limiter
+
+# ID giocatore nei link Transfermarkt (.../profil/spieler/567497)
+PLAYER_ID_PATTERN = re.compile(r'spieler/(\d+)')
+
 
 class TransfermarktScraper:
     """Scraper per estrarre dati da Transfermarkt"""
     
-    def __init__(self):
-        self.session = requests.Session()
+    def __init__(self, cache: Optional[HTMLCache] = None,
+                 rate_limiter: Optional[DomainRateLimiter] = None,
+                 session: Optional['requests.Session'] = None,
+                 partial_parse: bool = False):
+        """
+        Args:
+            cache: Cache opzionale delle pagine profilo (es: DiskHTMLCache)
+            rate_limiter: Rate limiter per dominio (default: quello condiviso dal processo)
+            session: Sessione HTTP da riusare (default: nuova sessione)
+            partial_parse: Costruisce solo le regioni HTML lette dall'estrattore
+        """
+        import requests
+        
+        self.cache = cache
+        self.partial_parse = partial_parse
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        # Una sessione passata dall'esterno (es. dal registro) è condivisa: non va riconfigurata
+        self._owns_session = session is None
+        self.session = session or requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept-Language': 'it-IT,it;q=0.9,en-US;q=0.8,en;q=0.7',
@@ -37,7 +72,7 @@ class TransfermarktScraper:
     
     def extract_player_id(self, url: str) -> Optional[str]:
         """Estrae l'ID del giocatore dall'URL"""
-        match = re.search(r'spieler/(\d+)', url)
+        match = PLAYER_ID_PATTERN.search(url)
         return match.group(1) if match else None
     
     def clean_text(self, text: str) -> str:
@@ -92,6 +127,8 @@ class TransfermarktScraper:
         Returns:
             Dizionario con tutti i dati del giocatore
         """
+        import requests
+        
         try:
             # Estrai ID giocatore
             player_id = self.extract_player_id(url)
@@ -100,221 +137,333 @@ class TransfermarktScraper:
             
             print(f"📥 Scaricamento dati per giocatore ID: {player_id}")
             
-            # Richiesta HTTP
-            response = self.session.get(url, timeout=15)
-            response.raise_for_status()
+            # Richiesta HTTP (o copia in cache)
+            html = self.fetch_player_page(url, player_id)
             
-            # Parse HTML
-            soup = BeautifulSoup(response.content, 'lxml')
+            return self.parse_player_page(html, url, player_id)
             
-            # Dizionario dati giocatore
-            player_data = {
-                'id': player_id,
-                'url': url,
-                'scraped_at': datetime.now().isoformat()
-            }
+        except requests.RequestException as e:
+            return {"error": f"Errore connessione: {str(e)}"}
+        except Exception as e:
+            return {"error": f"Errore inaspettato: {str(e)}"}
+    
+    def fetch_player_page(self, url: str, player_id: str) -> bytes:
+        """
+        Scarica l'HTML della pagina profilo (cache e rate limiter inclusi)
+        
+        Raises:
+            requests.RequestException in caso di errore di rete o HTTP
+        """
+        return fetch_html(self.session, url, timeout=15, cache=self.cache,
+                          cache_key=make_cache_key(url, player_id),
+                          rate_limiter=self.rate_limiter)
+    
+    def get_players_info(self, urls: List[str], concurrency: int = 8) -> List[Dict]:
+        """
+        Estrae le informazioni di più giocatori in parallelo
+        
+        Args:
+            urls: Lista di URL profilo Transfermarkt
+            concurrency: Numero massimo di richieste contemporanee
             
-            # ========================================
-            # IMMAGINE PROFILO
-            # ========================================
-            profile_img = soup.find('img', class_='data-header__profile-image')
-            if profile_img:
-                img_url = profile_img.get('src', '')
-                if img_url:
-                    # Se l'URL è relativo, rendilo assoluto
-                    if img_url.startswith('//'):
-                        img_url = 'https:' + img_url
-                    elif img_url.startswith('/'):
-                        img_url = 'https://www.transfermarkt.it' + img_url
-                    player_data['profile_image'] = img_url
+        Returns:
+            Lista di dizionari nello stesso ordine degli URL. In caso di
+            errore l'elemento contiene le chiavi 'error' e 'url'.
+        """
+        import asyncio
+        
+        return asyncio.run(self.get_players_info_async(urls, concurrency=concurrency))
+    
+    async def get_players_info_async(self, urls: List[str], concurrency: int = 8) -> List[Dict]:
+        """
+        Versione asyncio di get_players_info, da usare se un event loop è già attivo
+        
+        Le richieste girano su un pool di thread limitato a `concurrency` e
+        condividono la stessa sessione (e quindi le connessioni keep-alive).
+        """
+        import asyncio
+        from concurrent.futures import ThreadPoolExecutor
+        
+        concurrency = max(1, int(concurrency))
+        self._ensure_pool_size(concurrency)
+        
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='tm-scraper') as executor:
+            async def scrape_one(url: str) -> Dict:
+                try:
+                    data = await loop.run_in_executor(executor, self.get_player_info, url)
+                except Exception as e:
+                    data = {"error": f"Errore inaspettato: {str(e)}"}
+                if 'error' in data:
+                    data.setdefault('url', url)
+                return data
             
-            # ========================================
-            # NOME GIOCATORE
-            # ========================================
-            name_tag = soup.find('h1', class_='data-header__headline-wrapper')
-            if name_tag:
-                full_name = self.clean_text(name_tag.get_text())
-                # Rimuovi il numero di maglia se presente
-                name_clean = re.sub(r'^#\d+\s+', '', full_name)
-                player_data['name'] = name_clean
-                player_data['name_with_number'] = full_name
+            results = await asyncio.gather(*(scrape_one(url) for url in urls))
+        
+        failed = sum(1 for r in results if 'error' in r)
+        print(f"📦 Batch completato: {len(results) - failed} ok, {failed} errori su {len(results)} URL")
+        return list(results)
+    
+    def _ensure_pool_size(self, pool_size: int):
+        """
+        Allarga il pool di connessioni della sessione per il batch
+        
+        Solo per la sessione creata dallo scraper: quella del registro è
+        condivisa dalle altre istanze ed è già dimensionata dal registro.
+        """
+        from requests.adapters import HTTPAdapter
+        
+        if not self._owns_session:
+            return
+        adapter = self.session.get_adapter('https://')
+        if getattr(adapter, '_pool_maxsize', 0) >= pool_size:
+            return
+        # Stessi retry e numero di host dell'adapter attuale, pool più grande
+        adapter = HTTPAdapter(pool_connections=getattr(adapter, '_pool_connections', 10),
+                              pool_maxsize=pool_size,
+                              max_retries=adapter.max_retries)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+    
+    def parse_player_page(self, html, url: str, player_id: str) -> Dict:
+        """
+        Estrae i dati del giocatore dall'HTML già scaricato della pagina profilo
+        
+        Args:
+            html: Contenuto HTML (bytes o str) della pagina profilo
+            url: URL del profilo Transfermarkt
+            player_id: ID del giocatore estratto dall'URL
             
-            # ========================================
-            # INFORMAZIONI PRINCIPALI - APPROCCIO MULTI-METODO
-            # ========================================
+        Returns:
+            Dizionario con tutti i dati del giocatore
+        """
+        # Parse HTML (solo le regioni utili in modalità parziale)
+        soup = make_soup(html, partial=self.partial_parse)
+        
+        # Un'unica visita dell'albero raccoglie tutte le regioni della specifica
+        doc = PROFILE_FIELDS.extract(soup)
+        
+        # Dizionario dati giocatore
+        player_data = {
+            'id': player_id,
+            'url': url,
+            'scraped_at': datetime.now().isoformat()
+        }
+        
+        # ========================================
+        # IMMAGINE PROFILO
+        # ========================================
+        profile_img = doc.region('profile_image')
+        if profile_img:
+            img_url = profile_img.get('src', '')
+            if img_url:
+                # Se l'URL è relativo, rendilo assoluto
+                if img_url.startswith('//'):
+                    img_url = 'https:' + img_url
+                elif img_url.startswith('/'):
+                    img_url = 'https://www.transfermarkt.it' + img_url
+                player_data['profile_image'] = img_url
+        
+        # ========================================
+        # NOME GIOCATORE
+        # ========================================
+        name_tag = doc.region('headline')
+        if name_tag:
+            full_name = self.clean_text(name_tag.get_text())
+            # Rimuovi il numero di maglia se presente
+            name_clean = re.sub(r'^#\d+\s+', '', full_name)
+            player_data['name'] = name_clean
+            player_data['name_with_number'] = full_name
+        
+        # ========================================
+        # INFORMAZIONI PRINCIPALI - APPROCCIO MULTI-METODO
+        # ========================================
+        
+        # METODO 1: Cerca info-table (struttura classica)
+        if doc.region('info_table'):
+            # Tutte le righe (span con classe info-table__content), già raccolte nella visita
+            all_spans = doc.info_spans
             
-            # METODO 1: Cerca info-table (struttura classica)
-            info_table = soup.find('div', class_='info-table')
-            if info_table:
-                # Trova tutte le righe (span con classe info-table__content)
-                all_spans = info_table.find_all('span', class_='info-table__content')
+            for i, span in enumerate(all_spans):
+                text = self.clean_text(span.get_text()).lower()
+                
+                # Se questo span contiene una label, il prossimo contiene il valore
+                # Supporto multilingua: IT, EN, DE, ES, FR
+                field = PROFILE_LABELS.classify(text)
+                if field is None or i + 1 >= len(all_spans):
+                    continue
                 
-                for i, span in enumerate(all_spans):
-                    text = self.clean_text(span.get_text()).lower()
+                value_span = all_spans[i + 1]
+                value = self.clean_text(value_span.get_text())
+                
+                # Data di nascita
+                if field is InfoField.BIRTH:
+                    player_data['date_of_birth_text'] = value
+                    # Estrai età se presente
+                    age_match = re.search(r'\((\d+)\)', value)
+                    if age_match:
+                        player_data['age'] = int(age_match.group(1))
+                        # Calcola anno di nascita dall'età
+                        current_year = datetime.now().year
+                        player_data['birth_year'] = current_year - int(age_match.group(1))
+                        print(f"   📅 Anno calcolato da età: {player_data['birth_year']}")
                     
-                    # Se questo span contiene una label, il prossimo contiene il valore
-                    # Supporto multilingua: IT, EN, DE, ES, FR
-                    if any(keyword in text for keyword in [
-                        # Data di nascita
-                        'data di nascita', 'date of birth', 'nato il', 'geboren', 'f. nacim', 'edad', 'né le',
-                        # Luogo
-                        'luogo', 'place', 'lugar', 'lieu',
-                        # Altezza
-                        'altezza', 'height', 'altura', 'taille', 'größe',
-                        # Nazionalità
-                        'nazionalità', 'citizenship', 'nacionalidad', 'nationalité', 'staatsbürgerschaft',
-                        # Posizione
-                        'posizione', 'position', 'posición',
-                        # Piede
-                        'piede', 'foot', 'pie', 'pied', 'fuß'
-                    ]):
-                        # Il valore è nel prossimo span
-                        if i + 1 < len(all_spans):
-                            value_span = all_spans[i + 1]
-                            value = self.clean_text(value_span.get_text())
-                            
-                            # Data di nascita (multilingua)
-                            if any(kw in text for kw in ['data di nascita', 'date of birth', 'nato il', 'geboren', 'f. nacim', 'edad', 'né le']):
-                                player_data['date_of_birth_text'] = value
-                                # Estrai età se presente
-                                age_match = re.search(r'\((\d+)\)', value)
-                                if age_match:
-                                    player_data['age'] = int(age_match.group(1))
-                                    # Calcola anno di nascita dall'età
-                                    current_year = datetime.now().year
-                                    player_data['birth_year'] = current_year - int(age_match.group(1))
-                                    print(f"   📅 Anno calcolato da età: {player_data['birth_year']}")
-                                
-                                # Cerca anche anno esplicito (1900-2029)
-                                year_match = re.search(r'\b(19\d{2}|20[0-2]\d)\b', value)
-                                if year_match:
-                                    player_data['birth_year'] = int(year_match.group(1))
-                                    print(f"   📅 Anno estratto direttamente: {player_data['birth_year']}")
-                            
-                            # Luogo di nascita (multilingua)
-                            elif any(kw in text for kw in ['luogo', 'place', 'lugar', 'lieu']):
-                                player_data['birth_place'] = value
-                            
-                            # Altezza (multilingua)
-                            elif any(kw in text for kw in ['altezza', 'height', 'altura', 'taille', 'größe']):
-                                player_data['height_raw'] = value
-                                height_match = re.search(r'(\d+),(\d+)', value)
-                                if height_match:
-                                    height_m = float(f"{height_match.group(1)}.{height_match.group(2)}")
-                                    player_data['height_cm'] = int(height_m * 100)
-                            
-                            # Peso (multilingua)
-                            elif any(kw in text for kw in ['peso', 'weight', 'poids', 'gewicht']):
-                                player_data['weight_raw'] = value
-                                weight_match = re.search(r'(\d+)', value)
-                                if weight_match:
-                                    player_data['weight_kg'] = int(weight_match.group(1))
-                            
-                            # Nazionalità (multilingua)
-                            elif any(kw in text for kw in ['nazionalità', 'citizenship', 'nacionalidad', 'nationalité', 'staatsbürgerschaft']):
-                                flags = value_span.find_all('img', class_='flaggenrahmen')
-                                if flags:
-                                    nationalities = []
-                                    for flag in flags:
-                                        nat = flag.get('title', '') or flag.get('alt', '')
-                                        if nat and nat not in nationalities:
-                                            nationalities.append(nat)
-                                    if nationalities:
-                                        player_data['nationality'] = nationalities
-                                        player_data['nationality_primary'] = nationalities[0]
-                            
-                            # Posizione (multilingua)
-                            elif any(kw in text for kw in ['posizione', 'position', 'posición']):
-                                player_data['position'] = value
-                            
-                            # Piede (multilingua)
-                            elif any(kw in text for kw in ['piede', 'foot', 'pie', 'pied', 'fuß']):
-                                player_data['preferred_foot'] = value
+                    # Cerca anche anno esplicito (1900-2029)
+                    year_match = re.search(r'\b(19\d{2}|20[0-2]\d)\b', value)
+                    if year_match:
+                        player_data['birth_year'] = int(year_match.group(1))
+                        print(f"   📅 Anno estratto direttamente: {player_data['birth_year']}")
+                
+                # Luogo di nascita
+                elif field is InfoField.BIRTH_PLACE:
+                    player_data['birth_place'] = value
+                
+                # Altezza
+                elif field is InfoField.HEIGHT:
+                    player_data['height_raw'] = value
+                    height_match = re.search(r'(\d+),(\d+)', value)
+                    if height_match:
+                        height_m = float(f"{height_match.group(1)}.{height_match.group(2)}")
+                        player_data['height_cm'] = int(height_m * 100)
+                
+                # Peso
+                elif field is InfoField.WEIGHT:
+                    player_data['weight_raw'] = value
+                    weight_match = re.search(r'(\d+)', value)
+                    if weight_match:
+                        player_data['weight_kg'] = int(weight_match.group(1))
+                
+                # Nazionalità
+                elif field is InfoField.NATIONALITY:
+                    flags = value_span.find_all('img', class_='flaggenrahmen')
+                    if flags:
+                        nationalities = []
+                        for flag in flags:
+                            nat = flag.get('title', '') or flag.get('alt', '')
+                            if nat and nat not in nationalities:
+                                nationalities.append(nat)
+                        if nationalities:
+                            player_data['nationality'] = nationalities
+                            player_data['nationality_primary'] = nationalities[0]
+                
+                # Posizione
+                elif field is InfoField.POSITION:
+                    player_data['position'] = value
+                
+                # Piede
+                elif field is InfoField.FOOT:
+                    player_data['preferred_foot'] = value
+                
+                # Scadenza contratto: prima occorrenza
+                elif field is InfoField.CONTRACT and 'contract_expiry' not in player_data:
+                    player_data['contract_expiry'] = value
+        
+        # Fallback per posizione se non trovata sopra (multilingua)
+        if 'position' not in player_data:
+            for tag in doc.dd_tags:
+                text = self.clean_text(tag.get_text())
+                # Italiano, Inglese, Spagnolo, Francese, Tedesco
+                if any(pos in text for pos in ['Goalkeeper', 'Defender', 'Midfield', 'Forward', 
+                                                'Winger', 'Striker', 'Centre', 'Back', 
+                                                'Difesa', 'Centrocampo', 'Attacco',
+                                                'Defensa', 'Mediocampo', 'Delantero', 'Lateral',
+                                                'Défense', 'Milieu', 'Attaquant',
+                                                'Abwehr', 'Mittelfeld', 'Sturm']):
+                    player_data['position'] = text
+                    break
+        
+        # ========================================
+        # RUOLO DETTAGLIATO (con grafico campo e coordinate)
+        # ========================================
+        # Cerca la sezione "Ruolo" con ruolo naturale e altri ruoli
+        role_section = doc.region('detail_position')
+        if role_section:
+            # Ruolo naturale
+            natural_role = role_section.find('dt', string=re.compile(r'Ruolo naturale|Main position', re.IGNORECASE))
+            if natural_role:
+                natural_role_value = natural_role.find_next_sibling('dd')
+                if natural_role_value:
+                    player_data['natural_position'] = self.clean_text(natural_role_value.get_text())
             
-            # Fallback per posizione se non trovata sopra (multilingua)
-            if 'position' not in player_data:
-                position_tags = soup.find_all('dd')
-                for tag in position_tags:
-                    text = self.clean_text(tag.get_text())
-                    # Italiano, Inglese, Spagnolo, Francese, Tedesco
-                    if any(pos in text for pos in ['Goalkeeper', 'Defender', 'Midfield', 'Forward', 
-                                                    'Winger', 'Striker', 'Centre', 'Back', 
-                                                    'Difesa', 'Centrocampo', 'Attacco',
-                                                    'Defensa', 'Mediocampo', 'Delantero', 'Lateral',
-                                                    'Défense', 'Milieu', 'Attaquant',
-                                                    'Abwehr', 'Mittelfeld', 'Sturm']):
-                        player_data['position'] = text
-                        break
+            # Altri ruoli
+            other_roles = role_section.find('dt', string=re.compile(r'Altro ruolo|Other position', re.IGNORECASE))
+            if other_roles:
+                other_roles_value = other_roles.find_next_sibling('dd')
+                if other_roles_value:
+                    # Può esserci più di un ruolo alternativo
+                    roles_list = [self.clean_text(r.get_text()) for r in other_roles_value.find_all('dd')] if other_roles_value.find_all('dd') else [self.clean_text(other_roles_value.get_text())]
+                    player_data['other_positions'] = roles_list if len(roles_list) > 1 else roles_list[0] if roles_list else None
             
-            # ========================================
-            # RUOLO DETTAGLIATO (con grafico campo e coordinate)
-            # ========================================
-            # Cerca la sezione "Ruolo" con ruolo naturale e altri ruoli
-            role_section = soup.find('div', class_='detail-position')
-            if role_section:
-                # Ruolo naturale
-                natural_role = role_section.find('dt', string=re.compile(r'Ruolo naturale|Main position', re.IGNORECASE))
-                if natural_role:
-                    natural_role_value = natural_role.find_next_sibling('dd')
-                    if natural_role_value:
-                        player_data['natural_position'] = self.clean_text(natural_role_value.get_text())
-                
-                # Altri ruoli
-                other_roles = role_section.find('dt', string=re.compile(r'Altro ruolo|Other position', re.IGNORECASE))
-                if other_roles:
-                    other_roles_value = other_roles.find_next_sibling('dd')
-                    if other_roles_value:
-                        # Può esserci più di un ruolo alternativo
-                        roles_list = [self.clean_text(r.get_text()) for r in other_roles_value.find_all('dd')] if other_roles_value.find_all('dd') else [self.clean_text(other_roles_value.get_text())]
-                        player_data['other_positions'] = roles_list if len(roles_list) > 1 else roles_list[0] if roles_list else None
+            # ESTRAI COORDINATE PALLINI DAL GRAFICO SVG
+            svg_field = role_section.find('svg')
+            if svg_field:
+                positions = []
+                # Cerca tutti i cerchi (pallini) nel campo
+                circles = svg_field.find_all('circle', class_=re.compile(r'position'))
+                for circle in circles:
+                    try:
+                        cx = float(circle.get('cx', 0))
+                        cy = float(circle.get('cy', 0))
+                        # Normalizza coordinate (SVG è tipicamente 0-100)
+                        positions.append({'x': cx, 'y': cy})
+                    except:
+                        pass
                 
-                # ESTRAI COORDINATE PALLINI DAL GRAFICO SVG
-                svg_field = role_section.find('svg')
-                if svg_field:
-                    positions = []
-                    # Cerca tutti i cerchi (pallini) nel campo
-                    circles = svg_field.find_all('circle', class_=re.compile(r'position'))
-                    for circle in circles:
-                        try:
-                            cx = float(circle.get('cx', 0))
-                            cy = float(circle.get('cy', 0))
-                            # Normalizza coordinate (SVG è tipicamente 0-100)
-                            positions.append({'x': cx, 'y': cy})
-                        except:
-                            pass
-                    
-                    if positions:
-                        # Prendi la posizione principale (primo pallino più grande)
-                        main_position = positions[0] if positions else None
-                        if main_position:
-                            player_data['field_position_x'] = main_position['x']
-                            player_data['field_position_y'] = main_position['y']
+                if positions:
+                    # Prendi la posizione principale (primo pallino più grande)
+                    main_position = positions[0] if positions else None
+                    if main_position:
+                        player_data['field_position_x'] = main_position['x']
+                        player_data['field_position_y'] = main_position['y']
+        
+        # ========================================
+        # SQUADRA ATTUALE
+        # ========================================
+        club_header = doc.region('club')
+        if club_header:
+            club_link = club_header.find('a')
+            if club_link:
+                player_data['current_club'] = self.clean_text(club_link.get_text())
+                player_data['current_club_url'] = club_link.get('href', '')
+        
+        # ========================================
+        # VALORE DI MERCATO
+        # ========================================
+        market_value = doc.region('market_value_widget')
+        if market_value:
+            full_value = self.clean_text(market_value.get_text())
+            player_data['market_value_raw'] = full_value
             
-            # ========================================
-            # SQUADRA ATTUALE
-            # ========================================
-            club_header = soup.find('span', class_='data-header__club')
-            if club_header:
-                club_link = club_header.find('a')
-                if club_link:
-                    player_data['current_club'] = self.clean_text(club_link.get_text())
-                    player_data['current_club_url'] = club_link.get('href', '')
+            # Estrai valore numerico (es: "3,50 mln €")
+            value_match = re.search(r'(\d+[,.]?\d*)\s*(mln|mil|mila|k)?', full_value, re.IGNORECASE)
+            if value_match:
+                num = float(value_match.group(1).replace(',', '.'))
+                unit = value_match.group(2).lower() if value_match.group(2) else ''
+                
+                # Converti in milioni
+                if 'mln' in unit or 'mil' in unit:
+                    player_data['market_value'] = num
+                elif 'mila' in unit or 'k' in unit:
+                    player_data['market_value'] = num / 1000
+                else:
+                    player_data['market_value'] = num
             
-            # ========================================
-            # VALORE DI MERCATO
-            # ========================================
-            market_value = soup.find('div', class_='tm-player-market-value-development__current-value')
-            if market_value:
-                full_value = self.clean_text(market_value.get_text())
+            # Estrai data aggiornamento - pattern più flessibile
+            date_match = re.search(r'(\d{2}/\d{2}/\d{4})', full_value)
+            if date_match:
+                player_data['market_value_updated'] = date_match.group(1)
+        else:
+            # Prova metodo alternativo
+            value_tag = doc.region('market_value_header')
+            if value_tag:
+                full_value = self.clean_text(value_tag.get_text())
                 player_data['market_value_raw'] = full_value
                 
-                # Estrai valore numerico (es: "3,50 mln €")
                 value_match = re.search(r'(\d+[,.]?\d*)\s*(mln|mil|mila|k)?', full_value, re.IGNORECASE)
                 if value_match:
                     num = float(value_match.group(1).replace(',', '.'))
                     unit = value_match.group(2).lower() if value_match.group(2) else ''
                     
-                    # Converti in milioni
                     if 'mln' in unit or 'mil' in unit:
                         player_data['market_value'] = num
                     elif 'mila' in unit or 'k' in unit:
@@ -322,91 +471,42 @@ class TransfermarktScraper:
                     else:
                         player_data['market_value'] = num
                 
-                # Estrai data aggiornamento - pattern più flessibile
+                # Estrai data aggiornamento
                 date_match = re.search(r'(\d{2}/\d{2}/\d{4})', full_value)
                 if date_match:
                     player_data['market_value_updated'] = date_match.group(1)
-            else:
-                # Prova metodo alternativo
-                value_tag = soup.find('a', class_='data-header__market-value-wrapper')
-                if value_tag:
-                    full_value = self.clean_text(value_tag.get_text())
-                    player_data['market_value_raw'] = full_value
-                    
-                    value_match = re.search(r'(\d+[,.]?\d*)\s*(mln|mil|mila|k)?', full_value, re.IGNORECASE)
-                    if value_match:
-                        num = float(value_match.group(1).replace(',', '.'))
-                        unit = value_match.group(2).lower() if value_match.group(2) else ''
-                        
-                        if 'mln' in unit or 'mil' in unit:
-                            player_data['market_value'] = num
-                        elif 'mila' in unit or 'k' in unit:
-                            player_data['market_value'] = num / 1000
-                        else:
-                            player_data['market_value'] = num
-                    
-                    # Estrai data aggiornamento
-                    date_match = re.search(r'(\d{2}/\d{2}/\d{4})', full_value)
-                    if date_match:
-                        player_data['market_value_updated'] = date_match.group(1)
-            
-            # ========================================
-            # NUMERO MAGLIA
-            # ========================================
-            shirt_number = soup.find('span', class_='data-header__shirt-number')
-            if shirt_number:
-                number_text = self.clean_text(shirt_number.get_text())
-                number_match = re.search(r'#(\d+)', number_text)
-                if number_match:
-                    player_data['shirt_number'] = int(number_match.group(1))
-            
-            # ========================================
-            # CONTRATTO - Cerca nella info-table
-            # ========================================
-            # Cerca nella struttura info-table (multilingua)
-            info_table = soup.find('div', class_='info-table')
-            if info_table:
-                all_spans = info_table.find_all('span', class_='info-table__content')
-                for i, span in enumerate(all_spans):
-                    text = self.clean_text(span.get_text()).lower()
-                    # IT, EN, ES, FR, DE
-                    if any(kw in text for kw in ['scadenza', 'contratto', 'contract', 'expires', 'contrato hasta', 'fin de contrat', 'vertrag bis']):
-                        if i + 1 < len(all_spans):
-                            value_span = all_spans[i + 1]
-                            contract_text = self.clean_text(value_span.get_text())
-                            player_data['contract_expiry'] = contract_text
-                            break
-            
-            # ========================================
-            # AGENTE
-            # ========================================
-            agent_label = soup.find('span', string=re.compile(r'Agente|Agent', re.IGNORECASE))
-            if agent_label:
-                agent_parent = agent_label.find_parent()
-                if agent_parent:
-                    agent_value = agent_parent.find('span', class_='info-table__content--bold')
-                    if agent_value:
-                        player_data['agent'] = self.clean_text(agent_value.get_text())
-            
-            # ========================================
-            # STATISTICHE CARRIERA
-            # ========================================
-            # Cerca tabella statistiche
-            stats_table = soup.find('div', class_='grid-view')
-            if stats_table:
-                player_data['career_stats'] = self._extract_career_stats(stats_table)
-            
-            # Debug: mostra quali dati sono stati estratti
-            extracted_fields = [k for k in ['name', 'birth_year', 'age', 'height_cm', 'weight_kg', 'nationality_primary', 'position', 'preferred_foot', 'market_value', 'contract_expiry', 'profile_image', 'natural_position'] if k in player_data]
-            print(f"✅ Dati estratti con successo per {player_data.get('name', 'Giocatore')}")
-            print(f"   Campi estratti: {', '.join(extracted_fields)}" if extracted_fields else "   ⚠️  Pochi dati estratti - verificare struttura HTML")
-            
-            return player_data
-            
-        except requests.RequestException as e:
-            return {"error": f"Errore connessione: {str(e)}"}
-        except Exception as e:
-            return {"error": f"Errore inaspettato: {str(e)}"}
+        
+        # ========================================
+        # NUMERO MAGLIA
+        # ========================================
+        shirt_number = doc.region('shirt_number')
+        if shirt_number:
+            number_text = self.clean_text(shirt_number.get_text())
+            number_match = re.search(r'#(\d+)', number_text)
+            if number_match:
+                player_data['shirt_number'] = int(number_match.group(1))
+        
+        # ========================================
+        # AGENTE (il contratto è estratto insieme alla info-table)
+        # ========================================
+        agent_value = doc.agent_value()
+        if agent_value:
+            player_data['agent'] = self.clean_text(agent_value.get_text())
+        
+        # ========================================
+        # STATISTICHE CARRIERA
+        # ========================================
+        # Cerca tabella statistiche
+        stats_table = doc.region('grid_view')
+        if stats_table:
+            player_data['career_stats'] = self._extract_career_stats(stats_table)
+        
+        # Debug: mostra quali dati sono stati estratti
+        extracted_fields = [k for k in ['name', 'birth_year', 'age', 'height_cm', 'weight_kg', 'nationality_primary', 'position', 'preferred_foot', 'market_value', 'contract_expiry', 'profile_image', 'natural_position'] if k in player_data]
+        print(f"✅ Dati estratti con successo per {player_data.get('name', 'Giocatore')}")
+        print(f"   Campi estratti: {', '.join(extracted_fields)}" if extracted_fields else "   ⚠️  Pochi dati estratti - verificare struttura HTML")
+        
+        return player_data
     
     def _extract_career_stats(self, stats_table) -> Dict:
         """Estrae statistiche di carriera dalla tabella"""
@@ -461,556 +561,6 @@ def get_player_info(url: str) -> Dict:
     return scraper.get_player_info(url)
 
 
-def map_position_to_role(position: str) -> str:
-    """
-    Mappa la posizione Transfermarkt al ruolo generale (SEMPRE IN INGLESE)
-    
-    Ruoli generali disponibili:
-    - Goalkeeper
-    - Defender
-    - Terzino (Full-back)
-    - Centrocampo (Midfielder)
-    - Ala (Winger)
-    - Forward
-    """
-    if not position:
-        return 'Centrocampo'
-    
-    pos_lower = position.lower()
-    
-    # Portieri -> Goalkeeper
-    if any(x in pos_lower for x in ['portiere', 'goalkeeper', 'porta', 'torwart', 'gardien', 'portero']):
-        return 'Goalkeeper'
-    
-    # Terzini (esterni inclusi) - PRIMA dei difensori centrali per evitare conflitti con "back"
-    if any(x in pos_lower for x in ['terzino', 'left-back', 'right-back', 'esterno', 'wing-back', 'wingback', 'außenverteidiger', 'latéral', 'lateral']):
-        return 'Terzino'
-    
-    # Difensori centrali - DOPO i terzini -> Defender
-    if any(x in pos_lower for x in ['difensore', 'difesa', 'centre-back', 'center-back', 'defender', 'innenverteidiger', 'défenseur', 'defensa']):
-        return 'Defender'
-    
-    # Centrocampo - PRIMA di Ali e Attaccanti per catturare mezzala, trequartista, ecc.
-    if any(x in pos_lower for x in ['centrocampo', 'centrocampista', 'mediano', 'mezzala', 'trequartista', 'midfield', 'mittelfeld', 'milieu', 'mediocampista']):
-        return 'Centrocampo'
-    
-    # Ali - PRIMA degli attaccanti per evitare conflitti -> Ala
-    if any(x in pos_lower for x in ['ala', 'winger', 'flügel', 'ailier', 'extremo']):
-        return 'Ala'
-    
-    # Attaccanti (punte e seconde punte) -> Forward
-    if any(x in pos_lower for x in ['attaccante', 'attacco', 'punta', 'striker', 'forward', 'seconda punta', 'second striker', 'stürmer', 'avant', 'delantero']):
-        return 'Forward'
-    
-    # Fallback: Centrocampo
-    return 'Centrocampo'
-
-
-def map_foot(foot: str) -> str:
-    """Mappa il piede preferito al formato database (SEMPRE IN INGLESE)"""
-    if not foot:
-        return 'Right'
-    
-    foot_lower = foot.lower().strip()
-    
-    # Mapping multilingua -> Inglese
-    foot_mapping = {
-        # Inglese
-        'right': 'Right',
-        'left': 'Left',
-        'both': 'Both',
-        # Italiano
-        'destro': 'Right',
-        'sinistro': 'Left',
-        'entrambi': 'Both',
-        'ambidestro': 'Both',
-        # Tedesco
-        'rechts': 'Right',
-        'links': 'Left',
-        'beidfu��ig': 'Both',
-        # Francese
-        'droit': 'Right',
-        'gauche': 'Left',
-        'les deux': 'Both',
-        # Spagnolo
-        'derecho': 'Right',
-        'izquierdo': 'Left',
-        'ambos': 'Both'
-    }
-    
-    return foot_mapping.get(foot_lower, 'Right')
-
-
-def map_nationality(nationality: str) -> str:
-    """Mappa la nazionalità al formato inglese standard (SEMPRE IN INGLESE)"""
-    if not nationality:
-        return ''
-    
-    nat_lower = nationality.lower().strip()
-    
-    # Mapping completo multilingua -> Inglese
-    nationality_mapping = {
-        # Italiano -> Inglese
-        'italia': 'Italy',
-        'spagna': 'Spain',
-        'francia': 'France',
-        'germania': 'Germany',
-        'inghilterra': 'England',
-        'scozia': 'Scotland',
-        'galles': 'Wales',
-        'irlanda del nord': 'Northern Ireland',
-        'irlanda': 'Ireland',
-        'portogallo': 'Portugal',
-        'paesi bassi': 'Netherlands',
-        'olanda': 'Netherlands',
-        'belgio': 'Belgium',
-        'svizzera': 'Switzerland',
-        'austria': 'Austria',
-        'danimarca': 'Denmark',
-        'svezia': 'Sweden',
-        'norvegia': 'Norway',
-        'finlandia': 'Finland',
-        'polonia': 'Poland',
-        'repubblica ceca': 'Czech Republic',
-        'slovacchia': 'Slovakia',
-        'ungheria': 'Hungary',
-        'romania': 'Romania',
-        'bulgaria': 'Bulgaria',
-        'grecia': 'Greece',
-        'turchia': 'Turkey',
-        'russia': 'Russia',
-        'ucraina': 'Ukraine',
-        'croazia': 'Croatia',
-        'serbia': 'Serbia',
-        'slovenia': 'Slovenia',
-        'bosnia ed erzegovina': 'Bosnia and Herzegovina',
-        'argentina': 'Argentina',
-        'brasile': 'Brazil',
-        'uruguay': 'Uruguay',
-        'cile': 'Chile',
-        'colombia': 'Colombia',
-        'messico': 'Mexico',
-        'stati uniti': 'United States',
-        'canada': 'Canada',
-        'giappone': 'Japan',
-        'corea del sud': 'South Korea',
-        'cina': 'China',
-        'australia': 'Australia',
-        'nuova zelanda': 'New Zealand',
-        'sudafrica': 'South Africa',
-        'nigeria': 'Nigeria',
-        'ghana': 'Ghana',
-        'costa d\'avorio': 'Ivory Coast',
-        'senegal': 'Senegal',
-        'camerun': 'Cameroon',
-        'marocco': 'Morocco',
-        'algeria': 'Algeria',
-        'tunisia': 'Tunisia',
-        'egitto': 'Egypt',
-        
-        # Spagnolo -> Inglese
-        'españa': 'Spain',
-        'alemania': 'Germany',
-        'inglaterra': 'England',
-        'escocia': 'Scotland',
-        'gales': 'Wales',
-        'irlanda del norte': 'Northern Ireland',
-        'países bajos': 'Netherlands',
-        'holanda': 'Netherlands',
-        'bélgica': 'Belgium',
-        'suiza': 'Switzerland',
-        'dinamarca': 'Denmark',
-        'suecia': 'Sweden',
-        'noruega': 'Norway',
-        'finlandia': 'Finland',
-        'república checa': 'Czech Republic',
-        'eslovaquia': 'Slovakia',
-        'hungría': 'Hungary',
-        'rumania': 'Romania',
-        'grecia': 'Greece',
-        'turquía': 'Turkey',
-        'rusia': 'Russia',
-        'ucrania': 'Ukraine',
-        'croacia': 'Croatia',
-        'eslovenia': 'Slovenia',
-        'bosnia y herzegovina': 'Bosnia and Herzegovina',
-        'estados unidos': 'United States',
-        'canadá': 'Canada',
-        'japón': 'Japan',
-        'corea del sur': 'South Korea',
-        'sudáfrica': 'South Africa',
-        'costa de marfil': 'Ivory Coast',
-        'camerún': 'Cameroon',
-        'marruecos': 'Morocco',
-        'argelia': 'Algeria',
-        'túnez': 'Tunisia',
-        'egipto': 'Egypt',
-        
-        # Francese -> Inglese
-        'italie': 'Italy',
-        'espagne': 'Spain',
-        'allemagne': 'Germany',
-        'angleterre': 'England',
-        'écosse': 'Scotland',
-        'pays de galles': 'Wales',
-        'irlande du nord': 'Northern Ireland',
-        'irlande': 'Ireland',
-        'pays-bas': 'Netherlands',
-        'belgique': 'Belgium',
-        'suisse': 'Switzerland',
-        'autriche': 'Austria',
-        'danemark': 'Denmark',
-        'suède': 'Sweden',
-        'norvège': 'Norway',
-        'finlande': 'Finland',
-        'pologne': 'Poland',
-        'république tchèque': 'Czech Republic',
-        'slovaquie': 'Slovakia',
-        'hongrie': 'Hungary',
-        'roumanie': 'Romania',
-        'bulgarie': 'Bulgaria',
-        'grèce': 'Greece',
-        'turquie': 'Turkey',
-        'russie': 'Russia',
-        'croatie': 'Croatia',
-        'serbie': 'Serbia',
-        'slovénie': 'Slovenia',
-        'bosnie-herzégovine': 'Bosnia and Herzegovina',
-        'argentine': 'Argentina',
-        'brésil': 'Brazil',
-        'chili': 'Chile',
-        'colombie': 'Colombia',
-        'mexique': 'Mexico',
-        'états-unis': 'United States',
-        'japon': 'Japan',
-        'corée du sud': 'South Korea',
-        'chine': 'China',
-        'australie': 'Australia',
-        'nouvelle-zélande': 'New Zealand',
-        'afrique du sud': 'South Africa',
-        'nigéria': 'Nigeria',
-        'côte d\'ivoire': 'Ivory Coast',
-        'sénégal': 'Senegal',
-        'cameroun': 'Cameroon',
-        'maroc': 'Morocco',
-        'algérie': 'Algeria',
-        'tunisie': 'Tunisia',
-        'égypte': 'Egypt',
-        
-        # Tedesco -> Inglese
-        'italien': 'Italy',
-        'spanien': 'Spain',
-        'frankreich': 'France',
-        'deutschland': 'Germany',
-        'england': 'England',
-        'schottland': 'Scotland',
-        'wales': 'Wales',
-        'nordirland': 'Northern Ireland',
-        'irland': 'Ireland',
-        'niederlande': 'Netherlands',
-        'belgien': 'Belgium',
-        'schweiz': 'Switzerland',
-        'österreich': 'Austria',
-        'dänemark': 'Denmark',
-        'schweden': 'Sweden',
-        'norwegen': 'Norway',
-        'finnland': 'Finland',
-        'polen': 'Poland',
-        'tschechien': 'Czech Republic',
-        'slowakei': 'Slovakia',
-        'ungarn': 'Hungary',
-        'rumänien': 'Romania',
-        'bulgarien': 'Bulgaria',
-        'griechenland': 'Greece',
-        'türkei': 'Turkey',
-        'russland': 'Russia',
-        'kroatien': 'Croatia',
-        'serbien': 'Serbia',
-        'slowenien': 'Slovenia',
-        'bosnien und herzegowina': 'Bosnia and Herzegovina',
-        'argentinien': 'Argentina',
-        'brasilien': 'Brazil',
-        'chile': 'Chile',
-        'kolumbien': 'Colombia',
-        'mexiko': 'Mexico',
-        'vereinigte staaten': 'United States',
-        'kanada': 'Canada',
-        'japan': 'Japan',
-        'südkorea': 'South Korea',
-        'china': 'China',
-        'australien': 'Australia',
-        'neuseeland': 'New Zealand',
-        'südafrika': 'South Africa',
-        'elfenbeinküste': 'Ivory Coast',
-        'kamerun': 'Cameroon',
-        'marokko': 'Morocco',
-        'algerien': 'Algeria',
-        'tunesien': 'Tunisia',
-        'ägypten': 'Egypt'
-    }
-    
-    # Cerca corrispondenza esatta (case insensitive)
-    result = nationality_mapping.get(nat_lower)
-    if result:
-        return result
-    
-    # Se già in inglese o non trovato, capitalizza e ritorna
-    return nationality.strip().title()
-
-
-def get_role_abbreviation(position: str) -> str:
-    """
-    Mappa la posizione Transfermarkt all'abbreviazione usata nel campo tattico (SEMPRE IN INGLESE)
-    
-    Args:
-        position: Posizione da Transfermarkt (es: "Terzino sinistro", "Left-Back", "Linksverteidiger")
-        
-    Returns:
-        Abbreviazione inglese (es: "LB", "CB", "ST")
-    """
-    if not position:
-        return 'MF'
-    
-    # Pulisci il nome (rimuovi prefissi multilingua)
-    clean_pos = position
-    prefixes = ['Difesa - ', 'Centrocampo - ', 'Attacco - ', 'Defense - ', 'Midfield - ', 'Attack - ', 
-                'Abwehr - ', 'Mittelfeld - ', 'Sturm - ', 'Défense - ', 'Milieu - ', 'Attaque - ']
-    for prefix in prefixes:
-        clean_pos = clean_pos.replace(prefix, '')
-    clean_pos = clean_pos.strip()
-    
-    # Mappa completa delle abbreviazioni INGLESI (allineata con TacticalFieldSimple.js)
-    abbr_map = {
-        # Portieri -> GK
-        'Portiere': 'GK',
-        'Porta': 'GK',
-        'GK': 'GK',
-        'Goalkeeper': 'GK',
-        'Torwart': 'GK',
-        'Gardien': 'GK',
-        'Portero': 'GK',
-        
-        # Difensori centrali -> CB
-        'Difensore centrale': 'CB',
-        'Difensore centrale sinistro': 'LCB',
-        'Difensore centrale destro': 'RCB',
-        'CB': 'CB',
-        'CB-L': 'LCB',
-        'CB-R': 'RCB',
-        'Centre-Back': 'CB',
-        'Center-Back': 'CB',
-        'Innenverteidiger': 'CB',
-        'Défenseur central': 'CB',
-        'Defensa central': 'CB',
-        
-        # Terzini -> LB/RB
-        'Terzino sinistro': 'LB',
-        'Terzino destro': 'RB',
-        'LB': 'LB',
-        'RB': 'RB',
-        'Left-Back': 'LB',
-        'Right-Back': 'RB',
-        'Linksverteidiger': 'LB',
-        'Rechtsverteidiger': 'RB',
-        'Latéral gauche': 'LB',
-        'Latéral droit': 'RB',
-        'Lateral izquierdo': 'LB',
-        'Lateral derecho': 'RB',
-        
-        # Esterni (wingback) -> LWB/RWB
-        'Esterno sinistro': 'LWB',
-        'Esterno destro': 'RWB',
-        'Esterno di sinistra': 'LWB',
-        'Esterno di destra': 'RWB',
-        'LWB': 'LWB',
-        'RWB': 'RWB',
-        'Left Wing-Back': 'LWB',
-        'Right Wing-Back': 'RWB',
-        'Linker Flügelverteidiger': 'LWB',
-        'Rechter Flügelverteidiger': 'RWB',
-        
-        # Mediani -> DM
-        'Mediano': 'DM',
-        'Mediano sinistro': 'LDM',
-        'Mediano destro': 'RDM',
-        'CDM': 'DM',
-        'CDM-L': 'LDM',
-        'CDM-R': 'RDM',
-        'Defensive Midfield': 'DM',
-        'Defensives Mittelfeld': 'DM',
-        'Milieu défensif': 'DM',
-        'Mediocampista defensivo': 'DM',
-        
-        # Centrocampisti centrali -> CM
-        'Centrocampista': 'CM',
-        'Centrocampista centrale': 'CM',
-        'Centrocampista sinistro': 'LCM',
-        'Centrocampista destro': 'RCM',
-        'CM': 'CM',
-        'CM-L': 'LCM',
-        'CM-R': 'RCM',
-        'Central Midfield': 'CM',
-        'Zentrales Mittelfeld': 'CM',
-        'Milieu central': 'CM',
-        'Mediocampista central': 'CM',
-        
-        # Mezzali -> LCM/RCM
-        'Mezzala sinistra': 'LCM',
-        'Mezzala destra': 'RCM',
-        'LCM': 'LCM',
-        'RCM': 'RCM',
-        
-        # Trequartisti -> AM
-        'Trequartista': 'AM',
-        'Trequartista sinistro': 'LAM',
-        'Trequartista destro': 'RAM',
-        'CAM': 'AM',
-        'CAM-L': 'LAM',
-        'CAM-R': 'RAM',
-        'Attacking Midfield': 'AM',
-        'Offensives Mittelfeld': 'AM',
-        'Milieu offensif': 'AM',
-        'Mediocampista ofensivo': 'AM',
-        
-        # Ali -> LW/RW
-        'Ala sinistra': 'LW',
-        'Ala destra': 'RW',
-        'LW': 'LW',
-        'RW': 'RW',
-        'Left Winger': 'LW',
-        'Right Winger': 'RW',
-        'Linksaußen': 'LW',
-        'Rechtsaußen': 'RW',
-        'Ailier gauche': 'LW',
-        'Ailier droit': 'RW',
-        'Extremo izquierdo': 'LW',
-        'Extremo derecho': 'RW',
-        
-        # Seconde punte -> SS
-        'Seconda punta': 'SS',
-        'Seconda punta sinistra': 'LSS',
-        'Seconda punta destra': 'RSS',
-        'SS': 'SS',
-        'SS-L': 'LSS',
-        'SS-R': 'RSS',
-        'Second Striker': 'SS',
-        'Hängende Spitze': 'SS',
-        'Deuxième attaquant': 'SS',
-        'Segundo delantero': 'SS',
-        
-        # Attaccanti -> ST
-        'Attaccante': 'ST',
-        'Attaccante sinistro': 'LST',
-        'Attaccante destro': 'RST',
-        'Punta': 'ST',
-        'ST': 'ST',
-        'ST-L': 'LST',
-        'ST-R': 'RST',
-        'Centre-Forward': 'ST',
-        'Center-Forward': 'ST',
-        'Striker': 'ST',
-        'Mittelstürmer': 'ST',
-        'Avant-centre': 'ST',
-        'Delantero centro': 'ST'
-    }
-    
-    # Cerca corrispondenza esatta
-    if abbr_map.get(clean_pos):
-        return abbr_map[clean_pos]
-    
-    # Cerca corrispondenza esatta con posizione originale
-    if abbr_map.get(position):
-        return abbr_map[position]
-    
-    # Cerca corrispondenza parziale (case insensitive)
-    lower_pos = clean_pos.lower()
-    for key, value in abbr_map.items():
-        if key.lower() in lower_pos or lower_pos in key.lower():
-            return value
-    
-    # Fallback: MF (Midfielder)
-    return 'MF'
-
-
-def extract_market_value_number(market_value: str) -> int:
-    """Estrae il valore numerico dal valore di mercato"""
-    if not market_value:
-        return 3
-    
-    # Cerca pattern come "3,50 mln €"
-    import re
-    match = re.search(r'(\d+[,.]?\d*)', market_value)
-    if match:
-        value = float(match.group(1).replace(',', '.'))
-        if 'mln' in market_value.lower() or 'mil' in market_value.lower():
-            return int(value)
-        elif 'mila' in market_value.lower() or 'k' in market_value.lower():
-            return 1
-    
-    return 3
-
-
-# Funzione generate_notes() rimossa - le note devono essere compilate manualmente dallo scout
-
-
-def map_to_database_format(tm_data: Dict) -> Dict:
-    """
-    Mappa i dati di Transfermarkt al formato del database scouting
-    
-    Args:
-        tm_data: Dati estratti da Transfermarkt
-        
-    Returns:
-        Dizionario nel formato del database
-    """
-    # Estrai posizioni
-    position = tm_data.get('position', '')
-    natural_pos = tm_data.get('natural_position', '')
-    other_pos = tm_data.get('other_positions', '')
-    
-    # Calcola abbreviazioni
-    position_abbr = get_role_abbreviation(position)
-    natural_abbr = get_role_abbreviation(natural_pos) if natural_pos else None
-    other_abbr = get_role_abbreviation(other_pos) if other_pos else None
-    
-    # Mappa al formato database
-    db_data = {
-        'name': tm_data.get('name', ''),
-        'birth_year': tm_data.get('birth_year'),
-        'birth_place': tm_data.get('birth_place', ''),
-        'team': tm_data.get('current_club', ''),
-        'nationality': map_nationality(tm_data.get('nationality_primary', '')),  # INGLESE
-        'height_cm': tm_data.get('height_cm'),
-        'weight_kg': tm_data.get('weight_kg'),
-        'shirt_number': tm_data.get('shirt_number'),
-        'general_role': map_position_to_role(position),
-        'specific_position': position_abbr,  # Abbreviazione INGLESE
-        'preferred_foot': map_foot(tm_data.get('preferred_foot', '')),  # INGLESE
-        'market_value': f"{tm_data.get('market_value', 3):.2f} mln €" if tm_data.get('market_value') else '3.00 mln €',
-        'market_value_updated': tm_data.get('market_value_updated', ''),
-        'contract_expiry': tm_data.get('contract_expiry', ''),
-        'transfermarkt_link': tm_data.get('url', ''),
-        'profile_image': tm_data.get('profile_image', ''),
-        'natural_position': natural_abbr,  # Usa abbreviazione
-        'other_positions': other_abbr,  # Usa abbreviazione
-        'field_position_x': tm_data.get('field_position_x'),
-        'field_position_y': tm_data.get('field_position_y'),
-        'current_value': int(tm_data.get('market_value', 3)) if tm_data.get('market_value') else 3,
-        'potential_value': int(tm_data.get('market_value', 3)) if tm_data.get('market_value') else 3,
-        # Campi da compilare manualmente dallo scout (lasciati vuoti)
-        'priority': None,
-        'director_feedback': None,
-        'check_type': None,
-        'notes': None,
-        # Mantieni anche i nomi completi per riferimento
-        'position_full_name': position,
-        'natural_position_full_name': natural_pos,
-        'other_positions_full_name': other_pos
-    }
-    
-    return db_data
-
-
 # ========================================
 # MAIN - ESEMPI DI UTILIZZO
 # ========================================
@@ -1134,15 +684,16 @@ data = get_player_info(url)
 db_format = map_to_database_format(data)
 print(db_format)
 
-# Esempio 4: Multiple URLs
+# Esempio 4: Multiple URLs (in parallelo, risultati nello stesso ordine)
 urls = [
     "https://www.transfermarkt.it/player1/profil/spieler/123",
     "https://www.transfermarkt.it/player2/profil/spieler/456",
 ]
 
 scraper = TransfermarktScraper()
-for url in urls:
-    data = scraper.get_player_info(url)
+for data in scraper.get_players_info(urls, concurrency=8):
     if 'error' not in data:
         scraper.save_to_json(data)
+    else:
+        print(f"{data['url']}: {data['error']}")
 """
\ No newline at end of file
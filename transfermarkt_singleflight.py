@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Richieste contemporanee per lo stesso giocatore fuse in un solo scraping
+
+Se più scout aprono lo stesso giocatore, o PlayerForm.js e
+TacticalFieldSimple.js chiamano /api/scrape per lo stesso URL, solo la prima
+richiesta scarica, analizza e traduce la pagina: le altre attendono il suo
+risultato (o la sua eccezione) e lo condividono. A scraping terminato la
+chiave viene liberata, quindi le richieste successive ripartono da capo (la
+cache delle pagine resta quella di transfermarkt_cache).
+
+La chiave è l'edizione più l'ID giocatore (vedi player_flight_key): slug,
+/fromCaptcha, www e parametri non contano, mentre lingue diverse danno dati
+diversi (source_language, testi tradotti) e restano separate.
+
+Uso:
+    from transfermarkt_singleflight import SingleFlight, player_flight_key
+
+    inflight = SingleFlight()
+    data = inflight.do(player_flight_key(url), lambda: extract_and_map_to_database(url))
+    data = await inflight.do_async(player_flight_key(url), lambda: extract_async(url))
+
+Il risultato è lo stesso oggetto per tutte le richieste fuse: va trattato
+in sola lettura.
+"""
+
+import re
+import threading
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+
+from transfermarkt_cache import make_cache_key
+
+T = TypeVar('T')
+
+_PLAYER_ID_PATTERN = re.compile(r'spieler/(\d+)')
+
+
+def player_flight_key(url: str) -> str:
+    """Chiave di fusione: 'transfermarkt.es/363227' (l'URL stesso se manca l'ID)"""
+    match = _PLAYER_ID_PATTERN.search(url)
+    if not match:
+        return url
+    return make_cache_key(url, match.group(1))
+
+
+class _Call:
+    """Scraping in corso in un thread, atteso dalle richieste fuse"""
+
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Una sola esecuzione in volo per chiave (thread per Flask, task per ASGI)"""
+
+    def __init__(self):
+        self._calls: Dict[str, _Call] = {}
+        self._tasks: Dict[str, 'asyncio.Future'] = {}
+        self._lock = threading.Lock()
+        self.executions = 0
+        self.shared = 0
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        """
+        Esegue fn, oppure attende l'esecuzione già in corso per la stessa chiave
+
+        Raises:
+            L'eccezione di fn, anche alle richieste in attesa
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executions += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            print(f"🔗 Scraping già in corso per {key}: attendo il risultato")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    async def do_async(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Come do, con coroutine: una sola task per chiave, attesa da tutte le richieste
+
+        Se una richiesta viene annullata (client disconnesso) la task continua
+        per le altre.
+        """
+        import asyncio
+
+        with self._lock:
+            task = self._tasks.get(key)
+            if task is None:
+                task = self._tasks[key] = asyncio.ensure_future(fn())
+                task.add_done_callback(lambda t: self._forget(key, t))
+                self.executions += 1
+            else:
+                self.shared += 1
+                print(f"🔗 Scraping già in corso per {key}: attendo il risultato")
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task):
+        with self._lock:
+            if self._tasks.get(key) is task:
+                del self._tasks[key]
+        # Eccezione letta anche se nessuno è rimasto in attesa
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'in_flight': len(self._calls) + len(self._tasks),
+                'executions': self.executions,
+                'shared': self.shared,
+            }
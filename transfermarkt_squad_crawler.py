@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Crawler delle rose Transfermarkt (squadre e campionati)
+
+Partendo dalla pagina di una squadra o di un campionato estrae i link
+`spieler/<id>` dei giocatori della rosa (stesso pattern di extract_player_id),
+li deduplica e li passa allo scraping in batch dei profili: un intero
+campionato si importa con un solo comando.
+
+Pagine supportate:
+    - squadra:     https://www.transfermarkt.it/ssc-neapel/kader/verein/6195
+                   (anche /startseite/verein/<id>)
+    - campionato:  https://www.transfermarkt.it/serie-a/startseite/wettbewerb/IT1
+                   (vengono visitate le pagine rosa di tutte le squadre)
+
+Uso:
+    python transfermarkt_squad_crawler.py https://www.transfermarkt.it/serie-a/startseite/wettbewerb/IT1 -o serie_a.json
+
+    oppure:
+    from transfermarkt_squad_crawler import SquadCrawler
+    crawler = SquadCrawler()
+    urls = crawler.crawl_player_urls("https://www.transfermarkt.it/ssc-neapel/kader/verein/6195")
+    players = crawler.scrape_players(urls)
+"""
+
+import re
+import sys
+import json
+import argparse
+from typing import Dict, List, Optional
+from urllib.parse import urljoin, urlparse
+
+from transfermarkt_cache import fetch_html
+from transfermarkt_parsing import make_soup
+from transfermarkt_scraper import PLAYER_ID_PATTERN, TransfermarktScraper, map_to_database_format
+
+# Link a pagine giocatore: /<slug>/<sezione>/spieler/<id> (profil, leistungsdaten, ...)
+PLAYER_LINK_PATTERN = re.compile(r'/([^/?#]+)/[^/?#]+/' + PLAYER_ID_PATTERN.pattern)
+
+# Link a squadre: /<slug>/<sezione>/verein/<id>[/saison_id/<anno>]
+CLUB_LINK_PATTERN = re.compile(r'/([^/?#]+)/[^/?#]+/verein/(\d+)(?:/saison_id/(\d+))?')
+
+# Pagina di un campionato / coppa
+COMPETITION_PATTERN = re.compile(r'/wettbewerb/')
+
+
+class SquadCrawler:
+    """Estrae i giocatori dalle pagine squadra/campionato e ne scarica i profili"""
+
+    def __init__(self, scraper: Optional[TransfermarktScraper] = None):
+        """
+        Args:
+            scraper: Scraper usato per le richieste e per i profili
+                     (default: nuovo TransfermarktScraper con parsing parziale)
+        """
+        self.scraper = scraper or TransfermarktScraper(partial_parse=True)
+
+    def fetch_page(self, url: str) -> bytes:
+        """Scarica una pagina squadra/campionato (stessa sessione e rate limiter dei profili)"""
+        return fetch_html(self.scraper.session, url, timeout=15,
+                          rate_limiter=self.scraper.rate_limiter)
+
+    def extract_player_urls(self, html, page_url: str) -> List[str]:
+        """
+        Estrae gli URL profilo dei giocatori presenti nella pagina
+
+        Ogni giocatore compare più volte (foto, nome, statistiche): i link
+        vengono deduplicati per ID mantenendo l'ordine della pagina e
+        normalizzati alla pagina profilo sul dominio della pagina di partenza.
+        """
+        base = self._base_url(page_url)
+        soup = make_soup(html)
+
+        player_urls: Dict[str, str] = {}
+        for link in soup.find_all('a', href=True):
+            match = PLAYER_LINK_PATTERN.search(link['href'])
+            if not match:
+                continue
+            slug, player_id = match.groups()
+            if player_id not in player_urls:
+                player_urls[player_id] = f"{base}/{slug}/profil/spieler/{player_id}"
+
+        return list(player_urls.values())
+
+    def extract_club_urls(self, html, page_url: str) -> List[str]:
+        """Estrae gli URL delle pagine rosa delle squadre da una pagina campionato"""
+        base = self._base_url(page_url)
+        soup = make_soup(html)
+
+        club_urls: Dict[str, str] = {}
+        for link in soup.find_all('a', href=True):
+            match = CLUB_LINK_PATTERN.search(link['href'])
+            if not match:
+                continue
+            slug, club_id, season = match.groups()
+            if club_id not in club_urls:
+                club_url = f"{base}/{slug}/kader/verein/{club_id}"
+                if season:
+                    club_url += f"/saison_id/{season}"
+                club_urls[club_id] = club_url
+
+        return list(club_urls.values())
+
+    def crawl_player_urls(self, url: str) -> List[str]:
+        """
+        Restituisce gli URL profilo deduplicati di una squadra o di un campionato
+
+        Raises:
+            requests.RequestException se la pagina di partenza non è raggiungibile
+        """
+        import requests
+
+        html = self.fetch_page(url)
+
+        if not COMPETITION_PATTERN.search(urlparse(url).path):
+            player_urls = self.extract_player_urls(html, url)
+            print(f"👥 {len(player_urls)} giocatori trovati in {url}")
+            return player_urls
+
+        club_urls = self.extract_club_urls(html, url)
+        print(f"🏟️  {len(club_urls)} squadre trovate in {url}")
+
+        player_urls: Dict[str, str] = {}
+        for club_url in club_urls:
+            try:
+                club_html = self.fetch_page(club_url)
+            except requests.RequestException as e:
+                print(f"⚠️  Rosa non scaricata ({club_url}): {e}")
+                continue
+            for player_url in self.extract_player_urls(club_html, club_url):
+                # Un giocatore può comparire in due rose (es: trasferimento a metà stagione)
+                player_urls.setdefault(self.scraper.extract_player_id(player_url), player_url)
+
+        print(f"👥 {len(player_urls)} giocatori unici trovati")
+        return list(player_urls.values())
+
+    def scrape_players(self, player_urls: List[str], concurrency: int = 8) -> List[Dict]:
+        """Scarica i profili in batch (vedi TransfermarktScraper.get_players_info)"""
+        return self.scraper.get_players_info(player_urls, concurrency=concurrency)
+
+    def crawl(self, url: str, concurrency: int = 8) -> List[Dict]:
+        """Squadra/campionato → lista dei profili giocatore"""
+        return self.scrape_players(self.crawl_player_urls(url), concurrency=concurrency)
+
+    @staticmethod
+    def _base_url(page_url: str) -> str:
+        parsed = urlparse(urljoin(page_url, '/'))
+        return f"{parsed.scheme}://{parsed.netloc}"
+
+
+def main():
+    import requests
+
+    parser = argparse.ArgumentParser(description="Importa tutti i giocatori di una squadra o di un campionato Transfermarkt")
+    parser.add_argument('url', help="URL della pagina squadra o campionato")
+    parser.add_argument('--concurrency', type=int, default=8, help="Richieste profilo contemporanee")
+    parser.add_argument('--ids-only', action='store_true', help="Elenca solo gli URL profilo, senza scaricarli")
+    parser.add_argument('--db-format', action='store_true', help="Salva i dati nel formato del database")
+    parser.add_argument('-o', '--output', default='squad_players.json')
+    args = parser.parse_args()
+
+    crawler = SquadCrawler()
+    try:
+        player_urls = crawler.crawl_player_urls(args.url)
+    except requests.RequestException as e:
+        print(f"❌ Errore connessione: {e}")
+        return 1
+
+    if args.ids_only:
+        output = player_urls
+    else:
+        players = crawler.scrape_players(player_urls, concurrency=args.concurrency)
+        if args.db_format:
+            players = [p if 'error' in p else map_to_database_format(p) for p in players]
+        output = players
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(output, f, ensure_ascii=False, indent=2)
+    print(f"💾 Risultati salvati in: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
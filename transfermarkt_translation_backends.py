@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Backend di traduzione per lo scraper multilingua
+
+- 'google':  GoogleTranslator di deep-translator (rete)
+- 'offline': vocabolario locale compilato dai dizionari dello scraper
+             (ruoli, piede), tabella dei paesi nelle sei lingue
+             (transfermarkt_vocabulary) e nomi di città/parole
+             ricorrenti nei nomi delle squadre
+
+Il backend offline serve tutte le lingue di DOMAIN_LANGUAGE_MAP senza rete:
+utile in ambienti isolati o sotto rate limit, e nei test. Un testo che non
+compare nel vocabolario viene restituito invariato.
+
+Uso:
+    from transfermarkt_translation_backends import make_translator
+
+    translator = make_translator('offline', source='it')
+    translator.translate('Portogallo')      # 'Portugal'
+    translator.translate('AEK Atene')       # 'AEK Athens'
+
+    oppure:
+    MultiLangTransfermarktScraper(translation_backend='offline')
+    (default da variabile d'ambiente TM_TRANSLATION_BACKEND, altrimenti 'google')
+
+    Pool condiviso dal processo, un gruppo di client per (backend, sorgente, destinazione):
+    with get_translator_pool().translator('google', 'es') as translator:
+        translator.translate('Delantero centro')
+"""
+
+import os
+import re
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from transfermarkt_domains import DOMAIN_LANGUAGE_MAP
+from transfermarkt_vocabulary import NATIONALITIES
+
+# Backend di default (sovrascrivibile da env)
+DEFAULT_TRANSLATION_BACKEND = os.environ.get('TM_TRANSLATION_BACKEND', 'google')
+
+# Parole ricorrenti nei nomi delle squadre (città con esonimo, "Stella Rossa", ...)
+CLUB_TERMS = {
+    'it': {
+        'Atene': 'Athens', 'Lisbona': 'Lisbon', 'Monaco di Baviera': 'Munich', 'Bayern Monaco': 'Bayern Munich',
+        'Stoccarda': 'Stuttgart', 'Colonia': 'Cologne', 'Francoforte': 'Frankfurt', 'Amburgo': 'Hamburg',
+        'Marsiglia': 'Marseille', 'Siviglia': 'Sevilla', 'Salonicco': 'Thessaloniki', 'Belgrado': 'Belgrade',
+        'Mosca': 'Moscow', 'Bucarest': 'Bucharest', 'Varsavia': 'Warsaw', 'Praga': 'Prague',
+        'Copenaghen': 'Copenhagen', 'Stella Rossa': 'Red Star', 'Stella Rossa di Belgrado': 'Red Star Belgrade', 'Lipsia': 'Leipzig', 'Brema': 'Bremen',
+    },
+    'es': {
+        'Atenas': 'Athens', 'Lisboa': 'Lisbon', 'Bayern Múnich': 'Bayern Munich', 'Múnich': 'Munich',
+        'Colonia': 'Cologne', 'Fráncfort': 'Frankfurt', 'Hamburgo': 'Hamburg', 'Marsella': 'Marseille',
+        'Estrella Roja': 'Red Star', 'Estrella Roja de Belgrado': 'Red Star Belgrade', 'Belgrado': 'Belgrade', 'Moscú': 'Moscow', 'Bucarest': 'Bucharest',
+        'Varsovia': 'Warsaw', 'Praga': 'Prague', 'Copenhague': 'Copenhagen', 'Salónica': 'Thessaloniki',
+        'Londres': 'London',
+    },
+    'de': {
+        'Athen': 'Athens', 'Lissabon': 'Lisbon', 'München': 'Munich', 'Köln': 'Cologne',
+        'Roter Stern': 'Red Star', 'Belgrad': 'Belgrade', 'Moskau': 'Moscow', 'Bukarest': 'Bucharest',
+        'Warschau': 'Warsaw', 'Prag': 'Prague', 'Kopenhagen': 'Copenhagen', 'Mailand': 'Milan',
+        'Neapel': 'Naples', 'Rom': 'Rome', 'Florenz': 'Florence', 'Turin': 'Turin', 'Genua': 'Genoa',
+    },
+    'fr': {
+        'Athènes': 'Athens', 'Lisbonne': 'Lisbon', 'Bayern Munich': 'Bayern Munich', 'Munich': 'Munich',
+        'Cologne': 'Cologne', 'Francfort': 'Frankfurt', 'Hambourg': 'Hamburg', 'Séville': 'Sevilla',
+        'Étoile rouge': 'Red Star', 'Belgrade': 'Belgrade', 'Moscou': 'Moscow', 'Varsovie': 'Warsaw',
+        'Prague': 'Prague', 'Copenhague': 'Copenhagen', 'Londres': 'London', 'Milan': 'Milan',
+        'Naples': 'Naples', 'Rome': 'Rome', 'Florence': 'Florence', 'Turin': 'Turin', 'Gênes': 'Genoa',
+    },
+    'pt': {
+        'Atenas': 'Athens', 'Lisboa': 'Lisbon', 'Bayern de Munique': 'Bayern Munich', 'Munique': 'Munich',
+        'Colônia': 'Cologne', 'Frankfurt': 'Frankfurt', 'Hamburgo': 'Hamburg', 'Marselha': 'Marseille',
+        'Sevilha': 'Sevilla', 'Estrela Vermelha': 'Red Star', 'Belgrado': 'Belgrade', 'Moscou': 'Moscow',
+        'Varsóvia': 'Warsaw', 'Praga': 'Prague', 'Copenhague': 'Copenhagen', 'Londres': 'London',
+        'Milão': 'Milan', 'Nápoles': 'Naples', 'Roma': 'Rome', 'Florença': 'Florence', 'Turim': 'Turin',
+    },
+    'en': {},
+}
+
+
+class _Vocabulary:
+    """Vocabolario compilato di una lingua sorgente"""
+
+    __slots__ = ('exact', 'lowercase', 'club_pattern', 'club_terms')
+
+    def __init__(self, exact: Dict[str, str], lowercase: Dict[str, str], club_terms: Dict[str, str]):
+        self.exact = exact
+        self.lowercase = lowercase
+        self.club_terms = club_terms
+        # Frasi più lunghe prima: "Bayern Monaco" vince su "Monaco"
+        terms = sorted(club_terms, key=len, reverse=True)
+        self.club_pattern = re.compile(r'\b(?:' + '|'.join(map(re.escape, terms)) + r')\b') if terms else None
+
+    def translate(self, text: str) -> str:
+        key = ' '.join(text.split())
+        if key in self.exact:
+            return self.exact[key]
+        lowered = key.lower()
+        if lowered in self.lowercase:
+            return self.lowercase[lowered]
+        if self.club_pattern is not None:
+            return self.club_pattern.sub(lambda m: self.club_terms[m.group(0)], key)
+        return key
+
+
+_vocabularies: Dict[str, _Vocabulary] = {}
+_vocabularies_lock = threading.Lock()
+
+
+def _compile_vocabulary(source: str) -> _Vocabulary:
+    # Import locale: i dizionari dei ruoli stanno nello scraper multilingua,
+    # che a sua volta importa questo modulo
+    from transfermarkt_multilang_scraper import MultiLangTransfermarktScraper
+
+    # Ruoli e piede: i dizionari manuali sono misti, valgono per ogni lingua
+    exact = dict(MultiLangTransfermarktScraper.POSITION_TRANSLATIONS)
+    lowercase = dict(MultiLangTransfermarktScraper.FOOT_TRANSLATIONS)
+    lowercase.update(NATIONALITIES)
+    return _Vocabulary(exact, lowercase, CLUB_TERMS.get(source, {}))
+
+
+def get_vocabulary(source: str) -> _Vocabulary:
+    """Vocabolario compilato per la lingua sorgente (una volta per processo)"""
+    vocabulary = _vocabularies.get(source)
+    if vocabulary is None:
+        with _vocabularies_lock:
+            vocabulary = _vocabularies.get(source)
+            if vocabulary is None:
+                vocabulary = _vocabularies[source] = _compile_vocabulary(source)
+    return vocabulary
+
+
+class OfflineTranslator:
+    """Traduttore locale con la stessa interfaccia di GoogleTranslator"""
+
+    SUPPORTED_LANGUAGES = frozenset(DOMAIN_LANGUAGE_MAP.values())
+
+    def __init__(self, source: str = 'auto', target: str = 'en'):
+        if target != 'en':
+            raise ValueError(f"OfflineTranslator traduce solo verso l'inglese, non '{target}'")
+        if source not in self.SUPPORTED_LANGUAGES:
+            raise ValueError(f"Lingua non supportata: '{source}'")
+        self.source = source
+        self.target = target
+        self.vocabulary = get_vocabulary(source)
+
+    def translate(self, text: str) -> str:
+        """Traduce il testo (riga per riga); i termini sconosciuti restano invariati"""
+        if not text:
+            return text
+        return '\n'.join(self.vocabulary.translate(line) for line in text.split('\n'))
+
+    def translate_batch(self, batch: List[str]) -> List[str]:
+        return [self.translate(text) for text in batch]
+
+
+def make_translator(backend: Optional[str], source: str, target: str = 'en'):
+    """
+    Crea un traduttore del backend richiesto
+
+    Args:
+        backend: 'google' oppure 'offline' (None = DEFAULT_TRANSLATION_BACKEND)
+        source: Lingua sorgente
+        target: Lingua di destinazione
+    """
+    backend = backend or DEFAULT_TRANSLATION_BACKEND
+    if backend == 'offline':
+        return OfflineTranslator(source=source, target=target)
+    if backend == 'google':
+        # deep-translator serve solo per il backend online
+        from deep_translator import GoogleTranslator
+        return GoogleTranslator(source=source, target=target)
+    raise ValueError(f"Backend di traduzione sconosciuto: '{backend}' (usa 'google' o 'offline')")
+
+
+class TranslatorPool:
+    """
+    Client di traduzione riusabili per (backend, lingua sorgente, lingua destinazione)
+
+    Un client viene prestato a un solo thread alla volta e poi restituito:
+    un batch con lingue miste non ricostruisce il traduttore a ogni cambio di
+    lingua e richieste Flask concorrenti non condividono lo stesso oggetto.
+    """
+
+    def __init__(self, max_idle: int = 8):
+        """
+        Args:
+            max_idle: Client inattivi conservati per coppia di lingue
+        """
+        self.max_idle = max_idle
+        self._idle: Dict[Tuple[str, str, str], List] = {}
+        self._lock = threading.Lock()
+        self.created = 0
+        self.reused = 0
+        self.in_use = 0
+
+    @contextmanager
+    def translator(self, backend: Optional[str], source: str, target: str = 'en') -> Iterator:
+        """Presta un client per la coppia di lingue (creato al primo uso)"""
+        key = (backend or DEFAULT_TRANSLATION_BACKEND, source, target)
+        with self._lock:
+            idle = self._idle.get(key)
+            client = idle.pop() if idle else None
+            if client is not None:
+                self.reused += 1
+            self.in_use += 1
+
+        try:
+            if client is None:
+                client = make_translator(key[0], source=source, target=target)
+                with self._lock:
+                    self.created += 1
+            yield client
+        finally:
+            with self._lock:
+                self.in_use -= 1
+                if client is not None:
+                    idle = self._idle.setdefault(key, [])
+                    if len(idle) < self.max_idle:
+                        idle.append(client)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'created': self.created,
+                'reused': self.reused,
+                'in_use': self.in_use,
+                'idle': {'/'.join(key): len(clients) for key, clients in self._idle.items()},
+            }
+
+
+_shared_pool = None
+_shared_pool_lock = threading.Lock()
+
+
+def get_translator_pool() -> TranslatorPool:
+    """Restituisce il pool di traduttori condiviso dal processo"""
+    global _shared_pool
+    if _shared_pool is None:
+        with _shared_pool_lock:
+            if _shared_pool is None:
+                _shared_pool = TranslatorPool()
+    return _shared_pool
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Cache delle traduzioni a due livelli per lo scraper multilingua
+
+Le stesse stringhe ("Spagna", "Celtic", "Difensore centrale") vengono
+tradotte migliaia di volte in un batch. La cache tiene le traduzioni per
+(lingua sorgente, testo):
+    1. LRU in memoria del processo (microsecondi)
+    2. Store SQLite persistente, condiviso tra esecuzioni e processi
+
+Una traduzione trovata solo su disco viene promossa nell'LRU. I contatori
+distinguono hit in memoria, hit su disco e miss.
+
+Uso:
+    from transfermarkt_translation_cache import get_translation_cache
+
+    cache = get_translation_cache()      # unica per processo
+    cache.get_or_translate('it', 'Spagna', translate)
+    cache.invalidate(source_lang='it')   # o invalidate() per svuotare tutto
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+# Percorso di default dello store persistente (sovrascrivibile da env): accanto
+# alla cache HTML (TM_CACHE_DIR) o nella cartella del modulo, mai nella cwd
+DEFAULT_TRANSLATION_DB = os.environ.get('TM_TRANSLATION_CACHE') or os.path.join(
+    os.environ.get('TM_CACHE_DIR') or os.path.join(os.path.dirname(os.path.abspath(__file__)), '.tm_cache'),
+    'translations.sqlite')
+
+
+class TranslationCache:
+    """LRU in memoria davanti a uno store SQLite, chiave (source_lang, testo)"""
+
+    def __init__(self, path: Optional[str] = DEFAULT_TRANSLATION_DB, max_entries: int = 4096,
+                 target_lang: str = 'en'):
+        """
+        Args:
+            path: File SQLite delle traduzioni (None = solo memoria)
+            max_entries: Dimensione massima dell'LRU in memoria
+            target_lang: Lingua di destinazione delle traduzioni salvate
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.target_lang = target_lang
+        self._memory: 'OrderedDict[tuple, str]' = OrderedDict()
+        self._lock = threading.Lock()
+        # Lock separato per SQLite: durante una lettura su disco l'LRU resta disponibile
+        self._db_lock = threading.Lock()
+        self._db: Optional['sqlite3.Connection'] = None
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def _connection(self) -> Optional['sqlite3.Connection']:
+        """Apre lo store alla prima richiesta (costruire la cache non crea file); chiamare con _db_lock"""
+        if self.path is None:
+            return None
+        if self._db is None:
+            import sqlite3
+            
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute(
+                'CREATE TABLE IF NOT EXISTS translations ('
+                ' source_lang TEXT NOT NULL,'
+                ' target_lang TEXT NOT NULL,'
+                ' text TEXT NOT NULL,'
+                ' translation TEXT NOT NULL,'
+                ' PRIMARY KEY (source_lang, target_lang, text))'
+            )
+            self._db = db
+        return self._db
+
+    def _remember(self, key: tuple, translation: str):
+        self._memory[key] = translation
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, source_lang: str, text: str) -> Optional[str]:
+        """Traduzione in cache oppure None"""
+        key = (source_lang, text)
+        with self._lock:
+            translation = self._memory.get(key)
+            if translation is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return translation
+
+        # Lettura su disco fuori dal lock dell'LRU: gli altri thread continuano a usare la memoria
+        row = None
+        with self._db_lock:
+            db = self._connection()
+            if db is not None:
+                row = db.execute(
+                    'SELECT translation FROM translations WHERE source_lang = ? AND target_lang = ? AND text = ?',
+                    (source_lang, self.target_lang, text),
+                ).fetchone()
+
+        with self._lock:
+            if row is not None:
+                self._remember(key, row[0])
+                self.disk_hits += 1
+                return row[0]
+            self.misses += 1
+            return None
+
+    def put(self, source_lang: str, text: str, translation: str):
+        """Salva una traduzione in memoria e su disco"""
+        with self._lock:
+            self._remember((source_lang, text), translation)
+        with self._db_lock:
+            db = self._connection()
+            if db is not None:
+                db.execute(
+                    'INSERT OR REPLACE INTO translations (source_lang, target_lang, text, translation) VALUES (?, ?, ?, ?)',
+                    (source_lang, self.target_lang, text, translation),
+                )
+
+    def get_or_translate(self, source_lang: str, text: str, translate: Callable[[str], str]) -> str:
+        """
+        Restituisce la traduzione in cache o la calcola con `translate(text)`
+
+        Le eccezioni di `translate` vengono propagate e nulla viene salvato.
+        """
+        translation = self.get(source_lang, text)
+        if translation is None:
+            translation = translate(text)
+            if translation:
+                self.put(source_lang, text, translation)
+        return translation
+
+    def invalidate(self, source_lang: Optional[str] = None, text: Optional[str] = None) -> int:
+        """
+        Rimuove traduzioni dalla cache (memoria e disco)
+
+        Args:
+            source_lang: Solo questa lingua (None = tutte)
+            text: Solo questo testo (richiede source_lang)
+
+        Returns:
+            Numero di traduzioni rimosse dallo store persistente
+            (o dalla memoria se non c'è store)
+        """
+        if text is not None and source_lang is None:
+            raise ValueError("invalidate(text=...) richiede source_lang")
+
+        with self._lock:
+            keys = [k for k in self._memory
+                    if (source_lang is None or k[0] == source_lang) and (text is None or k[1] == text)]
+            for key in keys:
+                del self._memory[key]
+
+        with self._db_lock:
+            db = self._connection()
+            if db is None:
+                return len(keys)
+
+            query = 'DELETE FROM translations WHERE target_lang = ?'
+            params = [self.target_lang]
+            if source_lang is not None:
+                query += ' AND source_lang = ?'
+                params.append(source_lang)
+            if text is not None:
+                query += ' AND text = ?'
+                params.append(text)
+            return db.execute(query, params).rowcount
+
+    def stats(self) -> Dict:
+        """Contatori di hit/miss e dimensione dell'LRU"""
+        with self._lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            return {
+                'memory_hits': self.memory_hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'hit_rate': round((self.memory_hits + self.disk_hits) / lookups, 4) if lookups else 0.0,
+                'memory_entries': len(self._memory),
+                'max_entries': self.max_entries,
+                'path': self.path,
+            }
+
+    def close(self):
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+_shared_cache = None
+_shared_lock = threading.Lock()
+
+
+def get_translation_cache() -> TranslationCache:
+    """Restituisce la cache delle traduzioni condivisa dal processo"""
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_lock:
+            if _shared_cache is None:
+                _shared_cache = TranslationCache()
+    return _shared_cache
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Vocabolario di paesi e piede preferito nelle sei lingue dei siti Transfermarkt
+
+Le tabelle sono generate da generate_vocabulary.py (ISO 3166-1 con i nomi di
+iso-codes in it/en/es/de/fr/pt, più nazionali britanniche e Kosovo) in
+transfermarkt_vocabulary_data.py. All'import vengono congelate
+(MappingProxyType) e i valori canonici inglesi vengono internati: milioni di
+righe convertite condividono le stesse poche centinaia di stringhe.
+
+Uso:
+    from transfermarkt_vocabulary import NATIONALITIES, nationality, nationalities, foot
+
+    nationality('Costa do Marfim')           # 'Ivory Coast'
+    nationality('Türkei')                    # 'Turkey'
+    nationalities(['Spagna', 'España'])      # ['Spain', 'Spain']
+    foot('beidfüßig')                        # 'Both'
+    country_name('DE', 'it')                 # 'Germania'
+"""
+
+import sys
+import unicodedata
+from types import MappingProxyType
+from typing import Iterable, List, Mapping, Optional
+
+from transfermarkt_vocabulary_data import COUNTRIES as _COUNTRIES, COUNTRY_ALIASES as _COUNTRY_ALIASES, FOOT_ALIASES as _FOOT_ALIASES
+
+LANGUAGES = ('it', 'en', 'es', 'de', 'fr', 'pt')
+
+# Codice -> {lingua: nome}
+COUNTRIES: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    sys.intern(code): MappingProxyType({language: sys.intern(name) for language, name in names.items()})
+    for code, names in _COUNTRIES.items()
+})
+
+# Nome in qualsiasi lingua (minuscolo) -> codice
+COUNTRY_CODES: Mapping[str, str] = MappingProxyType({alias: sys.intern(code) for alias, code in _COUNTRY_ALIASES.items()})
+
+# Nome in qualsiasi lingua (minuscolo) -> nome inglese canonico (stesso oggetto stringa per paese)
+NATIONALITIES: Mapping[str, str] = MappingProxyType({alias: COUNTRIES[code]['en'] for alias, code in COUNTRY_CODES.items()})
+
+# Piede in qualsiasi lingua (minuscolo) -> 'Right' / 'Left' / 'Both'
+FEET: Mapping[str, str] = MappingProxyType({alias: sys.intern(value) for alias, value in _FOOT_ALIASES.items()})
+
+
+def normalize_key(text: str) -> str:
+    """Chiave di ricerca: minuscolo, spazi compattati"""
+    return ' '.join(text.lower().split())
+
+
+def _fold(key: str) -> str:
+    return ''.join(c for c in unicodedata.normalize('NFKD', key) if not unicodedata.combining(c))
+
+
+def _lookup(table: Mapping[str, str], text: str) -> Optional[str]:
+    key = normalize_key(text)
+    value = table.get(key)
+    if value is None and not key.isascii():
+        # "Turquia" / "Turquía": le tabelle hanno anche le chiavi senza accenti
+        value = table.get(_fold(key))
+    return value
+
+
+def country_code(name: str) -> Optional[str]:
+    """Codice ISO (o 'GB-ENG', 'XK', ...) del paese in qualsiasi lingua, oppure None"""
+    return _lookup(COUNTRY_CODES, name) if name else None
+
+
+def country_name(code: str, language: str = 'en') -> Optional[str]:
+    """Nome del paese nella lingua del sito (en = nome canonico del database)"""
+    names = COUNTRIES.get(code)
+    return names.get(language) if names else None
+
+
+def nationality(name: str, default: Optional[str] = None) -> Optional[str]:
+    """Nome inglese canonico della nazionalità, oppure default se sconosciuta"""
+    if not name:
+        return default
+    value = _lookup(NATIONALITIES, name)
+    return default if value is None else value
+
+
+def foot(name: str, default: Optional[str] = 'Right') -> Optional[str]:
+    """'Right' / 'Left' / 'Both' dal piede in qualsiasi lingua, oppure default"""
+    if not name:
+        return default
+    value = _lookup(FEET, name)
+    return default if value is None else value
+
+
+def nationalities(names: Iterable[str], default: Optional[str] = None) -> List[Optional[str]]:
+    """nationality() per una lista (es. una colonna Excel); ogni valore distinto è cercato una volta"""
+    names = list(names)
+    distinct = {name: nationality(name, default) for name in set(names)}
+    return [distinct[name] for name in names]
+
+
+def feet(names: Iterable[str], default: Optional[str] = 'Right') -> List[Optional[str]]:
+    """foot() per una lista; ogni valore distinto è cercato una volta"""
+    names = list(names)
+    distinct = {name: foot(name, default) for name in set(names)}
+    return [distinct[name] for name in names]
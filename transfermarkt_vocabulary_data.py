@@ -0,0 +1,2007 @@
+# Generato da generate_vocabulary.py: non modificare a mano
+"""Tabelle di paesi (ISO 3166-1 + nazionali britanniche e Kosovo) e piede preferito"""
+
+# Codice -> nome per lingua del sito (en = nome canonico del database)
+COUNTRIES = {
+    'AD': {'it': 'Andorra', 'en': 'Andorra', 'es': 'Andorra', 'de': 'Andorra', 'fr': 'Andorre', 'pt': 'Andorra'},
+    'AE': {'it': 'Emirati Arabi Uniti', 'en': 'United Arab Emirates', 'es': 'Emiratos Árabes Unidos', 'de': 'Vereinigte Arabische Emirate', 'fr': 'Émirats arabes unis', 'pt': 'Emirados Árabes Unidos'},
+    'AF': {'it': 'Afghanistan', 'en': 'Afghanistan', 'es': 'Afganistán', 'de': 'Afghanistan', 'fr': 'Afghanistan', 'pt': 'Afeganistão'},
+    'AG': {'it': 'Antigua e Barbuda', 'en': 'Antigua and Barbuda', 'es': 'Antigua y Barbuda', 'de': 'Antigua und Barbuda', 'fr': 'Antigua-et-Barbuda', 'pt': 'Antígua e Barbuda'},
+    'AI': {'it': 'Anguilla', 'en': 'Anguilla', 'es': 'Anguila', 'de': 'Anguilla', 'fr': 'Anguilla', 'pt': 'Anguilla'},
+    'AL': {'it': 'Albania', 'en': 'Albania', 'es': 'Albania', 'de': 'Albanien', 'fr': 'Albanie', 'pt': 'Albânia'},
+    'AM': {'it': 'Armenia', 'en': 'Armenia', 'es': 'Armenia', 'de': 'Armenien', 'fr': 'Arménie', 'pt': 'Arménia'},
+    'AO': {'it': 'Angola', 'en': 'Angola', 'es': 'Angola', 'de': 'Angola', 'fr': 'Angola', 'pt': 'Angola'},
+    'AQ': {'it': 'Antartide', 'en': 'Antarctica', 'es': 'Antártida', 'de': 'Antarktis', 'fr': 'Antarctique', 'pt': 'Antártida'},
+    'AR': {'it': 'Argentina', 'en': 'Argentina', 'es': 'Argentina', 'de': 'Argentinien', 'fr': 'Argentine', 'pt': 'Argentina'},
+    'AS': {'it': 'Samoa americane', 'en': 'American Samoa', 'es': 'Samoa Estadounidense', 'de': 'Amerikanisch-Samoa', 'fr': 'Samoa américaines', 'pt': 'Samoa Americana'},
+    'AT': {'it': 'Austria', 'en': 'Austria', 'es': 'Austria', 'de': 'Österreich', 'fr': 'Autriche', 'pt': 'Áustria'},
+    'AU': {'it': 'Australia', 'en': 'Australia', 'es': 'Australia', 'de': 'Australien', 'fr': 'Australie', 'pt': 'Austrália'},
+    'AW': {'it': 'Aruba', 'en': 'Aruba', 'es': 'Aruba', 'de': 'Aruba', 'fr': 'Aruba', 'pt': 'Aruba'},
+    'AX': {'it': 'Isole Åland', 'en': 'Åland Islands', 'es': 'Islas Äland', 'de': 'Åland-Inseln', 'fr': 'Îles Åland', 'pt': 'Ilhas Alanda'},
+    'AZ': {'it': 'Azerbaigian', 'en': 'Azerbaijan', 'es': 'Azerbaiyán', 'de': 'Aserbaidschan', 'fr': 'Azerbaïdjan', 'pt': 'Azerbaijão'},
+    'BA': {'it': 'Bosnia-Erzegovina', 'en': 'Bosnia and Herzegovina', 'es': 'Bosnia y Herzegovina', 'de': 'Bosnien und Herzegowina', 'fr': 'Bosnie-Herzégovine', 'pt': 'Bósnia e Herzegovina'},
+    'BB': {'it': 'Barbados', 'en': 'Barbados', 'es': 'Barbados', 'de': 'Barbados', 'fr': 'Barbade', 'pt': 'Barbados'},
+    'BD': {'it': 'Bangladesh', 'en': 'Bangladesh', 'es': 'Bangladés', 'de': 'Bangladesch', 'fr': 'Bangladesh', 'pt': 'Bangladeche'},
+    'BE': {'it': 'Belgio', 'en': 'Belgium', 'es': 'Bélgica', 'de': 'Belgien', 'fr': 'Belgique', 'pt': 'Bélgica'},
+    'BF': {'it': 'Burkina Faso', 'en': 'Burkina Faso', 'es': 'Burquina Faso', 'de': 'Burkina Faso', 'fr': 'Burkina Faso', 'pt': 'Burkina Faso'},
+    'BG': {'it': 'Bulgaria', 'en': 'Bulgaria', 'es': 'Bulgaria', 'de': 'Bulgarien', 'fr': 'Bulgarie', 'pt': 'Bulgária'},
+    'BH': {'it': 'Bahrein', 'en': 'Bahrain', 'es': 'Baréin', 'de': 'Bahrain', 'fr': 'Bahreïn', 'pt': 'Barém'},
+    'BI': {'it': 'Burundi', 'en': 'Burundi', 'es': 'Burundi', 'de': 'Burundi', 'fr': 'Burundi', 'pt': 'Burundi'},
+    'BJ': {'it': 'Benin', 'en': 'Benin', 'es': 'Benín', 'de': 'Benin', 'fr': 'Bénin', 'pt': 'Benim'},
+    'BL': {'it': 'Saint-Barthélemy', 'en': 'Saint Barthélemy', 'es': 'San Bartolomé', 'de': 'Saint-Barthélemy', 'fr': 'Saint-Barthélemy', 'pt': 'Saint Barthélemy'},
+    'BM': {'it': 'Bermuda', 'en': 'Bermuda', 'es': 'Islas Bermudas', 'de': 'Bermuda', 'fr': 'Bermudes', 'pt': 'Bermudas'},
+    'BN': {'it': 'Brunei', 'en': 'Brunei', 'es': 'Brunei Darussalam', 'de': 'Brunei Darussalam', 'fr': 'Brunéi Darussalam', 'pt': 'Brunei'},
+    'BO': {'it': 'Bolivia', 'en': 'Bolivia', 'es': 'Bolivia', 'de': 'Bolivien', 'fr': 'Bolivie', 'pt': 'Bolívia'},
+    'BQ': {'it': 'Paesi Bassi caraibici', 'en': 'Bonaire, Sint Eustatius and Saba', 'es': 'Islas BES (Caribe Neerlandés)', 'de': 'Sint Eustatius und Saba Bonaire', 'fr': 'Saint-Eustache et Saba Bonaire', 'pt': 'Santo Eustáquio e Saba Bonaire'},
+    'BR': {'it': 'Brasile', 'en': 'Brazil', 'es': 'Brasil', 'de': 'Brasilien', 'fr': 'Brésil', 'pt': 'Brasil'},
+    'BS': {'it': 'Bahamas', 'en': 'Bahamas', 'es': 'Bahamas', 'de': 'Bahamas', 'fr': 'Bahamas', 'pt': 'Bahamas'},
+    'BT': {'it': 'Bhutan', 'en': 'Bhutan', 'es': 'Bután', 'de': 'Bhutan', 'fr': 'Bhoutan', 'pt': 'Butão'},
+    'BV': {'it': 'Isola Bouvet', 'en': 'Bouvet Island', 'es': 'Isla Bouvet', 'de': 'Bouvet-Insel', 'fr': 'île Bouvet', 'pt': 'Ilha Bouvet'},
+    'BW': {'it': 'Botswana', 'en': 'Botswana', 'es': 'Botsuana', 'de': 'Botsuana', 'fr': 'Botswana', 'pt': 'Botsuana'},
+    'BY': {'it': 'Bielorussia', 'en': 'Belarus', 'es': 'Bielorrusia', 'de': 'Belarus', 'fr': 'Bélarus', 'pt': 'Bielorússia'},
+    'BZ': {'it': 'Belize', 'en': 'Belize', 'es': 'Belice', 'de': 'Belize', 'fr': 'Belize', 'pt': 'Belize'},
+    'CA': {'it': 'Canada', 'en': 'Canada', 'es': 'Canadá', 'de': 'Kanada', 'fr': 'Canada', 'pt': 'Canadá'},
+    'CC': {'it': 'Isole Cocos (Keeling)', 'en': 'Cocos (Keeling) Islands', 'es': 'Islas Cocos (Keeling)', 'de': 'Kokos-(Keeling-)Inseln', 'fr': 'Îles Cocos (Keeling)', 'pt': 'Ilhas Cocos'},
+    'CD': {'it': 'Repubblica democratica del Congo', 'en': 'DR Congo', 'es': 'República Democrática del Congo', 'de': 'Demokratische Republik Kongo', 'fr': 'République démocratique du Congo', 'pt': 'República Democrática do Congo'},
+    'CF': {'it': 'Repubblica Centrafricana', 'en': 'Central African Republic', 'es': 'República Centroafricana', 'de': 'Zentralafrikanische Republik', 'fr': 'République centrafricaine', 'pt': 'República Centro-Africana'},
+    'CG': {'it': 'Congo', 'en': 'Congo', 'es': 'Congo', 'de': 'Kongo', 'fr': 'République du Congo', 'pt': 'Congo'},
+    'CH': {'it': 'Svizzera', 'en': 'Switzerland', 'es': 'Suiza', 'de': 'Schweiz', 'fr': 'Suisse', 'pt': 'Suíça'},
+    'CI': {'it': "Costa d'Avorio", 'en': 'Ivory Coast', 'es': 'Costa de Marfíl', 'de': "Côte d'Ivoire", 'fr': "Côte d'Ivoire", 'pt': 'Costa do Marfim'},
+    'CK': {'it': 'Isole Cook', 'en': 'Cook Islands', 'es': 'Islas Cook', 'de': 'Cookinseln', 'fr': 'îles Cook', 'pt': 'Ilhas Cook'},
+    'CL': {'it': 'Cile', 'en': 'Chile', 'es': 'Chile', 'de': 'Chile', 'fr': 'Chili', 'pt': 'Chile'},
+    'CM': {'it': 'Camerun', 'en': 'Cameroon', 'es': 'Camerún', 'de': 'Kamerun', 'fr': 'Cameroun', 'pt': 'Camarões'},
+    'CN': {'it': 'Cina', 'en': 'China', 'es': 'China', 'de': 'China', 'fr': 'Chine', 'pt': 'China'},
+    'CO': {'it': 'Colombia', 'en': 'Colombia', 'es': 'Colombia', 'de': 'Kolumbien', 'fr': 'Colombie', 'pt': 'Colômbia'},
+    'CR': {'it': 'Costa Rica', 'en': 'Costa Rica', 'es': 'Costa Rica', 'de': 'Costa Rica', 'fr': 'Costa Rica', 'pt': 'Costa Rica'},
+    'CU': {'it': 'Cuba', 'en': 'Cuba', 'es': 'Cuba', 'de': 'Kuba', 'fr': 'Cuba', 'pt': 'Cuba'},
+    'CV': {'it': 'Capo Verde', 'en': 'Cape Verde', 'es': 'Cabo Verde', 'de': 'Kap Verde', 'fr': 'Cap-Vert', 'pt': 'Cabo Verde'},
+    'CW': {'it': 'Curaçao', 'en': 'Curacao', 'es': 'Curazao', 'de': 'Curaçao', 'fr': 'Curaçao', 'pt': 'Curação'},
+    'CX': {'it': 'Isola di Natale', 'en': 'Christmas Island', 'es': 'Isla de Navidad', 'de': 'Weihnachtsinseln', 'fr': 'Île Christmas', 'pt': 'Ilha Natal'},
+    'CY': {'it': 'Cipro', 'en': 'Cyprus', 'es': 'Chipre', 'de': 'Zypern', 'fr': 'Chypre', 'pt': 'Chipre'},
+    'CZ': {'it': 'Repubblica Ceca', 'en': 'Czech Republic', 'es': 'República Checa', 'de': 'Tschechische Republik', 'fr': 'République tchèque', 'pt': 'República Checa'},
+    'DE': {'it': 'Germania', 'en': 'Germany', 'es': 'Alemania', 'de': 'Deutschland', 'fr': 'Allemagne', 'pt': 'Alemanha'},
+    'DJ': {'it': 'Gibuti', 'en': 'Djibouti', 'es': 'Yibuti', 'de': 'Dschibuti', 'fr': 'Djibouti', 'pt': 'Djibouti'},
+    'DK': {'it': 'Danimarca', 'en': 'Denmark', 'es': 'Dinamarca', 'de': 'Dänemark', 'fr': 'Danemark', 'pt': 'Dinamarca'},
+    'DM': {'it': 'Dominica', 'en': 'Dominica', 'es': 'Dominica', 'de': 'Dominica', 'fr': 'Dominique', 'pt': 'Dominica'},
+    'DO': {'it': 'Repubblica Dominicana', 'en': 'Dominican Republic', 'es': 'República Dominicana', 'de': 'Dominikanische Republik', 'fr': 'République dominicaine', 'pt': 'República Dominicana'},
+    'DZ': {'it': 'Algeria', 'en': 'Algeria', 'es': 'Algeria', 'de': 'Algerien', 'fr': 'Algérie', 'pt': 'Argélia'},
+    'EC': {'it': 'Ecuador', 'en': 'Ecuador', 'es': 'Ecuador', 'de': 'Ecuador', 'fr': 'Équateur', 'pt': 'Equador'},
+    'EE': {'it': 'Estonia', 'en': 'Estonia', 'es': 'Estonia', 'de': 'Estland', 'fr': 'Estonie', 'pt': 'Estónia'},
+    'EG': {'it': 'Egitto', 'en': 'Egypt', 'es': 'Egipto', 'de': 'Ägypten', 'fr': 'Égypte', 'pt': 'Egito'},
+    'EH': {'it': 'Sahara occidentale', 'en': 'Western Sahara', 'es': 'Sahara Occidental', 'de': 'Westsahara', 'fr': 'Sahara occidental', 'pt': 'Saara Ocidental'},
+    'ER': {'it': 'Eritrea', 'en': 'Eritrea', 'es': 'Eritrea', 'de': 'Eritrea', 'fr': 'Érythrée', 'pt': 'Eritreia'},
+    'ES': {'it': 'Spagna', 'en': 'Spain', 'es': 'España', 'de': 'Spanien', 'fr': 'Espagne', 'pt': 'Espanha'},
+    'ET': {'it': 'Etiopia', 'en': 'Ethiopia', 'es': 'Etiopía', 'de': 'Äthiopien', 'fr': 'Éthiopie', 'pt': 'Etiópia'},
+    'FI': {'it': 'Finlandia', 'en': 'Finland', 'es': 'Finlandia', 'de': 'Finnland', 'fr': 'Finlande', 'pt': 'Finlândia'},
+    'FJ': {'it': 'Figi', 'en': 'Fiji', 'es': 'Fiyi', 'de': 'Fidschi', 'fr': 'Fidji', 'pt': 'Fiji'},
+    'FK': {'it': 'Isole Falkland (Malvine)', 'en': 'Falkland Islands (Malvinas)', 'es': 'Islas Falkland (Malvinas)', 'de': 'Falklandinseln (Malwinen)', 'fr': 'Îles (Falkland) Malouines', 'pt': 'Ilhas Falkland (Malvinas)'},
+    'FM': {'it': 'Micronesia', 'en': 'Micronesia', 'es': 'Estados Federados de Micronesia', 'de': 'Föderierte Staaten von Mikronesien', 'fr': 'États fédérés de Micronésie', 'pt': 'Estados Federados da Micronésia'},
+    'FO': {'it': 'Isole Fær Øer', 'en': 'Faroe Islands', 'es': 'Islas Feroe', 'de': 'Färöer-Inseln', 'fr': 'îles Féroé', 'pt': 'Ilhas Faroé'},
+    'FR': {'it': 'Francia', 'en': 'France', 'es': 'Francia', 'de': 'Frankreich', 'fr': 'France', 'pt': 'França'},
+    'GA': {'it': 'Gabon', 'en': 'Gabon', 'es': 'Gabón', 'de': 'Gabun', 'fr': 'Gabon', 'pt': 'Gabão'},
+    'GB': {'it': 'Regno Unito', 'en': 'United Kingdom', 'es': 'Reino Unido', 'de': 'Vereinigtes Königreich', 'fr': 'Royaume-Uni', 'pt': 'Reino Unido'},
+    'GD': {'it': 'Grenada', 'en': 'Grenada', 'es': 'Granada', 'de': 'Grenada', 'fr': 'Grenade', 'pt': 'Granada'},
+    'GE': {'it': 'Georgia', 'en': 'Georgia', 'es': 'Georgia', 'de': 'Georgien', 'fr': 'Géorgie', 'pt': 'Geórgia'},
+    'GF': {'it': 'Guyana francese', 'en': 'French Guiana', 'es': 'Guayana Francesa', 'de': 'Französisch-Guyana', 'fr': 'Guyane française', 'pt': 'Guiana Francesa'},
+    'GG': {'it': 'Guernsey', 'en': 'Guernsey', 'es': 'Guernsey', 'de': 'Guernsey', 'fr': 'Guernesey', 'pt': 'Guernsey'},
+    'GH': {'it': 'Ghana', 'en': 'Ghana', 'es': 'Ghana', 'de': 'Ghana', 'fr': 'Ghana', 'pt': 'Gana'},
+    'GI': {'it': 'Gibilterra', 'en': 'Gibraltar', 'es': 'Gibraltar', 'de': 'Gibraltar', 'fr': 'Gibraltar', 'pt': 'Gibraltar'},
+    'GL': {'it': 'Groenlandia', 'en': 'Greenland', 'es': 'Groenlandia', 'de': 'Grönland', 'fr': 'Groënland', 'pt': 'Gronelândia'},
+    'GM': {'it': 'Gambia', 'en': 'Gambia', 'es': 'Gambia', 'de': 'Gambia', 'fr': 'Gambie', 'pt': 'Gâmbia'},
+    'GN': {'it': 'Guinea', 'en': 'Guinea', 'es': 'Guinea', 'de': 'Guinea', 'fr': 'Guinée', 'pt': 'Guiné'},
+    'GP': {'it': 'Guadalupa', 'en': 'Guadeloupe', 'es': 'Guadalupe', 'de': 'Guadeloupe', 'fr': 'Guadeloupe', 'pt': 'Guadalupe'},
+    'GQ': {'it': 'Guinea equatoriale', 'en': 'Equatorial Guinea', 'es': 'Guinea Ecuatorial', 'de': 'Äquatorialguinea', 'fr': 'Guinée Équatoriale', 'pt': 'Guiné Equatorial'},
+    'GR': {'it': 'Grecia', 'en': 'Greece', 'es': 'Grecia', 'de': 'Griechenland', 'fr': 'Grèce', 'pt': 'Grécia'},
+    'GS': {'it': 'Georgia del Sud e Isole Sandwich Australi', 'en': 'South Georgia and the South Sandwich Islands', 'es': 'Islas Georgias del Sur y Sándwich del Sur', 'de': 'South Georgia und die Südlichen Sandwichinseln', 'fr': 'Géorgie du Sud et les îles Sandwich du Sud', 'pt': 'Ilhas Geórgia do Sul e Sandwich do Sul'},
+    'GT': {'it': 'Guatemala', 'en': 'Guatemala', 'es': 'Guatemala', 'de': 'Guatemala', 'fr': 'Guatemala', 'pt': 'Guatemala'},
+    'GU': {'it': 'Guam', 'en': 'Guam', 'es': 'Guam', 'de': 'Guam', 'fr': 'Guam', 'pt': 'Guam'},
+    'GW': {'it': 'Guinea-Bissau', 'en': 'Guinea-Bissau', 'es': 'Guinea-Bisáu', 'de': 'Guinea-Bissau', 'fr': 'Guinée-Bissau', 'pt': 'Guiné-Bissáu'},
+    'GY': {'it': 'Guyana', 'en': 'Guyana', 'es': 'Guyana', 'de': 'Guyana', 'fr': 'Guyana', 'pt': 'Guiana'},
+    'HK': {'it': 'Hong Kong', 'en': 'Hong Kong', 'es': 'Hong Kong', 'de': 'Hongkong', 'fr': 'Hong Kong', 'pt': 'Hong Kong'},
+    'HM': {'it': 'Isole Heard e McDonald', 'en': 'Heard Island and McDonald Islands', 'es': 'Islas Heard y McDonald', 'de': 'Heard und McDonaldinseln', 'fr': 'îles Heard-et-MacDonald', 'pt': 'Ilha Heard e Ilhas McDonald'},
+    'HN': {'it': 'Honduras', 'en': 'Honduras', 'es': 'Honduras', 'de': 'Honduras', 'fr': 'Honduras', 'pt': 'Honduras'},
+    'HR': {'it': 'Croazia', 'en': 'Croatia', 'es': 'Croacia', 'de': 'Kroatien', 'fr': 'Croatie', 'pt': 'Croácia'},
+    'HT': {'it': 'Haiti', 'en': 'Haiti', 'es': 'Haití', 'de': 'Haiti', 'fr': 'Haïti', 'pt': 'Haiti'},
+    'HU': {'it': 'Ungheria', 'en': 'Hungary', 'es': 'Hungría', 'de': 'Ungarn', 'fr': 'Hongrie', 'pt': 'Hungria'},
+    'ID': {'it': 'Indonesia', 'en': 'Indonesia', 'es': 'Indonesia', 'de': 'Indonesien', 'fr': 'Indonésie', 'pt': 'Indonésia'},
+    'IE': {'it': 'Irlanda', 'en': 'Ireland', 'es': 'Irlanda', 'de': 'Irland', 'fr': 'Irlande', 'pt': 'Irlanda'},
+    'IL': {'it': 'Israele', 'en': 'Israel', 'es': 'Israel', 'de': 'Israel', 'fr': 'Israël', 'pt': 'Israel'},
+    'IM': {'it': 'Isola di Man', 'en': 'Isle of Man', 'es': 'Isla de Man', 'de': 'Insel Man', 'fr': 'Île de Man', 'pt': 'Ilha de Man'},
+    'IN': {'it': 'India', 'en': 'India', 'es': 'India', 'de': 'Indien', 'fr': 'Inde', 'pt': 'Índia'},
+    'IO': {'it': "Territorio britannico dell'Oceano Indiano", 'en': 'British Indian Ocean Territory', 'es': 'Territorio Británico del Océano Índico', 'de': 'Britisches Territorium im Indischen Ozean', 'fr': "Territoire britannique de l'océan Indien", 'pt': 'Território Britânico do Oceano Índico'},
+    'IQ': {'it': 'Iraq', 'en': 'Iraq', 'es': 'Irak', 'de': 'Irak', 'fr': 'Irak', 'pt': 'Iraque'},
+    'IR': {'it': 'Iran', 'en': 'Iran', 'es': 'República islámica de Irán', 'de': 'Iran', 'fr': "République islamique d' Iran", 'pt': 'República Islâmica do Irão'},
+    'IS': {'it': 'Islanda', 'en': 'Iceland', 'es': 'Islandia', 'de': 'Island', 'fr': 'Islande', 'pt': 'Islândia'},
+    'IT': {'it': 'Italia', 'en': 'Italy', 'es': 'Italia', 'de': 'Italien', 'fr': 'Italie', 'pt': 'Itália'},
+    'JE': {'it': 'Jersey', 'en': 'Jersey', 'es': 'Jersey', 'de': 'Jersey', 'fr': 'Jersey', 'pt': 'Jersey'},
+    'JM': {'it': 'Giamaica', 'en': 'Jamaica', 'es': 'Jamaica', 'de': 'Jamaika', 'fr': 'Jamaïque', 'pt': 'Jamaica'},
+    'JO': {'it': 'Giordania', 'en': 'Jordan', 'es': 'Jordania', 'de': 'Jordanien', 'fr': 'Jordanie', 'pt': 'Jordânia'},
+    'JP': {'it': 'Giappone', 'en': 'Japan', 'es': 'Japón', 'de': 'Japan', 'fr': 'Japon', 'pt': 'Japão'},
+    'KE': {'it': 'Kenya', 'en': 'Kenya', 'es': 'Kenia', 'de': 'Kenia', 'fr': 'Kenya', 'pt': 'Quénia'},
+    'KG': {'it': 'Kirghizistan', 'en': 'Kyrgyzstan', 'es': 'Kirguistán', 'de': 'Kirgisistan', 'fr': 'Kirghizistan', 'pt': 'Quirguistão'},
+    'KH': {'it': 'Cambogia', 'en': 'Cambodia', 'es': 'Camboya', 'de': 'Kambodscha', 'fr': 'Cambodge', 'pt': 'Camboja'},
+    'KI': {'it': 'Kiribati', 'en': 'Kiribati', 'es': 'Kiribati', 'de': 'Kiribati', 'fr': 'Kiribati', 'pt': 'Kiribati'},
+    'KM': {'it': 'Comore', 'en': 'Comoros', 'es': 'Islas Comores', 'de': 'Komoren', 'fr': 'Comores', 'pt': 'Comores'},
+    'KN': {'it': 'Saint Kitts e Nevis', 'en': 'Saint Kitts and Nevis', 'es': 'San Cristóbal y Nieves', 'de': 'St. Kitts und Nevis', 'fr': 'Saint-Christophe-et-Niévès', 'pt': 'São Cristóvão e Nevis'},
+    'KP': {'it': 'Corea del Nord', 'en': 'North Korea', 'es': 'República Democrática Popular de Corea', 'de': 'Nordkorea', 'fr': 'Corée du Nord', 'pt': 'Coreia do Norte'},
+    'KR': {'it': 'Corea del Sud', 'en': 'South Korea', 'es': 'República de Corea', 'de': 'Südkorea', 'fr': 'Corée du Sud', 'pt': 'Coreia do Sul'},
+    'KW': {'it': 'Kuwait', 'en': 'Kuwait', 'es': 'Kuwait', 'de': 'Kuwait', 'fr': 'Koweït', 'pt': 'Kuwait'},
+    'KY': {'it': 'Isole Cayman', 'en': 'Cayman Islands', 'es': 'Islas Caimán', 'de': 'Cayman-Inseln', 'fr': 'îles Caïmans', 'pt': 'Ilhas Caimão'},
+    'KZ': {'it': 'Kazakistan', 'en': 'Kazakhstan', 'es': 'Kazajistán', 'de': 'Kasachstan', 'fr': 'Kazakhstan', 'pt': 'Cazaquistão'},
+    'LA': {'it': 'Laos', 'en': 'Laos', 'es': 'República Democrática Popular de Lao', 'de': 'Laos', 'fr': 'République démocratique populaire Lao', 'pt': 'República Democrática Popular do Laos'},
+    'LB': {'it': 'Libano', 'en': 'Lebanon', 'es': 'Líbano', 'de': 'Libanon', 'fr': 'Liban', 'pt': 'Líbano'},
+    'LC': {'it': 'Saint Lucia', 'en': 'Saint Lucia', 'es': 'Santa Lucía', 'de': 'St. Lucia', 'fr': 'Sainte-Lucie', 'pt': 'Santa Lúcia'},
+    'LI': {'it': 'Liechtenstein', 'en': 'Liechtenstein', 'es': 'Liechtenstein', 'de': 'Liechtenstein', 'fr': 'Liechtenstein', 'pt': 'Liechtenstein'},
+    'LK': {'it': 'Sri Lanka', 'en': 'Sri Lanka', 'es': 'Sri Lanka', 'de': 'Sri Lanka', 'fr': 'Sri Lanka', 'pt': 'Sri Lanka'},
+    'LR': {'it': 'Liberia', 'en': 'Liberia', 'es': 'Liberia', 'de': 'Liberia', 'fr': 'Libéria', 'pt': 'Libéria'},
+    'LS': {'it': 'Lesotho', 'en': 'Lesotho', 'es': 'Lesoto', 'de': 'Lesotho', 'fr': 'Lesotho', 'pt': 'Lesoto'},
+    'LT': {'it': 'Lituania', 'en': 'Lithuania', 'es': 'Lituania', 'de': 'Litauen', 'fr': 'Lituanie', 'pt': 'Lituânia'},
+    'LU': {'it': 'Lussemburgo', 'en': 'Luxembourg', 'es': 'Luxemburgo', 'de': 'Luxemburg', 'fr': 'Luxembourg', 'pt': 'Luxemburgo'},
+    'LV': {'it': 'Lettonia', 'en': 'Latvia', 'es': 'Letonia', 'de': 'Lettland', 'fr': 'Lettonie', 'pt': 'Letónia'},
+    'LY': {'it': 'Libia', 'en': 'Libya', 'es': 'Libia', 'de': 'Libyen', 'fr': 'Libye', 'pt': 'Líbia'},
+    'MA': {'it': 'Marocco', 'en': 'Morocco', 'es': 'Marruecos', 'de': 'Marokko', 'fr': 'Maroc', 'pt': 'Marrocos'},
+    'MC': {'it': 'Monaco', 'en': 'Monaco', 'es': 'Mónaco', 'de': 'Monaco', 'fr': 'Monaco', 'pt': 'Mónaco'},
+    'MD': {'it': 'Moldavia', 'en': 'Moldova', 'es': 'Moldavia', 'de': 'Moldau', 'fr': 'Moldavie', 'pt': 'Moldávia'},
+    'ME': {'it': 'Montenegro', 'en': 'Montenegro', 'es': 'Montenegro', 'de': 'Montenegro', 'fr': 'Monténégro', 'pt': 'Montenegro'},
+    'MF': {'it': 'Saint-Martin (Francia)', 'en': 'Saint Martin (French part)', 'es': 'San Martín (zona francesa)', 'de': 'Saint Martin (Französischer Teil)', 'fr': 'Saint-Martin (partie française)', 'pt': 'São Martin (Território Francês)'},
+    'MG': {'it': 'Madagascar', 'en': 'Madagascar', 'es': 'Madagascar', 'de': 'Madagaskar', 'fr': 'Madagascar', 'pt': 'Madagáscar'},
+    'MH': {'it': 'Isole Marshall', 'en': 'Marshall Islands', 'es': 'Islas Marshall', 'de': 'Marshallinseln', 'fr': 'Îles Marshall', 'pt': 'Ilhas Marshall'},
+    'MK': {'it': 'Macedonia del Nord', 'en': 'North Macedonia', 'es': 'Macedonia del Norte', 'de': 'Nordmazedonien', 'fr': 'Macédoine du Nord', 'pt': 'Macedónia do Norte'},
+    'ML': {'it': 'Mali', 'en': 'Mali', 'es': 'Malí', 'de': 'Mali', 'fr': 'Mali', 'pt': 'Mali'},
+    'MM': {'it': 'Birmania', 'en': 'Myanmar', 'es': 'Birmania', 'de': 'Myanmar', 'fr': 'Birmanie', 'pt': 'Birmânia'},
+    'MN': {'it': 'Mongolia', 'en': 'Mongolia', 'es': 'Mongolia', 'de': 'Mongolei', 'fr': 'Mongolie', 'pt': 'Mongólia'},
+    'MO': {'it': 'Macao', 'en': 'Macao', 'es': 'Macao', 'de': 'Macao', 'fr': 'Macau', 'pt': 'Macau'},
+    'MP': {'it': 'Isole Marianne Settentrionali', 'en': 'Northern Mariana Islands', 'es': 'Islas Marianas del Norte', 'de': 'Nördliche Marianen', 'fr': 'Îles Mariannes du Nord', 'pt': 'Ilhas Marianas do Norte'},
+    'MQ': {'it': 'Martinica', 'en': 'Martinique', 'es': 'Martinica', 'de': 'Martinique', 'fr': 'Martinique', 'pt': 'Martinica'},
+    'MR': {'it': 'Mauritania', 'en': 'Mauritania', 'es': 'Mauritania', 'de': 'Mauretanien', 'fr': 'Mauritanie', 'pt': 'Mauritânia'},
+    'MS': {'it': 'Montserrat', 'en': 'Montserrat', 'es': 'Montserrat', 'de': 'Montserrat', 'fr': 'Montserrat', 'pt': 'Monserrate'},
+    'MT': {'it': 'Malta', 'en': 'Malta', 'es': 'Malta', 'de': 'Malta', 'fr': 'Malte', 'pt': 'Malta'},
+    'MU': {'it': 'Maurizio', 'en': 'Mauritius', 'es': 'Mauricio', 'de': 'Mauritius', 'fr': 'Maurice', 'pt': 'Maurícia'},
+    'MV': {'it': 'Maldive', 'en': 'Maldives', 'es': 'Islas Maldivas', 'de': 'Malediven', 'fr': 'Maldives', 'pt': 'Maldivas'},
+    'MW': {'it': 'Malawi', 'en': 'Malawi', 'es': 'Malaui', 'de': 'Malawi', 'fr': 'Malawi', 'pt': 'Malawi'},
+    'MX': {'it': 'Messico', 'en': 'Mexico', 'es': 'México', 'de': 'Mexiko', 'fr': 'Mexique', 'pt': 'México'},
+    'MY': {'it': 'Malaysia', 'en': 'Malaysia', 'es': 'Malasia', 'de': 'Malaysia', 'fr': 'Malaisie', 'pt': 'Malásia'},
+    'MZ': {'it': 'Mozambico', 'en': 'Mozambique', 'es': 'Mozambique', 'de': 'Mosambik', 'fr': 'Mozambique', 'pt': 'Moçambique'},
+    'NA': {'it': 'Namibia', 'en': 'Namibia', 'es': 'Namibia', 'de': 'Namibia', 'fr': 'Namibie', 'pt': 'Namíbia'},
+    'NC': {'it': 'Nuova Caledonia', 'en': 'New Caledonia', 'es': 'Nueva Caledonia', 'de': 'Neukaledonien', 'fr': 'Nouvelle-Calédonie', 'pt': 'Nova Caledónia'},
+    'NE': {'it': 'Niger', 'en': 'Niger', 'es': 'Niger', 'de': 'Niger', 'fr': 'Niger', 'pt': 'Níger'},
+    'NF': {'it': 'Isola Norfolk', 'en': 'Norfolk Island', 'es': 'Isla Norfolk', 'de': 'Norfolkinsel', 'fr': 'île Norfolk', 'pt': 'Ilha Norfolk'},
+    'NG': {'it': 'Nigeria', 'en': 'Nigeria', 'es': 'Nigeria', 'de': 'Nigeria', 'fr': 'Nigeria', 'pt': 'Nigéria'},
+    'NI': {'it': 'Nicaragua', 'en': 'Nicaragua', 'es': 'Nicaragua', 'de': 'Nicaragua', 'fr': 'Nicaragua', 'pt': 'Nicarágua'},
+    'NL': {'it': 'Paesi Bassi', 'en': 'Netherlands', 'es': 'Países Bajos', 'de': 'Niederlande', 'fr': 'Pays-Bas', 'pt': 'Países Baixos'},
+    'NO': {'it': 'Norvegia', 'en': 'Norway', 'es': 'Noruega', 'de': 'Norwegen', 'fr': 'Norvège', 'pt': 'Noruega'},
+    'NP': {'it': 'Nepal', 'en': 'Nepal', 'es': 'Nepal', 'de': 'Nepal', 'fr': 'Népal', 'pt': 'Nepal'},
+    'NR': {'it': 'Nauru', 'en': 'Nauru', 'es': 'Nauru', 'de': 'Nauru', 'fr': 'Nauru', 'pt': 'Nauru'},
+    'NU': {'it': 'Niue', 'en': 'Niue', 'es': 'Niue', 'de': 'Niue', 'fr': 'Nioue', 'pt': 'Niue'},
+    'NZ': {'it': 'Nuova Zelanda', 'en': 'New Zealand', 'es': 'Nueva Zelanda', 'de': 'Neuseeland', 'fr': 'Nouvelle-Zélande', 'pt': 'Nova Zelândia'},
+    'OM': {'it': 'Oman', 'en': 'Oman', 'es': 'Omán', 'de': 'Oman', 'fr': 'Oman', 'pt': 'Omã'},
+    'PA': {'it': 'Panama', 'en': 'Panama', 'es': 'Panamá', 'de': 'Panama', 'fr': 'Panama', 'pt': 'Panamá'},
+    'PE': {'it': 'Perù', 'en': 'Peru', 'es': 'Perú', 'de': 'Peru', 'fr': 'Pérou', 'pt': 'Peru'},
+    'PF': {'it': 'Polinesia francese', 'en': 'French Polynesia', 'es': 'Polinesia Francesa', 'de': 'Französisch-Polynesien', 'fr': 'Polynésie française', 'pt': 'Polinésia Francesa'},
+    'PG': {'it': 'Papua Nuova Guinea', 'en': 'Papua New Guinea', 'es': 'Papúa Nueva Guinea', 'de': 'Papua-Neuguinea', 'fr': 'Papouasie-Nouvelle-Guinée', 'pt': 'Papua Nova Guiné'},
+    'PH': {'it': 'Filippine', 'en': 'Philippines', 'es': 'Filipinas', 'de': 'Philippinen', 'fr': 'Philippines', 'pt': 'Filipinas'},
+    'PK': {'it': 'Pakistan', 'en': 'Pakistan', 'es': 'Pakistán', 'de': 'Pakistan', 'fr': 'Pakistan', 'pt': 'Paquistão'},
+    'PL': {'it': 'Polonia', 'en': 'Poland', 'es': 'Polonia', 'de': 'Polen', 'fr': 'Pologne', 'pt': 'Polónia'},
+    'PM': {'it': 'Saint-Pierre e Miquelon', 'en': 'Saint Pierre and Miquelon', 'es': 'San Pedro y Miquelon', 'de': 'St. Pierre und Miquelon', 'fr': 'Saint-Pierre-et-Miquelon', 'pt': 'Saint Pierre e Miquelon'},
+    'PN': {'it': 'Pitcairn', 'en': 'Pitcairn', 'es': 'Pitcairn', 'de': 'Pitcairn', 'fr': 'Îles Pitcairn', 'pt': 'Pitcairn'},
+    'PR': {'it': 'Portorico', 'en': 'Puerto Rico', 'es': 'Puerto Rico', 'de': 'Puerto Rico', 'fr': 'Porto Rico', 'pt': 'Porto Rico'},
+    'PS': {'it': 'Stato di Palestina', 'en': 'Palestine', 'es': 'Estado de Palestina', 'de': 'Staat Palästina', 'fr': 'État de Palestine', 'pt': 'Estado da Palestina'},
+    'PT': {'it': 'Portogallo', 'en': 'Portugal', 'es': 'Portugal', 'de': 'Portugal', 'fr': 'Portugal', 'pt': 'Portugal'},
+    'PW': {'it': 'Palau', 'en': 'Palau', 'es': 'Palaos', 'de': 'Palau', 'fr': 'Palaos', 'pt': 'Palau'},
+    'PY': {'it': 'Paraguay', 'en': 'Paraguay', 'es': 'Paraguay', 'de': 'Paraguay', 'fr': 'Paraguay', 'pt': 'Paraguai'},
+    'QA': {'it': 'Qatar', 'en': 'Qatar', 'es': 'Catar', 'de': 'Katar', 'fr': 'Qatar', 'pt': 'Catar'},
+    'RE': {'it': 'Riunione', 'en': 'Réunion', 'es': 'Reunión', 'de': 'Réunion', 'fr': 'Île de la Réunion', 'pt': 'Ilha Reunião'},
+    'RO': {'it': 'Romania', 'en': 'Romania', 'es': 'Rumanía', 'de': 'Rumänien', 'fr': 'Roumanie', 'pt': 'Roménia'},
+    'RS': {'it': 'Serbia', 'en': 'Serbia', 'es': 'Serbia', 'de': 'Serbien', 'fr': 'Serbie', 'pt': 'Sérvia'},
+    'RU': {'it': 'Russia', 'en': 'Russia', 'es': 'Federación Rusa', 'de': 'Russische Föderation', 'fr': 'Fédération de Russie', 'pt': 'Federação Russa'},
+    'RW': {'it': 'Ruanda', 'en': 'Rwanda', 'es': 'Ruanda', 'de': 'Ruanda', 'fr': 'Rwanda', 'pt': 'Ruanda'},
+    'SA': {'it': 'Arabia Saudita', 'en': 'Saudi Arabia', 'es': 'Arabia Saudí', 'de': 'Saudi-Arabien', 'fr': 'Arabie saoudite', 'pt': 'Arábia Saudita'},
+    'SB': {'it': 'Isole Salomone', 'en': 'Solomon Islands', 'es': 'Islas Salomón', 'de': 'Salomoninseln', 'fr': 'Îles Salomon', 'pt': 'Ilhas Salomão'},
+    'SC': {'it': 'Seychelles', 'en': 'Seychelles', 'es': 'Seychelles', 'de': 'Seychellen', 'fr': 'Seychelles', 'pt': 'Seychelles'},
+    'SD': {'it': 'Sudan', 'en': 'Sudan', 'es': 'Sudán', 'de': 'Sudan', 'fr': 'Soudan', 'pt': 'Sudão'},
+    'SE': {'it': 'Svezia', 'en': 'Sweden', 'es': 'Suecia', 'de': 'Schweden', 'fr': 'Suède', 'pt': 'Suécia'},
+    'SG': {'it': 'Singapore', 'en': 'Singapore', 'es': 'Singapur', 'de': 'Singapur', 'fr': 'Singapour', 'pt': 'Singapura'},
+    'SH': {'it': "Ascensione e Tristan da Cunha Sant'Elena", 'en': 'Saint Helena, Ascension and Tristan da Cunha', 'es': 'Ascensión y Tristán de Acuña Santa Elena', 'de': 'Ascension und Tristan da Cunha St. Helena', 'fr': 'Ascension et Tristan da Cunha Sainte-Hélène', 'pt': 'Ascensão e Tristão da Cunha Santa Helena'},
+    'SI': {'it': 'Slovenia', 'en': 'Slovenia', 'es': 'Eslovenia', 'de': 'Slowenien', 'fr': 'Slovénie', 'pt': 'Eslovénia'},
+    'SJ': {'it': 'Svalbard e Jan Mayen', 'en': 'Svalbard and Jan Mayen', 'es': 'Svalbard y Jan Mayen', 'de': 'Svalbard und Jan Mayen', 'fr': 'Svalbard et île Jan Mayen', 'pt': 'Svalbard e Jan Mayen'},
+    'SK': {'it': 'Slovacchia', 'en': 'Slovakia', 'es': 'Eslovaquia', 'de': 'Slowakei', 'fr': 'Slovaquie', 'pt': 'Eslováquia'},
+    'SL': {'it': 'Sierra Leone', 'en': 'Sierra Leone', 'es': 'Sierra Leona', 'de': 'Sierra Leone', 'fr': 'Sierra Leone', 'pt': 'Serra Leoa'},
+    'SM': {'it': 'San Marino', 'en': 'San Marino', 'es': 'San Marino', 'de': 'San Marino', 'fr': 'Saint-Marin', 'pt': 'San Marino'},
+    'SN': {'it': 'Senegal', 'en': 'Senegal', 'es': 'Senegal', 'de': 'Senegal', 'fr': 'Sénégal', 'pt': 'Senegal'},
+    'SO': {'it': 'Somalia', 'en': 'Somalia', 'es': 'Somalia', 'de': 'Somalia', 'fr': 'Somalie', 'pt': 'Somália'},
+    'SR': {'it': 'Suriname', 'en': 'Suriname', 'es': 'Surinám', 'de': 'Suriname', 'fr': 'Surinam', 'pt': 'Suriname'},
+    'SS': {'it': 'Sudan del sud', 'en': 'South Sudan', 'es': 'Sudán del Sur', 'de': 'Südsudan', 'fr': 'Soudan du Sud', 'pt': 'Sudão do Sul'},
+    'ST': {'it': 'São Tomé e Príncipe', 'en': 'Sao Tome and Principe', 'es': 'Santo Tomé y Príncipe', 'de': 'São Tomé und Príncipe', 'fr': 'Sao Tomé-et-Principe', 'pt': 'São Tomé e Príncipe'},
+    'SV': {'it': 'El Salvador', 'en': 'El Salvador', 'es': 'El Salvador', 'de': 'El Salvador', 'fr': 'Salvador', 'pt': 'El Salvador'},
+    'SX': {'it': 'Sint Maarten (Olanda)', 'en': 'Sint Maarten (Dutch part)', 'es': 'Isla de San Martín (zona holandsea)', 'de': 'Saint-Martin (Niederländischer Teil)', 'fr': 'Saint-Martin (partie néerlandaise)', 'pt': 'São Martinho (Países Baixos)'},
+    'SY': {'it': 'Siria', 'en': 'Syria', 'es': 'República árabe de Siria', 'de': 'Syrien', 'fr': 'République arabe Syrienne', 'pt': 'República Árabe Síria'},
+    'SZ': {'it': 'Eswatini', 'en': 'Eswatini', 'es': 'Esuatini', 'de': 'Eswatini', 'fr': 'Eswatini', 'pt': 'Suazilândia'},
+    'TC': {'it': 'Isole Turks e Caicos', 'en': 'Turks and Caicos Islands', 'es': 'Islas Turcas y Caicos', 'de': 'Turks- und Caicosinseln', 'fr': 'îles Turques-et-Caïques', 'pt': 'Ilhas Turcas e Caicos'},
+    'TD': {'it': 'Ciad', 'en': 'Chad', 'es': 'Chad', 'de': 'Tschad', 'fr': 'Tchad', 'pt': 'Chade'},
+    'TF': {'it': 'Territori francesi meridionali', 'en': 'French Southern Territories', 'es': 'Territorios Franceses del Sur', 'de': 'Französische Süd- und Antarktisgebiete', 'fr': 'Terres australes françaises', 'pt': 'Territórios Franceses do Sul'},
+    'TG': {'it': 'Togo', 'en': 'Togo', 'es': 'Togo', 'de': 'Togo', 'fr': 'Togo', 'pt': 'Togo'},
+    'TH': {'it': 'Thailandia', 'en': 'Thailand', 'es': 'Tailandia', 'de': 'Thailand', 'fr': 'Thaïlande', 'pt': 'Tailândia'},
+    'TJ': {'it': 'Tagikistan', 'en': 'Tajikistan', 'es': 'Tayikistán', 'de': 'Tadschikistan', 'fr': 'Tadjikistan', 'pt': 'Tajiquistão'},
+    'TK': {'it': 'Tokelau', 'en': 'Tokelau', 'es': 'Tokelau', 'de': 'Tokelau', 'fr': 'Tokelau', 'pt': 'Tokelau'},
+    'TL': {'it': 'Timor Est', 'en': 'Timor-Leste', 'es': 'Timor Oriental', 'de': 'Timor-Leste', 'fr': 'Timor oriental', 'pt': 'Timor-Leste'},
+    'TM': {'it': 'Turkmenistan', 'en': 'Turkmenistan', 'es': 'Turkmenistán', 'de': 'Turkmenistan', 'fr': 'Turkménistan', 'pt': 'Turquemenistão'},
+    'TN': {'it': 'Tunisia', 'en': 'Tunisia', 'es': 'Tunez', 'de': 'Tunesien', 'fr': 'Tunisie', 'pt': 'Tunísia'},
+    'TO': {'it': 'Tonga', 'en': 'Tonga', 'es': 'Tonga', 'de': 'Tonga', 'fr': 'Tonga', 'pt': 'Tonga'},
+    'TR': {'it': 'Turchia', 'en': 'Turkey', 'es': 'Turquía', 'de': 'Türkei', 'fr': 'Turquie', 'pt': 'Turquia'},
+    'TT': {'it': 'Trinidad e Tobago', 'en': 'Trinidad and Tobago', 'es': 'Trinidad y Tobago', 'de': 'Trinidad und Tobago', 'fr': 'Trinité-et-Tobago', 'pt': 'Trindade e Tobago'},
+    'TV': {'it': 'Tuvalu', 'en': 'Tuvalu', 'es': 'Tuvalu', 'de': 'Tuvalu', 'fr': 'Tuvalu', 'pt': 'Tuvalu'},
+    'TW': {'it': 'Taiwan', 'en': 'Taiwan', 'es': 'Taiwán', 'de': 'Taiwan', 'fr': 'Taïwan', 'pt': 'Taiwan'},
+    'TZ': {'it': 'Tanzania', 'en': 'Tanzania', 'es': 'Tanzania', 'de': 'Tansania', 'fr': 'Tanzanie', 'pt': 'Tanzânia'},
+    'UA': {'it': 'Ucraina', 'en': 'Ukraine', 'es': 'Ucrania', 'de': 'Ukraine', 'fr': 'Ukraine', 'pt': 'Ucrânia'},
+    'UG': {'it': 'Uganda', 'en': 'Uganda', 'es': 'Uganda', 'de': 'Uganda', 'fr': 'Ouganda', 'pt': 'Uganda'},
+    'UM': {'it': "Isole minori esterne degli Stati Uniti d'America", 'en': 'United States Minor Outlying Islands', 'es': 'Islas Ultramarinas Menores de Estados Unidos', 'de': 'United States Minor Outlying Islands', 'fr': 'Îles mineures éloignées des États-Unis', 'pt': 'Ilhas Menores Distantes dos Estados Unidos'},
+    'US': {'it': 'Stati Uniti', 'en': 'United States', 'es': 'Estados Unidos', 'de': 'Vereinigte Staaten', 'fr': 'États-Unis', 'pt': 'Estados Unidos'},
+    'UY': {'it': 'Uruguay', 'en': 'Uruguay', 'es': 'Uruguay', 'de': 'Uruguay', 'fr': 'Uruguay', 'pt': 'Uruguai'},
+    'UZ': {'it': 'Uzbekistan', 'en': 'Uzbekistan', 'es': 'Uzbekistán', 'de': 'Usbekistan', 'fr': 'Ouzbékistan', 'pt': 'Uzbequistão'},
+    'VA': {'it': 'Città del Vaticano', 'en': 'Vatican City', 'es': 'Ciudad del Vaticano', 'de': 'Vatikanstadt', 'fr': 'Vatican', 'pt': 'Vaticano'},
+    'VC': {'it': 'Saint Vincent e Grenadine', 'en': 'Saint Vincent and the Grenadines', 'es': 'San Vicente y las Granadinas', 'de': 'St. Vincent und die Grenadinen', 'fr': 'Saint-Vincent-et-les-Grenadines', 'pt': 'São Vicente e Granadinas'},
+    'VE': {'it': 'Venezuela', 'en': 'Venezuela', 'es': 'Venezuela', 'de': 'Venezuela', 'fr': 'Vénézuela', 'pt': 'Venezuela'},
+    'VG': {'it': 'Regno Unito Isole Vergini', 'en': 'Virgin Islands, British', 'es': 'Británicas Islas Vírgenes', 'de': 'Britische Jungferninseln', 'fr': 'Îles Vierges britanniques', 'pt': 'Britânicas Ilhas Virgens'},
+    'VI': {'it': 'U.S.A. Isole Vergini', 'en': 'Virgin Islands, U.S.', 'es': 'de EEUU Islas Vírgenes', 'de': 'Amerikanische Jungferninseln', 'fr': 'États-Unis Îles Vierges', 'pt': 'Estados Unidos Ilhas Virgens'},
+    'VN': {'it': 'Vietnam', 'en': 'Vietnam', 'es': 'Vietnam', 'de': 'Vietnam', 'fr': 'Viêt Nam', 'pt': 'Vietname'},
+    'VU': {'it': 'Vanuatu', 'en': 'Vanuatu', 'es': 'Vanuatu', 'de': 'Vanuatu', 'fr': 'Vanuatu', 'pt': 'Vanuatu'},
+    'WF': {'it': 'Wallis e Futuna', 'en': 'Wallis and Futuna', 'es': 'Wallis y Futuna', 'de': 'Wallis und Futuna', 'fr': 'Wallis et Futuna', 'pt': 'Wallis e Futuna'},
+    'WS': {'it': 'Samoa', 'en': 'Samoa', 'es': 'Samoa', 'de': 'Samoa', 'fr': 'Samoa', 'pt': 'Samoa'},
+    'YE': {'it': 'Yemen', 'en': 'Yemen', 'es': 'Yemen', 'de': 'Jemen', 'fr': 'Yémen', 'pt': 'Iémen'},
+    'YT': {'it': 'Mayotte', 'en': 'Mayotte', 'es': 'Mayotte', 'de': 'Mayotte', 'fr': 'Mayotte', 'pt': 'Mayotte'},
+    'ZA': {'it': 'Sudafrica', 'en': 'South Africa', 'es': 'Sudáfrica', 'de': 'Südafrika', 'fr': 'Afrique du Sud', 'pt': 'África do Sul'},
+    'ZM': {'it': 'Zambia', 'en': 'Zambia', 'es': 'Zambia', 'de': 'Sambia', 'fr': 'Zambie', 'pt': 'Zâmbia'},
+    'ZW': {'it': 'Zimbabwe', 'en': 'Zimbabwe', 'es': 'Zimbabue', 'de': 'Simbabwe', 'fr': 'Zimbabwe', 'pt': 'Zimbábue'},
+    'GB-ENG': {'it': 'Inghilterra', 'en': 'England', 'es': 'Inglaterra', 'de': 'England', 'fr': 'Angleterre', 'pt': 'Inglaterra'},
+    'GB-SCT': {'it': 'Scozia', 'en': 'Scotland', 'es': 'Escocia', 'de': 'Schottland', 'fr': 'Écosse', 'pt': 'Escócia'},
+    'GB-WLS': {'it': 'Galles', 'en': 'Wales', 'es': 'Gales', 'de': 'Wales', 'fr': 'Pays de Galles', 'pt': 'País de Gales'},
+    'GB-NIR': {'it': 'Irlanda del Nord', 'en': 'Northern Ireland', 'es': 'Irlanda del Norte', 'de': 'Nordirland', 'fr': 'Irlande du Nord', 'pt': 'Irlanda do Norte'},
+    'XK': {'it': 'Kosovo', 'en': 'Kosovo', 'es': 'Kosovo', 'de': 'Kosovo', 'fr': 'Kosovo', 'pt': 'Kosovo'},
+}
+
+# Nome in qualsiasi lingua (minuscolo, anche senza accenti) -> codice
+COUNTRY_ALIASES = {
+    'afeganistao': 'AF',
+    'afeganistão': 'AF',
+    'afganistan': 'AF',
+    'afganistán': 'AF',
+    'afghanistan': 'AF',
+    'africa do sul': 'ZA',
+    'afrique du sud': 'ZA',
+    'agypten': 'EG',
+    'aland islands': 'AX',
+    'aland, iles': 'AX',
+    'aland-inseln': 'AX',
+    'albania': 'AL',
+    'albanie': 'AL',
+    'albanien': 'AL',
+    'albânia': 'AL',
+    'alemanha': 'DE',
+    'alemania': 'DE',
+    'algeria': 'DZ',
+    'algerie': 'DZ',
+    'algerien': 'DZ',
+    'algérie': 'DZ',
+    'allemagne': 'DE',
+    'american samoa': 'AS',
+    'amerikanisch-samoa': 'AS',
+    'amerikanische jungferninseln': 'VI',
+    'andorra': 'AD',
+    'andorre': 'AD',
+    'angleterre': 'GB-ENG',
+    'angola': 'AO',
+    'anguila': 'AI',
+    'anguilla': 'AI',
+    'antarctica': 'AQ',
+    'antarctique': 'AQ',
+    'antarktis': 'AQ',
+    'antartida': 'AQ',
+    'antartide': 'AQ',
+    'antigua and barbuda': 'AG',
+    'antigua e barbuda': 'AG',
+    'antigua und barbuda': 'AG',
+    'antigua y barbuda': 'AG',
+    'antigua-et-barbuda': 'AG',
+    'antártida': 'AQ',
+    'antígua e barbuda': 'AG',
+    'aquatorialguinea': 'GQ',
+    'arab republic of egypt': 'EG',
+    'arabia saudi': 'SA',
+    'arabia saudita': 'SA',
+    'arabia saudí': 'SA',
+    'arabie saoudite': 'SA',
+    'arabische republik syrien': 'SY',
+    'argelia': 'DZ',
+    'argentina': 'AR',
+    'argentine': 'AR',
+    'argentine republic': 'AR',
+    'argentinien': 'AR',
+    'argélia': 'DZ',
+    'armenia': 'AM',
+    'armenie': 'AM',
+    'armenien': 'AM',
+    'arménia': 'AM',
+    'arménie': 'AM',
+    'armênia': 'AM',
+    'aruba': 'AW',
+    'arábia saudita': 'SA',
+    'ascensao e tristao da cunha santa helena': 'SH',
+    'ascension and tristan da cunha saint helena': 'SH',
+    'ascension et tristan da cunha sainte-helene': 'SH',
+    'ascension et tristan da cunha sainte-hélène': 'SH',
+    'ascension und tristan da cunha st. helena': 'SH',
+    'ascension y tristan de acuna santa elena': 'SH',
+    "ascensione e tristan da cunha sant'elena": 'SH',
+    'ascensión y tristán de acuña santa elena': 'SH',
+    'ascensão e tristão da cunha santa helena': 'SH',
+    'aserbaidschan': 'AZ',
+    'athiopien': 'ET',
+    'australia': 'AU',
+    'australie': 'AU',
+    'australien': 'AU',
+    'austria': 'AT',
+    'austrália': 'AU',
+    'autriche': 'AT',
+    'azerbaidjan': 'AZ',
+    'azerbaidjao': 'AZ',
+    'azerbaidjão': 'AZ',
+    'azerbaigian': 'AZ',
+    'azerbaijan': 'AZ',
+    'azerbaijao': 'AZ',
+    'azerbaijão': 'AZ',
+    'azerbaiyan': 'AZ',
+    'azerbaiyán': 'AZ',
+    'azerbaïdjan': 'AZ',
+    'bahamas': 'BS',
+    'bahrain': 'BH',
+    'bahrein': 'BH',
+    'bahreïn': 'BH',
+    'bangladeche': 'BD',
+    'banglades': 'BD',
+    'bangladesch': 'BD',
+    'bangladesh': 'BD',
+    'bangladés': 'BD',
+    'barbade': 'BB',
+    'barbados': 'BB',
+    'barein': 'BH',
+    'barem': 'BH',
+    'baréin': 'BH',
+    'barém': 'BH',
+    'belarus': 'BY',
+    'belgica': 'BE',
+    'belgien': 'BE',
+    'belgio': 'BE',
+    'belgique': 'BE',
+    'belgium': 'BE',
+    'belice': 'BZ',
+    'belize': 'BZ',
+    'benim': 'BJ',
+    'benin': 'BJ',
+    'benín': 'BJ',
+    'bermuda': 'BM',
+    'bermudas': 'BM',
+    'bermudes': 'BM',
+    'bhoutan': 'BT',
+    'bhutan': 'BT',
+    'bielo-russia': 'BY',
+    'bielo-rússia': 'BY',
+    'bielorrusia': 'BY',
+    'bielorussia': 'BY',
+    'bielorússia': 'BY',
+    'birmania': 'MM',
+    'birmanie': 'MM',
+    'birmânia': 'MM',
+    'bolivarian republic of venezuela': 'VE',
+    'bolivarische republik venezuela': 'VE',
+    'bolivia': 'BO',
+    'bolivia, estado plurinacional da': 'BO',
+    'bolivia, estado plurinacional de': 'BO',
+    'bolivia, plurinational state of': 'BO',
+    'bolivia, stato plurinazionale della': 'BO',
+    'bolivie': 'BO',
+    'bolivie, etat plurinational de': 'BO',
+    'bolivie, état plurinational de': 'BO',
+    'bolivien': 'BO',
+    'bolivien, plurinationaler staat': 'BO',
+    'bolívia': 'BO',
+    'bolívia, estado plurinacional da': 'BO',
+    'bonaire, saba e santo eustaquio': 'BQ',
+    'bonaire, saba e santo eustáquio': 'BQ',
+    'bonaire, saint-eustache et saba': 'BQ',
+    'bonaire, santo eustaquio e saba': 'BQ',
+    'bonaire, santo eustáquio e saba': 'BQ',
+    'bonaire, sint eustatius and saba': 'BQ',
+    'bonaire, sint eustatius und saba': 'BQ',
+    'bosnia and herzegovina': 'BA',
+    'bosnia e herzegovina': 'BA',
+    'bosnia ed erzegovina': 'BA',
+    'bosnia y herzegovina': 'BA',
+    'bosnia-erzegovina': 'BA',
+    'bosnia-herzegovina': 'BA',
+    'bosnie-herzegovine': 'BA',
+    'bosnie-herzégovine': 'BA',
+    'bosnien und herzegowina': 'BA',
+    'botsuana': 'BW',
+    'botswana': 'BW',
+    'bouvet island': 'BV',
+    'bouvet-insel': 'BV',
+    'brasil': 'BR',
+    'brasile': 'BR',
+    'brasilien': 'BR',
+    'brazil': 'BR',
+    'bresil': 'BR',
+    'britanicas ilhas virgens': 'VG',
+    'britanicas islas virgenes': 'VG',
+    'britische jungferninseln': 'VG',
+    'britisches territorium im indischen ozean': 'IO',
+    'british indian ocean territory': 'IO',
+    'british virgin islands': 'VG',
+    'británicas islas vírgenes': 'VG',
+    'britânicas ilhas virgens': 'VG',
+    'brunei': 'BN',
+    'brunei darussalam': 'BN',
+    'brunéi darussalam': 'BN',
+    'brésil': 'BR',
+    'bulgaria': 'BG',
+    'bulgarie': 'BG',
+    'bulgarien': 'BG',
+    'bulgária': 'BG',
+    'burkina faso': 'BF',
+    'burquina': 'BF',
+    'burquina faso': 'BF',
+    'burundi': 'BI',
+    'butan': 'BT',
+    'butao': 'BT',
+    'bután': 'BT',
+    'butão': 'BT',
+    'bélarus': 'BY',
+    'bélgica': 'BE',
+    'bénin': 'BJ',
+    'bósnia e herzegovina': 'BA',
+    'bósnia-herzegóvina': 'BA',
+    'cabo verde': 'CV',
+    'camaroes': 'CM',
+    'camarões': 'CM',
+    'cambodge': 'KH',
+    'cambodia': 'KH',
+    'cambogia': 'KH',
+    'camboja': 'KH',
+    'camboya': 'KH',
+    'cameroon': 'CM',
+    'cameroun': 'CM',
+    'camerun': 'CM',
+    'camerún': 'CM',
+    'canada': 'CA',
+    'canadá': 'CA',
+    'cap-vert': 'CV',
+    'cape verde': 'CV',
+    'capo verde': 'CV',
+    'catar': 'QA',
+    'cayman islands': 'KY',
+    'cayman-inseln': 'KY',
+    'cazaquistao': 'KZ',
+    'cazaquistão': 'KZ',
+    'cechia': 'CZ',
+    'central african republic': 'CF',
+    'chad': 'TD',
+    'chade': 'TD',
+    'chequia': 'CZ',
+    'chile': 'CL',
+    'chili': 'CL',
+    'china': 'CN',
+    'chine': 'CN',
+    'chinese taipei': 'TW',
+    'chinesische provinz taiwan': 'TW',
+    'chipre': 'CY',
+    'christmas island': 'CX',
+    'christmas, ile': 'CX',
+    'christmas, île': 'CX',
+    'chypre': 'CY',
+    'chéquia': 'CZ',
+    'ciad': 'TD',
+    'cile': 'CL',
+    'cina': 'CN',
+    'cingapura': 'SG',
+    'cipro': 'CY',
+    'cocos (keeling) islands': 'CC',
+    'cocos (keeling), iles': 'CC',
+    'cocos (keeling), îles': 'CC',
+    'colombia': 'CO',
+    'colombie': 'CO',
+    'colômbia': 'CO',
+    'commonwealth of dominica': 'DM',
+    'commonwealth of the bahamas': 'BS',
+    'commonwealth of the northern mariana islands': 'MP',
+    'comore': 'KM',
+    'comores': 'KM',
+    'comores, islas': 'KM',
+    'comoros': 'KM',
+    'congo': 'CG',
+    'congo dr': 'CD',
+    'congo, republica democratica del': 'CD',
+    'congo, republica democratica do': 'CD',
+    'congo, república democrática del': 'CD',
+    'congo, república democrática do': 'CD',
+    'congo, the democratic republic of the': 'CD',
+    'cook islands': 'CK',
+    'cookinseln': 'CK',
+    'corea del nord': 'KP',
+    'corea del norte': 'KP',
+    'corea del sud': 'KR',
+    'corea del sur': 'KR',
+    'corea, republica de': 'KR',
+    'corea, republica democratica popular de': 'KP',
+    'corea, república de': 'KR',
+    'corea, república democrática popular de': 'KP',
+    'coree du nord': 'KP',
+    'coree du sud': 'KR',
+    'coree, republique de': 'KR',
+    'coree, republique populaire democratique de': 'KP',
+    'coreia do norte': 'KP',
+    'coreia do sul': 'KR',
+    'coreia, republica da': 'KR',
+    'coreia, republica popular democratica da': 'KP',
+    'coreia, república da': 'KR',
+    'coreia, república popular democrática da': 'KP',
+    'corée du nord': 'KP',
+    'corée du sud': 'KR',
+    'corée, république de': 'KR',
+    'corée, république populaire démocratique de': 'KP',
+    "costa d'avorio": 'CI',
+    'costa de marfil': 'CI',
+    'costa de marfíl': 'CI',
+    'costa do marfim': 'CI',
+    'costa rica': 'CR',
+    "cote d'ivoire": 'CI',
+    'croacia': 'HR',
+    'croatia': 'HR',
+    'croatie': 'HR',
+    'croazia': 'HR',
+    'croácia': 'HR',
+    'cuba': 'CU',
+    'curacao': 'CW',
+    'curazao': 'CW',
+    'curaçao': 'CW',
+    'curação': 'CW',
+    'cyprus': 'CY',
+    'czech republic': 'CZ',
+    'czechia': 'CZ',
+    "côte d'ivoire": 'CI',
+    'danemark': 'DK',
+    'danimarca': 'DK',
+    'de eeuu islas virgenes': 'VI',
+    'de eeuu islas vírgenes': 'VI',
+    "democratic people's republic of korea": 'KP',
+    'democratic republic of sao tome and principe': 'ST',
+    'democratic republic of timor-leste': 'TL',
+    'democratic socialist republic of sri lanka': 'LK',
+    'demokratische republik kongo': 'CD',
+    'demokratische volksrepublik korea': 'KP',
+    'demokratische volksrepublik laos': 'LA',
+    'denmark': 'DK',
+    'deutschland': 'DE',
+    'dinamarca': 'DK',
+    'djibouti': 'DJ',
+    'djibuti': 'DJ',
+    'dominica': 'DM',
+    'dominican republic': 'DO',
+    'dominikanische republik': 'DO',
+    'dominique': 'DM',
+    'domínica': 'DM',
+    'dr congo': 'CD',
+    'dschibuti': 'DJ',
+    'dänemark': 'DK',
+    'eastern republic of uruguay': 'UY',
+    'ecosse': 'GB-SCT',
+    'ecuador': 'EC',
+    'egipto': 'EG',
+    'egito': 'EG',
+    'egitto': 'EG',
+    'egypt': 'EG',
+    'egypte': 'EG',
+    'el salvador': 'SV',
+    'elfenbeinkuste': 'CI',
+    'elfenbeinküste': 'CI',
+    'emirados arabes unidos': 'AE',
+    'emirados árabes unidos': 'AE',
+    'emirati arabi uniti': 'AE',
+    'emiratos arabes unidos': 'AE',
+    'emiratos árabes unidos': 'AE',
+    'emirats arabes unis': 'AE',
+    'england': 'GB-ENG',
+    'equador': 'EC',
+    'equateur': 'EC',
+    'equatorial guinea': 'GQ',
+    'eritrea': 'ER',
+    'eritreia': 'ER',
+    'eritréia': 'ER',
+    'erythree': 'ER',
+    'escocia': 'GB-SCT',
+    'escócia': 'GB-SCT',
+    'eslovaquia': 'SK',
+    'eslovenia': 'SI',
+    'eslováquia': 'SK',
+    'eslovénia': 'SI',
+    'eslovênia': 'SI',
+    'espagne': 'ES',
+    'espana': 'ES',
+    'espanha': 'ES',
+    'españa': 'ES',
+    'estado da palestina': 'PS',
+    'estado de palestina': 'PS',
+    'estado plurinacional da bolivia': 'BO',
+    'estado plurinacional da bolívia': 'BO',
+    'estado plurinacional de bolivia': 'BO',
+    'estados federados da micronesia': 'FM',
+    'estados federados da micronésia': 'FM',
+    'estados federados de micronesia': 'FM',
+    'estados unidos': 'US',
+    'estados unidos ilhas virgens': 'VI',
+    'estland': 'EE',
+    'estonia': 'EE',
+    'estonie': 'EE',
+    'estónia': 'EE',
+    'estônia': 'EE',
+    'esuatini': 'SZ',
+    'eswatini': 'SZ',
+    'etat de palestine': 'PS',
+    'etat plurinational de bolivie': 'BO',
+    'etats federes de micronesie': 'FM',
+    'etats-unis': 'US',
+    'etats-unis iles vierges': 'VI',
+    'ethiopia': 'ET',
+    'ethiopie': 'ET',
+    'etiopia': 'ET',
+    'etiopía': 'ET',
+    'etiópia': 'ET',
+    'falkland islands (malvinas)': 'FK',
+    'falklandinseln (malwinen)': 'FK',
+    'faroe islands': 'FO',
+    'faroer-inseln': 'FO',
+    'federacao russa': 'RU',
+    'federacion rusa': 'RU',
+    'federación rusa': 'RU',
+    'federal democratic republic of ethiopia': 'ET',
+    'federal democratic republic of nepal': 'NP',
+    'federal republic of germany': 'DE',
+    'federal republic of nigeria': 'NG',
+    'federal republic of somalia': 'SO',
+    'federated states of micronesia': 'FM',
+    'federation de russie': 'RU',
+    'federative republic of brazil': 'BR',
+    'federação russa': 'RU',
+    'fidji': 'FJ',
+    'fidschi': 'FJ',
+    'figi': 'FJ',
+    'fiji': 'FJ',
+    'filipinas': 'PH',
+    'filippine': 'PH',
+    'finland': 'FI',
+    'finlande': 'FI',
+    'finlandia': 'FI',
+    'finlândia': 'FI',
+    'finnland': 'FI',
+    'fiyi': 'FJ',
+    'foderierte staaten von mikronesien': 'FM',
+    'franca': 'FR',
+    'france': 'FR',
+    'francia': 'FR',
+    'frankreich': 'FR',
+    'franzosisch-guyana': 'GF',
+    'franzosisch-polynesien': 'PF',
+    'franzosische sud- und antarktisgebiete': 'TF',
+    'französisch-guyana': 'GF',
+    'französisch-polynesien': 'PF',
+    'französische süd- und antarktisgebiete': 'TF',
+    'frança': 'FR',
+    'french guiana': 'GF',
+    'french polynesia': 'PF',
+    'french republic': 'FR',
+    'french southern territories': 'TF',
+    'färöer-inseln': 'FO',
+    'fédération de russie': 'RU',
+    'föderierte staaten von mikronesien': 'FM',
+    'gabao': 'GA',
+    'gabon': 'GA',
+    'gabonese republic': 'GA',
+    'gabun': 'GA',
+    'gabão': 'GA',
+    'gabón': 'GA',
+    'gales': 'GB-WLS',
+    'galles': 'GB-WLS',
+    'gambia': 'GM',
+    'gambie': 'GM',
+    'gana': 'GH',
+    'georgia': 'GE',
+    'georgia del sud e isole sandwich australi': 'GS',
+    'georgia do sul e ilhas sandwich do sul': 'GS',
+    'georgie': 'GE',
+    'georgie du sud et les iles sandwich du sud': 'GS',
+    'georgien': 'GE',
+    'germania': 'DE',
+    'germany': 'DE',
+    'geórgia': 'GE',
+    'geórgia do sul e ilhas sandwich do sul': 'GS',
+    'ghana': 'GH',
+    'giamaica': 'JM',
+    'giappone': 'JP',
+    'gibilterra': 'GI',
+    'gibraltar': 'GI',
+    'gibuti': 'DJ',
+    'giordania': 'JO',
+    'gran bretagna': 'GB',
+    'granada': 'GD',
+    'grand duchy of luxembourg': 'LU',
+    'great britain': 'GB',
+    'grece': 'GR',
+    'grecia': 'GR',
+    'greece': 'GR',
+    'greenland': 'GL',
+    'grenada': 'GD',
+    'grenade': 'GD',
+    'griechenland': 'GR',
+    'groenland': 'GL',
+    'groenlandia': 'GL',
+    'groenlândia': 'GL',
+    'gronelandia': 'GL',
+    'gronelândia': 'GL',
+    'gronland': 'GL',
+    'groënland': 'GL',
+    'grèce': 'GR',
+    'grécia': 'GR',
+    'grönland': 'GL',
+    'guadalupa': 'GP',
+    'guadalupe': 'GP',
+    'guadeloupe': 'GP',
+    'guam': 'GU',
+    'guatemala': 'GT',
+    'guayana francesa': 'GF',
+    'guernesey': 'GG',
+    'guernsey': 'GG',
+    'guiana': 'GY',
+    'guiana francesa': 'GF',
+    'guine': 'GN',
+    'guine equatorial': 'GQ',
+    'guine-bissau': 'GW',
+    'guinea': 'GN',
+    'guinea ecuatorial': 'GQ',
+    'guinea equatoriale': 'GQ',
+    'guinea-bisau': 'GW',
+    'guinea-bissau': 'GW',
+    'guinea-bisáu': 'GW',
+    'guinee': 'GN',
+    'guinee equatoriale': 'GQ',
+    'guinee-bissau': 'GW',
+    'guiné': 'GN',
+    'guiné equatorial': 'GQ',
+    'guiné-bissau': 'GW',
+    'guiné-bissáu': 'GW',
+    'guinée': 'GN',
+    'guinée équatoriale': 'GQ',
+    'guinée-bissau': 'GW',
+    'guyana': 'GY',
+    'guyana francese': 'GF',
+    'guyane francaise': 'GF',
+    'guyane française': 'GF',
+    'gâmbia': 'GM',
+    'géorgie': 'GE',
+    'géorgie du sud et les îles sandwich du sud': 'GS',
+    'haiti': 'HT',
+    'haití': 'HT',
+    'hashemite kingdom of jordan': 'JO',
+    'haïti': 'HT',
+    'heard island and mcdonald islands': 'HM',
+    'heard und mcdonaldinseln': 'HM',
+    'heiliger stuhl (staat vatikanstadt)': 'VA',
+    'hellenic republic': 'GR',
+    'holanda': 'NL',
+    'holy see (vatican city state)': 'VA',
+    'honduras': 'HN',
+    'hong kong': 'HK',
+    'hong kong special administrative region of china': 'HK',
+    'hongkong': 'HK',
+    'hongrie': 'HU',
+    'hungary': 'HU',
+    'hungria': 'HU',
+    'hungría': 'HU',
+    'iceland': 'IS',
+    'iemen': 'YE',
+    'ile bouvet': 'BV',
+    'ile christmas': 'CX',
+    'ile de la reunion': 'RE',
+    'ile de man': 'IM',
+    'ile norfolk': 'NF',
+    'iles (falkland) malouines': 'FK',
+    'iles aland': 'AX',
+    'iles caimans': 'KY',
+    'iles cocos (keeling)': 'CC',
+    'iles cook': 'CK',
+    'iles feroe': 'FO',
+    'iles heard-et-macdonald': 'HM',
+    'iles mariannes du nord': 'MP',
+    'iles marshall': 'MH',
+    'iles mineures eloignees des etats-unis': 'UM',
+    'iles pitcairn': 'PN',
+    'iles salomon': 'SB',
+    'iles turques-et-caiques': 'TC',
+    'iles vierges britanniques': 'VG',
+    'iles vierges, etats-unis': 'VI',
+    'ilha bouvet': 'BV',
+    'ilha christmas': 'CX',
+    'ilha de man': 'IM',
+    'ilha heard e ilhas mcdonald': 'HM',
+    'ilha natal': 'CX',
+    'ilha norfolk': 'NF',
+    'ilha reuniao': 'RE',
+    'ilha reunião': 'RE',
+    'ilhas aland': 'AX',
+    'ilhas alanda': 'AX',
+    'ilhas caimao': 'KY',
+    'ilhas caimão': 'KY',
+    'ilhas cayman': 'KY',
+    'ilhas cocos': 'CC',
+    'ilhas cook': 'CK',
+    'ilhas falkland (malvinas)': 'FK',
+    'ilhas faroe': 'FO',
+    'ilhas faroé': 'FO',
+    'ilhas georgia do sul e sandwich do sul': 'GS',
+    'ilhas geórgia do sul e sandwich do sul': 'GS',
+    'ilhas malvinas (falkland)': 'FK',
+    'ilhas marianas do norte': 'MP',
+    'ilhas marshall': 'MH',
+    'ilhas menores distantes dos estados unidos': 'UM',
+    'ilhas salomao': 'SB',
+    'ilhas salomão': 'SB',
+    'ilhas turcas e caicos': 'TC',
+    'ilhas turks e caicos': 'TC',
+    'ilhas virgens britanicas': 'VG',
+    'ilhas virgens britânicas': 'VG',
+    'ilhas virgens dos estados unidos': 'VI',
+    'ilhas virgens, britanicas': 'VG',
+    'ilhas virgens, britânicas': 'VG',
+    'ilhas virgens, estados unidos': 'VI',
+    'ilhas åland': 'AX',
+    'inde': 'IN',
+    'independent state of papua new guinea': 'PG',
+    'independent state of samoa': 'WS',
+    'india': 'IN',
+    'indien': 'IN',
+    'indonesia': 'ID',
+    'indonesie': 'ID',
+    'indonesien': 'ID',
+    'indonésia': 'ID',
+    'indonésie': 'ID',
+    'inghilterra': 'GB-ENG',
+    'inglaterra': 'GB-ENG',
+    'insel man': 'IM',
+    'ira, republica islamica do': 'IR',
+    'irak': 'IQ',
+    'iran': 'IR',
+    'iran, islamic republic of': 'IR',
+    'iran, islamische republik': 'IR',
+    'iran, republica islamica de': 'IR',
+    "iran, republique islamique d'": 'IR',
+    "iran, république islamique d'": 'IR',
+    'irao, republica islamica do': 'IR',
+    'iraq': 'IQ',
+    'iraque': 'IQ',
+    'ireland': 'IE',
+    'irland': 'IE',
+    'irlanda': 'IE',
+    'irlanda del nord': 'GB-NIR',
+    'irlanda del norte': 'GB-NIR',
+    'irlanda do norte': 'GB-NIR',
+    'irlande': 'IE',
+    'irlande du nord': 'GB-NIR',
+    'irán, república islámica de': 'IR',
+    'irã, república islâmica do': 'IR',
+    'irão, república islâmica do': 'IR',
+    'isla bouvet': 'BV',
+    'isla de man': 'IM',
+    'isla de navidad': 'CX',
+    'isla de san martin (zona holandsea)': 'SX',
+    'isla de san martín (zona holandsea)': 'SX',
+    'isla norfolk': 'NF',
+    'islamic republic of afghanistan': 'AF',
+    'islamic republic of iran': 'IR',
+    'islamic republic of mauritania': 'MR',
+    'islamic republic of pakistan': 'PK',
+    'islamische republik iran': 'IR',
+    'island': 'IS',
+    'islanda': 'IS',
+    'islande': 'IS',
+    'islandia': 'IS',
+    'islas aland': 'AX',
+    'islas bermudas': 'BM',
+    'islas bes (caribe neerlandes)': 'BQ',
+    'islas bes (caribe neerlandés)': 'BQ',
+    'islas caiman': 'KY',
+    'islas caimán': 'KY',
+    'islas cocos (keeling)': 'CC',
+    'islas comores': 'KM',
+    'islas cook': 'CK',
+    'islas falkland (malvinas)': 'FK',
+    'islas feroe': 'FO',
+    'islas georgias del sur y sandwich del sur': 'GS',
+    'islas georgias del sur y sándwich del sur': 'GS',
+    'islas heard y mcdonald': 'HM',
+    'islas maldivas': 'MV',
+    'islas marianas del norte': 'MP',
+    'islas marshall': 'MH',
+    'islas salomon': 'SB',
+    'islas salomón': 'SB',
+    'islas turcas y caicos': 'TC',
+    'islas ultramarinas menores de estados unidos': 'UM',
+    'islas virgenes, britanicas': 'VG',
+    'islas virgenes, de eeuu': 'VI',
+    'islas vírgenes, británicas': 'VG',
+    'islas vírgenes, de eeuu': 'VI',
+    'islas äland': 'AX',
+    'isle of man': 'IM',
+    'islândia': 'IS',
+    'isola bouvet': 'BV',
+    'isola di man': 'IM',
+    'isola di natale': 'CX',
+    'isola norfolk': 'NF',
+    'isole aland': 'AX',
+    'isole cayman': 'KY',
+    'isole cocos (keeling)': 'CC',
+    'isole cook': 'CK',
+    'isole falkland (malvine)': 'FK',
+    'isole fær øer': 'FO',
+    'isole heard e mcdonald': 'HM',
+    'isole marianne settentrionali': 'MP',
+    'isole marshall': 'MH',
+    "isole minori esterne degli stati uniti d'america": 'UM',
+    'isole salomone': 'SB',
+    'isole turks e caicos': 'TC',
+    'isole vergini, regno unito': 'VG',
+    'isole vergini, u.s.a.': 'VI',
+    'isole åland': 'AX',
+    'israel': 'IL',
+    'israele': 'IL',
+    'israël': 'IL',
+    'italia': 'IT',
+    'italian republic': 'IT',
+    'italie': 'IT',
+    'italien': 'IT',
+    'italy': 'IT',
+    'itália': 'IT',
+    'ivory coast': 'CI',
+    'iémen': 'YE',
+    'iêmen': 'YE',
+    'jamaica': 'JM',
+    'jamaika': 'JM',
+    'jamaique': 'JM',
+    'jamaïque': 'JM',
+    'japan': 'JP',
+    'japao': 'JP',
+    'japon': 'JP',
+    'japão': 'JP',
+    'japón': 'JP',
+    'jemen': 'YE',
+    'jersey': 'JE',
+    'jordan': 'JO',
+    'jordania': 'JO',
+    'jordanie': 'JO',
+    'jordanien': 'JO',
+    'jordânia': 'JO',
+    'kambodscha': 'KH',
+    'kamerun': 'CM',
+    'kanada': 'CA',
+    'kap verde': 'CV',
+    'kasachstan': 'KZ',
+    'katar': 'QA',
+    'kazajistan': 'KZ',
+    'kazajistán': 'KZ',
+    'kazakhstan': 'KZ',
+    'kazakistan': 'KZ',
+    'kenia': 'KE',
+    'kenya': 'KE',
+    'kingdom of bahrain': 'BH',
+    'kingdom of belgium': 'BE',
+    'kingdom of bhutan': 'BT',
+    'kingdom of cambodia': 'KH',
+    'kingdom of denmark': 'DK',
+    'kingdom of eswatini': 'SZ',
+    'kingdom of lesotho': 'LS',
+    'kingdom of morocco': 'MA',
+    'kingdom of norway': 'NO',
+    'kingdom of saudi arabia': 'SA',
+    'kingdom of spain': 'ES',
+    'kingdom of sweden': 'SE',
+    'kingdom of thailand': 'TH',
+    'kingdom of the netherlands': 'NL',
+    'kingdom of tonga': 'TO',
+    'kirghizistan': 'KG',
+    'kirgisistan': 'KG',
+    'kirguistan': 'KG',
+    'kirguistán': 'KG',
+    'kiribati': 'KI',
+    'kokos-(keeling-)inseln': 'CC',
+    'kolumbien': 'CO',
+    'komoren': 'KM',
+    'kongo': 'CG',
+    "korea, democratic people's republic of": 'KP',
+    'korea, demokratische volksrepublik': 'KP',
+    'korea, north': 'KP',
+    'korea, republic of': 'KR',
+    'korea, republik': 'KR',
+    'korea, south': 'KR',
+    'kosovo': 'XK',
+    'koweit': 'KW',
+    'koweït': 'KW',
+    'kroatien': 'HR',
+    'kuba': 'CU',
+    'kuwait': 'KW',
+    'kyrgyz republic': 'KG',
+    'kyrgyzstan': 'KG',
+    "lao people's democratic republic": 'LA',
+    'lao, republique democratique populaire': 'LA',
+    'lao, république démocratique populaire': 'LA',
+    'laos': 'LA',
+    'laos, demokratische volksrepublik': 'LA',
+    'latvia': 'LV',
+    'lebanese republic': 'LB',
+    'lebanon': 'LB',
+    'lesotho': 'LS',
+    'lesoto': 'LS',
+    'letonia': 'LV',
+    'lettland': 'LV',
+    'lettonia': 'LV',
+    'lettonie': 'LV',
+    'letónia': 'LV',
+    'letônia': 'LV',
+    'liban': 'LB',
+    'libano': 'LB',
+    'libanon': 'LB',
+    'liberia': 'LR',
+    'libia': 'LY',
+    'libya': 'LY',
+    'libye': 'LY',
+    'libyen': 'LY',
+    'libéria': 'LR',
+    'liechtenstein': 'LI',
+    'litauen': 'LT',
+    'lithuania': 'LT',
+    'lituania': 'LT',
+    'lituanie': 'LT',
+    'lituânia': 'LT',
+    'lussemburgo': 'LU',
+    'luxembourg': 'LU',
+    'luxemburg': 'LU',
+    'luxemburgo': 'LU',
+    'líbano': 'LB',
+    'líbia': 'LY',
+    'macao': 'MO',
+    'macao special administrative region of china': 'MO',
+    'macau': 'MO',
+    'macedoine du nord': 'MK',
+    'macedonia': 'MK',
+    'macedonia del nord': 'MK',
+    'macedonia del norte': 'MK',
+    'macedonia do norte': 'MK',
+    'macedónia do norte': 'MK',
+    'macedônia do norte': 'MK',
+    'macédoine du nord': 'MK',
+    'madagascar': 'MG',
+    'madagaskar': 'MG',
+    'madagáscar': 'MG',
+    'maiote': 'YT',
+    'malaisie': 'MY',
+    'malasia': 'MY',
+    'malaui': 'MW',
+    'malawi': 'MW',
+    'malaysia': 'MY',
+    'maldivas': 'MV',
+    'maldive': 'MV',
+    'maldives': 'MV',
+    'malediven': 'MV',
+    'mali': 'ML',
+    'malouines, iles (falkland)': 'FK',
+    'malouines, îles (falkland)': 'FK',
+    'malta': 'MT',
+    'malte': 'MT',
+    'malásia': 'MY',
+    'malí': 'ML',
+    'maroc': 'MA',
+    'marocco': 'MA',
+    'marokko': 'MA',
+    'marrocos': 'MA',
+    'marruecos': 'MA',
+    'marshall islands': 'MH',
+    'marshallinseln': 'MH',
+    'martinica': 'MQ',
+    'martinique': 'MQ',
+    'mauretanien': 'MR',
+    'maurice': 'MU',
+    'mauricia': 'MU',
+    'mauricio': 'MU',
+    'mauritania': 'MR',
+    'mauritanie': 'MR',
+    'mauritius': 'MU',
+    'mauritânia': 'MR',
+    'maurizio': 'MU',
+    'maurícia': 'MU',
+    'maurício': 'MU',
+    'mayotte': 'YT',
+    'messico': 'MX',
+    'mexico': 'MX',
+    'mexiko': 'MX',
+    'mexique': 'MX',
+    'micronesia': 'FM',
+    'micronesia, estados federados da': 'FM',
+    'micronesia, estados federados de': 'FM',
+    'micronesia, federated states of': 'FM',
+    'micronesie, etats federes de': 'FM',
+    'micronésia, estados federados da': 'FM',
+    'micronésie, états fédérés de': 'FM',
+    'mikronesien, foderierte staaten von': 'FM',
+    'mikronesien, föderierte staaten von': 'FM',
+    'mocambique': 'MZ',
+    'moldau': 'MD',
+    'moldau, republik': 'MD',
+    'moldavia': 'MD',
+    'moldavia, republica da': 'MD',
+    'moldavia, republica de': 'MD',
+    'moldavia, república de': 'MD',
+    'moldavie': 'MD',
+    'moldova': 'MD',
+    'moldova, republic of': 'MD',
+    'moldova, republique de': 'MD',
+    'moldova, république de': 'MD',
+    'moldávia': 'MD',
+    'moldávia, república da': 'MD',
+    'monaco': 'MC',
+    'mongolei': 'MN',
+    'mongolia': 'MN',
+    'mongolie': 'MN',
+    'mongólia': 'MN',
+    'monserrate': 'MS',
+    'montenegro': 'ME',
+    'montserrat': 'MS',
+    'monténégro': 'ME',
+    'morocco': 'MA',
+    'mosambik': 'MZ',
+    'mozambico': 'MZ',
+    'mozambique': 'MZ',
+    'moçambique': 'MZ',
+    'myanmar': 'MM',
+    'méxico': 'MX',
+    'mónaco': 'MC',
+    'mônaco': 'MC',
+    'namibia': 'NA',
+    'namibie': 'NA',
+    'namíbia': 'NA',
+    'nauru': 'NR',
+    'nepal': 'NP',
+    'netherlands': 'NL',
+    'neukaledonien': 'NC',
+    'neuseeland': 'NZ',
+    'new caledonia': 'NC',
+    'new zealand': 'NZ',
+    'nicaragua': 'NI',
+    'nicarágua': 'NI',
+    'niederlande': 'NL',
+    'niger': 'NE',
+    'nigeria': 'NG',
+    'nigéria': 'NG',
+    'nioue': 'NU',
+    'niue': 'NU',
+    'nordirland': 'GB-NIR',
+    'nordkorea': 'KP',
+    'nordliche marianen': 'MP',
+    'nordmazedonien': 'MK',
+    'norfolk island': 'NF',
+    'norfolkinsel': 'NF',
+    'north korea': 'KP',
+    'north macedonia': 'MK',
+    'northern ireland': 'GB-NIR',
+    'northern mariana islands': 'MP',
+    'noruega': 'NO',
+    'norvege': 'NO',
+    'norvegia': 'NO',
+    'norvège': 'NO',
+    'norway': 'NO',
+    'norwegen': 'NO',
+    'nouvelle-caledonie': 'NC',
+    'nouvelle-calédonie': 'NC',
+    'nouvelle-zelande': 'NZ',
+    'nouvelle-zélande': 'NZ',
+    'nova caledonia': 'NC',
+    'nova caledónia': 'NC',
+    'nova caledônia': 'NC',
+    'nova zelandia': 'NZ',
+    'nova zelândia': 'NZ',
+    'nueva caledonia': 'NC',
+    'nueva zelanda': 'NZ',
+    'nuova caledonia': 'NC',
+    'nuova zelanda': 'NZ',
+    'népal': 'NP',
+    'níger': 'NE',
+    'nördliche marianen': 'MP',
+    'olanda': 'NL',
+    'oma': 'OM',
+    'oman': 'OM',
+    'omán': 'OM',
+    'omã': 'OM',
+    'osterreich': 'AT',
+    'ouganda': 'UG',
+    'ouzbekistan': 'UZ',
+    'ouzbékistan': 'UZ',
+    'paesi bassi': 'NL',
+    'paesi bassi caraibici': 'BQ',
+    'pais de gales': 'GB-WLS',
+    'paises baixos': 'NL',
+    'paises bajos': 'NL',
+    'pakistan': 'PK',
+    'pakistán': 'PK',
+    'palaos': 'PW',
+    'palastina, staat': 'PS',
+    'palau': 'PW',
+    'palestina, estado da': 'PS',
+    'palestina, estado de': 'PS',
+    'palestina, stato di': 'PS',
+    'palestine': 'PS',
+    'palestine, etat de': 'PS',
+    'palestine, state of': 'PS',
+    'palestine, état de': 'PS',
+    'palästina, staat': 'PS',
+    'panama': 'PA',
+    'panamá': 'PA',
+    'papouasie-nouvelle-guinee': 'PG',
+    'papouasie-nouvelle-guinée': 'PG',
+    'papua new guinea': 'PG',
+    'papua nova guine': 'PG',
+    'papua nova guiné': 'PG',
+    'papua nueva guinea': 'PG',
+    'papua nuova guinea': 'PG',
+    'papua-neuguinea': 'PG',
+    'papua-nova guine': 'PG',
+    'papua-nova guiné': 'PG',
+    'papúa nueva guinea': 'PG',
+    'paquistao': 'PK',
+    'paquistão': 'PK',
+    'paraguai': 'PY',
+    'paraguay': 'PY',
+    'pays de galles': 'GB-WLS',
+    'pays-bas': 'NL',
+    'país de gales': 'GB-WLS',
+    'países baixos': 'NL',
+    'países bajos': 'NL',
+    "people's democratic republic of algeria": 'DZ',
+    "people's republic of bangladesh": 'BD',
+    "people's republic of china": 'CN',
+    'perou': 'PE',
+    'peru': 'PE',
+    'perù': 'PE',
+    'perú': 'PE',
+    'philippinen': 'PH',
+    'philippines': 'PH',
+    'pitcairn': 'PN',
+    'plurinational state of bolivia': 'BO',
+    'plurinationaler staat bolivien': 'BO',
+    'poland': 'PL',
+    'polen': 'PL',
+    'polinesia francesa': 'PF',
+    'polinesia francese': 'PF',
+    'polinésia francesa': 'PF',
+    'pologne': 'PL',
+    'polonia': 'PL',
+    'polynesie francaise': 'PF',
+    'polynésie française': 'PF',
+    'polónia': 'PL',
+    'polônia': 'PL',
+    'porto rico': 'PR',
+    'portogallo': 'PT',
+    'portorico': 'PR',
+    'portugal': 'PT',
+    'portuguese republic': 'PT',
+    'principality of andorra': 'AD',
+    'principality of liechtenstein': 'LI',
+    'principality of monaco': 'MC',
+    'province de chine taiwan': 'TW',
+    'province de chine taïwan': 'TW',
+    'province of china taiwan': 'TW',
+    'provincia da china taiwan': 'TW',
+    'provincia de china taiwan': 'TW',
+    'provincia de china taiwán': 'TW',
+    'província da china taiwan': 'TW',
+    'puerto rico': 'PR',
+    'pérou': 'PE',
+    'qatar': 'QA',
+    'quenia': 'KE',
+    'quirguistao': 'KG',
+    'quirguistão': 'KG',
+    'quénia': 'KE',
+    'quênia': 'KE',
+    'rd congo': 'CD',
+    'rd del congo': 'CD',
+    'rdc': 'CD',
+    'regno unito': 'GB',
+    'regno unito isole vergini': 'VG',
+    'reino unido': 'GB',
+    'repubblica bolivariana del venezuela': 'VE',
+    'repubblica ceca': 'CZ',
+    'repubblica centrafricana': 'CF',
+    'repubblica democratica del congo': 'CD',
+    'repubblica di cina taiwan': 'TW',
+    'repubblica dominicana': 'DO',
+    'republic of albania': 'AL',
+    'republic of angola': 'AO',
+    'republic of armenia': 'AM',
+    'republic of austria': 'AT',
+    'republic of azerbaijan': 'AZ',
+    'republic of belarus': 'BY',
+    'republic of benin': 'BJ',
+    'republic of bosnia and herzegovina': 'BA',
+    'republic of botswana': 'BW',
+    'republic of bulgaria': 'BG',
+    'republic of burundi': 'BI',
+    'republic of cabo verde': 'CV',
+    'republic of cameroon': 'CM',
+    'republic of chad': 'TD',
+    'republic of chile': 'CL',
+    'republic of colombia': 'CO',
+    'republic of costa rica': 'CR',
+    "republic of cote d'ivoire": 'CI',
+    'republic of croatia': 'HR',
+    'republic of cuba': 'CU',
+    'republic of cyprus': 'CY',
+    "republic of côte d'ivoire": 'CI',
+    'republic of djibouti': 'DJ',
+    'republic of ecuador': 'EC',
+    'republic of el salvador': 'SV',
+    'republic of equatorial guinea': 'GQ',
+    'republic of estonia': 'EE',
+    'republic of fiji': 'FJ',
+    'republic of finland': 'FI',
+    'republic of ghana': 'GH',
+    'republic of guatemala': 'GT',
+    'republic of guinea': 'GN',
+    'republic of guinea-bissau': 'GW',
+    'republic of guyana': 'GY',
+    'republic of haiti': 'HT',
+    'republic of honduras': 'HN',
+    'republic of iceland': 'IS',
+    'republic of india': 'IN',
+    'republic of indonesia': 'ID',
+    'republic of iraq': 'IQ',
+    'republic of kazakhstan': 'KZ',
+    'republic of kenya': 'KE',
+    'republic of kiribati': 'KI',
+    'republic of korea': 'KR',
+    'republic of latvia': 'LV',
+    'republic of liberia': 'LR',
+    'republic of lithuania': 'LT',
+    'republic of madagascar': 'MG',
+    'republic of malawi': 'MW',
+    'republic of maldives': 'MV',
+    'republic of mali': 'ML',
+    'republic of malta': 'MT',
+    'republic of mauritius': 'MU',
+    'republic of moldova': 'MD',
+    'republic of mozambique': 'MZ',
+    'republic of myanmar': 'MM',
+    'republic of namibia': 'NA',
+    'republic of nauru': 'NR',
+    'republic of nicaragua': 'NI',
+    'republic of north macedonia': 'MK',
+    'republic of palau': 'PW',
+    'republic of panama': 'PA',
+    'republic of paraguay': 'PY',
+    'republic of peru': 'PE',
+    'republic of poland': 'PL',
+    'republic of san marino': 'SM',
+    'republic of senegal': 'SN',
+    'republic of serbia': 'RS',
+    'republic of seychelles': 'SC',
+    'republic of sierra leone': 'SL',
+    'republic of singapore': 'SG',
+    'republic of slovenia': 'SI',
+    'republic of south africa': 'ZA',
+    'republic of south sudan': 'SS',
+    'republic of suriname': 'SR',
+    'republic of tajikistan': 'TJ',
+    'republic of the congo': 'CG',
+    'republic of the gambia': 'GM',
+    'republic of the marshall islands': 'MH',
+    'republic of the niger': 'NE',
+    'republic of the philippines': 'PH',
+    'republic of the sudan': 'SD',
+    'republic of trinidad and tobago': 'TT',
+    'republic of tunisia': 'TN',
+    'republic of turkiye': 'TR',
+    'republic of türkiye': 'TR',
+    'republic of uganda': 'UG',
+    'republic of uzbekistan': 'UZ',
+    'republic of vanuatu': 'VU',
+    'republic of yemen': 'YE',
+    'republic of zambia': 'ZM',
+    'republic of zimbabwe': 'ZW',
+    'republica arabe da siria': 'SY',
+    'republica arabe de siria': 'SY',
+    'republica arabe siria': 'SY',
+    'republica bolivariana da venezuela': 'VE',
+    'republica bolivariana de venezuela': 'VE',
+    'republica centro-africana': 'CF',
+    'republica centroafricana': 'CF',
+    'republica checa': 'CZ',
+    'republica da coreia': 'KR',
+    'republica da moldavia': 'MD',
+    'republica de corea': 'KR',
+    'republica de moldavia': 'MD',
+    'republica democratica del congo': 'CD',
+    'republica democratica do congo': 'CD',
+    'republica democratica popular de corea': 'KP',
+    'republica democratica popular de lao': 'LA',
+    'republica democratica popular do laos': 'LA',
+    'republica dominicana': 'DO',
+    'republica islamica de iran': 'IR',
+    'republica islamica do ira': 'IR',
+    'republica islamica do irao': 'IR',
+    'republica popular democratica da coreia': 'KP',
+    'republica popular democratica do laos': 'LA',
+    'republica tcheca': 'CZ',
+    'republica unida da tanzania': 'TZ',
+    'republica unida de tanzania': 'TZ',
+    'republik korea': 'KR',
+    'republik moldau': 'MD',
+    'republique arabe syrienne': 'SY',
+    'republique bolivarienne du venezuela': 'VE',
+    'republique centrafricaine': 'CF',
+    'republique de coree': 'KR',
+    'republique de moldova': 'MD',
+    'republique democratique du congo': 'CD',
+    'republique democratique populaire lao': 'LA',
+    'republique dominicaine': 'DO',
+    'republique du congo': 'CG',
+    "republique islamique d' iran": 'IR',
+    'republique populaire democratique de coree': 'KP',
+    'republique tcheque': 'CZ',
+    'republique unie de tanzanie': 'TZ',
+    'república bolivariana da venezuela': 'VE',
+    'república bolivariana de venezuela': 'VE',
+    'república centro-africana': 'CF',
+    'república centroafricana': 'CF',
+    'república checa': 'CZ',
+    'república da coreia': 'KR',
+    'república da moldávia': 'MD',
+    'república de corea': 'KR',
+    'república de moldavia': 'MD',
+    'república democrática del congo': 'CD',
+    'república democrática do congo': 'CD',
+    'república democrática popular de corea': 'KP',
+    'república democrática popular de lao': 'LA',
+    'república democrática popular do laos': 'LA',
+    'república dominicana': 'DO',
+    'república islámica de irán': 'IR',
+    'república islâmica do irã': 'IR',
+    'república islâmica do irão': 'IR',
+    'república popular democrática da coreia': 'KP',
+    'república popular democrática do laos': 'LA',
+    'república tcheca': 'CZ',
+    'república unida da tanzânia': 'TZ',
+    'república unida de tanzania': 'TZ',
+    'república árabe da síria': 'SY',
+    'república árabe de siria': 'SY',
+    'república árabe síria': 'SY',
+    'reuniao': 'RE',
+    'reunion': 'RE',
+    'reunion, ile de la': 'RE',
+    'reunião': 'RE',
+    'reunión': 'RE',
+    'riunione': 'RE',
+    'romania': 'RO',
+    'romenia': 'RO',
+    'roménia': 'RO',
+    'romênia': 'RO',
+    'roumanie': 'RO',
+    'royaume-uni': 'GB',
+    'ruanda': 'RW',
+    'rumania': 'RO',
+    'rumanien': 'RO',
+    'rumanía': 'RO',
+    'rumänien': 'RO',
+    'rusia': 'RU',
+    'russia': 'RU',
+    'russian federation': 'RU',
+    'russie': 'RU',
+    'russie, federation de': 'RU',
+    'russie, fédération de': 'RU',
+    'russische foderation': 'RU',
+    'russische föderation': 'RU',
+    'russland': 'RU',
+    'rwanda': 'RW',
+    'rwandese republic': 'RW',
+    'république arabe syrienne': 'SY',
+    'république bolivarienne du vénézuela': 'VE',
+    'république centrafricaine': 'CF',
+    'république de corée': 'KR',
+    'république de moldova': 'MD',
+    'république dominicaine': 'DO',
+    'république du congo': 'CG',
+    'république démocratique du congo': 'CD',
+    'république démocratique populaire lao': 'LA',
+    "république islamique d' iran": 'IR',
+    'république populaire démocratique de corée': 'KP',
+    'république tchèque': 'CZ',
+    'république unie de tanzanie': 'TZ',
+    'réunion': 'RE',
+    'réunion, île de la': 'RE',
+    'rússia': 'RU',
+    'saara ocidental': 'EH',
+    'saba e santo eustaquio bonaire': 'BQ',
+    'saba e santo eustáquio bonaire': 'BQ',
+    'sahara occidental': 'EH',
+    'sahara occidentale': 'EH',
+    'saint barthelemy': 'BL',
+    'saint barthélemy': 'BL',
+    'saint helena, ascension and tristan da cunha': 'SH',
+    'saint kitts and nevis': 'KN',
+    'saint kitts e nevis': 'KN',
+    'saint lucia': 'LC',
+    'saint martin (franzosischer teil)': 'MF',
+    'saint martin (französischer teil)': 'MF',
+    'saint martin (french part)': 'MF',
+    'saint pierre and miquelon': 'PM',
+    'saint pierre e miquelon': 'PM',
+    'saint vincent and the grenadines': 'VC',
+    'saint vincent e grenadine': 'VC',
+    'saint-barthelemy': 'BL',
+    'saint-barthélemy': 'BL',
+    'saint-christophe-et-nieves': 'KN',
+    'saint-christophe-et-niévès': 'KN',
+    'saint-eustache et saba bonaire': 'BQ',
+    'saint-marin': 'SM',
+    'saint-martin (francia)': 'MF',
+    'saint-martin (niederlandischer teil)': 'SX',
+    'saint-martin (niederländischer teil)': 'SX',
+    'saint-martin (partie francaise)': 'MF',
+    'saint-martin (partie française)': 'MF',
+    'saint-martin (partie neerlandaise)': 'SX',
+    'saint-martin (partie néerlandaise)': 'SX',
+    'saint-pierre e miquelon': 'PM',
+    'saint-pierre-et-miquelon': 'PM',
+    'saint-siege (etat de la cite du vatican)': 'VA',
+    'saint-siège (état de la cité du vatican)': 'VA',
+    'saint-vincent-et-les-grenadines': 'VC',
+    'sainte-helene, ascension et tristan da cunha': 'SH',
+    'sainte-hélène, ascension et tristan da cunha': 'SH',
+    'sainte-lucie': 'LC',
+    'salomon, iles': 'SB',
+    'salomon, îles': 'SB',
+    'salomoninseln': 'SB',
+    'salvador': 'SV',
+    'sambia': 'ZM',
+    'samoa': 'WS',
+    'samoa americaines': 'AS',
+    'samoa americana': 'AS',
+    'samoa americane': 'AS',
+    'samoa américaines': 'AS',
+    'samoa estadounidense': 'AS',
+    'san bartolome': 'BL',
+    'san bartolomé': 'BL',
+    'san cristobal y nieves': 'KN',
+    'san cristóbal y nieves': 'KN',
+    'san marino': 'SM',
+    'san martin (zona francesa)': 'MF',
+    'san martín (zona francesa)': 'MF',
+    'san pedro y miquelon': 'PM',
+    'san vicente y las granadinas': 'VC',
+    "sant'elena, ascensione e tristan da cunha": 'SH',
+    'santa elena, ascension y tristan de acuna': 'SH',
+    'santa elena, ascensión y tristán de acuña': 'SH',
+    'santa helena, ascensao e tristao da cunha': 'SH',
+    'santa helena, ascensão e tristão da cunha': 'SH',
+    'santa lucia': 'LC',
+    'santa lucía': 'LC',
+    'santa lúcia': 'LC',
+    'santa se (cidade-estado do vaticano)': 'VA',
+    'santa se (estado da cidade do vaticano)': 'VA',
+    'santa sede (ciudad estado del vaticano)': 'VA',
+    'santa sede (stato della citta del vaticano)': 'VA',
+    'santa sede (stato della città del vaticano)': 'VA',
+    'santa sé (cidade-estado do vaticano)': 'VA',
+    'santa sé (estado da cidade do vaticano)': 'VA',
+    'santo eustaquio e saba bonaire': 'BQ',
+    'santo eustáquio e saba bonaire': 'BQ',
+    'santo tome y principe': 'ST',
+    'santo tomé y príncipe': 'ST',
+    'sao bartolomeu': 'BL',
+    'sao cristovao e nevis': 'KN',
+    'sao marino': 'SM',
+    'sao martim (parte francesa)': 'MF',
+    'sao martim (parte holandesa)': 'SX',
+    'sao martin (territorio frances)': 'MF',
+    'sao martinho (paises baixos)': 'SX',
+    'sao pedro e miquelon': 'PM',
+    'sao tome and principe': 'ST',
+    'sao tome e principe': 'ST',
+    'sao tome und principe': 'ST',
+    'sao tome-et-principe': 'ST',
+    'sao tomé-et-principe': 'ST',
+    'sao vicente e granadinas': 'VC',
+    'saudi arabia': 'SA',
+    'saudi-arabien': 'SA',
+    'schottland': 'GB-SCT',
+    'schweden': 'SE',
+    'schweiz': 'CH',
+    'scotland': 'GB-SCT',
+    'scozia': 'GB-SCT',
+    'senegal': 'SN',
+    'serbia': 'RS',
+    'serbie': 'RS',
+    'serbien': 'RS',
+    'serra leoa': 'SL',
+    'servia': 'RS',
+    'seychellen': 'SC',
+    'seychelles': 'SC',
+    'sierra leona': 'SL',
+    'sierra leone': 'SL',
+    'simbabwe': 'ZW',
+    'singapore': 'SG',
+    'singapour': 'SG',
+    'singapur': 'SG',
+    'singapura': 'SG',
+    'sint eustatius and saba bonaire': 'BQ',
+    'sint eustatius und saba bonaire': 'BQ',
+    'sint maarten (dutch part)': 'SX',
+    'sint maarten (olanda)': 'SX',
+    'siria': 'SY',
+    'slovacchia': 'SK',
+    'slovak republic': 'SK',
+    'slovakia': 'SK',
+    'slovaquie': 'SK',
+    'slovenia': 'SI',
+    'slovenie': 'SI',
+    'slovénie': 'SI',
+    'slowakei': 'SK',
+    'slowenien': 'SI',
+    'socialist republic of viet nam': 'VN',
+    'solomon islands': 'SB',
+    'somalia': 'SO',
+    'somalie': 'SO',
+    'somália': 'SO',
+    'soudan': 'SD',
+    'soudan du sud': 'SS',
+    'south africa': 'ZA',
+    'south georgia and the south sandwich islands': 'GS',
+    'south georgia und die sudlichen sandwichinseln': 'GS',
+    'south georgia und die südlichen sandwichinseln': 'GS',
+    'south korea': 'KR',
+    'south sudan': 'SS',
+    'spagna': 'ES',
+    'spain': 'ES',
+    'spanien': 'ES',
+    'sri lanka': 'LK',
+    'st. helena, ascension und tristan da cunha': 'SH',
+    'st. kitts und nevis': 'KN',
+    'st. lucia': 'LC',
+    'st. pierre und miquelon': 'PM',
+    'st. vincent und die grenadinen': 'VC',
+    'staat palastina': 'PS',
+    'staat palästina': 'PS',
+    'state of israel': 'IL',
+    'state of kuwait': 'KW',
+    'state of palestine': 'PS',
+    'state of qatar': 'QA',
+    'stati uniti': 'US',
+    'stato di palestina': 'PS',
+    'stato plurinazionale della bolivia': 'BO',
+    'suazilandia': 'SZ',
+    'suazilândia': 'SZ',
+    'sudafrica': 'ZA',
+    'sudafrika': 'ZA',
+    'sudan': 'SD',
+    'sudan del sud': 'SS',
+    'sudan del sur': 'SS',
+    'sudao': 'SD',
+    'sudao do sul': 'SS',
+    'sudkorea': 'KR',
+    'sudsudan': 'SS',
+    'sudáfrica': 'ZA',
+    'sudán': 'SD',
+    'sudán del sur': 'SS',
+    'sudão': 'SD',
+    'sudão do sul': 'SS',
+    'suecia': 'SE',
+    'suede': 'SE',
+    'suica': 'CH',
+    'suisse': 'CH',
+    'suiza': 'CH',
+    'sultanate of oman': 'OM',
+    'surinam': 'SR',
+    'suriname': 'SR',
+    'surinám': 'SR',
+    'suède': 'SE',
+    'suécia': 'SE',
+    'suíça': 'CH',
+    'svalbard and jan mayen': 'SJ',
+    'svalbard e a ilha de jan mayen': 'SJ',
+    'svalbard e jan mayen': 'SJ',
+    'svalbard et ile jan mayen': 'SJ',
+    'svalbard et île jan mayen': 'SJ',
+    'svalbard und jan mayen': 'SJ',
+    'svalbard y jan mayen': 'SJ',
+    'svezia': 'SE',
+    'svizzera': 'CH',
+    'sweden': 'SE',
+    'swiss confederation': 'CH',
+    'switzerland': 'CH',
+    'syria': 'SY',
+    'syrian arab republic': 'SY',
+    'syrien': 'SY',
+    'syrien, arabische republik': 'SY',
+    'syrienne, republique arabe': 'SY',
+    'syrienne, république arabe': 'SY',
+    'são bartolomeu': 'BL',
+    'são cristóvão e nevis': 'KN',
+    'são cristóvão e névis': 'KN',
+    'são marino': 'SM',
+    'são martim (parte francesa)': 'MF',
+    'são martim (parte holandesa)': 'SX',
+    'são martin (território francês)': 'MF',
+    'são martinho (países baixos)': 'SX',
+    'são pedro e miquelon': 'PM',
+    'são tomé e príncipe': 'ST',
+    'são tomé und príncipe': 'ST',
+    'são vicente e granadinas': 'VC',
+    'sénégal': 'SN',
+    'sérvia': 'RS',
+    'südafrika': 'ZA',
+    'südkorea': 'KR',
+    'südsudan': 'SS',
+    'tadjikistan': 'TJ',
+    'tadjiquistao': 'TJ',
+    'tadjiquistão': 'TJ',
+    'tadschikistan': 'TJ',
+    'tagikistan': 'TJ',
+    'tailandia': 'TH',
+    'tailândia': 'TH',
+    'taiwan': 'TW',
+    'taiwan, chinesische provinz': 'TW',
+    'taiwan, province de chine': 'TW',
+    'taiwan, province of china': 'TW',
+    'taiwan, provincia da china': 'TW',
+    'taiwan, provincia de china': 'TW',
+    'taiwan, província da china': 'TW',
+    'taiwan, repubblica di cina': 'TW',
+    'taiwán': 'TW',
+    'taiwán, provincia de china': 'TW',
+    'tajikistan': 'TJ',
+    'tajiquistao': 'TJ',
+    'tajiquistão': 'TJ',
+    'tansania': 'TZ',
+    'tansania, vereinigte republik': 'TZ',
+    'tanzania': 'TZ',
+    'tanzania, republica unida da': 'TZ',
+    'tanzania, republica unida de': 'TZ',
+    'tanzania, república unida de': 'TZ',
+    'tanzania, united republic of': 'TZ',
+    'tanzanie': 'TZ',
+    'tanzanie, republique unie de': 'TZ',
+    'tanzanie, république unie de': 'TZ',
+    'tanzânia': 'TZ',
+    'tanzânia, república unida da': 'TZ',
+    'tayikistan': 'TJ',
+    'tayikistán': 'TJ',
+    'taïwan': 'TW',
+    'taïwan, province de chine': 'TW',
+    'tchad': 'TD',
+    'tchequie': 'CZ',
+    'tchéquie': 'CZ',
+    'terres australes francaises': 'TF',
+    'terres australes françaises': 'TF',
+    "territoire britannique de l'ocean indien": 'IO',
+    "territoire britannique de l'océan indien": 'IO',
+    'territori francesi meridionali': 'TF',
+    'territorio britanico del oceano indico': 'IO',
+    'territorio britanico do oceano indico': 'IO',
+    "territorio britannico dell'oceano indiano": 'IO',
+    'territorio británico del océano índico': 'IO',
+    'territorios franceses del sur': 'TF',
+    'territorios franceses do sul': 'TF',
+    'território britânico do oceano índico': 'IO',
+    'territórios franceses do sul': 'TF',
+    'thailand': 'TH',
+    'thailande': 'TH',
+    'thailandia': 'TH',
+    'thaïlande': 'TH',
+    'the democratic republic of the congo': 'CD',
+    'the gambia': 'GM',
+    'the state of eritrea': 'ER',
+    'the state of palestine': 'PS',
+    'timor est': 'TL',
+    'timor leste': 'TL',
+    'timor oriental': 'TL',
+    'timor-leste': 'TL',
+    'togo': 'TG',
+    'togolese republic': 'TG',
+    'tokelau': 'TK',
+    'tonga': 'TO',
+    'toquelau': 'TK',
+    'trindade e tobago': 'TT',
+    'trinidad and tobago': 'TT',
+    'trinidad e tobago': 'TT',
+    'trinidad und tobago': 'TT',
+    'trinidad y tobago': 'TT',
+    'trinidade e tobago': 'TT',
+    'trinite-et-tobago': 'TT',
+    'trinité-et-tobago': 'TT',
+    'tschad': 'TD',
+    'tschechien': 'CZ',
+    'tschechische republik': 'CZ',
+    'tunesien': 'TN',
+    'tunez': 'TN',
+    'tunisia': 'TN',
+    'tunisie': 'TN',
+    'tunísia': 'TN',
+    'turchia': 'TR',
+    'turcomenistao': 'TM',
+    'turcomenistão': 'TM',
+    'turkei': 'TR',
+    'turkey': 'TR',
+    'turkiye': 'TR',
+    'turkmenistan': 'TM',
+    'turkmenistán': 'TM',
+    'turkménistan': 'TM',
+    'turks and caicos islands': 'TC',
+    'turks- und caicosinseln': 'TC',
+    'turquemenistao': 'TM',
+    'turquemenistão': 'TM',
+    'turquia': 'TR',
+    'turquie': 'TR',
+    'turquía': 'TR',
+    'tuvalu': 'TV',
+    'túnez': 'TN',
+    'türkei': 'TR',
+    'türkiye': 'TR',
+    'u.s. virgin islands': 'VI',
+    'u.s.a. isole vergini': 'VI',
+    'ucraina': 'UA',
+    'ucrania': 'UA',
+    'ucrânia': 'UA',
+    'uganda': 'UG',
+    'ukraine': 'UA',
+    'ungarn': 'HU',
+    'ungheria': 'HU',
+    'union of the comoros': 'KM',
+    'united arab emirates': 'AE',
+    'united kingdom': 'GB',
+    'united kingdom of great britain and northern ireland': 'GB',
+    'united mexican states': 'MX',
+    'united republic of tanzania': 'TZ',
+    'united states': 'US',
+    'united states minor outlying islands': 'UM',
+    'united states of america': 'US',
+    'uruguai': 'UY',
+    'uruguay': 'UY',
+    'usa': 'US',
+    'usbekistan': 'UZ',
+    'uzbekistan': 'UZ',
+    'uzbekistán': 'UZ',
+    'uzbequistao': 'UZ',
+    'uzbequistão': 'UZ',
+    'vanuatu': 'VU',
+    'vatican city': 'VA',
+    'venezuela': 'VE',
+    'venezuela, bolivarian republic of': 'VE',
+    'venezuela, bolivarische republik': 'VE',
+    'venezuela, repubblica bolivariana del': 'VE',
+    'venezuela, republica bolivariana da': 'VE',
+    'venezuela, republica bolivariana de': 'VE',
+    'venezuela, republique bolivarienne du': 'VE',
+    'venezuela, república bolivariana da': 'VE',
+    'venezuela, república bolivariana de': 'VE',
+    'vereinigte arabische emirate': 'AE',
+    'vereinigte republik tansania': 'TZ',
+    'vereinigte staaten': 'US',
+    'vereinigtes konigreich': 'GB',
+    'vereinigtes königreich': 'GB',
+    'viet nam': 'VN',
+    'vietna': 'VN',
+    'vietnam': 'VN',
+    'vietname': 'VN',
+    'vietnã': 'VN',
+    'virgin islands of the united states': 'VI',
+    'virgin islands, british': 'VG',
+    'virgin islands, u.s.': 'VI',
+    'viêt nam': 'VN',
+    'vénézuela': 'VE',
+    'vénézuela, république bolivarienne du': 'VE',
+    'wales': 'GB-WLS',
+    'wallis and futuna': 'WF',
+    'wallis e futuna': 'WF',
+    'wallis et futuna': 'WF',
+    'wallis und futuna': 'WF',
+    'wallis y futuna': 'WF',
+    'weihnachtsinseln': 'CX',
+    'western sahara': 'EH',
+    'westsahara': 'EH',
+    'yemen': 'YE',
+    'yibuti': 'DJ',
+    'yémen': 'YE',
+    'zambia': 'ZM',
+    'zambie': 'ZM',
+    'zentralafrikanische republik': 'CF',
+    'zimbabue': 'ZW',
+    'zimbabwe': 'ZW',
+    'zimbábue': 'ZW',
+    'zypern': 'CY',
+    'zâmbia': 'ZM',
+    'áfrica do sul': 'ZA',
+    'áustria': 'AT',
+    'ägypten': 'EG',
+    'äquatorialguinea': 'GQ',
+    'äthiopien': 'ET',
+    'åland islands': 'AX',
+    'åland, îles': 'AX',
+    'åland-inseln': 'AX',
+    'écosse': 'GB-SCT',
+    'égypte': 'EG',
+    'émirats arabes unis': 'AE',
+    'équateur': 'EC',
+    'érythrée': 'ER',
+    'état de palestine': 'PS',
+    'état plurinational de bolivie': 'BO',
+    'états fédérés de micronésie': 'FM',
+    'états-unis': 'US',
+    'états-unis îles vierges': 'VI',
+    'éthiopie': 'ET',
+    'índia': 'IN',
+    'île bouvet': 'BV',
+    'île christmas': 'CX',
+    'île de la réunion': 'RE',
+    'île de man': 'IM',
+    'île norfolk': 'NF',
+    'îles (falkland) malouines': 'FK',
+    'îles caïmans': 'KY',
+    'îles cocos (keeling)': 'CC',
+    'îles cook': 'CK',
+    'îles féroé': 'FO',
+    'îles heard-et-macdonald': 'HM',
+    'îles mariannes du nord': 'MP',
+    'îles marshall': 'MH',
+    'îles mineures éloignées des états-unis': 'UM',
+    'îles pitcairn': 'PN',
+    'îles salomon': 'SB',
+    'îles turques-et-caïques': 'TC',
+    'îles vierges britanniques': 'VG',
+    'îles vierges, états-unis': 'VI',
+    'îles åland': 'AX',
+    'österreich': 'AT',
+}
+
+# Piede preferito in qualsiasi lingua (minuscolo) -> valore canonico
+FOOT_ALIASES = {
+    'ambidestro': 'Both',
+    'ambidextre': 'Both',
+    'ambidextrous': 'Both',
+    'ambidiestro': 'Both',
+    'ambos': 'Both',
+    'beidfussig': 'Both',
+    'beidfußig': 'Both',
+    'beidfüssig': 'Both',
+    'beidfüßig': 'Both',
+    'both': 'Both',
+    'canhoto': 'Left',
+    'derecho': 'Right',
+    'destro': 'Right',
+    'destro (naturale)': 'Right',
+    'diestro': 'Right',
+    'direito': 'Right',
+    'droit': 'Right',
+    'entrambi': 'Both',
+    'esquerdo': 'Left',
+    'gauche': 'Left',
+    'izquierdo': 'Left',
+    'left': 'Left',
+    'les deux': 'Both',
+    'links': 'Left',
+    'mancino': 'Left',
+    'rechts': 'Right',
+    'right': 'Right',
+    'sinistro': 'Left',
+    'zurdo': 'Left',
+}